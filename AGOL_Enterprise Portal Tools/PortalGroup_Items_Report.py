@@ -1,7 +1,7 @@
 # ---------------------------------------------------------------------------
 # Portal_Group_Items_Report.py
 # Created on: 2023-10-09
-# Updated on: 2023-10-11
+# Updated on: 2026-10-18
 #
 # Author: Phil Baranyai / DLC
 #
@@ -14,6 +14,8 @@
 ########  ----> Designed to be run from CMD line
 ########  ----> Right click on .py file and "Run with ArcGIS Pro"
 #
+# Item urls are kept in the item cache (Shared_Modules\Portal_Item_Cache.py) - only items modified since the last run are requested
+# Each group's sheet is built once and streamed to excel with links, column widths and filter (Shared_Modules\Excel_Report.py)
 # ---------------------------------------------------------------------------
 
 print("This tool will catalog all items (listed in script) within each group from portal site (or AGOL if that URL is entered) entered below, then export them to Microsoft Excel.")
@@ -22,8 +24,10 @@ print("\nLoading python modules, please wait...")
 from arcgis.gis import GIS
 import pandas as pd
 import os,time,sys,datetime,logging
-from openpyxl import load_workbook
-from openpyxl.worksheet.datavalidation import DataValidationList
+
+# Shared modules folder (portal item cache, report dataframes, streaming excel report writer) - Shared_Modules next to this tools folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Portal_Item_Cache,Portal_Frames,Excel_Report
 
 print("Enter Portal or AGOL URL below: | Example: https://ORGANIZATIONALURL/arcgis")
 print("\n  You MUST login with an administrator account to run this report")
@@ -88,71 +92,73 @@ ExcelOutput = os.path.join(ReportDirectory,str(PortalName)+'_GroupItems'+str(dat
 # Get the portal groups into a list called "groups"
 groups = gis.groups.search()
 
-# Create writer for dataframe to export to Excel
-writer = pd.ExcelWriter(ExcelOutput)
+# Open item cache shared by the portal tools run from this folder (*script location* cache folder)
+ItemCache = Portal_Item_Cache.ItemCache(os.getcwd()+"\\cache\\"+str(PortalName)+"_Item_Cache.sqlite")
 
-# Build fuction to add "Click here to open URL" in excel spreadsheet
-def make_hyperlink(url):
-    return '=HYPERLINK("%s", "Click here to open URL")' % url
+# Create writer for dataframes to export to Excel (sheets are streamed to the file, columns sized as they are written)
+XLReport = Excel_Report.ReportWriter(ExcelOutput)
 
-# Build fuction to iterate over a single portal group, create a dataframe dictionary of items and add the item dictionary to the excel; with each group as it's own worksheet in the workbook. 
+# Build fuction to iterate over a single portal group, create a dataframe of items and add it to the excel; with each group as it's own worksheet in the workbook. 
 def build_group_df(groupname):
     # Get the group items
     items = groupname.content()
-    # Create a pandas DataFrame to store the results
-    df = pd.DataFrame(columns=['Group Name', 'Title', 'Item ID', 'Type','Sharing Level', 'URL','Link to Item'])
+    # Create a record collector (one list per column) to store the results
+    GroupRecords = Portal_Frames.RecordCollector(['Group Name', 'Title', 'Item ID', 'Type','Sharing Level', 'URL','Link to Item'])
     print('\n Creating dataframe for '+str(groupname.title)+' group')
     write_log('\n Creating dataframe for '+str(groupname.title)+' group',logfile)
     
-    # Add the items to the DataFrame
+    # Add the items to the record collector
     for item in items:
-        item_info = item
-        find_id = item_info.id
-        find_url = gis.content.get(item.id).url
+        find_url = ItemCache.cached(item, 'url', lambda item: gis.content.get(item.id).url)
         if(find_url):
-            df = df.append({
+            GroupRecords.add({
                 'Group Name': groupname.title,
                 'Title': item.title,
                 'Item ID': item.id,
                 'Type': item.type,
                 'Sharing Level': item.shared_with,
                 'URL': find_url
-            }, ignore_index=True)
-            GroupName = (groupname.title).replace(" ","")[:30]
-            df['Link to Item'] = df['URL'].apply(make_hyperlink)
-            # Build masks to create custom URLs where the URL is not available from the item description in your portal/AGOL
-            WebMap_mask = df['Type'] == 'Web Map'
-            df.loc[WebMap_mask, 'URL'] = Portal+'/home/webmap/viewer.html?webmap='+ df['Item ID'].astype(str)
-            Form_mask = df['Type'] == 'Form'
-            df.loc[Form_mask, 'URL'] = 'https://survey123.arcgis.com/share/' + df['Item ID'].astype(str)+"?"+ Portal + '&open=native'
-            ExperienceBuilder_mask = df['Type'] == 'Web Experience'
-            df.loc[ExperienceBuilder_mask, 'URL'] = Portal+'/apps/experiencebuilder/experience/?id='+ df['Item ID'].astype(str)
-            Dashboard_mask = df['Type'] == 'Dashboard'
-            df.loc[Dashboard_mask, 'URL'] = Portal+'/apps/opsdashboard/index.html#/'+ df['Item ID'].astype(str)
-            WebScene_mask = df['Type'] == 'Web Scene'
-            df.loc[WebScene_mask, 'URL'] = Portal+'/home/webscene/viewer.html?webscene='+ df['Item ID'].astype(str)
-            No_URL_Other_mask = df['URL'] == 'N/A'
-            df.loc[No_URL_Other_mask, 'Link to Item'] = 'N/A'
+            })
         else:
-            df = df.append({
+            GroupRecords.add({
                 'Group Name': groupname.title,
                 'Title': item.title,
                 'Item ID': item.id,
                 'Type': item.type,
-                'URL': 'N/A',
-                'Link to Item': 'N/A'
-            }, ignore_index=True)
-            GroupName = (groupname.title).replace(" ","")[:30]
-        df.to_excel(writer, sheet_name=GroupName, index=False)
+                'URL': 'N/A'
+            })
         print(str(groupname.title+' : '+item.title)+' created')
-        writer.save()
+    if not len(GroupRecords):
+        return
+    df = GroupRecords.frame()
+    # Build masks to create custom URLs where the URL is not available from the item description in your portal/AGOL
+    WebMap_mask = df['Type'] == 'Web Map'
+    df.loc[WebMap_mask, 'URL'] = Portal+'/home/webmap/viewer.html?webmap='+ df['Item ID'].astype(str)
+    Form_mask = df['Type'] == 'Form'
+    df.loc[Form_mask, 'URL'] = 'https://survey123.arcgis.com/share/' + df['Item ID'].astype(str)+"?"+ Portal + '&open=native'
+    ExperienceBuilder_mask = df['Type'] == 'Web Experience'
+    df.loc[ExperienceBuilder_mask, 'URL'] = Portal+'/apps/experiencebuilder/experience/?id='+ df['Item ID'].astype(str)
+    Dashboard_mask = df['Type'] == 'Dashboard'
+    df.loc[Dashboard_mask, 'URL'] = Portal+'/apps/opsdashboard/index.html#/'+ df['Item ID'].astype(str)
+    WebScene_mask = df['Type'] == 'Web Scene'
+    df.loc[WebScene_mask, 'URL'] = Portal+'/home/webscene/viewer.html?webscene='+ df['Item ID'].astype(str)
+    # "Click here to open URL" link for every item with a URL ("N/A" where there isn't one)
+    df['Link to Item'] = df['URL']
+    GroupName = (groupname.title).replace(" ","")[:30]
+    XLReport.add_frame(GroupName, df, links={'Link to Item': 'Click here to open URL'})
         
 # Call function from above, iterating each group through function to append each group's items result to excel workbook
 try:
     for group in groups:
         build_group_df(group)
+    XLReport.close()
+    ItemCache.close()
+    print('\n  '+ItemCache.summary())
+    write_log('\n  '+ItemCache.summary(),logfile)
     print('\n  Items have been inventoried and dataframe has been created and exported to excel')
     write_log('\n  Items have been inventoried and dataframe has been created and exported to excel',logfile)
+    print('\n    Report exported out to: '+ExcelOutput)
+    write_log('\n    Report exported out to: '+ExcelOutput,logfile)
 except:
     print('\n Unable to iterate through group and append each dictionary into the dataframe')
     write_log('\n Unable to iterate through group and append each dictionary into the dataframe',logfile)
@@ -160,35 +166,6 @@ except:
     raise
     sys.exit()
 
-# Access exported excel workbook, and auto-size columns for easier read
-try:
-    print("\n Resizing excel columns to autofit columns")
-    write_log("\n Resizing excel columns to autofit columns",logfile)
-    wb = load_workbook(ExcelOutput)
-    for sheet in wb.worksheets:
-        for column in sheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(cell.value)
-                except:
-                    pass
-            adjusted_width = (max_length + 2) * 1.2
-            sheet.column_dimensions[column_letter].width = adjusted_width
-            sheet.data_validations = DataValidationList()
-            sheet.auto_filter.ref = sheet.dimensions
-    wb.save(ExcelOutput)
-    print('\n    Report exported out to: '+ExcelOutput)
-    write_log('\n    Report exported out to: '+ExcelOutput,logfile)
-except:
-    print('\n Unable to resize excel columns to fit data')
-    write_log('\n Unable to resize excel columns to fit data',logfile)
-    logging.exception('Got exception on resize excel columns to fit data logged at:' + time.strftime("%I:%M:%S %p", time.localtime()))
-    raise
-    sys.exit()
-
 # Calculating run time and printing end statement
 end_time = time.strftime("%I:%M:%S %p", time.localtime())
 elapsed_time = time.time() -start_time
@@ -1,7 +1,7 @@
 # ---------------------------------------------------------------------------
 # PortalGroupMembers_ExportTool.py
 # Created on: 2023-05-25
-# Updated on: 2023-10-11
+# Updated on: 2026-10-18
 #
 # Author: Phil Baranyai
 #
@@ -14,15 +14,18 @@
 ########  ----> Designed to be run from CMD line
 ########  ----> Right click on .py file and "Run with ArcGIS Pro"
 #
-#
+# Group members are requested in a thread pool (Shared_Modules\Portal_Fetch.py), then joined to the
+# user list in one merge and each group's sheet is streamed to excel once (Shared_Modules\Portal_Frames.py, Excel_Report.py)
 # ---------------------------------------------------------------------------
 print("This tool reads from portal URL entered below, lists all groups and members within by username, and export out results an excel report.")
 print("\nLoading python modules, please wait...")
 from arcgis.gis import GIS
 import pandas as pd
 import os,time,sys,datetime,logging
-from openpyxl import load_workbook
-from openpyxl.worksheet.datavalidation import DataValidationList
+
+# Shared modules folder (concurrent portal requests, group member sheets, streaming excel report writer) - Shared_Modules next to this tools folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Portal_Fetch,Portal_Frames,Excel_Report
 
 # Comment out for manual run of script - Used for prompts within command window (Run with ArcGIS Pro)
 print("Enter portal URL below: | Example: https://PORTALNAME.com/arcgis")
@@ -100,8 +103,8 @@ groups = gis.groups.search()
 # Set Excel spreadsheet output name
 ExcelOutput = os.path.join(ReportDirectory,str(PortalName)+'__Portal_Group_Members_report__'+str(date)+"_"+str(Time)+'.xlsx')
 
-# Create writer for dataframe to export to Excel
-writer = pd.ExcelWriter(ExcelOutput)
+# Create writer for dataframes to export to Excel (sheets are streamed to the file, columns sized as they are written)
+XLReport = Excel_Report.ReportWriter(ExcelOutput)
 
 # Create a pandas DataFrame to store the results
 df = pd.DataFrame(columns=['Group Name', 'Group Owner', 'Member Username'])
@@ -113,47 +116,40 @@ write_log('\n Creating dataframe with column headings',logfile)
 print("\n Iterating through group to collect group/user names")
 write_log("\n Iterating through group to collect group/user names",logfile)
 
-# Create a dataframe with a list of users (will be joined to group/user dataframe in user_inventory function for more informative reporting
-userdf = pd.DataFrame(columns=['Member Username', 'Full Name', 'Email', 'Role', 'Level'])
+# Create a dataframe with a list of users (will be joined to group/user dataframe by Portal_Frames.group_member_frame for more informative reporting)
+UserRecords = Portal_Frames.RecordCollector(['Member Username', 'Full Name', 'Email', 'Role', 'Level'])
 portalusers = gis.users.search(max_users = 2000)
 for user in portalusers:
-                      userdf = userdf.append({
-                          'Member Username': user.username,
-                          'Full Name': user.fullName,
-                          'Email': user.email,
-                          'Role': user.role,
-                          'Level': user.level
-                          }, ignore_index=True)
-
-# Function to interate through each group and create a list, enter into dataframe, and write out to excel
-def user_inventory(groupname):
-    # Create a pandas DataFrame to store the results
-    grpdf = pd.DataFrame(columns=['Group Name', 'Group Owner', 'Member Username'])  
-    for member in groupMembers['users']:
-        grpuser = gis.users.get(member)
-        grpdf = grpdf.append({
-            'Group Name':groupname.title,
-            'Group Owner':groupname.owner,
-            'Member Username':member
-            }, ignore_index=True)
-        GroupName = (groupname.title).replace(" ","")[:30]
-        # Join user and group dataframes together on Member Username field
-        df = pd.merge(grpdf,userdf,on='Member Username')
-        # Replace level numbers with actual user level descriptions for ease of reading.
-        df['Level'].replace('2', 'Creator',inplace=True)
-        df['Level'].replace('11', 'Field Worker', inplace = True)
-        df['Level'].replace('1', 'Viewer', inplace = True)
-        df.to_excel(writer, sheet_name=GroupName, index=False)
-        print(str(groupname.title+' : '+member)+' created')
-        writer.save()
-
-# Call function from above, iterating each group through function to append each group's member list result to excel workbook
+    UserRecords.add({
+        'Member Username': user.username,
+        'Full Name': user.fullName,
+        'Email': user.email,
+        'Role': user.role,
+        'Level': user.level
+        })
+userdf = UserRecords.frame()
+
+# Collect every group's members, join them to the user list once, and write each group's sheet once
 try:
+    # Collect members of every group (FetchWorkers requests at a time)
+    FetchWorkers = 8
+    FetchPool = Portal_Fetch.FetchPool(workers=FetchWorkers)
+    GroupMembers = {}
+    for result in FetchPool.map(lambda group: group.get_members(), groups):
+        if not result.ok:
+            raise result.error
+        GroupMembers[result.key.id] = result.value
+    print('\n   Group member requests: '+FetchPool.summary())
+    write_log('\n   Group member requests: '+FetchPool.summary(),logfile)
+    df = Portal_Frames.group_member_frame(groups, GroupMembers, userdf)
     for group in groups:
-        groupMembers = group.get_members()
-        user_inventory(group)
-    print('\n   Dataframe has been created with group members and exported to excel - spreadsheet cleanup is next')
-    write_log('\n   Dataframe has been created with group members and exported to excel - spreadsheet cleanup is next',logfile)
+        print(str(group.title)+' : '+str(len(GroupMembers[group.id]['users']))+' members')
+    SheetCount = Portal_Frames.write_group_sheets(XLReport, df, Portal_Frames.group_sheets(groups, GroupMembers))
+    XLReport.close()
+    print('\n   Dataframe has been created with '+str(len(df))+' group members and exported to excel ('+str(SheetCount)+' group sheets)')
+    write_log('\n   Dataframe has been created with '+str(len(df))+' group members and exported to excel ('+str(SheetCount)+' group sheets)',logfile)
+    print('\n    Report exported out to: '+ExcelOutput)
+    write_log('\n    Report exported out to: '+ExcelOutput,logfile)
 except:
     print('\n Unable to iterate through group to collect group/user names')
     write_log('\n Unable to iterate through group to collect group/user names',logfile)
@@ -161,35 +157,6 @@ except:
     raise
     sys.exit()
 
-# Access exported excel workbook, and auto-size columns for easier read
-try:
-    print("\n Resizing excel columns to autofit columns")
-    write_log("\n Resizing excel columns to autofit columns",logfile)
-    wb = load_workbook(ExcelOutput)
-    for sheet in wb.worksheets:
-        for column in sheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(cell.value)
-                except:
-                    pass
-            adjusted_width = (max_length + 2) * 1.2
-            sheet.column_dimensions[column_letter].width = adjusted_width
-            sheet.data_validations = DataValidationList()
-            sheet.auto_filter.ref = sheet.dimensions
-    wb.save(ExcelOutput)
-    print('\n    Report exported out to: '+ExcelOutput)
-    write_log('\n    Report exported out to: '+ExcelOutput,logfile)
-except:
-    print('\n Unable to resize excel columns to fit data')
-    write_log('\n Unable to resize excel columns to fit data',logfile)
-    logging.exception('Got exception on resize excel columns to fit data logged at:' + time.strftime("%I:%M:%S %p", time.localtime()))
-    raise
-    sys.exit()
-
 
 # Calculating run time and printing end statement
 end_time = time.strftime("%I:%M:%S %p", time.localtime())
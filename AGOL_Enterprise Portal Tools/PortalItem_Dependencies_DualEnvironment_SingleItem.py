@@ -2,7 +2,7 @@
 #
 # PortalItem_Dependencies_DualEnvironment_SingleItem.py
 # Created on: 2023-03-23
-# Updated on: 2023-05-16
+# Updated on: 2026-10-18
 # Works in ArcGIS Pro
 #
 # Works with Enterprise GIS & ArcGIS Online
@@ -19,7 +19,10 @@ print("\nLoading python modules, please wait...")
 from arcgis.gis import GIS
 import pandas as pd
 import os,time,sys,datetime,logging
-from openpyxl import load_workbook
+
+# Shared modules folder (dependency index, portal item cache, streaming excel report writer) - Shared_Modules next to this tools folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Portal_Dependency_Index,Portal_Item_Cache,Excel_Report
 
 # For command window run, requests user imput for portal URL (layer URL can be from either portal)
 print("Enter Portal/AGOL URLs below: | Example: https://PORTALNAME.com/arcgis")
@@ -174,7 +177,7 @@ FuncResults = []
 
 
 # Defining function that will gather the information needed for comparison.
-def gather_info(connection, connection_type, item, webapps):
+def gather_info(index, connection_type, item):
 
     # For some reason script won't pull in certain Urls so try and except added to prevent script breaking.
     # If url cant be pulled it will still collect as much as the item info added.
@@ -186,32 +189,8 @@ def gather_info(connection, connection_type, item, webapps):
         item_owner = item_info.owner
         item_type = item_info.type
 
-        # Collects Web maps then return subset of map IDs which contain the service URL we're looking for
-        webmaps = connection.content.search(query='NOT owner: esri', item_type='Web Map', max_items=-1)
-        matches = [m.id for m in webmaps if str(m.get_data()).find(find_url) > -1]
-
-        # Create empty list to populate with results
-        app_list = []
-
-        # Check each web app for matches
-        for w in webapps:
-
-            try:
-                # Get the JSON as a string
-                wdata = str(w.get_data())
-
-                criteria = [
-                    wdata.find(find_url) > -1,  # Check if URL is directly referenced
-                    any([wdata.find(m) > -1 for m in matches])  # Check if any matching maps are in app
-                ]
-
-                # If layer is referenced directly or indirectly, append app to list
-                if any(criteria):
-                    app_list.append(w)
-
-            # Some apps don't have data, so skip them if they throw a TypeError
-            except:
-                continue
+        # Web maps & apps that reference the service URL we're looking for (looked up in the dependency index built once per portal)
+        app_list = index.apps_for(find_url)
 
         if len(app_list) > 0:
             for a in app_list:
@@ -279,6 +258,37 @@ for app in AppList:
 print('\nYou have ' + str(len(PortalApps)) + ' apps in '+Portal+'.' + ' You have ' + str(len(Portal2Apps)) + ' apps in '+Portal2+'.')
 print('    Finished Apps')
 
+# Building dependency index for each portal (one get_data per web map/app - maps/apps unchanged since the last run are read from the saved index)
+try:
+    print('\nBuilding dependency index')
+    write_log('\nBuilding dependency index',logfile)
+    PortalCache = Portal_Item_Cache.ItemCache(os.getcwd()+"\\cache\\"+str(PortalName)+"_Item_Cache.sqlite")
+    PortalIndex = Portal_Dependency_Index.DependencyIndex(os.path.join(ReportDirectory,str(PortalName)+'__Dependency_Index.json'),
+                                                  fetch=lambda item: PortalCache.cached(item, 'data', lambda item: item.get_data()))
+    PortalIndex.crawl(gis.content.search(query='NOT owner: esri', item_type='Web Map', max_items=-1), PortalApps)
+    PortalIndex.save()
+    PortalCache.close()
+    print('    '+Portal+': '+str(PortalIndex.fetched)+' maps/apps read, '+str(PortalIndex.reused)+' unchanged since last run')
+    write_log('    '+Portal+': '+str(PortalIndex.fetched)+' maps/apps read, '+str(PortalIndex.reused)+' unchanged since last run',logfile)
+    print('    '+Portal+': '+PortalCache.summary())
+    write_log('    '+Portal+': '+PortalCache.summary(),logfile)
+    Portal2Cache = Portal_Item_Cache.ItemCache(os.getcwd()+"\\cache\\"+str(Portal2Name)+"_Item_Cache.sqlite")
+    Portal2Index = Portal_Dependency_Index.DependencyIndex(os.path.join(ReportDirectory,str(Portal2Name)+'__Dependency_Index.json'),
+                                                  fetch=lambda item: Portal2Cache.cached(item, 'data', lambda item: item.get_data()))
+    Portal2Index.crawl(gis2.content.search(query='NOT owner: esri', item_type='Web Map', max_items=-1), Portal2Apps)
+    Portal2Index.save()
+    Portal2Cache.close()
+    print('    '+Portal2+': '+str(Portal2Index.fetched)+' maps/apps read, '+str(Portal2Index.reused)+' unchanged since last run')
+    write_log('    '+Portal2+': '+str(Portal2Index.fetched)+' maps/apps read, '+str(Portal2Index.reused)+' unchanged since last run',logfile)
+    print('    '+Portal2+': '+Portal2Cache.summary())
+    write_log('    '+Portal2+': '+Portal2Cache.summary(),logfile)
+except:
+    print('\n Unable to build dependency index')
+    write_log('\n Unable to build dependency index',logfile)
+    logging.exception('Got exception on build dependency index logged at:' + time.strftime("%I:%M:%S %p", time.localtime()))
+    raise
+    sys.exit()
+
 # Running gather_info function through a loop for Portal
 try:
     print('\n****Starting '+Portal+' Items')
@@ -286,7 +296,7 @@ try:
     for i in PortalItems:
         print('Working on ' + str(i.title))
         write_log('Working on ' + str(i.title),logfile)
-        gather_info(gis, Portal, i, PortalApps)
+        gather_info(PortalIndex, Portal, i)
     print('    Finished '+Portal+' Items')
     write_log('    Finished '+Portal+' Items',logfile)
 except:
@@ -303,7 +313,7 @@ try:
     for i in Portal2Items:
         print('Working on ' + str(i.title))
         write_log('Working on ' + str(i.title),logfile)
-        gather_info(gis2, Portal2, i, PortalApps)
+        gather_info(Portal2Index, Portal2, i)
     print('    Finished '+Portal2+' Items')
     write_log('    Finished '+Portal2+' Items',logfile)
 except:
@@ -353,7 +363,9 @@ ExcelOutput = os.path.join(ReportDirectory,str(PortalName)+' - '+str(Portal2Name
 try:
     print('\nExporting to Excel, located at: '+ExcelOutput)
     write_log('\nExporting to Excel, located at: '+ExcelOutput,logfile)
-    new_df.to_excel(ExcelOutput, 'Items', index=False)
+    XLReport = Excel_Report.ReportWriter(ExcelOutput)
+    XLReport.add_frame('Items', new_df)
+    XLReport.close()
 except:
     print('\n Unable to export excel spreadsheet to: '+ExcelOutput)
     write_log('\n Unable to export excel spreadsheet to: '+ExcelOutput,logfile)
@@ -361,32 +373,6 @@ except:
     raise
     sys.exit()
 
-# Access exported excel workbook, and auto-size columns for easier read
-try:
-    print("\n Resizing excel columns to autofit columns")
-    write_log("\n Resizing excel columns to autofit columns",logfile)
-    wb = load_workbook(ExcelOutput)
-    ws = wb['Items']
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(cell.value)
-            except:
-                pass
-        adjusted_width = (max_length + 2) * 1.2
-        ws.column_dimensions[column_letter].width = adjusted_width
-        ws.auto_filter.ref = ws.dimensions
-    wb.save(ExcelOutput)
-except:
-    print('\n Unable to resize excel columns to fit data')
-    write_log('\n Unable to resize excel columns to fit data',logfile)
-    logging.exception('Got exception on resize excel columns to fit data logged at:' + time.strftime("%I:%M:%S %p", time.localtime()))
-    raise
-    sys.exit()
-
 # Calculating run time and printing end statement
 end_time = time.strftime("%I:%M:%S %p", time.localtime())
 elapsed_time = time.time() -start_time
@@ -1,7 +1,7 @@
 # ---------------------------------------------------------------------------
 # PortalItem_InventoryReport_Tool.py
 # Created on: 2024-01-26
-# Updated on: 2024-01-29
+# Updated on: 2026-10-18
 #
 # Author: Phil Baranyai / GIS Analyst
 #
@@ -11,14 +11,17 @@
 #
 # Works with Enterprise GIS & ArcGIS Online
 #
-#
+# Item details (sharing level needs a request per item) are collected in a thread pool (Shared_Modules\Portal_Fetch.py)
 # ---------------------------------------------------------------------------
 print("This tool will load layers and applications (listed in script) from both portal sites (or AGOL if that URL is entered) entered below, then compare them, and export out an excel report to show what dependencies (if any) each layer has to a map/app.")
 print("\nLoading python modules, please wait...")
 from arcgis.gis import GIS
 import pandas as pd
 import os,time,sys,datetime,logging
-from openpyxl import load_workbook
+
+# Shared modules folder (concurrent portal requests, streaming excel report writer) - Shared_Modules next to this tools folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Portal_Fetch,Excel_Report
 
 # Comment out for manual run of script - Used for prompts within command window (Run with ArcGIS Pro)
 print("Enter portal URL below: | Example: https://PORTALNAME.com/arcgis")
@@ -108,50 +111,54 @@ write_log('\nCollecting Item Data...',logfile)
 ItemList = gis.content.search(query='NOT owner: esri*',item_type= '*',max_items=-1)
 PortalItems = []
 
-# Define item information fields, iterate through items in ItemList, append into PortalItems list as dictionary  
+# Define item information fields for one item, returned as a dictionary (runs in the Portal_Fetch thread pool)
+def capture_item(item):
+    # Item info (url comes with the search result - no need to get the item again)
+    item_info = item
+    find_id = item_info.id
+    find_url = item_info.url
+    item_title = item_info.title
+    item_owner = item_info.owner
+    item_type = item_info.type
+    item_created = item_info.created
+    item_created_formatted = datetime.datetime.fromtimestamp(item_created / 1000).strftime("%Y-%m-%d")
+    item_modified = item_info.modified
+    item_modified_formatted = datetime.datetime.fromtimestamp(item_modified / 1000).strftime("%Y-%m-%d")
+    item_viewcount = item_info.numViews
+    item_sharing = item_info.shared_with
+
+    # If item has content status, write it into dictionary, if not, write N/A
+    if hasattr(item, 'content_status'):
+        item_status = item_info.content_status
+    else:
+        item_status = 'N/A'
+
+    return {'Item Name': item_title,
+            'Item Type': item_type,
+            'Item ID': find_id,
+            'Item Url': find_url,
+            'Item Owner': item_owner,
+            'Item Status': item_status,
+            'Item Created Date': item_created_formatted,
+            'Item Last Modified Date': item_modified_formatted,
+            'Item Lifetime View Count': item_viewcount,
+            'Item Sharing Level': item_sharing}
+
+# Capture every item in ItemList (FetchWorkers requests at a time), append into PortalItems list as dictionary
+FetchWorkers = 8
 print('\n')  #<--just adds a carriage return for the on screen print statements for a cleaner look
-for item in ItemList:
-    try:
-        # Item info
-        item_info = item
-        find_id = item_info.id
-        find_url = gis.content.get(find_id).url
-        item_title = item_info.title
-        item_owner = item_info.owner
-        item_type = item_info.type
-        item_created = item_info.created
-        item_created_formatted = datetime.datetime.fromtimestamp(item_created / 1000).strftime("%Y-%m-%d")
-        item_modified = item_info.modified
-        item_modified_formatted = datetime.datetime.fromtimestamp(item_modified / 1000).strftime("%Y-%m-%d")
-        item_viewcount = item_info.numViews
-        item_sharing = item_info.shared_with
-
-        # If item has content status, write it into dictionary, if not, write N/A
-        if hasattr(item, 'content_status'):
-            item_status = item_info.content_status
-        else:
-            item_status = 'N/A'
-
-        PortalItems.append({'Item Name': item_title,
-                            'Item Type': item_type,
-                            'Item ID': find_id,
-                            'Item Url': find_url,
-                            'Item Owner': item_owner,
-                            'Item Status': item_status,
-                            'Item Created Date': item_created_formatted,
-                            'Item Last Modified Date': item_modified_formatted,
-                            'Item Lifetime View Count': item_viewcount,
-                            'Item Sharing Level': item_sharing})
+ItemPool = Portal_Fetch.FetchPool(workers=FetchWorkers)
+for result in ItemPool.map(capture_item, ItemList):
+    if result.ok:
+        PortalItems.append(result.value)
         # Provides a visual indication on screen that it's working
-        print("Captured: {} | {}".format(item_title,item_type))
-                  
-    except (AttributeError, KeyError) as e:
-        print(f"Error capturing item: {e}")
-        continue
-
-    except Exception as e:
-        print(f"Unexpected error capturing item: {e}")
-        continue
+        print("Captured: {} | {}".format(result.value['Item Name'],result.value['Item Type']))
+    elif isinstance(result.error, (AttributeError, KeyError)):
+        print(f"Error capturing item: {result.error}")
+    else:
+        print(f"Unexpected error capturing item: {result.error}")
+print('\n   Item requests: '+ItemPool.summary())
+write_log('\n   Item requests: '+ItemPool.summary(),logfile)
 
 # Provides final item count
 print('\nYou have ' + str(len(PortalItems)) + ' items in '+Portal+' that have been inventoried.')
@@ -201,7 +208,9 @@ except:
 try:
     print('\nExporting to Excel, located at: '+ExcelOutput)
     write_log('\nExporting to Excel, located at: '+ExcelOutput,logfile)
-    new_inventory_df.to_excel(ExcelOutput, 'Items', index=False)
+    XLReport = Excel_Report.ReportWriter(ExcelOutput)
+    XLReport.add_frame('Items', new_inventory_df)
+    XLReport.close()
 except:
     print('\n Unable to export excel spreadsheet to: '+ExcelOutput)
     write_log('\n Unable to export excel spreadsheet to: '+ExcelOutput,logfile)
@@ -209,32 +218,6 @@ except:
     raise
     sys.exit()
 
-# Access exported excel workbook, and auto-size columns for easier read
-try:
-    print("\n Resizing excel columns to autofit columns")
-    write_log("\n Resizing excel columns to autofit columns",logfile)
-    wb = load_workbook(ExcelOutput)
-    ws = wb['Items']
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(cell.value)
-            except:
-                pass
-        adjusted_width = (max_length + 2) * 1.2
-        ws.column_dimensions[column_letter].width = adjusted_width
-        ws.auto_filter.ref = ws.dimensions
-    wb.save(ExcelOutput)
-except:
-    print('\n Unable to resize excel columns to fit data')
-    write_log('\n Unable to resize excel columns to fit data',logfile)
-    logging.exception('Got exception on resize excel columns to fit data logged at:' + time.strftime("%I:%M:%S %p", time.localtime()))
-    raise
-    sys.exit()
-
 # Calculating run time and printing end statement
 end_time = time.strftime("%I:%M:%S %p", time.localtime())
 elapsed_time = time.time() -start_time
@@ -1,7 +1,7 @@
 # ---------------------------------------------------------------------------
 # PortalUser_ExportTool.py
 # Created on: 2023-10-12
-# Updated on: 2023-10-12
+# Updated on: 2026-10-18
 #
 # Author: Phil Baranyai
 #
@@ -14,15 +14,18 @@
 ########  ----> Designed to be run from CMD line
 ########  ----> Right click on .py file and "Run with ArcGIS Pro"
 #
-#
+# User details are collected into columns and the dataframe is built once (Shared_Modules\Portal_Frames.py), then streamed
+# to excel with column widths and filter set as it is written (Shared_Modules\Excel_Report.py)
 # ---------------------------------------------------------------------------
 print("This tool reads from portal URL entered below, lists all users and details, and exports out results an excel report.")
 print("\nLoading python modules, please wait...")
 from arcgis.gis import GIS
 import pandas as pd
 import os,time,sys,datetime,logging
-from openpyxl import load_workbook
-from openpyxl.worksheet.datavalidation import DataValidationList
+
+# Shared modules folder (report dataframes, streaming excel report writer) - Shared_Modules next to this tools folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Portal_Frames,Excel_Report
 
 # Comment out for manual run of script - Used for prompts within command window (Run with ArcGIS Pro)
 print("Enter portal URL below: | Example: https://PORTALNAME.com/arcgis")
@@ -112,11 +115,8 @@ portalusers = gis.users.search(max_users = 3000)
 # Set Excel spreadsheet output name
 ExcelOutput = os.path.join(ReportDirectory,str(PortalName)+'__Portal_User_Members_report__'+str(date)+"_"+str(Time)+'.xlsx')
 
-# Create writer for dataframe to export to Excel
-writer = pd.ExcelWriter(ExcelOutput)
-
-# Create a pandas DataFrame to store the results
-df = pd.DataFrame(columns=['Full Name', 'User Name', 'Email', 'Last Login Date', 'Role','Level','Description', 'Identity Provider','Group Membership'])
+# Create a record collector (one list per column) to store the results
+UserRecords = Portal_Frames.RecordCollector(['Full Name', 'User Name', 'Email', 'Last Login Date', 'Role','Level','Description', 'Identity Provider','Group Membership'])
 print('\n Creating dataframe with column headings')
 write_log('\n Creating dataframe with column headings',logfile)
 
@@ -124,60 +124,37 @@ write_log('\n Creating dataframe with column headings',logfile)
 print("\n Iterating through portal to collect users and details")
 write_log("\n Iterating through group to collect users and details",logfile)
     
-# Create a dataframe with a list of users and descriptions, then save to excel.
+# Collect a list of users and descriptions, then create the dataframe once and save to excel.
 for user in portalusers:
-                      df = df.append({
-                          'Full Name': user.fullName,
-                          'User Name': user.username,
-                          'Email': user.email,
-                          'Last Login Date': user.lastLogin,
-                          'Role': user.role,
-                          'Level': user.level,
-                          'Description': user.description,
-                          'Identity Provider': user.provider,
-                          'Group Membership': user.groups
-                          }, ignore_index=True)
-                      print(str(user.fullName)+' added to dataframe')
-# Change level #s to readable values
-df['Level'].replace('2', 'Creator',inplace=True)
-df['Level'].replace('11', 'Field Worker', inplace = True)
-df['Level'].replace('1', 'Viewer', inplace = True)
-# Calculate from UNIX Epoch time value to readable time (calculate into new column, copy values to original column, remove new column)
-df['Last Login - New']=(pd.to_datetime(df['Last Login Date'],unit='ms'))
-df['Last Login Date'] = df['Last Login - New']
-df = df.drop('Last Login - New',axis=1)
-# New Last Login column is created at end of dataframe, reorganizing columns to original order
-df = df.reindex(columns=['Full Name', 'User Name', 'Email', 'Last Login Date', 'Role','Level','Description', 'Identity Provider','Group Membership'])
+    UserRecords.add({
+        'Full Name': user.fullName,
+        'User Name': user.username,
+        'Email': user.email,
+        'Last Login Date': user.lastLogin,
+        'Role': user.role,
+        'Level': user.level,
+        'Description': user.description,
+        'Identity Provider': user.provider,
+        'Group Membership': user.groups
+        })
+    print(str(user.fullName)+' added to dataframe')
+# Change level #s to readable values and calculate from UNIX Epoch time value to readable time (whole columns at once)
+df = UserRecords.frame(levels='Level', epoch_dates=['Last Login Date'])
 df.sort_values('Full Name')
-df.to_excel(writer, sheet_name='User List', index=False)
-writer.save()
 
-# Access exported excel workbook, and auto-size columns for easier read
+# Exporting dataframe to excel
 try:
-    print("\n Resizing excel columns to autofit columns")
-    write_log("\n Resizing excel columns to autofit columns",logfile)
-    wb = load_workbook(ExcelOutput)
-    for sheet in wb.worksheets:
-        for column in sheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(cell.value)
-                except:
-                    pass
-            adjusted_width = (max_length + 2) * 1.2
-            sheet.column_dimensions[column_letter].width = adjusted_width
-            sheet.data_validations = DataValidationList()
-            sheet.auto_filter.ref = sheet.dimensions
-    wb.save(ExcelOutput)
+    print('\n Exporting to Excel with columns sized to fit')
+    write_log('\n Exporting to Excel with columns sized to fit',logfile)
+    XLReport = Excel_Report.ReportWriter(ExcelOutput)
+    XLReport.add_frame('User List', df)
+    XLReport.close()
     print('\n    Report exported out to: '+ExcelOutput)
     write_log('\n    Report exported out to: '+ExcelOutput,logfile)
 except:
-    print('\n Unable to resize excel columns to fit data')
-    write_log('\n Unable to resize excel columns to fit data',logfile)
-    logging.exception('Got exception on resize excel columns to fit data logged at:' + time.strftime("%I:%M:%S %p", time.localtime()))
+    print('\n Unable to export excel spreadsheet to: '+ExcelOutput)
+    write_log('\n Unable to export excel spreadsheet to: '+ExcelOutput,logfile)
+    logging.exception('Got exception on export excel spreadsheet to: '+ExcelOutput+' logged at:' + time.strftime("%I:%M:%S %p", time.localtime()))
     raise
     sys.exit()
 
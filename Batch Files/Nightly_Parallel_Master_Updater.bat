@@ -0,0 +1,57 @@
+echo. > \\FILELOCATION\GIS\GIS_LOGS\BatchLogs\Nightly_Parallel_Master_Updater_bat.log
+::  Runs the LandRecords, TaxClaim and Miscellaneous master scripts from Manifests\Nightly_Script_Graph.json
+::  Independent scripts run at the same time - each script's own output is in BatchLogs\Nightly_Parallel
+::
+date=date /t
+time=time /t
+set STARTTIME=%TIME%
+::
+Set sharedwrkspce=\\FILELOCATION\GIS\ArcAutomations\Shared_Modules
+::
+Set manifestwrkspce=\\FILELOCATION\GIS\ArcAutomations\Manifests
+::
+Set batLogwrkspce=\\FILELOCATION\GIS\GIS_LOGS\BatchLogs
+::
+Set batLog=%batLogwrkspce%\Nightly_Parallel_Master_Updater_bat.log
+::
+::::::::::::::::::::::: Run Batch Orchestrator (Batch_Orchestrator.py) :::::::::::::::::::::::
+::
+echo _Nightly_Parallel_Master_Updater_bat, %date%, %time% >> %batLog% 
+::
+Set prgLog=%batLogwrkspce%\Nightly_Parallel_Master_Updater_bat.log
+::
+echo Start Running Batch_Orchestrator.py >> %prgLog% 
+call "%PROGRAMFILES%\ArcGIS\Pro\bin\Python\Scripts\propy" %sharedwrkspce%\Batch_Orchestrator.py %manifestwrkspce%\Nightly_Script_Graph.json >> %prgLog%
+::
+echo End Running Batch_Orchestrator.py %date%, %time% >> %prgLog%
+::
+echo _Finish Nightly_Parallel_Master_Updater, %date%, %time% >> %batLog%
+::
+set ENDTIME=%TIME%
+rem Change formatting for the start and end times
+    for /F "tokens=1-4 delims=:.," %%a in ("%STARTTIME%") do (
+       set /A "start=(((%%a*60)+1%%b %% 100)*60+1%%c %% 100)*100+1%%d %% 100"
+    )
+
+    for /F "tokens=1-4 delims=:.," %%a in ("%ENDTIME%") do (
+       set /A "end=(((%%a*60)+1%%b %% 100)*60+1%%c %% 100)*100+1%%d %% 100"
+    )
+
+    rem Calculate the elapsed time by subtracting values
+    set /A elapsed=end-start
+
+    rem Format the results for output
+    set /A hh=elapsed/(60*60*100), rest=elapsed%%(60*60*100), mm=rest/(60*100), rest%%=60*100, ss=rest/100, cc=rest%%100
+    if %hh% lss 10 set hh=0%hh%
+    if %mm% lss 10 set mm=0%mm%
+    if %ss% lss 10 set ss=0%ss%
+    if %cc% lss 10 set cc=0%cc%
+
+    set DURATION=%hh%:%mm%:%ss%.%cc%
+
+    echo Start    : %STARTTIME% >> %prgLog%
+    echo Finish   : %ENDTIME% >> %prgLog%
+    echo          --------------- >> %prgLog%
+    echo Duration : %DURATION% >> %prgLog%
+::
+exit
@@ -0,0 +1,31 @@
+echo. > \\FILELOCATION\GIS\GIS_LOGS\BatchLogs\Warm_Worker_Server_bat.log
+::  Starts the Warm_Worker server (Shared_Modules\Warm_Worker.py) - arcpy and the SDE connections stay
+::  loaded in its worker processes and Batch_Orchestrator sends the nightly scripts to them.
+::  Schedule at startup (before the masters); each script's output is in BatchLogs\Warm_Worker.
+::  Stop with: propy %sharedwrkspce%\Warm_Worker.py stop
+::
+date=date /t
+time=time /t
+::
+Set sharedwrkspce=\\FILELOCATION\GIS\ArcAutomations\Shared_Modules
+::
+Set manifestwrkspce=\\FILELOCATION\GIS\ArcAutomations\Manifests
+::
+Set batLogwrkspce=\\FILELOCATION\GIS\GIS_LOGS\BatchLogs
+::
+Set batLog=%batLogwrkspce%\Warm_Worker_Server_bat.log
+::
+::::::::::::::::::::::: Run Warm Worker server (Warm_Worker.py) :::::::::::::::::::::::
+::
+echo _Warm_Worker_Server_bat, %date%, %time% >> %batLog% 
+::
+Set prgLog=%batLogwrkspce%\Warm_Worker_Server_bat.log
+::
+echo Start Running Warm_Worker.py >> %prgLog% 
+call "%PROGRAMFILES%\ArcGIS\Pro\bin\Python\Scripts\propy" %sharedwrkspce%\Warm_Worker.py --config %manifestwrkspce%\Warm_Worker.json serve >> %prgLog%
+::
+echo End Running Warm_Worker.py %date%, %time% >> %prgLog%
+::
+echo _Finish Warm_Worker_Server, %date%, %time% >> %batLog%
+::
+exit
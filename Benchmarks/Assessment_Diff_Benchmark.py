@@ -0,0 +1,93 @@
+# ---------------------------------------------------------------------------
+# Assessment_Diff_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no arcpy needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares the old Vision_Reconcile_Report steps (copy PARCEL, join the weekly totals,
+#  append everything to the reconcile table, then one cursor pass deleting rows not costed
+#  today and calculating the difference row by row, and a second deleting zero/null
+#  differences - one delete per row) with Assessment_Diff on in-memory tables
+#  (Sync_Engine.MemoryBackend) shaped like VISION.REAL_PROP.PARCEL and VISION_OTHER_TBL.
+#  Both must end with the same rows or the benchmark stops.
+#
+#  Usage:  propy Assessment_Diff_Benchmark.py [parcel count] [share costed today, percent]
+# ---------------------------------------------------------------------------
+
+import datetime,os,random,sys,time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Assessment_Diff,Hash_Join,Sync_Engine
+
+
+def make_tables(backend, parcel_count, percent, today, rng):
+    backend.create_table("PARCEL", Assessment_Diff.PARCEL_FIELDS)
+    backend.create_table("VISION_OTHER_TBL", Assessment_Diff.WEEKLY_FIELDS)
+    parcels, weekly = [], []
+    last_week = datetime.datetime.combine(today - datetime.timedelta(days=7), datetime.time(2))
+    for pid in range(1, parcel_count + 1):
+        total = float(rng.randrange(5000, 400000, 100))
+        costed = rng.random() < percent / 100.0
+        cost_date = datetime.datetime.combine(today, datetime.time(9)) if costed else (None if rng.random() < 0.01 else last_week)
+        current = total + rng.choice([0, 0, 0, 500, -1200]) if costed else total
+        parcels.append([pid, None if rng.random() < 0.002 else current, cost_date])
+        if rng.random() < 0.01:
+            continue                                        # no weekly record (new parcel)
+        weekly.append([pid, "{:03d}".format(pid % 400), "{:02d}".format(pid % 30), "{:03d}".format(pid % 90), total, last_week])
+    backend.load_rows("PARCEL", Assessment_Diff.PARCEL_FIELDS, parcels)
+    backend.load_rows("VISION_OTHER_TBL", Assessment_Diff.WEEKLY_FIELDS, weekly)
+
+
+def old_report(backend, today):
+    # TableToTable + join + Append + UpdateCursor (delete/calculate) + UpdateCursor (delete zero/null)
+    backend.create_table("PARCEL_TBL_TEMP", ["PRC_PID", "PRC_TTL_15", "PRC_COST_D"])
+    backend.load_rows("PARCEL_TBL_TEMP", ["PRC_PID", "PRC_TTL_15", "PRC_COST_D"],
+                      [values for row_id, values in backend.read_rows("PARCEL", Assessment_Diff.PARCEL_FIELDS)])
+    Hash_Join.join_field(backend, "PARCEL_TBL_TEMP", "PRC_PID", "VISION_OTHER_TBL", "REM_PID",
+                         "REM_PRCL_STATUS_DATE;REM_MBLU_MAP;REM_MBLU_BLOCK;REM_MBLU_LOT;PRC_TTL_ASSESS")
+    backend.create_table("RECONCILE", Assessment_Diff.OUTPUT_FIELDS)
+    backend.load_rows("RECONCILE", Assessment_Diff.OUTPUT_FIELDS[:-1],
+                      [values for row_id, values in backend.read_rows("PARCEL_TBL_TEMP", ["PRC_PID", "REM_MBLU_MAP", "REM_MBLU_BLOCK", "REM_MBLU_LOT",
+                                                                                            "PRC_TTL_ASSESS", "REM_PRCL_STATUS_DATE", "PRC_TTL_15", "PRC_COST_D"])])
+    fields = ["WEEKLY_ASSESSMENT_TOTAL", "CURRENT_ASSESSMENT_TOTAL", "TOTAL_ASSESSMENT_DIFFERENCE", "CURRENT_ASSESSMENT_DATE"]
+    for row_id, row in list(backend.read_rows("RECONCILE", fields)):
+        if row[3] is None or row[3].date() != today:
+            backend.apply_changes("RECONCILE", fields, [], {}, set([row_id]))
+        elif row[1] is not None:
+            row[2] = row[1] - row[0] if row[0] is not None else row[1]
+            backend.apply_changes("RECONCILE", fields, [], {row_id: row}, set())
+    for row_id, row in list(backend.read_rows("RECONCILE", ["TOTAL_ASSESSMENT_DIFFERENCE"])):
+        if row[0] == 0 or row[0] is None:
+            backend.apply_changes("RECONCILE", ["TOTAL_ASSESSMENT_DIFFERENCE"], [], {}, set([row_id]))
+    return [values for row_id, values in backend.read_rows("RECONCILE", Assessment_Diff.OUTPUT_FIELDS)]
+
+
+def main():
+    parcel_count = int(sys.argv[1]) if len(sys.argv) > 1 else 60000
+    percent = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    today = datetime.date(2026, 10, 18)
+    backend = Sync_Engine.MemoryBackend()
+    make_tables(backend, parcel_count, percent, today, random.Random(1901))
+
+    started = time.time()
+    old_rows = old_report(backend, today)
+    old_seconds = time.time() - started
+
+    started = time.time()
+    result = Assessment_Diff.assessment_differences(backend, "PARCEL", "VISION_OTHER_TBL", today)
+    new_seconds = time.time() - started
+    if sorted(old_rows, key=lambda row: row[0]) != sorted(result.rows, key=lambda row: row[0]):
+        raise RuntimeError("Rows differ: old {} rows, Assessment_Diff {} rows".format(len(old_rows), len(result.rows)))
+
+    print ("============================================================================")
+    print ("Assessment difference benchmark: {} parcels, ~{}% costed today".format(parcel_count, percent))
+    print ("  Copy + join + append + two delete/update cursor passes : {:.2f} seconds ({} rows)".format(old_seconds, len(old_rows)))
+    print ("  Assessment_Diff (arrays, nonzero rows only)            : {:.2f} seconds ({} rows)".format(new_seconds, len(result.rows)))
+    print ("  " + result.summary())
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
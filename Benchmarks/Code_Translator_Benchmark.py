@@ -0,0 +1,143 @@
+# ---------------------------------------------------------------------------
+# Code_Translator_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no arcpy needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares the old code conversions (parallel lists, "if row[0] in codes: values[codes.index(row[0])]",
+#  one cursor pass per field) with Code_Translator (dicts from Manifests\Code_Tables.json, every
+#  field in one pass, only changed rows written back) on in-memory tables (Sync_Engine.MemoryBackend):
+#
+#   AddressPoint_NG911   - St_PreDir, St_PosDir, St_PosTyp (three passes before, one now)
+#   LANDUSE_PARCELS_WKSP - LND_USE_CODE -> six planning/LBCS fields (every row written before),
+#                          run twice - the second run finds the codes already translated
+#
+#  Both must end with the same rows or the benchmark stops.  Written rows are counted as
+#  the updateRow calls a real cursor would make.
+#
+#  Usage:  propy Code_Translator_Benchmark.py [address points] [land use parcels]
+# ---------------------------------------------------------------------------
+
+import json,os,random,sys,time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Code_Translator,Sync_Engine
+
+CODE_TABLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Manifests", "Code_Tables.json")
+STREET_FIELDS = ["St_PreDir", "St_PosDir", "St_PosTyp"]
+LAND_USE_FIELDS = ["LND_USE_CODE", "LAND_USE_CATEGORY", "LBCS_ACTIVITY", "LBCS_FUNCTION", "LBCS_STRUCTURE", "LBCS_SITE_CHARACTER", "LBCS_OWNERSHIP"]
+
+
+def parallel_lists(definition):
+    # The old script layout: code list + value list(s) (null code first when the table has one)
+    codes = ([None] if "null" in definition else []) + list(definition["codes"])
+    values = ([definition["null"]] if "null" in definition else []) + list(definition["codes"].values())
+    if "columns" in definition:
+        return codes, [[row[column] for row in values] for column in range(len(definition["columns"]))]
+    return codes, values
+
+
+def make_tables(backend, definitions, address_count, parcel_count, rng):
+    directionals = list(definitions["Directionals_NG911"]["codes"]) + [None] * 30 + ["X"]
+    post_types = list(definitions["PostType_NG911"]["codes"]) + [None, "BYP"]
+    backend.create_table("AddressPoint_NG911", STREET_FIELDS)
+    backend.load_rows("AddressPoint_NG911", STREET_FIELDS, [[rng.choice(directionals), rng.choice(directionals), rng.choice(post_types)]
+                                                            for number in range(address_count)])
+    land_use = list(definitions["AST_LandUse_LBCS"]["codes"]) + [None, "XXXX"]
+    backend.create_table("LANDUSE_PARCELS_WKSP", LAND_USE_FIELDS)
+    backend.load_rows("LANDUSE_PARCELS_WKSP", LAND_USE_FIELDS, [[rng.choice(land_use)] + [None] * 6 for number in range(parcel_count)])
+
+
+def copy_table(backend, dataset, fields, copy):
+    backend.create_table(copy, fields)
+    backend.load_rows(copy, fields, [values for row_id, values in backend.read_rows(dataset, fields)])
+
+
+def old_streets(backend, dataset, definitions):
+    written = 0
+    for field, table in zip(STREET_FIELDS, ["Directionals_NG911", "Directionals_NG911", "PostType_NG911"]):
+        codes, values = parallel_lists(definitions[table])
+        updates = {}
+        for row_id, row in backend.read_rows(dataset, [field]):
+            if row[0] in codes:
+                row[0] = values[codes.index(row[0])]
+                updates[row_id] = row
+        backend.apply_changes(dataset, [field], [], updates, set())
+        written += len(updates)
+    return written
+
+
+def old_land_use(backend, dataset, definitions):
+    codes, columns = parallel_lists(definitions["AST_LandUse_LBCS"])
+    updates = {}
+    for row_id, row in backend.read_rows(dataset, LAND_USE_FIELDS):
+        for position, values in enumerate(columns, 1):
+            if row[0] in codes:
+                row[position] = values[codes.index(row[0])]
+        updates[row_id] = row
+    backend.apply_changes(dataset, LAND_USE_FIELDS, [], updates, set())
+    return len(updates)
+
+
+def new_translate(backend, dataset, tables, translations):
+    # Translator.apply with a MemoryBackend read/write in place of the UpdateCursor
+    translator = Code_Translator.Translator(tables, translations)
+    started = time.time()
+    updates = {}
+    for row_id, row in backend.read_rows(dataset, translator.fields):
+        if translator.translate(row):
+            updates[row_id] = row
+    backend.apply_changes(dataset, translator.fields, [], updates, set())
+    translator.result.seconds = time.time() - started
+    return translator.result
+
+
+def rows(backend, dataset, fields):
+    return [values for row_id, values in backend.read_rows(dataset, fields)]
+
+
+def main():
+    address_count = int(sys.argv[1]) if len(sys.argv) > 1 else 150000
+    parcel_count = int(sys.argv[2]) if len(sys.argv) > 2 else 60000
+    with open(CODE_TABLES) as tables_file:
+        definitions = json.load(tables_file)
+    tables = Code_Translator.load_tables(CODE_TABLES)
+    backend = Sync_Engine.MemoryBackend()
+    make_tables(backend, definitions, address_count, parcel_count, random.Random(2001))
+    copy_table(backend, "AddressPoint_NG911", STREET_FIELDS, "AddressPoint_OLD")
+    copy_table(backend, "LANDUSE_PARCELS_WKSP", LAND_USE_FIELDS, "LANDUSE_OLD")
+
+    lines = []
+    started = time.time()
+    old_written = old_streets(backend, "AddressPoint_OLD", definitions)
+    old_seconds = time.time() - started
+    result = new_translate(backend, "AddressPoint_NG911", tables, [(field, table) for field, table in
+                                                                   zip(STREET_FIELDS, ["Directionals_NG911", "Directionals_NG911", "PostType_NG911"])])
+    if rows(backend, "AddressPoint_OLD", STREET_FIELDS) != rows(backend, "AddressPoint_NG911", STREET_FIELDS):
+        raise RuntimeError("Address point rows differ after translation")
+    lines.append(("Address points, 3 fields", old_seconds, old_written, result))
+
+    for label in ("Land use parcels, run 1", "Land use parcels, run 2"):
+        started = time.time()
+        old_written = old_land_use(backend, "LANDUSE_OLD", definitions)
+        old_seconds = time.time() - started
+        result = new_translate(backend, "LANDUSE_PARCELS_WKSP", tables, [("LND_USE_CODE", "AST_LandUse_LBCS")])
+        if rows(backend, "LANDUSE_OLD", LAND_USE_FIELDS) != rows(backend, "LANDUSE_PARCELS_WKSP", LAND_USE_FIELDS):
+            raise RuntimeError("{}: land use rows differ after translation".format(label))
+        lines.append((label, old_seconds, old_written, result))
+
+    print ("============================================================================")
+    print ("Code translation benchmark: {} address points, {} land use parcels".format(address_count, parcel_count))
+    for label, old_seconds, old_written, result in lines:
+        print ("  {:<26} list.index {:.2f}s ({:>6} rows written) | Code_Translator {:.2f}s ({:>6} rows written)".format(
+            label, old_seconds, old_written, result.seconds, result.updated))
+        print ("    " + result.summary())
+        if result.unmapped_summary():
+            print ("    unmapped: " + result.unmapped_summary())
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+# ---------------------------------------------------------------------------
+# County_Data.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no arcpy needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Synthetic county shaped like our schemas, for benchmarking the ETL stages without
+#  \\FILELOCATION or ccsde.  The county is a grid of blocks (10 parcels each, streets between
+#  them), so every layer lines up the way the real ones do:
+#
+#   TAX_PARCELS / TAX_PARCELS_AIR - PID, CAMA_PIN, land district/municipality, land use code,
+#                                   Landex URL type (a few PID 0 right-of-way polygons)
+#   ADDRESS_POINTS                - SSAP fields (Site_NGUID, number, NG911 street parts, ESN),
+#                                   one per parcel plus a second unit on some
+#   STREET_CENTERLINE             - one segment per block face: NG911 street parts, address
+#                                   ranges, OneWay, speed, road class, FT/TF_RoutingCost
+#   ESZ_ALL                       - emergency service zones (fire, EMS, QRS, police, rescue
+#                                   departments covering groups of zones, an edge of the
+#                                   neighbouring county)
+#   REALMAST                      - VISION records by REM_PID (some inactive, some with no parcel)
+#   VISION_PARCEL / VISION_WEEKLY - current and weekly assessment totals (some costed today)
+#
+#  Codes (land districts, land use, road classes, directionals, post types, police ORIs) come
+#  from Manifests\Code_Tables.json.  Geometry is WKT (Sync_Engine SQLite/memory backends).  The
+#  same parcel count and seed always give the same data.  About 1.1 address points, 0.2
+#  centerline segments and 0.002 ESZ polygons per parcel - 1,000 to 1,000,000 parcels works.
+#
+#  Usage:
+#
+#   import County_Data
+#   county = County_Data.County(100000, seed=42039)
+#   county.write(Sync_Engine.SQLiteBackend(path))
+#
+#   propy County_Data.py <parcel count> <SQLite file> [--seed 42039]
+# ---------------------------------------------------------------------------
+
+import argparse,datetime,json,math,os,random,sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Sync_Engine
+
+CODE_TABLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Manifests", "Code_Tables.json")
+
+SHAPE = Sync_Engine.SHAPE_TOKEN
+
+PARCEL_FIELDS = ["PID", "CAMA_PIN", "LND_DSTRCT", "SEC_MUNI_NAME", "LND_USE_CODE", "LANDEX_URL_TYPE", "LANDEX_URL", "ACREAGE", SHAPE]
+ADDRESS_FIELDS = ["Site_NGUID", "Add_Number", "Unit", "St_PreDir", "St_Name", "St_PosTyp", "St_PosDir", "Post_Comm", "ESN", "PID",
+                  "DateUpdate", SHAPE]
+CENTERLINE_FIELDS = ["Seg_NGUID", "St_PreDir", "St_Name", "St_PosTyp", "St_PosDir", "FromAddr_L", "ToAddr_L", "FromAddr_R", "ToAddr_R",
+                     "OneWay", "SpeedLimit", "Road_Class", "FT_RoutingCost", "TF_RoutingCost", "Post_Comm", "DateUpdate", SHAPE]
+ESZ_FIELDS = ["ESZ", "ESN", "FIRE_DEPT", "FIRE_FDID", "FIRE_NUM", "EMS_DEPT", "EMS_NUM", "EMS_EMSID", "QRS_DEPT", "QRS_NUM", "QRS_FDID",
+              "POLICE_DEPT", "POLICE_DISTRICT", "POLICE_ORI", "POLICE_ID", "RESCUE_DEPT", "RESCUE_NUM", "RESCUE_FDID", "COUNTY_NAME",
+              "COUNTY_FIPS", "DiscrpAgID", "STATE", SHAPE]
+VISION_FIELDS = ["REM_PID", "REM_PARCEL_STATUS", "REM_PIN", "REM_MBLU_MAP", "REM_MBLU_BLOCK", "REM_MBLU_LOT", "REM_OWN_NAME", "REM_PRCL_LOCN",
+                 "SLH_BOOK", "SLH_PAGE", "LND_USE_CODE", "LND_DSTRCT", "MUNI_NAME", "PRC_TTL_ASSESS", "REM_PRCL_STATUS_DATE"]
+ASSESSMENT_FIELDS = ["PRC_PID", "PRC_TTL_ASSESS", "PRC_COST_DATE"]
+WEEKLY_FIELDS = ["REM_PID", "REM_MBLU_MAP", "REM_MBLU_BLOCK", "REM_MBLU_LOT", "PRC_TTL_ASSESS", "REM_PRCL_STATUS_DATE"]
+
+# Dataset -> (fields, key field, text field changed by daily_edits)
+DATASETS = {
+    "TAX_PARCELS": (PARCEL_FIELDS, "PID", "LND_USE_CODE"),
+    "TAX_PARCELS_AIR": (PARCEL_FIELDS, "PID", "LND_USE_CODE"),
+    "ADDRESS_POINTS": (ADDRESS_FIELDS, "Site_NGUID", "Post_Comm"),
+    "STREET_CENTERLINE": (CENTERLINE_FIELDS, "Seg_NGUID", "St_Name"),
+    "ESZ_ALL": (ESZ_FIELDS, "ESZ", "FIRE_DEPT"),
+    "REALMAST": (VISION_FIELDS, "REM_PID", "REM_OWN_NAME"),
+    "VISION_PARCEL": (ASSESSMENT_FIELDS, "PRC_PID", "PRC_TTL_ASSESS"),
+    "VISION_WEEKLY": (WEEKLY_FIELDS, "REM_PID", "PRC_TTL_ASSESS"),
+}
+
+# Grid (state plane feet): blocks of 5 x 2 parcels with a road between blocks
+ORIGIN_X = 1240000.0
+ORIGIN_Y = 330000.0
+PARCEL_WIDTH = 120.0
+PARCEL_DEPTH = 150.0
+ROAD_WIDTH = 60.0
+PARCELS_PER_BLOCK = 10
+ZONE_BLOCKS = 8                  # blocks on a side of one ESZ
+
+# Date the data is "pulled" on (Vision_Reconcile_Report compares against it)
+TODAY = datetime.date(2026, 10, 18)
+
+STREET_NAMES = ["MAIN", "PARK", "STATE", "WATER", "CHESTNUT", "ARCH", "MARKET", "LIBERTY", "SPRING", "CHURCH", "MILL", "HIGH",
+                "PINE", "MAPLE", "WALNUT", "CENTER", "RIDGE", "LAKE", "FRENCH CREEK", "CONNEAUT", "OIL CREEK", "SUGAR LAKE"]
+OWNER_NAMES = ["SMITH", "JOHNSON", "MILLER", "BROWN", "YODER", "SHAFFER", "MCGILL", "HOTCHKISS", "DEVORE", "KLECKNER", "PORTER"]
+
+
+def ordinal(number):
+    suffix = "TH" if 10 <= number % 100 <= 20 else {1: "ST", 2: "ND", 3: "RD"}.get(number % 10, "TH")
+    return "{}{}".format(number, suffix)
+
+
+def _rectangle(x, y, width, height):
+    return "POLYGON (({0:.2f} {1:.2f}, {2:.2f} {1:.2f}, {2:.2f} {3:.2f}, {0:.2f} {3:.2f}, {0:.2f} {1:.2f}))".format(x, y, x + width, y + height)
+
+
+class County(object):
+    """Synthetic county of a given parcel count - every layer is generated row by row (lists of values in *_FIELDS order)."""
+
+    def __init__(self, parcels, seed=42039, code_tables=CODE_TABLES):
+        self.parcels = parcels
+        self.seed = seed
+        self.blocks = int(math.ceil(parcels / float(PARCELS_PER_BLOCK)))
+        self.grid = max(1, int(math.ceil(math.sqrt(self.blocks))))
+        self.block_width = 5 * PARCEL_WIDTH
+        self.block_height = 2 * PARCEL_DEPTH
+        self.zones = int(math.ceil(self.grid / float(ZONE_BLOCKS)))
+        with open(code_tables) as tables_file:
+            tables = json.load(tables_file)
+        self.districts = sorted(tables["Land_District_Muni_Name"]["codes"].items())
+        self.land_uses = sorted(code for code in tables["AST_LandUse_LBCS"]["codes"] if code)
+        self.road_classes = list(tables["Crawford_Road_Class_NT"]["codes"])
+        self.directionals = list(tables["Directionals_NG911"]["codes"])
+        self.post_types = list(tables["PostType_NG911"]["codes"])
+        self.police = list(tables["Police_Dept_ORI"]["codes"].items())
+
+    def _random(self, name):
+        # One generator per layer, so a layer's rows don't depend on which layers were generated first
+        return random.Random("{}-{}-{}".format(self.seed, self.parcels, name))
+
+    def _block_origin(self, column, row):
+        return (ORIGIN_X + column * (self.block_width + ROAD_WIDTH), ORIGIN_Y + row * (self.block_height + ROAD_WIDTH))
+
+    def _district(self, column, row):
+        # Land districts are bands of blocks (like the townships)
+        band = max(1, int(math.ceil(self.grid / math.sqrt(len(self.districts)))))
+        return self.districts[((row // band) * 7 + column // band) % len(self.districts)]
+
+    def _horizontal_street(self, row):
+        return ordinal(row + 1), "ST"
+
+    def _vertical_street(self, column):
+        return STREET_NAMES[column % len(STREET_NAMES)], self.post_types[column % len(self.post_types)]
+
+    def _parcel_cells(self):
+        # (pid, column, row, position in block) for every parcel, in PID order
+        for number in range(self.parcels):
+            block = number // PARCELS_PER_BLOCK
+            yield number + 1, block % self.grid, block // self.grid, number % PARCELS_PER_BLOCK
+
+    def _parcel_shape(self, column, row, position):
+        x, y = self._block_origin(column, row)
+        return x + (position % 5) * PARCEL_WIDTH, y + (position // 5) * PARCEL_DEPTH
+
+    def _pin(self, pid, column, row, position):
+        district = self._district(column, row)[0]
+        return "{}{:03d}".format(district, column % 1000), "{:03d}".format(row % 1000), "{:04d}".format(position + 1)
+
+    def air_pid(self, pid):
+        """True for the PIDs kept in TAX_PARCELS_AIR (condo air rights)."""
+        return pid % 40 == 0
+
+    def tax_parcels(self, air=False):
+        rng = self._random("parcels" + ("_air" if air else ""))
+        for pid, column, row, position in self._parcel_cells():
+            if self.air_pid(pid) != air:
+                continue
+            x, y = self._parcel_shape(column, row, position)
+            district, muni = self._district(column, row)
+            road = not air and rng.random() < 0.001                # right-of-way/water polygons carry PID 0
+            map_number, block, lot = self._pin(pid, column, row, position)
+            url_type = None if road else rng.choice(["UPI", "UPI", "UPI", "Book_Page", None])
+            yield [0 if road else pid, None if road else "{}-{}-{}".format(map_number, block, lot), district, muni,
+                   None if road else rng.choice(self.land_uses), url_type, None, round(PARCEL_WIDTH * PARCEL_DEPTH / 43560.0, 3),
+                   _rectangle(x, y, PARCEL_WIDTH, PARCEL_DEPTH)]
+
+    def address_points(self):
+        rng = self._random("address_points")
+        stamp = TODAY - datetime.timedelta(days=400)
+        for pid, column, row, position in self._parcel_cells():
+            x, y = self._parcel_shape(column, row, position)
+            facing_north = position >= 5
+            name, post_type = self._horizontal_street(row + 1 if facing_north else row)
+            number = 100 * (column + 1) + 2 * (position % 5) + (0 if facing_north else 1)
+            muni = self._district(column, row)[1]
+            pre_dir = rng.choice(self.directionals) if rng.random() < 0.15 else None
+            post_dir = rng.choice(self.directionals) if rng.random() < 0.03 else None
+            esn = 100 + (column // ZONE_BLOCKS) * self.zones + row // ZONE_BLOCKS
+            units = 2 if rng.random() < 0.1 else 1
+            for unit in range(units):
+                updated = stamp + datetime.timedelta(days=rng.randint(0, 399))
+                yield ["{{{:08d}-{:04d}}}@crawfordcountypa.net".format(pid, unit), number, "APT {}".format(unit + 1) if units > 1 else None,
+                       pre_dir, name, post_type, post_dir, muni, esn, pid, updated.isoformat(),
+                       "POINT ({:.2f} {:.2f})".format(x + PARCEL_WIDTH / 2, y + (PARCEL_DEPTH - 15 if facing_north else 15))]
+
+    def street_centerline(self):
+        rng = self._random("street_centerline")
+        segment = 0
+        stamp = TODAY - datetime.timedelta(days=800)
+        for horizontal in (True, False):
+            for line in range(self.grid + 1):
+                for span in range(self.grid):
+                    segment += 1
+                    if horizontal:
+                        name, post_type = self._horizontal_street(line)
+                        x, y = self._block_origin(span, line)
+                        x, y = x - ROAD_WIDTH / 2, y - ROAD_WIDTH / 2
+                        length = self.block_width + ROAD_WIDTH
+                        shape = "LINESTRING ({:.2f} {:.2f}, {:.2f} {:.2f})".format(x, y, x + length, y)
+                    else:
+                        name, post_type = self._vertical_street(line)
+                        x, y = self._block_origin(line, span)
+                        x, y = x - ROAD_WIDTH / 2, y - ROAD_WIDTH / 2
+                        length = self.block_height + ROAD_WIDTH
+                        shape = "LINESTRING ({:.2f} {:.2f}, {:.2f} {:.2f})".format(x, y, x, y + length)
+                    low = 100 * (span + 1)
+                    speed = rng.choice([25, 25, 35, 35, 45, 55])
+                    one_way = rng.choice([None, "B", "B", "B", "B", "B", "FT", "TF"]) if rng.random() < 0.4 else "B"
+                    minutes = round(length / 5280.0 / speed * 60, 4)
+                    column, row = (span, min(line, self.grid - 1)) if horizontal else (min(line, self.grid - 1), span)
+                    updated = stamp + datetime.timedelta(days=rng.randint(0, 799))
+                    yield ["{{{:08d}}}@crawfordcountypa.net".format(segment), rng.choice(self.directionals) if rng.random() < 0.15 else None,
+                           name, post_type, rng.choice(self.directionals) if rng.random() < 0.03 else None, low + 1, low + 9, low, low + 8,
+                           one_way, speed, rng.choice(self.road_classes), None if one_way == "TF" else minutes,
+                           None if one_way == "FT" else minutes, self._district(column, row)[1], updated.isoformat(), shape]
+
+    def esz(self):
+        rng = self._random("esz")
+        size_x = ZONE_BLOCKS * (self.block_width + ROAD_WIDTH)
+        size_y = ZONE_BLOCKS * (self.block_height + ROAD_WIDTH)
+        zone = 0
+        for column in range(self.zones + 1):
+            neighbour = column == self.zones                        # strip of the neighbouring county (filtered out by COUNTY_FIPS)
+            for row in range(self.zones):
+                zone += 1
+                fire = (column // 3) * 100 + row // 3
+                ems = (column // 4) * 100 + row // 4
+                qrs = (column // 2) * 100 + row // 2
+                police_name, police_ori = self.police[((column // 5) * 7 + row // 5) % len(self.police)]
+                rescue = (column // 6) * 100 + row // 6
+                x = ORIGIN_X - ROAD_WIDTH / 2 + column * size_x
+                y = ORIGIN_Y - ROAD_WIDTH / 2 + row * size_y
+                yield [zone, 100 + column * self.zones + row, "FIRE COMPANY {}".format(fire), "{:05d}".format(fire), "{}".format(fire % 100),
+                       "AMBULANCE SERVICE {}".format(ems), "{}".format(ems % 100), "EMS{:05d}".format(ems),
+                       "QRS {}".format(qrs) if rng.random() < 0.7 else None, "{}".format(qrs % 100), "{:05d}".format(qrs),
+                       police_name, "DISTRICT {}".format(row // 5 + 1), police_ori, (column // 5) * 100 + row // 5,
+                       "RESCUE {}".format(rescue), "{}".format(rescue % 100), "{:05d}".format(rescue),
+                       "ERIE" if neighbour else "CRAWFORD", 42049 if neighbour else 42039, "PA", "PA", _rectangle(x, y, size_x, size_y)]
+
+    def _vision_rows(self):
+        # (pid, column, row, position) of every VISION record: parcels (most of them) + PIDs with no parcel
+        for cell in self._parcel_cells():
+            yield cell
+        for extra in range(max(1, self.parcels // 300)):
+            yield self.parcels + extra + 1, extra % self.grid, (extra // self.grid) % self.grid, extra % PARCELS_PER_BLOCK
+
+    def realmast(self):
+        rng = self._random("realmast")
+        for pid, column, row, position in self._vision_rows():
+            if rng.random() < 0.01:
+                continue                                            # parcel with no VISION record
+            district, muni = self._district(column, row)
+            map_number, block, lot = self._pin(pid, column, row, position)
+            status = "I" if rng.random() < 0.01 else "A"
+            changed = TODAY - datetime.timedelta(days=rng.randint(0, 3000))
+            yield [pid, status, "{}-{}-{}".format(map_number, block, lot), map_number, block, lot,
+                   "{} {}".format(rng.choice(OWNER_NAMES), rng.choice(OWNER_NAMES)), "{} {}".format(100 * (column + 1), ordinal(row + 1)),
+                   rng.randint(100, 1500), rng.randint(1, 999), rng.choice(self.land_uses), district, muni,
+                   rng.randrange(5000, 400000, 10), changed.isoformat()]
+
+    def _assessments(self):
+        # (pid, current total, cost date, weekly total or None) - about 2% costed today, most of those changed
+        rng = self._random("assessments")
+        for pid, column, row, position in self._vision_rows():
+            total = rng.randrange(5000, 400000, 10)
+            if rng.random() < 0.02:
+                weekly = None if rng.random() < 0.05 else (total if rng.random() < 0.4 else total - rng.randrange(-20000, 20000, 10))
+                yield pid, column, row, position, total, TODAY.isoformat(), weekly
+            else:
+                yield pid, column, row, position, total, (TODAY - datetime.timedelta(days=rng.randint(1, 3000))).isoformat(), total
+
+    def vision_parcel(self):
+        for pid, column, row, position, total, cost_date, weekly in self._assessments():
+            yield [pid, total, cost_date]
+
+    def vision_weekly(self):
+        for pid, column, row, position, total, cost_date, weekly in self._assessments():
+            if weekly is None:
+                continue
+            map_number, block, lot = self._pin(pid, column, row, position)
+            yield [pid, map_number, block, lot, weekly, cost_date]
+
+    def rows(self, dataset):
+        """Rows of one dataset (a generator)."""
+        return {"TAX_PARCELS": lambda: self.tax_parcels(),
+                "TAX_PARCELS_AIR": lambda: self.tax_parcels(air=True),
+                "ADDRESS_POINTS": self.address_points,
+                "STREET_CENTERLINE": self.street_centerline,
+                "ESZ_ALL": self.esz,
+                "REALMAST": self.realmast,
+                "VISION_PARCEL": self.vision_parcel,
+                "VISION_WEEKLY": self.vision_weekly}[dataset]()
+
+    def write(self, backend, datasets=None):
+        """Create and load the datasets in a backend (SQLiteBackend/MemoryBackend) - {dataset: row count}."""
+        counts = {}
+        for dataset in datasets or DATASETS:
+            fields = DATASETS[dataset][0]
+            counter = [0]
+            backend.create_table(dataset, fields)
+            backend.load_rows(dataset, fields, _counted(self.rows(dataset), counter))
+            counts[dataset] = counter[0]
+        return counts
+
+
+def _counted(rows, counter):
+    # Rows are streamed into the backend (a million parcels never sit in a list)
+    for row in rows:
+        counter[0] += 1
+        yield row
+
+
+def copy_dataset(backend, dataset, copy):
+    """Copy a SQLiteBackend table (rows and columns) to a new table."""
+    with backend.connection:
+        backend.connection.execute('DROP TABLE IF EXISTS "{}"'.format(copy))
+        backend.connection.execute('CREATE TABLE "{}" AS SELECT * FROM "{}"'.format(copy, dataset))
+
+
+def daily_edits(backend, dataset, count, seed=0, table=None):
+    """A day of edits: half updated, a quarter deleted, a quarter inserted (new keys) - (updates, deletes, inserts).
+
+    dataset - DATASETS name (fields, key, edited field)
+    table   - table edited, when it is a copy of the dataset (default: the dataset itself)
+    """
+    fields, key_field, edit_field = DATASETS[dataset]
+    table = table or dataset
+    rng = random.Random("{}-{}-edits".format(seed, dataset))
+    rows = dict((row_id, list(values)) for row_id, values in backend.read_rows(table, fields))
+    if not rows:
+        return 0, 0, 0
+    chosen = rng.sample(sorted(rows), min(count, len(rows)))
+    update_ids = chosen[:len(chosen) // 2]
+    delete_ids = set(chosen[len(chosen) // 2:len(chosen) // 2 + len(chosen) // 4])
+    edit = fields.index(edit_field)
+    key = fields.index(key_field)
+    updates = {}
+    for row_id in update_ids:
+        values = rows[row_id]
+        values[edit] = values[edit] + 10 if isinstance(values[edit], (int, float)) else "EDITED {}".format(row_id)
+        updates[row_id] = values
+    last_key = max(values[key] for values in rows.values() if isinstance(values[key], int)) if isinstance(rows[chosen[0]][key], int) else None
+    inserts = []
+    for number in range(len(chosen) - len(update_ids) - len(delete_ids)):
+        values = list(rows[chosen[number]])
+        if last_key is not None:
+            values[key] = last_key + number + 1
+        else:
+            values[key] = "{}-NEW{}".format(values[key], number)
+        inserts.append(values)
+    backend.apply_changes(table, fields, inserts, updates, delete_ids)
+    return len(updates), len(delete_ids), len(inserts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic county to a SQLite database.")
+    parser.add_argument("parcels", type=int, help="parcel count (1000 to 1000000)")
+    parser.add_argument("database", help="SQLite file (tables are replaced)")
+    parser.add_argument("--seed", type=int, default=42039)
+    args = parser.parse_args()
+    county = County(args.parcels, args.seed)
+    counts = county.write(Sync_Engine.SQLiteBackend(args.database))
+    for dataset, count in counts.items():
+        print ("{:<20} {:>9} rows".format(dataset, count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+# ---------------------------------------------------------------------------
+# ETL_Benchmark_Suite.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no arcpy needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Times the ETL stages against a synthetic county (County_Data) in a local SQLite database
+#  (Sync_Engine.SQLiteBackend), so changes to the shared modules can be measured without
+#  running the production batch against \\FILELOCATION and ccsde:
+#
+#   Spreader        - Sync_Engine sync of address points, centerlines, tax parcels and ESZ
+#                     after a day of edits; the DeleteRows + Append reload still used by the
+#                     other spreaders
+#   Parcel_Builder  - VISION join (Hash_Join) and Landex URLs (Landex_URLs)
+#   Reports         - Active_GIS_Missing_VISION (PID_Reconcile), Active_VISION_Missing_GIS
+#                     (PID_Match, no geocoder), Vision_Reconcile_Report (Assessment_Diff)
+#   PublicSafety    - the five ESZ_ALL coverage dissolves, one read each and all from one read
+#                     (Multi_Dissolve, in this process - WKT parts are collected, not unioned)
+#
+#  Every stage runs --repeat times on fresh copies of its tables (copies are made before the
+#  clock starts) and reports rows, best/median/worst wall seconds and median CPU seconds.  One
+#  more run under tracemalloc gives each stage's peak python memory (--no-memory skips it, it
+#  slows the run down).  The data only depends on the size and --seed, so runs are repeatable.
+#
+#  --json writes the results to a file; --metrics adds the medians to a Run_Metrics database
+#  as a run of "ETL_Benchmark_Suite", so propy Run_Metrics.py --db <file> regressions compares
+#  a benchmark run with the earlier ones.
+#
+#  Usage:  propy ETL_Benchmark_Suite.py [parcel counts ...] [--repeat 3] [--stages sync,report]
+#                                       [--folder keep_here] [--json results.json] [--metrics metrics.sqlite]
+# ---------------------------------------------------------------------------
+
+import argparse,gc,json,os,platform,shutil,sys,tempfile,time,tracemalloc
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import County_Data,Sync_Engine
+import Assessment_Diff,Hash_Join,Landex_URLs,Multi_Dissolve,PID_Match,PID_Reconcile,Run_Metrics
+
+import pandas as pd
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+# Rows edited in a spreader source per day (share of the rows, at least MIN_EDITS)
+EDIT_SHARE = 0.002
+MIN_EDITS = 10
+
+# PublicSafety_Data_Spreader coverage layers dissolved from ESZ_ALL
+COVERAGE_OUTPUTS = [Multi_Dissolve.Output("FIRE", "FIRE_DEPT_COVERAGE", ["FIRE_DEPT", "FIRE_FDID", "FIRE_NUM", "COUNTY_NAME", "COUNTY_FIPS", "DiscrpAgID", "STATE"]),
+                    Multi_Dissolve.Output("BLS", "BLS_COVERAGE", ["EMS_DEPT", "EMS_NUM", "EMS_EMSID", "COUNTY_NAME", "COUNTY_FIPS", "DiscrpAgID", "STATE"],
+                                          only={"COUNTY_FIPS": 42039}),
+                    Multi_Dissolve.Output("QRS", "QRS_DEPT_COVERAGE", ["QRS_FDID", "COUNTY_NAME", "COUNTY_FIPS", "QRS_DEPT", "QRS_NUM", "DiscrpAgID", "STATE"],
+                                          only={"COUNTY_FIPS": 42039}),
+                    Multi_Dissolve.Output("POLICE", "POLICE_DEPT_COVERAGE", ["POLICE_DEPT", "POLICE_DISTRICT", "POLICE_ORI", "COUNTY_NAME", "COUNTY_FIPS", "POLICE_ID", "DiscrpAgID", "STATE"],
+                                          ["POLICE_DEPT", "COUNTY_NAME", "COUNTY_FIPS", "POLICE_ID", "DiscrpAgID", "STATE"], only={"COUNTY_FIPS": 42039}),
+                    Multi_Dissolve.Output("RESCUE", "RESCUE_DEPT_COVERAGE", ["RESCUE_DEPT", "RESCUE_NUM", "COUNTY_NAME", "COUNTY_FIPS", "RESCUE_FDID", "DiscrpAgID", "STATE"],
+                                          only={"COUNTY_FIPS": 42039})]
+
+
+class Stage(object):
+    """One benchmarked stage.
+
+    setup(backend)       - untimed, before every run (fresh table copies); returns what run gets
+    run(backend, state)  - the timed work; returns the rows it produced or changed
+    """
+
+    def __init__(self, group, name, run, setup=None):
+        self.group = group
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+    @property
+    def label(self):
+        return "{} - {}".format(self.group, self.name)
+
+
+class StageTiming(object):
+    """Timings of one stage at one size."""
+
+    def __init__(self, stage, size):
+        self.stage = stage
+        self.size = size
+        self.rows = None
+        self.wall = []
+        self.cpu = []
+        self.traced_mb = None
+
+    @property
+    def median(self):
+        return sorted(self.wall)[len(self.wall) // 2]
+
+    @property
+    def median_cpu(self):
+        return sorted(self.cpu)[len(self.cpu) // 2]
+
+    def as_dict(self):
+        return {"size": self.size, "group": self.stage.group, "stage": self.stage.name, "rows": self.rows,
+                "best": round(min(self.wall), 4), "median": round(self.median, 4), "worst": round(max(self.wall), 4),
+                "cpu": round(self.median_cpu, 4), "traced_mb": self.traced_mb, "runs": len(self.wall)}
+
+
+# Spreader stages
+
+def sync_stage(dataset, edits, seed):
+    fields, key_field, edit_field = County_Data.DATASETS[dataset]
+    def setup(backend):
+        County_Data.copy_dataset(backend, dataset, dataset + "_SOURCE")
+        County_Data.copy_dataset(backend, dataset, dataset + "_TARGET")
+        count = max(MIN_EDITS, int(edits(dataset) * EDIT_SHARE))
+        County_Data.daily_edits(backend, dataset, count, seed, dataset + "_SOURCE")
+    def run(backend, state):
+        return Sync_Engine.sync_dataset(backend, dataset + "_SOURCE", dataset + "_TARGET", key_field, fields).touched
+    return Stage("Spreader", "{} sync".format(dataset), run, setup)
+
+
+def reload_stage(dataset):
+    fields = County_Data.DATASETS[dataset][0]
+    def setup(backend):
+        County_Data.copy_dataset(backend, dataset, dataset + "_RELOAD")
+    def run(backend, state):
+        # DeleteRows + Append: every target row deleted, every source row inserted
+        rows = [values for row_id, values in backend.read_rows(dataset, fields)]
+        existing = set(row_id for row_id, values in backend.read_rows(dataset + "_RELOAD", fields[:1]))
+        backend.apply_changes(dataset + "_RELOAD", fields, rows, {}, existing)
+        return len(rows)
+    return Stage("Spreader", "{} delete + append".format(dataset), run, setup)
+
+
+# Parcel_Builder stages
+
+def _joined_parcels(backend):
+    County_Data.copy_dataset(backend, "TAX_PARCELS", "TAX_PARCELS_JOINED")
+
+
+def vision_join(backend, state):
+    return Hash_Join.join_field(backend, "TAX_PARCELS_JOINED", "PID", "REALMAST", "REM_PID").matched
+
+
+def landex_setup(backend):
+    _joined_parcels(backend)
+    vision_join(backend, None)
+
+
+def landex_urls(backend, state):
+    # Landex_URLs.update_landex_urls with the backend in place of the arcpy cursors
+    fields = [Landex_URLs.URL_FIELD] + Landex_URLs.VALUE_FIELDS + ["LANDEX_URL_TYPE"]
+    rows = list(backend.read_rows("TAX_PARCELS_JOINED", fields))
+    frame = pd.DataFrame([values for row_id, values in rows], columns=fields, index=[row_id for row_id, values in rows], dtype=object)
+    urls = Landex_URLs.changed_urls(frame, "LANDEX_URL_TYPE")
+    backend.apply_changes("TAX_PARCELS_JOINED", [Landex_URLs.URL_FIELD], [], dict((row_id, [url]) for row_id, url in urls.items()), set())
+    return len(urls)
+
+
+# Report stages
+
+def gis_missing_vision(backend, state):
+    gis_fields = ["PID", "CAMA_PIN", "SEC_MUNI_NAME", "LND_USE_CODE"]
+    result = PID_Reconcile.reconcile(backend, [PID_Reconcile.Source("TAX_PARCELS", "PID", gis_fields, "PID > 0", "Tax Parcels"),
+                                               PID_Reconcile.Source("TAX_PARCELS_AIR", "PID", gis_fields, "PID > 0", "Air Parcels")],
+                                     [PID_Reconcile.Source("REALMAST", "REM_PID", County_Data.VISION_FIELDS, "REM_PARCEL_STATUS = 'A'", "REALMAST")])
+    return len(result.left_only) + len(result.right_only)
+
+
+def vision_missing_gis(folder):
+    def run(backend, state):
+        parcels = PID_Match.ParcelPIDs.read(backend, ["TAX_PARCELS", "TAX_PARCELS_AIR"])
+        cache = PID_Match.MatchCache(os.path.join(folder, "PID_Match.json"))
+        return len(cache.match(PID_Match.record_pids(backend, "REALMAST", "REM_PID", "REM_PARCEL_STATUS = 'A'"), parcels).unmatched)
+    return run
+
+
+def assessment_differences(backend, state):
+    return len(Assessment_Diff.assessment_differences(backend, "VISION_PARCEL", "VISION_WEEKLY", County_Data.TODAY).rows)
+
+
+# PublicSafety stages
+
+def coverage_separately(backend, state):
+    # One read of ESZ_ALL per coverage layer, like the five Dissolve_management calls
+    return sum(len(Multi_Dissolve.dissolve(backend, "ESZ_ALL", [output], workers=1).rows[output.name]) for output in COVERAGE_OUTPUTS)
+
+
+def coverage_one_read(backend, state):
+    result = Multi_Dissolve.dissolve(backend, "ESZ_ALL", COVERAGE_OUTPUTS, workers=1)
+    return sum(len(rows) for rows in result.rows.values())
+
+
+def build_stages(counts, seed, folder):
+    edits = lambda dataset: counts.get(dataset, 0)
+    stages = [sync_stage(dataset, edits, seed) for dataset in ("ADDRESS_POINTS", "STREET_CENTERLINE", "TAX_PARCELS", "ESZ_ALL")]
+    stages.append(reload_stage("TAX_PARCELS"))
+    stages.append(Stage("Parcel_Builder", "VISION join (Hash_Join)", vision_join, _joined_parcels))
+    stages.append(Stage("Parcel_Builder", "Landex URLs", landex_urls, landex_setup))
+    stages.append(Stage("Reports", "Active_GIS_Missing_VISION (PID_Reconcile)", gis_missing_vision))
+    stages.append(Stage("Reports", "Active_VISION_Missing_GIS (PID_Match)", vision_missing_gis(folder)))
+    stages.append(Stage("Reports", "Vision_Reconcile_Report (Assessment_Diff)", assessment_differences))
+    stages.append(Stage("PublicSafety", "ESZ coverage, five dissolves", coverage_separately))
+    stages.append(Stage("PublicSafety", "ESZ coverage, one read (Multi_Dissolve)", coverage_one_read))
+    return stages
+
+
+def measure(stage, backend, size, repeat, memory):
+    timing = StageTiming(stage, size)
+    for number in range(repeat):
+        state = stage.setup(backend) if stage.setup else None
+        gc.collect()
+        started = time.perf_counter()
+        cpu_started = time.thread_time()
+        rows = stage.run(backend, state)
+        timing.wall.append(time.perf_counter() - started)
+        timing.cpu.append(time.thread_time() - cpu_started)
+        if timing.rows is not None and rows != timing.rows:
+            raise RuntimeError("{} gave {} rows, {} on an earlier run".format(stage.label, rows, timing.rows))
+        timing.rows = rows
+    if memory:
+        state = stage.setup(backend) if stage.setup else None
+        gc.collect()
+        tracemalloc.start()
+        try:
+            stage.run(backend, state)
+            timing.traced_mb = round(tracemalloc.get_traced_memory()[1] / 1048576.0, 1)
+        finally:
+            tracemalloc.stop()
+    return timing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the ETL stages against a synthetic county in SQLite.")
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES, help="parcel counts (default {})".format(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage")
+    parser.add_argument("--seed", type=int, default=42039)
+    parser.add_argument("--stages", help="comma separated parts of stage names to run (sync,landex,report,coverage)")
+    parser.add_argument("--folder", help="keep the SQLite databases here (default: temp folder, removed)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--metrics", help="add the medians to this Run_Metrics database")
+    args = parser.parse_args()
+    folder = args.folder or tempfile.mkdtemp()
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    filters = [part.strip().lower() for part in args.stages.split(",")] if args.stages else None
+
+    results = []
+    print ("============================================================================")
+    print ("ETL benchmark suite: {} parcels, {} runs per stage, seed {} (python {}, {})".format(
+        ", ".join(str(size) for size in args.sizes), args.repeat, args.seed, platform.python_version(), platform.platform()))
+    for size in args.sizes:
+        database = os.path.join(folder, "County_{}.sqlite".format(size))
+        if os.path.exists(database):
+            os.remove(database)
+        backend = Sync_Engine.SQLiteBackend(database)
+        started = time.perf_counter()
+        counts = County_Data.County(size, args.seed).write(backend)
+        print ("\n {} parcels - county generated in {:.2f} seconds ({})".format(
+            size, time.perf_counter() - started, ", ".join("{} {}".format(dataset, count) for dataset, count in counts.items())))
+        print ("   {:<58} {:>8} {:>9} {:>9} {:>9} {:>9} {:>10}".format("Stage", "Rows", "Best", "Median", "Worst", "CPU", "Traced MB"))
+        for stage in build_stages(counts, args.seed, folder):
+            if filters and not any(part in stage.label.lower() for part in filters):
+                continue
+            timing = measure(stage, backend, size, args.repeat, not args.no_memory)
+            results.append(timing)
+            print ("   {:<58} {:>8} {:>9.3f} {:>9.3f} {:>9.3f} {:>9.3f} {:>10}".format(
+                stage.label, timing.rows, min(timing.wall), timing.median, max(timing.wall), timing.median_cpu,
+                "-" if timing.traced_mb is None else timing.traced_mb))
+        backend.connection.close()
+        if not args.folder:
+            os.remove(database)
+    print ("\n Peak process memory: {} MB".format(Run_Metrics.peak_memory_mb()))
+    print ("============================================================================")
+    if not args.folder:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump({"seed": args.seed, "repeat": args.repeat, "python": platform.python_version(), "platform": platform.platform(),
+                       "results": [timing.as_dict() for timing in results]}, json_file, indent=2)
+    if args.metrics:
+        store = Run_Metrics.MetricsStore("ETL_Benchmark_Suite", args.metrics)
+        for timing in results:
+            store.add_stage("{} ({} parcels)".format(timing.stage.label, timing.size), timing.median, rows_out=timing.rows,
+                            cpu_seconds=timing.median_cpu, peak_memory=timing.traced_mb)
+        store.finish()
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# ---------------------------------------------------------------------------
+# Excel_Report_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 with pandas/openpyxl - no SDE/portal needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares the reports' old excel export (pandas to_excel, load_workbook, walk every cell
+#  to size the columns, save again) with Excel_Report.ReportWriter on a synthetic SDE
+#  inventory sized like a large geodatabase.  Reports time and peak python memory of each
+#  (peak measured in a second run under tracemalloc) and checks both workbooks hold the
+#  same cells, filter and text column widths.
+#
+#  Usage:  propy Excel_Report_Benchmark.py [rows]
+# ---------------------------------------------------------------------------
+
+import os,random,sys,tempfile,time,tracemalloc
+
+import pandas as pd
+from openpyxl import load_workbook
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Excel_Report
+
+
+def synthetic_inventory(rows, rng):
+    kinds = ["Feature Class within Dataset", "Standalone Feature Class", "Tables", "Rasters", "Relationship Class"]
+    return pd.DataFrame({
+        "Item": ["DB{} | GIS.{}_{}".format(rng.randint(1, 9), rng.choice(["PARCELS", "ROADS", "HYDRANTS", "ADDRESS_POINTS"]), number) for number in range(rows)],
+        "Type": [rng.choice(kinds) for number in range(rows)],
+        "Records": [rng.randint(0, 500000) for number in range(rows)],
+        "Description": [rng.choice([None, "x" * rng.randint(5, 120)]) for number in range(rows)],
+        "Edited": pd.to_datetime([rng.randint(1500000000000, 1790000000000) for number in range(rows)], unit="ms")})
+
+
+def old_export(path, frame):
+    # SDE_Inventory_Tool before Excel_Report
+    frame.to_excel(path, sheet_name="Items", index=False)
+    wb = load_workbook(path)
+    ws = wb["Items"]
+    for column in ws.columns:
+        max_length = 0
+        column_letter = column[0].column_letter
+        for cell in column:
+            try:
+                if len(str(cell.value)) > max_length:
+                    max_length = len(cell.value)
+            except:
+                pass
+        adjusted_width = (max_length + 2) * 1.2
+        ws.column_dimensions[column_letter].width = adjusted_width
+        ws.auto_filter.ref = ws.dimensions
+    wb.save(path)
+
+
+def new_export(path, frame):
+    report = Excel_Report.ReportWriter(path)
+    report.add_frame("Items", frame)
+    report.close()
+
+
+def measured(function, *args):
+    # Timed on its own, then run again under tracemalloc for the peak (tracing slows python down)
+    started = time.time()
+    function(*args)
+    seconds = time.time() - started
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / (1024.0 * 1024.0)
+
+
+def contents(path):
+    workbook = load_workbook(path, read_only=True)
+    sheet = workbook["Items"]
+    return [tuple(row) for row in sheet.iter_rows(values_only=True)]
+
+
+def widths(path):
+    sheet = load_workbook(path)["Items"]
+    return dict((letter, round(dimension.width, 1)) for letter, dimension in sheet.column_dimensions.items()), sheet.auto_filter.ref
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rng = random.Random(2718)
+    frame = synthetic_inventory(rows, rng)
+    folder = tempfile.mkdtemp()
+    old_path = os.path.join(folder, "old.xlsx")
+    new_path = os.path.join(folder, "new.xlsx")
+
+    old_seconds, old_peak = measured(old_export, old_path, frame)
+    new_seconds, new_peak = measured(new_export, new_path, frame)
+    if contents(old_path) != contents(new_path):
+        raise RuntimeError("Old and new exports wrote different cells")
+    old_widths, new_widths = widths(old_path), widths(new_path)
+    # The old sizing skipped non-text cells (len() of a number/date fails), ReportWriter sizes them too
+    text_columns = ["A", "B", "D"]
+    if [old_widths[0][letter] for letter in text_columns] != [new_widths[0][letter] for letter in text_columns] or old_widths[1] != new_widths[1]:
+        raise RuntimeError("Column widths/filter differ: {} / {}".format(old_widths, new_widths))
+
+    print ("============================================================================")
+    print ("Excel report benchmark: {} rows x {} columns (cells identical)".format(rows, len(frame.columns)))
+    print ("  to_excel + load_workbook resize : {:.2f} seconds, peak {:.0f} MB".format(old_seconds, old_peak))
+    print ("  Excel_Report.ReportWriter       : {:.2f} seconds, peak {:.0f} MB".format(new_seconds, new_peak))
+    print ("  Widths old {}".format(old_widths[0]))
+    print ("  Widths new {}".format(new_widths[0]))
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# ---------------------------------------------------------------------------
+# Field_Map_Registry_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no arcpy needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Times the per-run field map work for a spreader with 30+ Append calls: compiling and
+#  checking every mapping from the schemas (first run / schema changed) against reusing the
+#  compiled cache keyed by schema hash.  Schemas are in-memory stand-ins shaped like the
+#  tax parcel feature classes (~110 fields), so only the registry itself is measured.
+#
+#  Usage:  propy Field_Map_Registry_Benchmark.py [mappings] [fields]
+# ---------------------------------------------------------------------------
+
+import json,os,random,sys,tempfile,time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Field_Map_Registry
+
+
+def make_schema(field_count, rng):
+    fields = [{"name": "OBJECTID", "type": "OID"}]
+    for number in range(field_count):
+        field_type = rng.choice(["String", "String", "String", "Integer", "Double", "Date"])
+        fields.append({"name": "FIELD_{}".format(number), "type": field_type, "alias": "Field {}".format(number),
+                       "length": 50 if field_type == "String" else 8, "precision": 0, "scale": 0, "nullable": True,
+                       "editable": True, "required": False})
+    return fields
+
+
+def run(definitions_path, schemas, mappings):
+    started = time.time()
+    field_maps = Field_Map_Registry.FieldMapRegistry(definitions_path, describe=lambda dataset: schemas[dataset])
+    for number in range(mappings):
+        field_maps.field_map("Mapping_{}".format(number), "SOURCE_{}".format(number), "TARGET_{}".format(number))
+    return time.time() - started, field_maps
+
+
+def main():
+    mappings = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    field_count = int(sys.argv[2]) if len(sys.argv) > 2 else 110
+    rng = random.Random(42039)
+
+    workspace = tempfile.mkdtemp()
+    definitions_path = os.path.join(workspace, "Field_Maps.json")
+    schemas = {}
+    definitions = {}
+    for number in range(mappings):
+        schema = make_schema(field_count, rng)
+        schemas["SOURCE_{}".format(number)] = [dict(field) for field in schema]
+        schemas["TARGET_{}".format(number)] = schema
+        schemas["SOURCE_{}".format(number)][1]["name"] = "RENAMED_0"
+        definitions["Mapping_{}".format(number)] = {"renames": {"FIELD_0": "RENAMED_0"}}
+    with open(definitions_path, "w") as definitions_file:
+        json.dump(definitions, definitions_file)
+
+    compile_seconds, first = run(definitions_path, schemas, mappings)
+    cached_seconds, second = run(definitions_path, schemas, mappings)
+    schemas["TARGET_0"].append({"name": "NEW_FIELD", "type": "String", "length": 10, "nullable": True})
+    changed_seconds, third = run(definitions_path, schemas, mappings)
+
+    print ("============================================================================")
+    print ("Field map registry benchmark: {} mappings x {} fields (cache at {})".format(mappings, field_count, workspace))
+    print ("  Compile + check all : {:.3f} seconds ({} compiled)".format(compile_seconds, first.regenerated))
+    print ("  Cached              : {:.3f} seconds ({} hits)".format(cached_seconds, second.hits))
+    print ("  One schema changed  : {:.3f} seconds ({} hits, {} regenerated)".format(changed_seconds, third.hits, third.regenerated))
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
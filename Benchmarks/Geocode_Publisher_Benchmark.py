@@ -0,0 +1,101 @@
+# ---------------------------------------------------------------------------
+# Geocode_Publisher_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no server needed, staging and uploads are simulated)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares Locator_Rebuilder's old publishing (draft, stage and upload all 10 geocode services
+#  one after another) with Geocode_Publisher on synthetic locator files: staging and uploads
+#  sleep for a random duration (scaled by the second argument) and staging writes a fake .sd.
+#
+#   night 1 - no published hashes yet: every service is staged (concurrently) and uploaded
+#   night 2 - one participant locator rewritten: only the services using it are republished
+#   night 3 - nothing changed: nothing is staged or uploaded
+#
+#  Usage:  propy Geocode_Publisher_Benchmark.py [workers] [seconds per stage/upload, average]
+# ---------------------------------------------------------------------------
+
+import os,random,sys,tempfile,time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import Geocode_Publisher
+
+# Service -> participant locators (shaped like the Locator_Rebuilder composites)
+SERVICES = {"CC_Address_Search": ["ADDR_HSESTREET_CC", "ADDR_OldAdd_CC", "TaxParcel_ADDR1_CC", "AirParcels_ADDR1_CC"],
+            "CC_Name_Locator": ["ADDR_Name_CC", "TaxParcel_Name_CC", "AirParcels_Name_CC"],
+            "CC_Parcel_Locator": ["TaxParcel_PID_CC", "TaxParcel_UPI_CC", "AirParcels_PID_CC"],
+            "CC_Roads_Locator": ["Roads_Name_CC", "Roads_RouteNumber_CC"],
+            "Crawford_Address_Search": ["ADDR_HSESTREET_Pub", "ADDR_OldAdd_Pub", "TaxParcel_ADDR1_Pub", "AirParcels_ADDR1_Pub"],
+            "Crawford_Cemeteries_Locator": [],
+            "Crawford_Landmarks_Locator": [],
+            "Crawford_Name_Locator": ["ADDR_Name_Pub", "TaxParcel_Name_Pub", "AirParcels_Name_Pub"],
+            "Crawford_Parcel_Locator": ["TaxParcel_PID_Pub", "TaxParcel_UPI_Pub", "AirParcels_PID_Pub"],
+            "Crawford_Roads_Locator": ["Roads_Name_Pub", "Roads_RouteNumber_Pub"]}
+
+# Simulated durations, set by main() (module level so the staging workers see them through the arguments)
+UPLOAD_SECONDS = {}
+
+
+def simulated_stage(name, locator, summary, tags, settings, connection, folder):
+    # Same arguments as Geocode_Publisher.stage_service; the stage time rides in the summary
+    time.sleep(float(summary))
+    with open(os.path.join(folder, name + ".sd"), "wb") as sd:
+        sd.write(os.urandom(1024))
+    return {"rows": None, "message": ""}
+
+
+def simulated_upload(sd, connection):
+    time.sleep(UPLOAD_SECONDS[os.path.basename(sd)[:-3]])
+
+
+def write_locator(folder, name, rng):
+    for extension in (".loc", ".loz"):
+        with open(os.path.join(folder, name + extension), "wb") as locator_file:
+            locator_file.write(bytes(rng.getrandbits(8) for number in range(4096)))
+    return os.path.join(folder, name + ".loc")
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    average = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+    rng = random.Random(1604)
+    folder = tempfile.mkdtemp()
+    services = []
+    serial_seconds = 0.0
+    for name, participants in SERVICES.items():
+        stage_seconds = rng.uniform(0.5, 1.5) * average
+        UPLOAD_SECONDS[name] = rng.uniform(0.5, 1.5) * average
+        serial_seconds += stage_seconds + UPLOAD_SECONDS[name]
+        paths = [write_locator(folder, name, rng)] + [write_locator(folder, participant, rng) for participant in participants]
+        services.append(Geocode_Publisher.GeocodeService(name, paths[0], "{:.3f}".format(stage_seconds), "", inputs=paths))
+
+    lines = []
+    cache = os.path.join(folder, "Publish_Cache")
+    for label, change in (("night 1 (nothing published yet)", None), ("night 2 (TaxParcel_Name_CC rebuilt)", "TaxParcel_Name_CC"),
+                          ("night 3 (nothing changed)", None)):
+        if change:
+            write_locator(folder, change, rng)
+        publisher = Geocode_Publisher.GeocodePublisher(cache, "server.ags", lambda line: None, workers,
+                                                       stage_function="Geocode_Publisher_Benchmark:simulated_stage", upload=simulated_upload)
+        started = time.time()
+        result = publisher.publish(services)
+        if not result.succeeded:
+            raise RuntimeError("Simulated publishing failed: {}".format(result.failed))
+        lines.append((label, result, time.time() - started))
+    if lines[1][1].published != ["CC_Name_Locator"] or lines[2][1].published:
+        raise RuntimeError("Republished {} / {}".format(lines[1][1].published, lines[2][1].published))
+
+    print ("============================================================================")
+    print ("Geocode publishing benchmark: {} services, {} staging workers".format(len(services), workers))
+    print ("  Old (stage + upload every service, one after another): ~{:.2f} seconds every night".format(serial_seconds))
+    for label, result, seconds in lines:
+        print ("  {:<38} published {:>2}, unchanged {:>2} | staging {:.2f}s, total {:.2f}s".format(
+            label, len(result.published), len(result.unchanged), result.stage_seconds, seconds))
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# ---------------------------------------------------------------------------
+# Hash_Join_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no arcpy needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares a JoinField-style join (add the fields, then look the join table up for every
+#  target row) against Hash_Join.join_field on a SQLite stand-in shaped like Tax_Parcels_Joined
+#  and VISIDATA.  Some parcels have no VISION record and some VISION keys repeat, so both the
+#  unmatched and the first-match paths are exercised.  Both joins must give the same values -
+#  the benchmark stops if they don't.
+#
+#  Usage:  propy Hash_Join_Benchmark.py [parcel count] [joined field count]
+# ---------------------------------------------------------------------------
+
+import os,random,sys,tempfile,time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Hash_Join,Sync_Engine
+
+TARGET_FIELDS = ["PID", "PIN", "MUNI_NAME", "GIS_ACRES"]
+
+
+def make_tables(backend, parcel_count, field_count, rng):
+    vision_fields = ["REM_PID"] + ["VISION_{:02d}".format(number) for number in range(field_count - 2)] + ["MUNI_NAME"]
+    backend.create_table("TARGET_JOINFIELD", TARGET_FIELDS)
+    backend.create_table("TARGET_HASHJOIN", TARGET_FIELDS)
+    backend.create_table("VISIDATA", vision_fields)
+    parcels = [[float(number), "{:012d}".format(number), "MEADVILLE", rng.random() * 40] for number in range(1, parcel_count + 1)]
+    backend.load_rows("TARGET_JOINFIELD", TARGET_FIELDS, parcels)
+    backend.load_rows("TARGET_HASHJOIN", TARGET_FIELDS, parcels)
+    vision = []
+    for number in range(1, parcel_count + 1):
+        if rng.random() < 0.02:
+            continue                                        # parcel with no VISION record
+        copies = 2 if rng.random() < 0.01 else 1            # repeated VISION key (first row joins)
+        for copy in range(copies):
+            vision.append([number] + ["{}-{}-{}".format(number, field, copy) for field in range(field_count - 2)] + ["TOWN {}".format(copy)])
+    rng.shuffle(vision)
+    backend.load_rows("VISIDATA", vision_fields, vision)
+    return vision_fields
+
+
+def joinfield_equivalent(backend, fields, names):
+    # Add the fields, then one indexed lookup per target row per field (first VISION row by rowid)
+    connection = backend.connection
+    backend.add_fields("TARGET_JOINFIELD", "VISIDATA", fields, names)
+    connection.execute('CREATE INDEX IF NOT EXISTS VISIDATA_REM_PID ON VISIDATA (REM_PID)')
+    with connection:
+        for field, name in zip(fields, names):
+            connection.execute('UPDATE TARGET_JOINFIELD SET "{}" = (SELECT "{}" FROM VISIDATA WHERE REM_PID = TARGET_JOINFIELD.PID '
+                               'ORDER BY rowid LIMIT 1)'.format(name, field))
+
+
+def main():
+    parcel_count = int(sys.argv[1]) if len(sys.argv) > 1 else 40000
+    field_count = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    rng = random.Random(42039)
+    folder = tempfile.mkdtemp()
+    backend = Sync_Engine.SQLiteBackend(os.path.join(folder, "Hash_Join_Benchmark.sqlite"))
+    vision_fields = make_tables(backend, parcel_count, field_count, rng)
+    names = Hash_Join.output_names(TARGET_FIELDS, vision_fields)
+
+    started = time.time()
+    joinfield_equivalent(backend, vision_fields, names)
+    joinfield_seconds = time.time() - started
+
+    result = Hash_Join.join_field(backend, "TARGET_HASHJOIN", "PID", "VISIDATA", "REM_PID")
+
+    expected = dict(backend.read_rows("TARGET_JOINFIELD", TARGET_FIELDS + names))
+    joined = dict(backend.read_rows("TARGET_HASHJOIN", TARGET_FIELDS + names))
+    for row_id, values in expected.items():
+        if list(values) != list(joined[row_id]):
+            raise RuntimeError("Join mismatch on row {}: {} / {}".format(row_id, values, joined[row_id]))
+    try:
+        Hash_Join.join_field(backend, "TARGET_HASHJOIN", "PID", "VISIDATA", "REM_PID", ["VISION_00"], mode="one_to_one")
+        raise RuntimeError("one_to_one join did not stop on a repeated key")
+    except Hash_Join.JoinError:
+        pass
+
+    print ("============================================================================")
+    print ("Hash join benchmark: {} parcels, {} VISION fields ({} joined as {})".format(parcel_count, len(vision_fields), "MUNI_NAME", result.fields["MUNI_NAME"]))
+    print ("  JoinField-style lookup : {:.3f} seconds".format(joinfield_seconds))
+    print ("  Hash_Join              : {:.3f} seconds".format(result.seconds))
+    print ("  " + result.summary())
+    print ("============================================================================")
+    backend.connection.close()
+
+
+if __name__ == "__main__":
+    main()
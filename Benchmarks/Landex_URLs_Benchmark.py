@@ -0,0 +1,93 @@
+# ---------------------------------------------------------------------------
+# Landex_URLs_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 with pandas - no arcpy needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares the old Parcel_Builder LANDEX_URL loop (check the URL type twice per row,
+#  updateRow for every parcel) against Landex_URLs.changed_urls on a synthetic parcel
+#  table.  Rows are plain lists standing in for cursor rows; updateRow calls are counted.
+#  Both paths must produce the same URLs - the benchmark stops if they don't.  On SDE the
+#  time goes into the updateRow calls, so compare those counts as well as the seconds.
+#
+#  Usage:  propy Landex_URLs_Benchmark.py [parcel count]
+# ---------------------------------------------------------------------------
+
+import os,random,sys,time
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Landex_URLs
+
+CHOICE_FIELD = "LANDEX_URL_TYPE"
+FIELDS = [Landex_URLs.URL_FIELD] + Landex_URLs.VALUE_FIELDS + [CHOICE_FIELD]
+
+
+def make_rows(parcel_count, rng):
+    rows = []
+    for number in range(parcel_count):
+        pid = None if rng.random() < 0.01 else number + 1
+        choice = rng.choice(["Book_Page", "Book_Page", "UPI", None])
+        rows.append([None, str(rng.randint(100, 900)), str(rng.randint(1, 999)), "{:02d}".format(rng.randint(1, 99)),
+                     "{:03d}".format(rng.randint(1, 999)), "{:04d}".format(rng.randint(1, 9999)), pid, choice])
+    return rows
+
+
+def cursor_loop(rows):
+    # The old UpdateCursor body, with updateRow counted instead of written
+    updates = 0
+    for row in rows:
+        if row[6] == None:
+            continue
+        if (row[7] == 'Book_Page' and row[6] > 0):
+            row[0] = Landex_URLs.BOOK_PAGE_URL.format(row[1], row[2])
+            updates += 1
+        if row[6] == None:
+            continue
+        if (row[7] == 'UPI' and row[6] > 0):
+            row[0] = Landex_URLs.UPI_URL.format(row[3], row[4], row[5], row[6])
+            updates += 1
+    return updates
+
+
+def main():
+    parcel_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rng = random.Random(42039)
+    rows = make_rows(parcel_count, rng)
+
+    started = time.time()
+    frame = pd.DataFrame([list(row) for row in rows], columns=FIELDS, dtype=object)
+    frame.index.name = "OID"
+    first_urls = Landex_URLs.changed_urls(frame, CHOICE_FIELD)
+    vectorized_seconds = time.time() - started
+
+    loop_rows = [list(row) for row in rows]
+    started = time.time()
+    loop_updates = cursor_loop(loop_rows)
+    loop_seconds = time.time() - started
+
+    for oid, row in enumerate(loop_rows):
+        if row[0] != first_urls.get(oid, None):
+            raise RuntimeError("URL mismatch on row {}: {} / {}".format(oid, row[0], first_urls.get(oid)))
+
+    # Second night: URLs already in place, a few parcels re-typed
+    frame.loc[list(first_urls), Landex_URLs.URL_FIELD] = list(first_urls.values())
+    for oid in rng.sample(list(first_urls), 25):
+        frame.at[oid, CHOICE_FIELD] = "UPI" if frame.at[oid, CHOICE_FIELD] == "Book_Page" else "Book_Page"
+    started = time.time()
+    second_urls = Landex_URLs.changed_urls(frame, CHOICE_FIELD)
+    second_seconds = time.time() - started
+
+    print ("============================================================================")
+    print ("Landex URL benchmark: {} parcels".format(parcel_count))
+    print ("  Cursor loop        : {:.3f} seconds, {} updateRow calls".format(loop_seconds, loop_updates))
+    print ("  Vectorized (empty) : {:.3f} seconds, {} rows to write".format(vectorized_seconds, len(first_urls)))
+    print ("  Vectorized (rerun) : {:.3f} seconds, {} rows to write".format(second_seconds, len(second_urls)))
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# ---------------------------------------------------------------------------
+# Locator_Fingerprints_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no locators needed, rebuilds are simulated)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Three simulated nights of Locator_Rebuilder with Locator_Fingerprints on in-memory
+#  reference data (Sync_Engine.MemoryBackend) shaped like the county layers:
+#
+#   night 1 - no fingerprints yet, everything rebuilds
+#   night 2 - street centerlines reloaded (delete/append of the same rows) and one centerline
+#             edited: only the roads locators and the roads composites rebuild
+#   night 3 - nothing changed: nothing rebuilds
+#
+#  Reports, per night, the locators rebuilt/skipped, the time spent fingerprinting and the
+#  rebuild time (simulated rebuild durations, scaled by the second argument).
+#
+#  Usage:  propy Locator_Fingerprints_Benchmark.py [rows per layer] [seconds per rebuild, average]
+# ---------------------------------------------------------------------------
+
+import os,random,sys,tempfile,time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import Locator_Fingerprints,Locator_Scheduler,Sync_Engine
+
+LAYERS = {"Address_Points": ["ADDR_HSESTREET", "ADDR_Name", "ADDR_FName", "ADDR_OldAdd"],
+          "Street_Centerlines": ["Roads_Name", "Roads_RouteNumber", "Roads_LegislativeNumber"],
+          "Tax_Parcels": ["TaxParcel_ADDR1", "TaxParcel_ADDR2", "TaxParcel_Name", "TaxParcel_PID", "TaxParcel_UPI"],
+          "Air_Parcels": ["AirParcels_ADDR1", "AirParcels_Name", "AirParcels_PID"],
+          "Cemeteries": ["Cemeteries"],
+          "Landmarks": ["Landmarks"]}
+COMPOSITES = {"Address_Search": ["ADDR_HSESTREET", "ADDR_OldAdd", "TaxParcel_ADDR1", "TaxParcel_ADDR2", "AirParcels_ADDR1"],
+              "Name_Locator": ["ADDR_Name", "ADDR_FName", "TaxParcel_Name", "AirParcels_Name"],
+              "Parcel_Locator": ["TaxParcel_PID", "TaxParcel_UPI", "AirParcels_PID"],
+              "Roads_Locator": ["Roads_Name", "Roads_RouteNumber", "Roads_LegislativeNumber"]}
+FIELDS = ["NAME", "NUMBER", "UPDATED", "SHAPE@"]
+
+
+def synthetic_layers(rows, rng):
+    backend = Sync_Engine.MemoryBackend()
+    for side in ("Pub", "CC"):
+        for layer in LAYERS:
+            dataset = "{}_{}".format(layer, side)
+            backend.create_table(dataset, FIELDS)
+            backend.load_rows(dataset, FIELDS, [["{} {}".format(layer, number), number, None,
+                                                 "POINT ({} {})".format(rng.uniform(0, 9e5), rng.uniform(0, 9e5))] for number in range(rows)])
+    return backend
+
+
+def locator_lists(average, rng):
+    locators, references, composites = [], [], []
+    for side in ("Pub", "CC"):
+        for layer, names in LAYERS.items():
+            for name in names:
+                locator = "{}_{}".format(name, side)
+                locators.append((locator, "{}|{:.3f}".format(locator, rng.uniform(0.3, 1.7) * average)))
+                references.append((locator, ["{}_{}".format(layer, side)]))
+        for name, participants in COMPOSITES.items():
+            composite = "{}_{}".format(name, side)
+            composites.append((composite, "{}|{:.3f}".format(composite, rng.uniform(0.3, 1.7) * average),
+                               ["{}_{}".format(participant, side) for participant in participants]))
+    return locators, references, composites
+
+
+def reload_centerlines(backend, rng):
+    # A spreader's DeleteRows + Append of the same rows (new row ids), then one real edit
+    for side in ("Pub", "CC"):
+        dataset = "Street_Centerlines_{}".format(side)
+        rows = [values for row_id, values in backend.read_rows(dataset, FIELDS)]
+        backend.apply_changes(dataset, FIELDS, rows, {}, set(row_id for row_id, values in backend.read_rows(dataset, FIELDS)))
+    row_id = next(row_id for row_id, values in backend.read_rows("Street_Centerlines_CC", FIELDS))
+    backend.apply_changes("Street_Centerlines_CC", ["NAME"], [], {row_id: ["RENAMED RD"]}, set())
+
+
+def night(store_path, backend, locators, references, composites, workers):
+    started = time.time()
+    store = Locator_Fingerprints.FingerprintStore(store_path)
+    changes = store.changes(references, backend, composites)
+    fingerprint_seconds = time.time() - started
+    plan = Locator_Scheduler.build_plan("Locator_Fingerprints_Benchmark", locators, composites, workers,
+                                        function="Locator_Scheduler_Benchmark:simulated_rebuild", only=changes.rebuild)
+    result = Locator_Scheduler.run_plan(plan, lambda line: None)
+    if not result.succeeded:
+        raise RuntimeError("Simulated rebuilds failed")
+    store.record(changes, result.stages)
+    return changes, fingerprint_seconds, result.seconds
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    average = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    rng = random.Random(1507)
+    backend = synthetic_layers(rows, rng)
+    locators, references, composites = locator_lists(average, rng)
+    store_path = os.path.join(tempfile.mkdtemp(), "Locator_Fingerprints.json")
+
+    lines = []
+    for label, change in (("night 1 (no fingerprints)", None), ("night 2 (centerlines reloaded + 1 edit)", reload_centerlines),
+                          ("night 3 (nothing changed)", None)):
+        if change:
+            change(backend, rng)
+        changes, fingerprint_seconds, rebuild_seconds = night(store_path, backend, locators, references, composites, 4)
+        lines.append((label, changes, fingerprint_seconds, rebuild_seconds))
+    if sorted(lines[1][1].rebuild) != sorted(["Roads_Name_CC", "Roads_RouteNumber_CC", "Roads_LegislativeNumber_CC", "Roads_Locator_CC"]):
+        raise RuntimeError("Night 2 rebuilt {}".format(lines[1][1].rebuild))
+    if lines[2][1].rebuild:
+        raise RuntimeError("Night 3 rebuilt {}".format(lines[2][1].rebuild))
+
+    print ("============================================================================")
+    print ("Locator fingerprint benchmark: {} locators, {} layers x {} rows per side".format(len(locators) + len(composites), len(LAYERS), rows))
+    for label, changes, fingerprint_seconds, rebuild_seconds in lines:
+        print ("  {:<42} rebuilt {:>2}, skipped {:>2} | fingerprints {:.2f}s, rebuild {:.2f}s, saved ~{:.2f}s".format(
+            label, len(changes.rebuild), len(changes.skipped), fingerprint_seconds, rebuild_seconds, changes.saved_seconds))
+    print ("  Night 2 rebuilt: " + ", ".join(lines[1][1].rebuild))
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
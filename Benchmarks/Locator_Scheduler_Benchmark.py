@@ -0,0 +1,82 @@
+# ---------------------------------------------------------------------------
+# Locator_Scheduler_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no locators needed, rebuilds are simulated)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares Locator_Rebuilder's old one-after-another rebuild with Locator_Scheduler on a
+#  synthetic graph shaped like the Public + Intranet locators (about 50 single-role locators,
+#  10 composites with 2-8 participants each).  Each "rebuild" sleeps for a random duration,
+#  so the comparison shows scheduling only: the serial run is the same plan with one worker.
+#  Checks every composite started after all of its participants finished.
+#
+#  Usage:  propy Locator_Scheduler_Benchmark.py [workers] [seconds per rebuild, average]
+# ---------------------------------------------------------------------------
+
+import os,random,sys,time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import Locator_Scheduler,Pipeline_Runner
+
+# Participants per composite on each side (Address Search, Name, Parcel, Roads, ...)
+COMPOSITE_SIZES = {"Pub": [8, 6, 8, 3], "CC": [8, 3, 6, 8, 3, 2]}
+SINGLE_COUNTS = {"Pub": 25, "CC": 27}
+
+
+def simulated_rebuild(path):
+    # path is "<locator>|<seconds>" - sleeps instead of arcpy.geocoding.RebuildAddressLocator
+    time.sleep(float(path.split("|")[1]))
+    return {"rows": None, "message": ""}
+
+
+def synthetic_plan(average, workers, rng):
+    locators = []
+    composites = []
+    for side, count in SINGLE_COUNTS.items():
+        names = ["Single_{}_{}".format(number, side) for number in range(count)]
+        locators.extend((name, "{}|{:.3f}".format(name, rng.uniform(0.3, 1.7) * average)) for name in names)
+        for number, size in enumerate(COMPOSITE_SIZES[side]):
+            name = "Composite_{}_{}".format(number, side)
+            composites.append((name, "{}|{:.3f}".format(name, rng.uniform(0.3, 1.7) * average), rng.sample(names, size)))
+    return Locator_Scheduler.build_plan("Locator_Scheduler_Benchmark", locators, composites, workers,
+                                        function="Locator_Scheduler_Benchmark:simulated_rebuild")
+
+
+def check_order(plan, result):
+    graph = Pipeline_Runner.build_graph(plan["stages"])
+    by_name = dict((stage.name, stage) for stage in result.stages)
+    for name, participants in graph.items():
+        for participant in participants:
+            if by_name[name].started < by_name[participant].finished:
+                raise RuntimeError("{} started before {} finished".format(name, participant))
+    if not result.succeeded:
+        raise RuntimeError("Simulated rebuilds failed: {}".format([stage.name for stage in result.failed]))
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    average = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    plan = synthetic_plan(average, workers, random.Random(1406))
+    quiet = lambda line: None
+
+    serial = Locator_Scheduler.run_plan(plan, quiet, workers=1)
+    scheduled = Locator_Scheduler.run_plan(plan, quiet, workers=workers)
+    check_order(plan, serial)
+    check_order(plan, scheduled)
+    work = sum(stage.seconds for stage in scheduled.stages)
+    path = Locator_Scheduler.critical_path(plan, scheduled)
+
+    print ("============================================================================")
+    print ("Locator rebuild benchmark: {} locators, {:.1f} seconds of simulated rebuilds".format(len(plan["stages"]), work))
+    print ("  One after another (1 worker) : {:.2f} seconds".format(serial.seconds))
+    print ("  Locator_Scheduler ({} workers): {:.2f} seconds ({:.1f}x)".format(workers, scheduled.seconds, serial.seconds / scheduled.seconds))
+    print ("  Lower bound (work / workers) : {:.2f} seconds".format(work / workers))
+    print ("  Critical path: " + " -> ".join("{} ({:.2f}s)".format(stage.name, stage.seconds) for stage in path))
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# ---------------------------------------------------------------------------
+# PID_Match_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no locator needed, geocoding is simulated)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares the old Active_VISION_Missing_GIS / Active_TaxClaim_Missing_GIS matching
+#  (geocode every record PID against CAMA_PID_Locator) with PID_Match on synthetic
+#  REALMAST and parcel PIDs (Sync_Engine.MemoryBackend).  The simulated geocoder costs the
+#  second argument in milliseconds per PID and matches a PID when it is a parcel PID or one
+#  of a few CAMA_PIN look-alikes.
+#
+#   night 1 - no match cache: the left-over PIDs are geocoded
+#   night 2 - nothing changed: the left-over PIDs come from the cache, no geocoding
+#   night 3 - a parcel was added for one missing PID: the left-over PIDs are geocoded again
+#
+#  Usage:  propy PID_Match_Benchmark.py [records] [milliseconds per geocoded PID]
+# ---------------------------------------------------------------------------
+
+import os,random,sys,tempfile,time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import PID_Match,Sync_Engine
+
+MISSING = 60        # record PIDs with no parcel
+LOOK_ALIKES = 15    # of those, matched by the geocoder anyway
+
+
+def synthetic_data(records, rng):
+    backend = Sync_Engine.MemoryBackend()
+    pids = rng.sample(range(1, records * 4), records)
+    missing = pids[:MISSING]
+    backend.create_table("VISIDATA_TEMP", ["REM_PID", "REM_OWN_NAME"])
+    backend.load_rows("VISIDATA_TEMP", ["REM_PID", "REM_OWN_NAME"], [[pid, "OWNER {}".format(pid)] for pid in pids])
+    backend.create_table("TAX_PARCELS", ["PID"])
+    backend.load_rows("TAX_PARCELS", ["PID"], [[pid] for pid in pids[MISSING:] if pid % 20])
+    backend.create_table("TAXPARCEL_AIR", ["PID"])
+    backend.load_rows("TAXPARCEL_AIR", ["PID"], [["{:08d}".format(pid)] for pid in pids[MISSING:] if not pid % 20])
+    return backend, set(str(pid) for pid in missing[:LOOK_ALIKES]), set(str(pid) for pid in missing[LOOK_ALIKES:])
+
+
+def simulated_geocoder(parcels, look_alikes, milliseconds):
+    def geocode(pids):
+        time.sleep(len(pids) * milliseconds / 1000.0)
+        return dict((pid, pid in parcels.pids or pid in look_alikes) for pid in pids)
+    return geocode
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 60000
+    milliseconds = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    rng = random.Random(1701)
+    backend, look_alikes, missing = synthetic_data(records, rng)
+    cache_path = os.path.join(tempfile.mkdtemp(), "PID_Match.json")
+
+    # Old: geocode every record PID
+    started = time.time()
+    pids = PID_Match.record_pids(backend, "VISIDATA_TEMP", "REM_PID")
+    parcels = PID_Match.ParcelPIDs.read(backend, ["TAX_PARCELS", "TAXPARCEL_AIR"])
+    old = simulated_geocoder(parcels, look_alikes, milliseconds)(sorted(pids))
+    old_unmatched = set(pid for pid, matched in old.items() if not matched)
+    old_seconds = time.time() - started
+    if old_unmatched != missing:
+        raise RuntimeError("Old matching found {} unmatched, expected {}".format(len(old_unmatched), len(missing)))
+
+    lines = []
+    for label, change in (("night 1 (no match cache)", None), ("night 2 (nothing changed)", None),
+                          ("night 3 (parcel added for a missing PID)", sorted(missing)[0])):
+        if change:
+            backend.load_rows("TAX_PARCELS", ["PID"], [[int(change)]])
+            missing.discard(change)
+        started = time.time()
+        parcels = PID_Match.ParcelPIDs.read(backend, ["TAX_PARCELS", "TAXPARCEL_AIR"])
+        result = PID_Match.MatchCache(cache_path).match(PID_Match.record_pids(backend, "VISIDATA_TEMP", "REM_PID"), parcels,
+                                                        geocode=simulated_geocoder(parcels, look_alikes, milliseconds))
+        if result.unmatched != missing:
+            raise RuntimeError("{}: {} unmatched, expected {}".format(label, len(result.unmatched), len(missing)))
+        lines.append((label, result, time.time() - started))
+    if lines[1][1].geocoded:
+        raise RuntimeError("Night 2 geocoded {} PIDs".format(lines[1][1].geocoded))
+
+    print ("============================================================================")
+    print ("PID match benchmark: {} record PIDs, {} with no parcel ({} matched by the geocoder anyway)".format(records, MISSING, LOOK_ALIKES))
+    print ("  {:<42} geocoded {:>6}, unmatched {:>3} | {:.2f}s".format("old (geocode every record)", len(pids), len(old_unmatched), old_seconds))
+    for label, result, seconds in lines:
+        print ("  {:<42} geocoded {:>6}, unmatched {:>3} | {:.2f}s (cached {})".format(
+            label, result.geocoded, len(result.unmatched), seconds, result.cached))
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
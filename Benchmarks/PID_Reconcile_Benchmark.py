@@ -0,0 +1,96 @@
+# ---------------------------------------------------------------------------
+# PID_Reconcile_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no arcpy needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares the old Active_GIS_Missing_VISION steps (copy the tax parcels into a temp
+#  database, append the air parcels, copy active REALMAST, join them, calculate a Match field
+#  row by row and select Match = 'No') with PID_Reconcile on a SQLite stand-in shaped like
+#  TAX_PARCELS_INTERNAL, TaxParcel_Air_INTERNAL and REALMAST.  Some parcels have no active
+#  VISION record and some VISION PIDs have no parcel - both ways must give the same
+#  GIS-not-in-VISION PIDs or the benchmark stops.
+#
+#  Usage:  propy PID_Reconcile_Benchmark.py [parcel count] [report field count]
+# ---------------------------------------------------------------------------
+
+import os,random,sys,tempfile,time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import PID_Reconcile,Sync_Engine
+
+
+def make_tables(backend, parcel_count, field_count, rng):
+    gis_fields = ["PID"] + ["FIELD_{:02d}".format(number) for number in range(field_count - 1)]
+    vision_fields = ["REM_PID", "REM_PARCEL_STATUS"] + ["REM_{:02d}".format(number) for number in range(field_count - 2)]
+    backend.create_table("TAX_PARCELS", gis_fields)
+    backend.create_table("AIR_PARCELS", gis_fields)
+    backend.create_table("REALMAST", vision_fields)
+    parcels, air, vision = [], [], []
+    for pid in range(1, parcel_count + 1):
+        row = [pid] + ["{}-{}".format(pid, number) for number in range(field_count - 1)]
+        (air if pid % 25 == 0 else parcels).append(row)
+        if rng.random() < 0.01:
+            continue                                        # parcel with no VISION record
+        status = "I" if rng.random() < 0.01 else "A"        # inactive VISION record (counts as missing)
+        vision.append([pid, status] + ["V{}".format(number) for number in range(field_count - 2)])
+    parcels.extend([[0] + [None] * (field_count - 1)] * 20)  # PID 0 - left out of the report
+    vision.extend([[parcel_count + number, "A"] + [None] * (field_count - 2) for number in range(1, 200)])
+    backend.load_rows("TAX_PARCELS", gis_fields, parcels)
+    backend.load_rows("AIR_PARCELS", gis_fields, air)
+    backend.load_rows("REALMAST", vision_fields, vision)
+    return gis_fields, vision_fields
+
+
+def old_report(backend, gis_fields, vision_fields):
+    # TableToTable + Append + TableToTable + AddJoin + CalculateField (python per row) + MakeTableView
+    connection = backend.connection
+    columns = ", ".join('"{}"'.format(field) for field in gis_fields)
+    connection.execute("DROP TABLE IF EXISTS ActiveGISRecords")
+    connection.execute("DROP TABLE IF EXISTS REALMAST_CO_TEMP_REPORT")
+    connection.execute("CREATE TABLE ActiveGISRecords AS SELECT {} FROM TAX_PARCELS".format(columns))
+    connection.execute("INSERT INTO ActiveGISRecords SELECT {} FROM AIR_PARCELS".format(columns))
+    connection.execute("CREATE TABLE REALMAST_CO_TEMP_REPORT AS SELECT * FROM REALMAST WHERE REM_PARCEL_STATUS = 'A'")
+    connection.execute("ALTER TABLE ActiveGISRecords ADD COLUMN Match TEXT")
+    joined = connection.execute("SELECT g.rowid, g.PID, v.REM_PID FROM ActiveGISRecords g LEFT JOIN REALMAST_CO_TEMP_REPORT v ON g.PID = v.REM_PID").fetchall()
+    calc = lambda pid, rem_pid: 'Yes' if pid == rem_pid else 'No'
+    connection.executemany("UPDATE ActiveGISRecords SET Match = ? WHERE rowid = ?", [(calc(pid, rem_pid), row_id) for row_id, pid, rem_pid in joined])
+    connection.commit()
+    rows = connection.execute("SELECT {} FROM ActiveGISRecords WHERE Match = 'No' AND PID > 0".format(columns)).fetchall()
+    connection.execute("DROP TABLE ActiveGISRecords")
+    connection.execute("DROP TABLE REALMAST_CO_TEMP_REPORT")
+    return rows
+
+
+def main():
+    parcel_count = int(sys.argv[1]) if len(sys.argv) > 1 else 60000
+    field_count = int(sys.argv[2]) if len(sys.argv) > 2 else 35
+    rng = random.Random(1801)
+    backend = Sync_Engine.SQLiteBackend(os.path.join(tempfile.mkdtemp(), "reconcile.sqlite"))
+    gis_fields, vision_fields = make_tables(backend, parcel_count, field_count, rng)
+
+    started = time.time()
+    old_rows = old_report(backend, gis_fields, vision_fields)
+    old_seconds = time.time() - started
+
+    started = time.time()
+    result = PID_Reconcile.reconcile(backend, [PID_Reconcile.Source("TAX_PARCELS", "PID", gis_fields, "PID > 0"),
+                                               PID_Reconcile.Source("AIR_PARCELS", "PID", gis_fields, "PID > 0")],
+                                     [PID_Reconcile.Source("REALMAST", "REM_PID", vision_fields, "REM_PARCEL_STATUS = 'A'")])
+    new_seconds = time.time() - started
+    if sorted(row[0] for row in old_rows) != sorted(row[1] for row in result.left_only):
+        raise RuntimeError("GIS-not-in-VISION PIDs differ: old {} rows, PID_Reconcile {} rows".format(len(old_rows), len(result.left_only)))
+
+    print ("============================================================================")
+    print ("PID reconcile benchmark: {} parcels, {} report fields".format(parcel_count, field_count))
+    print ("  Temp tables + join + row-by-row Match : {:.2f} seconds ({} GIS rows not in VISION)".format(old_seconds, len(old_rows)))
+    print ("  PID_Reconcile (hash sets)            : {:.2f} seconds ({} GIS rows not in VISION, {} VISION rows not in GIS)".format(
+        new_seconds, len(result.left_only), len(result.right_only)))
+    print ("  " + result.summary())
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# ---------------------------------------------------------------------------
+# Portal_Dependency_Index_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no arcgis module needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares the old gather_info dependency search (get_data() on every web map and every app
+#  for each layer item) against Portal_Dependency_Index on a synthetic portal.  Items are plain
+#  objects standing in for arcgis Items; get_data() calls are counted, since on a real portal
+#  each one is a REST request.  Both searches must find the same apps for every layer - the
+#  benchmark stops if they don't.  A second index run (saved index, a few maps edited) shows
+#  the calls left when the index is reused.
+#
+#  Usage:  propy Portal_Dependency_Index_Benchmark.py [layers] [web maps] [apps]
+# ---------------------------------------------------------------------------
+
+import os,random,sys,tempfile,time,uuid
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Portal_Dependency_Index
+
+PORTAL = "https://PORTALNAME.com/server/rest/services"
+
+
+class FakeItem(object):
+    calls = 0
+
+    def __init__(self, item_type, title, url=None, data=None, rng=None):
+        self.id = uuid.UUID(int=rng.getrandbits(128)).hex
+        self.type = item_type
+        self.title = title
+        self.owner = "gisadmin"
+        self.url = url
+        self.modified = 1700000000000
+        self.data = data
+
+    def get_data(self):
+        FakeItem.calls += 1
+        return self.data
+
+
+def make_portal(layer_count, map_count, app_count, rng):
+    layers = [FakeItem("Feature Service", "Layer {}".format(number), "{}/Hosted/Layer_{}/FeatureServer".format(PORTAL, number), rng=rng)
+              for number in range(layer_count)]
+    webmaps = []
+    for number in range(map_count):
+        operational = [{"id": "layer{}".format(position), "url": "{}/{}".format(layer.url, rng.randint(0, 4)), "title": layer.title}
+                       for position, layer in enumerate(rng.sample(layers, rng.randint(1, 12)))]
+        webmaps.append(FakeItem("Web Map", "Map {}".format(number), data={"operationalLayers": operational, "baseMap": {"title": "Topo"}}, rng=rng))
+    apps = []
+    for number in range(app_count):
+        sources = {"map": {"itemId": rng.choice(webmaps).id}}
+        if rng.random() < 0.3:
+            layer = rng.choice(layers)
+            sources["widgets"] = [{"config": {"description": "<a href='{}/0'>data</a>".format(layer.url)}}]
+        apps.append(FakeItem("Dashboard", "App {}".format(number), data=sources if rng.random() > 0.05 else None, rng=rng))
+    # Web maps are in the AppList searched by the tools, so they are apps too
+    return layers, webmaps, webmaps + apps
+
+
+def old_search(find_url, webmaps, webapps):
+    # gather_info before the index: every map and app fetched again for every layer
+    matches = [m.id for m in webmaps if str(m.get_data()).find(find_url) > -1]
+    app_list = []
+    for w in webapps:
+        wdata = str(w.get_data())
+        if wdata.find(find_url) > -1 or any([wdata.find(m) > -1 for m in matches]):
+            app_list.append(w)
+    return app_list
+
+
+def main():
+    layer_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    map_count = int(sys.argv[2]) if len(sys.argv) > 2 else 150
+    app_count = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    rng = random.Random(42039)
+    layers, webmaps, apps = make_portal(layer_count, map_count, app_count, rng)
+
+    FakeItem.calls = 0
+    started = time.time()
+    expected = dict((layer.id, [app.id for app in old_search(layer.url, webmaps, apps)]) for layer in layers)
+    old_seconds = time.time() - started
+    old_calls = FakeItem.calls
+
+    path = os.path.join(tempfile.mkdtemp(), "PORTALNAME__Dependency_Index.json")
+    FakeItem.calls = 0
+    started = time.time()
+    index = Portal_Dependency_Index.DependencyIndex(path)
+    index.crawl(webmaps, apps)
+    index.save()
+    found = dict((layer.id, [app.id for app in index.apps_for(layer.url)]) for layer in layers)
+    index_seconds = time.time() - started
+    index_calls = FakeItem.calls
+
+    for layer in layers:
+        if found[layer.id] != expected[layer.id]:
+            raise RuntimeError("Dependency mismatch for {}: {} / {}".format(layer.title, found[layer.id], expected[layer.id]))
+
+    for webmap in rng.sample(webmaps, 5):
+        webmap.modified += 1
+    FakeItem.calls = 0
+    started = time.time()
+    rerun = Portal_Dependency_Index.DependencyIndex(path)
+    rerun.crawl(webmaps, apps)
+    rerun_seconds = time.time() - started
+
+    print ("============================================================================")
+    print ("Dependency index benchmark: {} layers, {} web maps, {} apps".format(layer_count, map_count, len(apps)))
+    print ("  Per-layer search : {:.3f} seconds, {} get_data calls".format(old_seconds, old_calls))
+    print ("  Index (new)      : {:.3f} seconds, {} get_data calls".format(index_seconds, index_calls))
+    print ("  Index (reused)   : {:.3f} seconds, {} get_data calls".format(rerun_seconds, FakeItem.calls))
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# ---------------------------------------------------------------------------
+# Portal_Fetch_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no portal needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Runs Portal_Fetch against a local HTTP stand-in of the portal REST endpoints the tools call
+#  (content/items/<id>, community/users/<username>).  Every response is delayed like a real
+#  portal request, and the first request for some paths is answered with a 429 (throttled)
+#  or a portal error body, so the retry/backoff path is exercised.  Item and user lookups
+#  run one at a time and then in the thread pool - both must return the same JSON for every
+#  key, and no lookup may fail once retried.
+#
+#  Usage:  propy Portal_Fetch_Benchmark.py [items] [users] [workers]
+# ---------------------------------------------------------------------------
+
+import http.server,json,os,sys,threading,time,zlib
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Portal_Fetch
+
+LATENCY = 0.02
+
+
+class PortalStandIn(http.server.BaseHTTPRequestHandler):
+    seen = set()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        time.sleep(LATENCY)
+        with PortalStandIn.lock:
+            first = path not in PortalStandIn.seen
+            PortalStandIn.seen.add(path)
+        name = path.rstrip("/").rsplit("/", 1)[-1]
+        if first and zlib.crc32(name.encode("utf-8")) % 20 == 0:
+            self._send(429, {"error": {"code": 429, "message": "Too many requests"}})
+        elif first and zlib.crc32(name.encode("utf-8")) % 20 == 1:
+            self._send(200, {"error": {"code": 503, "message": "Service unavailable"}})
+        elif "/content/items/" in path:
+            self._send(200, {"id": name, "title": "Item " + name, "url": "https://PORTALNAME.com/server/rest/services/{}/FeatureServer".format(name)})
+        elif "/community/users/" in path:
+            self._send(200, {"username": name, "fullName": name.title(), "level": "2"})
+        else:
+            self._send(404, {"error": {"code": 400, "message": "Unknown endpoint"}})
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *arguments):
+        pass
+
+
+def run(pool, root, item_ids, usernames):
+    started = time.time()
+    items = pool.map(lambda item_id: Portal_Fetch.get_json(root + "/content/items/" + item_id), item_ids)
+    users = pool.map(lambda username: Portal_Fetch.get_json(root + "/community/users/" + username), usernames)
+    seconds = time.time() - started
+    failed = [result.key for result in items + users if not result.ok]
+    if failed:
+        raise RuntimeError("{} lookups failed after retries: {}".format(len(failed), failed[:5]))
+    return dict((result.key, result.value) for result in items + users), seconds
+
+
+def main():
+    item_count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    user_count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), PortalStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    root = "http://127.0.0.1:{}/arcgis/sharing/rest".format(server.server_address[1])
+    item_ids = ["{:032x}".format(number * 7919) for number in range(item_count)]
+    usernames = ["user{:04d}".format(number) for number in range(user_count)]
+
+    serial_pool = Portal_Fetch.FetchPool(workers=1, backoff=0.05)
+    serial, serial_seconds = run(serial_pool, root, item_ids, usernames)
+    PortalStandIn.seen.clear()
+    pooled_pool = Portal_Fetch.FetchPool(workers=workers, backoff=0.05)
+    pooled, pooled_seconds = run(pooled_pool, root, item_ids, usernames)
+    server.shutdown()
+    if serial != pooled:
+        raise RuntimeError("Pooled lookups returned different JSON than serial lookups")
+
+    print ("============================================================================")
+    print ("Portal fetch benchmark: {} items + {} users, {:.0f} ms per request".format(item_count, user_count, LATENCY * 1000))
+    print ("  One at a time : {:.3f} seconds - {}".format(serial_seconds, serial_pool.summary()))
+    print ("  {} workers     : {:.3f} seconds - {}".format(workers, pooled_seconds, pooled_pool.summary()))
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# ---------------------------------------------------------------------------
+# Portal_Frames_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 with pandas - no portal needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares PortalUser_ExportTool's old row-by-row DataFrame.append (emulated with
+#  pd.concat, which copies the frame the same way - append is gone in pandas 2) with
+#  Portal_Frames.RecordCollector on synthetic portal users, at the 3000-user max_users
+#  search and at a few other sizes to show how each scales.  Both frames, after the level
+#  names and last login dates are converted, must be equal.
+#
+#  Usage:  propy Portal_Frames_Benchmark.py [users, ...]
+# ---------------------------------------------------------------------------
+
+import os,random,sys,time
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Portal_Frames
+
+COLUMNS = ['Full Name', 'User Name', 'Email', 'Last Login Date', 'Role', 'Level', 'Description', 'Identity Provider', 'Group Membership']
+
+
+class FakeUser(object):
+    def __init__(self, number, rng):
+        self.fullName = "User {}".format(number)
+        self.username = "user{:05d}".format(number)
+        self.email = "user{}@example.com".format(number)
+        self.lastLogin = rng.choice([-1, rng.randint(1500000000000, 1790000000000)])
+        self.role = rng.choice(["org_user", "org_publisher", "org_admin"])
+        self.level = rng.choice(["1", "2", "11"])
+        self.description = rng.choice([None, "GIS staff", "Planning"])
+        self.provider = rng.choice(["arcgis", "enterprise"])
+        self.groups = ["group{}".format(rng.randint(1, 50)) for group in range(rng.randint(0, 5))]
+
+
+def record(user):
+    return {'Full Name': user.fullName, 'User Name': user.username, 'Email': user.email, 'Last Login Date': user.lastLogin,
+            'Role': user.role, 'Level': user.level, 'Description': user.description, 'Identity Provider': user.provider,
+            'Group Membership': user.groups}
+
+
+def old_frame(users):
+    # PortalUser_ExportTool before Portal_Frames
+    df = pd.DataFrame(columns=COLUMNS)
+    for user in users:
+        row = pd.DataFrame([record(user)], columns=COLUMNS)
+        df = pd.concat([df, row], ignore_index=True) if len(df) else row
+    df['Level'] = df['Level'].replace('2', 'Creator').replace('11', 'Field Worker').replace('1', 'Viewer')
+    df['Last Login - New'] = pd.to_datetime(df['Last Login Date'].astype("int64"), unit='ms')
+    df['Last Login Date'] = df['Last Login - New']
+    df = df.drop('Last Login - New', axis=1)
+    return df.reindex(columns=COLUMNS)
+
+
+def new_frame(users):
+    records = Portal_Frames.RecordCollector(COLUMNS)
+    for user in users:
+        records.add(record(user))
+    return records.frame(levels='Level', epoch_dates=['Last Login Date'])
+
+
+def timed(function, *args):
+    started = time.time()
+    value = function(*args)
+    return time.time() - started, value
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or [1000, 3000, 6000]
+    rng = random.Random(8231)
+    lines = []
+    for size in sizes:
+        users = [FakeUser(number, rng) for number in range(size)]
+        old_seconds, old = timed(old_frame, users)
+        new_seconds, new = timed(new_frame, users)
+        pd.testing.assert_frame_equal(old.astype(str), new.astype(str))
+        lines.append((size, old_seconds, new_seconds))
+
+    print ("============================================================================")
+    print ("Portal user dataframe benchmark (frames identical at every size)")
+    for size, old_seconds, new_seconds in lines:
+        print ("  {:>6} users: append {:7.3f} seconds ({:.3f} ms per user) | RecordCollector {:.3f} seconds ({:.4f} ms per user)".format(
+            size, old_seconds, 1000 * old_seconds / size, new_seconds, 1000 * new_seconds / size))
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# ---------------------------------------------------------------------------
+# Portal_Group_Export_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 with pandas/openpyxl - no portal needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares PortalGroup_Members_ExportTool's old per-member export (append the member,
+#  re-merge the group with the user list, rewrite the group's sheet and save the workbook
+#  - once per member) with Portal_Frames (one merge, one sheet write per group, one save)
+#  on a synthetic portal.  The old export is quadratic, so it runs on the first few groups
+#  only; the new export runs on both that sample and the full portal.  Sheets written by
+#  both exports on the sample must hold the same cells, including the header-only sheet of
+#  a group whose members are all missing from the user list.
+#
+#  Usage:  propy Portal_Group_Export_Benchmark.py [groups] [members per group] [sample groups] [sample members]
+# ---------------------------------------------------------------------------
+
+import os,random,sys,tempfile,time
+
+import pandas as pd
+from openpyxl import load_workbook
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Excel_Report,Portal_Frames
+
+
+class FakeGroup(object):
+    def __init__(self, number):
+        self.id = "{:032x}".format(number * 7919 + 1)
+        self.title = "Group {} Editors".format(number)
+        self.owner = "owner{}".format(number % 7)
+
+
+def synthetic_portal(group_count, member_count, rng):
+    user_count = max(member_count * 4, 3000)
+    levels = ["1", "2", "11"]
+    users = pd.DataFrame({
+        "Member Username": ["user{:05d}".format(number) for number in range(user_count)],
+        "Full Name": ["User {}".format(number) for number in range(user_count)],
+        "Email": ["user{}@example.com".format(number) for number in range(user_count)],
+        "Role": [rng.choice(["org_user", "org_publisher", "org_admin"]) for number in range(user_count)],
+        "Level": [rng.choice(levels) for number in range(user_count)]},
+        columns=["Member Username", "Full Name", "Email", "Role", "Level"])
+    groups = [FakeGroup(number) for number in range(group_count)]
+    # A few usernames per group aren't in the user list (the inner join drops them, as the tool did)
+    members = dict((group.id, {"users": rng.sample(list(users["Member Username"]), member_count - 2) + ["gone1", "gone2"]})
+                   for group in groups)
+    # ... and none of the second group's are (it still gets a header-only sheet)
+    if group_count > 1:
+        members[groups[1].id] = {"users": ["gone{}".format(number) for number in range(member_count)]}
+    return groups, members, users
+
+
+def old_export(path, groups, members, users):
+    # PortalGroup_Members_ExportTool before Portal_Frames (DataFrame.append emulated with concat)
+    writer = pd.ExcelWriter(path, engine="openpyxl")
+    for group in groups:
+        grpdf = pd.DataFrame(columns=["Group Name", "Group Owner", "Member Username"])
+        for member in members[group.id]["users"]:
+            row = pd.DataFrame([{"Group Name": group.title, "Group Owner": group.owner, "Member Username": member}])
+            grpdf = pd.concat([grpdf, row], ignore_index=True) if len(grpdf) else row
+            df = pd.merge(grpdf, users, on="Member Username")
+            df["Level"] = df["Level"].replace("2", "Creator").replace("11", "Field Worker").replace("1", "Viewer")
+            df.to_excel(writer, sheet_name=group.title.replace(" ", "")[:30], index=False)
+            # writer.save() wrote the whole workbook out
+            writer.book.save(path)
+    writer.close()
+
+
+def new_export(path, groups, members, users):
+    report = Excel_Report.ReportWriter(path)
+    frame = Portal_Frames.group_member_frame(groups, members, users)
+    Portal_Frames.write_group_sheets(report, frame, Portal_Frames.group_sheets(groups, members))
+    report.close()
+    return len(frame)
+
+
+def sheets(path):
+    workbook = load_workbook(path, read_only=True)
+    return dict((sheet.title, [tuple(row) for row in sheet.iter_rows(values_only=True)]) for sheet in workbook.worksheets)
+
+
+def timed(function, *args):
+    started = time.time()
+    value = function(*args)
+    return time.time() - started, value
+
+
+def main():
+    group_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    member_count = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    sample_groups = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    sample_members = int(sys.argv[4]) if len(sys.argv) > 4 else 100
+    rng = random.Random(5113)
+    folder = tempfile.mkdtemp()
+
+    groups, members, users = synthetic_portal(group_count, member_count, rng)
+    sample = groups[:sample_groups]
+    sample_members_by_group = dict((group.id, {"users": members[group.id]["users"][-sample_members:]}) for group in sample)
+
+    old_path = os.path.join(folder, "old.xlsx")
+    new_sample_path = os.path.join(folder, "new_sample.xlsx")
+    new_path = os.path.join(folder, "new.xlsx")
+    old_seconds, ignored = timed(old_export, old_path, sample, sample_members_by_group, users)
+    new_sample_seconds, ignored = timed(new_export, new_sample_path, sample, sample_members_by_group, users)
+    if sheets(old_path) != sheets(new_sample_path):
+        raise RuntimeError("Old and new exports wrote different sheets")
+    new_seconds, rows = timed(new_export, new_path, groups, members, users)
+    written = sheets(new_path)
+    if len(written) != group_count or sum(len(values) - 1 for values in written.values()) != rows:
+        raise RuntimeError("Full export wrote {} sheets / {} rows".format(len(written), rows))
+
+    sample_rows = sample_groups * sample_members
+    print ("============================================================================")
+    print ("Portal group member export benchmark: {} users".format(len(users)))
+    print ("  Sample, {} groups x {} members (sheets identical):".format(sample_groups, sample_members))
+    print ("    per-member rewrite   : {:.2f} seconds ({:.1f} ms per member)".format(old_seconds, 1000 * old_seconds / sample_rows))
+    print ("    Portal_Frames        : {:.2f} seconds ({:.2f} ms per member)".format(new_sample_seconds, 1000 * new_sample_seconds / sample_rows))
+    print ("  Full portal, {} groups x {} members:".format(group_count, member_count))
+    print ("    Portal_Frames        : {:.2f} seconds, {} rows on {} sheets".format(new_seconds, rows, len(written)))
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
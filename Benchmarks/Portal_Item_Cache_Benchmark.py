@@ -0,0 +1,78 @@
+# ---------------------------------------------------------------------------
+# Portal_Item_Cache_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no portal needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Runs Portal_Item_Cache over a synthetic portal three times: an empty cache (every item
+#  downloaded), an unchanged portal (every item from disk) and a portal where a few items
+#  were modified (only those downloaded again).  Downloads are simulated with a fixed delay
+#  per item; the cache is limited below the item count so the LRU eviction is exercised.
+#  Values read from the cache must equal the downloaded JSON.
+#
+#  Usage:  propy Portal_Item_Cache_Benchmark.py [items] [ms per download]
+# ---------------------------------------------------------------------------
+
+import os,random,sys,tempfile,time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Portal_Item_Cache
+
+
+class FakeItem(object):
+    downloads = 0
+    delay = 0.0
+
+    def __init__(self, number, rng):
+        self.id = "{:032x}".format(number * 104729)
+        self.modified = 1700000000000 + number
+        self.layers = [{"id": "layer{}".format(layer), "url": "https://PORTALNAME.com/server/rest/services/S{}/FeatureServer/{}".format(
+            rng.randint(1, 400), layer), "popupInfo": {"description": "x" * rng.randint(50, 2000)}} for layer in range(rng.randint(1, 15))]
+
+    def expected(self):
+        return {"operationalLayers": self.layers, "version": "2.28"}
+
+    def get_data(self):
+        FakeItem.downloads += 1
+        time.sleep(FakeItem.delay)
+        return self.expected()
+
+
+def run(path, items, max_entries):
+    FakeItem.downloads = 0
+    started = time.time()
+    cache = Portal_Item_Cache.ItemCache(path, max_entries=max_entries)
+    for item in items:
+        if cache.cached(item, "data", lambda item: item.get_data()) != item.expected():
+            raise RuntimeError("Cached data differs for item {}".format(item.id))
+    cache.close()
+    return time.time() - started, FakeItem.downloads, cache.summary()
+
+
+def main():
+    item_count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    FakeItem.delay = (float(sys.argv[2]) if len(sys.argv) > 2 else 5) / 1000.0
+    rng = random.Random(42039)
+    items = [FakeItem(number, rng) for number in range(item_count)]
+    path = os.path.join(tempfile.mkdtemp(), "cache", "PORTALNAME_Item_Cache.sqlite")
+    # Limit the cache to 90% of the items so the least recently used ones are dropped after each run
+    max_entries = int(item_count * 0.9)
+
+    lines = []
+    lines.append(("Empty cache", run(path, items, max_entries)))
+    lines.append(("Unchanged portal", run(path, items, max_entries)))
+    for item in rng.sample(items, max(1, item_count // 50)):
+        item.modified += 1000
+    lines.append(("2% of items modified", run(path, items, max_entries)))
+
+    print ("============================================================================")
+    print ("Portal item cache benchmark: {} items, {:.0f} ms per download, cache limited to {} entries".format(item_count, FakeItem.delay * 1000, max_entries))
+    for label, (seconds, downloads, summary) in lines:
+        print ("  {:<22}: {:.3f} seconds, {} downloads - {}".format(label, seconds, downloads, summary))
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# ---------------------------------------------------------------------------
+# Run_Log_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no arcpy needed, the share is simulated)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares the scripts' old write_log(text, file) - open the log on the share for every line,
+#  handle never closed - with Run_Log (records queued, written by a background thread in batches
+#  to a local log and mirrored to the share as .jsonl and plain text).  The "share" is a temp
+#  folder where every open costs the second argument in milliseconds (an SMB round trip).  Both
+#  logs must end with every line or the benchmark stops.
+#
+#  Usage:  propy Run_Log_Benchmark.py [log lines] [milliseconds per open on the share]
+# ---------------------------------------------------------------------------
+
+import os,sys,tempfile,time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Run_Log
+
+
+class SimulatedShare(object):
+    def __init__(self, folder, milliseconds):
+        self.folder = folder
+        self.milliseconds = milliseconds
+        self.opens = 0
+
+    def open(self, path, mode):
+        if path.startswith(self.folder):
+            self.opens += 1
+            time.sleep(self.milliseconds / 1000.0)
+        return open(path, mode)
+
+
+class ShareRunLog(Run_Log.RunLog):
+    # RunLog whose writes to the share go through the simulated share
+    share = None
+
+    def _append(self, path, text, mode="a"):
+        with self.share.open(path, mode) as log_file:
+            log_file.write(text)
+
+
+def old_write_log(share):
+    handles = []
+    def write_log(text, file):
+        f = share.open(file, 'a')           # 'a' will append to an existing file if it exists
+        f.write("{}\n".format(text))        # write the text to the logfile and move to next line
+        handles.append(f)                   # (never closed - left to the garbage collector in the scripts)
+        return
+    return write_log, handles
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    milliseconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    share = SimulatedShare(tempfile.mkdtemp(), milliseconds)
+    local_folder = tempfile.mkdtemp()
+    logfile = os.path.join(share.folder, "LandRecords_Data_Spreader.log")
+    messages = ["{} has {} records".format("CCSDE.CRAW_INTERNAL.TAX_PARCELS_INTERNAL", number) for number in range(lines)]
+
+    write_log, handles = old_write_log(share)
+    started = time.time()
+    for message in messages:
+        write_log(message, logfile)
+    old_seconds = time.time() - started
+    old_opens = share.opens
+    for handle in handles:
+        handle.close()
+    with open(logfile) as log_file:
+        if log_file.read().splitlines() != messages:
+            raise RuntimeError("Old log is missing lines")
+
+    share.opens = 0
+    ShareRunLog.share = share
+    run_log = ShareRunLog("LandRecords_Data_Spreader", logfile, local_folder)
+    started = time.time()
+    for number, message in enumerate(messages):
+        run_log.record(message, stage="Tax Parcels", rows=number)
+    queued_seconds = time.time() - started
+    run_log.close()
+    closed_seconds = time.time() - started
+    for path in (run_log.local_path, run_log.mirror_path):
+        if [entry["message"] for entry in Run_Log.read_records(path)] != messages:
+            raise RuntimeError("{} is missing records".format(path))
+    with open(run_log.text_path) as log_file:
+        if len(log_file.read().splitlines()) != lines:
+            raise RuntimeError("{} is missing lines".format(run_log.text_path))
+
+    print ("============================================================================")
+    print ("Run log benchmark: {} lines, {} ms per open on the share".format(lines, milliseconds))
+    print ("  write_log (open per line)   : {:.2f} seconds, {} opens on the share, {} handles left open".format(old_seconds, old_opens, len(handles)))
+    print ("  Run_Log (queued, batched)   : {:.2f} seconds in the script, {:.2f} seconds to close, {} batches, {} opens on the share".format(
+        queued_seconds, closed_seconds, run_log.batches, share.opens))
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
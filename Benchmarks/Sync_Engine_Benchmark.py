@@ -0,0 +1,101 @@
+# ---------------------------------------------------------------------------
+# Sync_Engine_Benchmark.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro (or any python 3 - no arcpy needed)
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Compares the old nightly pattern (delete every target row, re-insert every source row)
+#  against Sync_Engine.sync_dataset on a SQLite stand-in shaped like the SSAP address points.
+#  A day's worth of edits (inserts/updates/deletes) is applied to the source between runs.
+#  Some rows share a key (condo parcels sharing a CAMA_PIN) and some have no key, and edits hit
+#  those too.  After each run the target must hold exactly the source rows or the benchmark stops.
+#
+#  Usage:  propy Sync_Engine_Benchmark.py [row count] [edits]
+# ---------------------------------------------------------------------------
+
+import collections,os,random,sys,tempfile,time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Sync_Engine
+
+FIELDS = ["Site_NGUID", "Add_Number", "St_Name", "St_PosTyp", "Post_Comm", "ESN", "DateUpdate", Sync_Engine.SHAPE_TOKEN]
+STREETS = ["MAIN", "PARK", "STATE", "WATER", "CHESTNUT", "ARCH", "MARKET", "LIBERTY"]
+TYPES = ["ST", "AVE", "RD", "LN", "DR"]
+COMMUNITIES = ["MEADVILLE", "TITUSVILLE", "CAMBRIDGE SPRINGS", "CONNEAUT LAKE", "LINESVILLE"]
+
+# Every DUPLICATE_EVERY-th row repeats the previous row's key, every NULL_KEY_EVERY-th has no key
+DUPLICATE_EVERY = 250
+NULL_KEY_EVERY = 400
+
+
+def make_row(number, rng):
+    x = 1300000 + rng.random() * 90000
+    y = 400000 + rng.random() * 70000
+    if number % NULL_KEY_EVERY == 0:
+        key = None
+    else:
+        key = "SSAP{}@crawfordcountypa.net".format(number - 1 if number % DUPLICATE_EVERY == 0 else number)
+    return [key, rng.randint(1, 29999), rng.choice(STREETS), rng.choice(TYPES),
+            rng.choice(COMMUNITIES), rng.randint(1, 400), "2026-10-{:02d}".format(rng.randint(1, 17)), "POINT ({:.3f} {:.3f})".format(x, y)]
+
+
+def full_reload(backend, source, target):
+    started = time.time()
+    rows = [values for row_id, values in backend.read_rows(source, FIELDS)]
+    existing = set(row_id for row_id, values in backend.read_rows(target, FIELDS[:1]))
+    backend.apply_changes(target, FIELDS, rows, {}, existing)
+    return time.time() - started, len(rows) + len(existing)
+
+
+def check_same(backend, source, target):
+    # Target rows must equal the source rows (as a multiset - duplicate keys, null keys and all)
+    source_rows = collections.Counter(tuple(values) for row_id, values in backend.read_rows(source, FIELDS))
+    target_rows = collections.Counter(tuple(values) for row_id, values in backend.read_rows(target, FIELDS))
+    if source_rows != target_rows:
+        raise RuntimeError("{} does not match {}: {} source rows missing, {} extra rows".format(
+            target, source, sum((source_rows - target_rows).values()), sum((target_rows - source_rows).values())))
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    edits = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rng = random.Random(42039)
+
+    workspace = tempfile.mkdtemp()
+    backend = Sync_Engine.SQLiteBackend(os.path.join(workspace, "sync_benchmark.sqlite"))
+    for name in ("SSAP_SOURCE", "SSAP_RELOAD", "SSAP_SYNC"):
+        backend.create_table(name, FIELDS)
+    rows = [make_row(number, rng) for number in range(row_count)]
+    backend.load_rows("SSAP_SOURCE", FIELDS, rows)
+    backend.load_rows("SSAP_RELOAD", FIELDS, rows)
+    backend.load_rows("SSAP_SYNC", FIELDS, rows)
+
+    # One day of address edits against the source
+    source_ids = [row_id for row_id, values in backend.read_rows("SSAP_SOURCE", FIELDS[:1])]
+    changed = rng.sample(source_ids, edits)
+    # ... including rows with a shared key and rows with no key
+    special = [row_id for row_id, values in backend.read_rows("SSAP_SOURCE", FIELDS[:1])
+               if values[0] is None or int(values[0][4:values[0].index("@")]) % DUPLICATE_EVERY in (DUPLICATE_EVERY - 1, 0)]
+    changed = list(collections.OrderedDict.fromkeys(rng.sample(special, min(len(special), edits // 5)) + changed))[:edits]
+    rng.shuffle(changed)
+    backend.apply_changes("SSAP_SOURCE", ["Post_Comm"], [], dict((row_id, ["EDITED"]) for row_id in changed[:edits // 2]), set(changed[edits // 2:]))
+    backend.load_rows("SSAP_SOURCE", FIELDS, [make_row(row_count + number, rng) for number in range(edits)])
+
+    reload_seconds, reload_rows = full_reload(backend, "SSAP_SOURCE", "SSAP_RELOAD")
+    result = Sync_Engine.sync_dataset(backend, "SSAP_SOURCE", "SSAP_SYNC", "Site_NGUID", FIELDS)
+    check_same(backend, "SSAP_SOURCE", "SSAP_RELOAD")
+    check_same(backend, "SSAP_SOURCE", "SSAP_SYNC")
+
+    print ("============================================================================")
+    print ("Sync engine benchmark: {} rows, {} edits (SQLite stand-in at {})".format(row_count, edits, workspace))
+    print ("  Delete + Append : {:.2f} seconds, {} rows written".format(reload_seconds, reload_rows))
+    print ("  Sync engine     : {:.2f} seconds, {} rows touched, {} rows skipped".format(result.seconds, result.touched, result.skipped))
+    print ("  " + result.summary())
+    print ("  Both targets match the source (rows with shared keys and no keys included)")
+    print ("============================================================================")
+
+
+if __name__ == "__main__":
+    main()
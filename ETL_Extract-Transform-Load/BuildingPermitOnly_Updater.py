@@ -1,7 +1,7 @@
 # ---------------------------------------------------------------------------
 # BuildingPermitOnly_Updater.py
 # Created on: 2019-05-09 
-# Updated on 2021-07-18
+# Updated on 2026-10-18
 #
 # Author: Phil Baranyai/GIS Manager
 #
@@ -16,33 +16,36 @@
 #
 # This tool updates VISION records M-F for Assessment Dashboard, & Building Permits.   Separate tool
 # updates parcels runs Saturdays from hardlines and uses the most current VISION tables from this tool.
+#
+# Land district and building permit codes are translated with Code_Translator (code tables in Manifests\Code_Tables.json).
 # 
 # ---------------------------------------------------------------------------
 
 # Import modules
 import sys,os,time,arcpy,datetime,logging
 
+# Shared modules folder (code table translation)
+Shared_Modules = r"\\FILELOCATION\\GIS\\ArcAutomations\\Shared_Modules"
+sys.path.append(Shared_Modules)
+import Code_Translator,Run_Log
+
+# Manifest folder (code tables)
+Manifests = r"\\FILELOCATION\\GIS\\ArcAutomations\\Manifests"
+
 # Stop geoprocessing log history in metadata
 arcpy.SetLogHistory(False)
 
-# Setup error logging
+# Setup run log (JSON-lines records, local copy mirrored to a .jsonl next to logfile on the share -- overwrite every run)
 logfile = r"\\FILELOCATION\\GIS\\GIS_LOGS\\Assessment\\BuildingPermitOnly_Updater.log"  
-logging.basicConfig(filename= logfile, filemode='w', level=logging.DEBUG)
+run_log = Run_Log.start("BuildingPermitOnly_Updater", logfile)
 
 # Setup Date (and day/time)
 date = datetime.date.today().strftime("%Y%m%d")
 Day = time.strftime("%m-%d-%Y", time.localtime())
 Time = time.strftime("%I:%M:%S %p", time.localtime())
 
-try:
-    # Write Logfile (define logfile write process, each step will append to the log, if program is started over, it will wipe the log and re-start fresh)
-    def write_log(text, file):
-        f = open(file, 'a')           # 'a' will append to an existing file if it exists
-        f.write("{}\n".format(text))  # write the text to the logfile and move to next line
-        return
-except:
-    print ("\n Unable to write log file")
-    sys.exit ()
+# Write Logfile (run log records - Run_Log writes them locally and mirrors them to the share in batches, logging.exception goes to the same log)
+write_log = run_log.write_log
 
 #Database Connection Folder
 Database_Connections = r"\\FILELOCATION\\GIS\\ArcAutomations\\Database_Connections"
@@ -56,6 +59,7 @@ CRAW_INTERNAL = Database_Connections + "\\craw_internal@ccsde.sde"
 PUBLIC_WEB = Database_Connections + "\\public_web@ccsde.sde"
 LOCATOR_WKSP = r"\\FILELOCATION\\GIS\\CurrentWebsites\\Locators\\Intranet_Locators"
 AST_REPORTS_FLDR = r"\\FILELOCATION\\GIS\\Assessment\\Reports"
+CODE_TABLES = Manifests + "\\Code_Tables.json"
 
 # Local variables:
 BLDG_PRMT_AST = AUTOWORKSPACE + "\\CCSDE.AUTO_WORKSPACE.Building_Permit_Base"
@@ -225,22 +229,15 @@ except:
     raise
     sys.exit ()
 
-# Convert district numbers to Municipal names in LAND_VISION table
-Land_District = ["11", "12", "13", "14", "15", "16", "17", "18", "19", "20", "21", "22", "23", "24", "25", "26", "27", "28", "29", "30", "31", "32", "33", "34", "35", "36", "37", "38", "39", "40", "41", "42", "43", "44", "45", "46", "47", "48", "49", "50", "51", "52", "53", "54", "55", "56", "57", "58", "59", "60", "61", "62", "63", "64", "65", "66", "67", "68", "69"]
-Muni_Name = ["ATHENS TWP", "BEAVER TWP", "BLOOMFIELD TWP", "BLOOMING VALLEY BORO", "CAMBRIDGE TWP", "CAMBRIDGE SPRINGS BORO", "CENTERVILLE BORO", "COCHRANTON BORO", "CONNEAUT TWP", "CONNEAUTVILLE BORO", "CONNEAUT LAKE BORO", "CUSSEWAGO TWP", "FAIRFIELD TWP", "EAST FAIRFIELD TWP", "EAST FALLOWFIELD TWP", "WEST FALLOWFIELD TWP", "GREENWOOD TWP", "HAYFIELD TWP", "HYDETOWN BORO", "LINESVILLE BORO", "EAST MEAD TWP", "WEST MEAD TWP", "MEADVILLE CITY", "MEADVILLE CITY", "MEADVILLE CITY", "MEADVILLE CITY", "MEADVILLE CITY", "OIL CREEK TWP", "PINE TWP", "RANDOLPH TWP", "RICHMOND TWP", "ROCKDALE TWP", "ROME TWP", "SADSBURY TWP", "SAEGERTOWN BORO", "NORTH SHENANGO TWP", "SOUTH SHENANGO TWP", "WEST SHENANGO TWP", "SPARTA TWP", "SPARTANSBURG BORO", "SPRING TWP", "SPRINGBORO BORO", "STEUBEN TWP", "SUMMERHILL TWP", "SUMMIT TWP", "TITUSVILLE CITY", "TITUSVILLE CITY", "TITUSVILLE CITY", "TITUSVILLE CITY", "TOWNVILLE BORO", "TROY TWP", "UNION TWP", "VENANGO TWP", "VENANGO BORO", "VERNON TWP", "WAYNE TWP", "WOODCOCK TWP", "WOODCOCK BORO", "TITUSVILLE CITY"]
-    
-try:    
-    with arcpy.da.UpdateCursor(VISION_LAND_SDE, 'MUNI_NAME') as cursor:
-        for row in cursor:
-            if row[0] in Land_District:
-                row[0] = Muni_Name[Land_District.index(row[0])]
-                cursor.updateRow(row)
-            else:
-                pass
-        del row 
-        del cursor
-        print ("    Land Districts converted to Municipal names at " + time.strftime("%I:%M:%S %p", time.localtime()))
-        write_log("    Land Districts converted to Municipal names at "+time.strftime("%I:%M:%S %p", time.localtime()), logfile)
+# Convert district numbers to Municipal names in LAND_VISION table, and building permit codes to descriptions in BLDGPERM table
+# (code tables in Manifests\Code_Tables.json - one cursor pass per table, only rows whose value changes are written back)
+try:
+    code_tables = Code_Translator.load_tables(CODE_TABLES)
+    land_result = Code_Translator.translate(VISION_LAND_SDE, code_tables, [("MUNI_NAME", "Land_District_Muni_Name")])
+    print ("    Land Districts converted to Municipal names at " + time.strftime("%I:%M:%S %p", time.localtime()) + ": " + land_result.summary())
+    write_log("    Land Districts converted to Municipal names at "+time.strftime("%I:%M:%S %p", time.localtime()) + ": " + land_result.summary(), logfile)
+    if land_result.unmapped_summary():
+        write_log("    Land District codes with no municipal name: " + land_result.unmapped_summary(), logfile)
 except:
     print ("\n Unable to convert land district codes to municipal names in LAND_VISION table")
     write_log("Unable to convert land district codes to municipal names in LAND_VISION table", logfile)
@@ -249,25 +246,12 @@ except:
     pass
     sys.exit ()
 
-# Convert building permit codes to descriptions in BLDGPERM table
-BuildingPmtCode = ["", "00", "01", "02", "03", "04", "05", "06", "07", "08", "09", "10", "11", "12", "13", "14", "15", "16", "17", "18", "19", "20", "21", "22", "23", "24", "25", "26", "27", "28", "29", "30", "31", "32", "33", "34", "35", "36", "37", "38", "39", "40", "41", "42", "43", "44", "45", "46", "47", "48", "49", "50", "51", "52", "53", "54", "55", "56", "57", "58", "59", "60", "62", "64", "65", "66", "67", "68", "69", "70", "71", "72", "73", "74", "75", "76", "77", "78", "79", "80", "81", "82", "84", "86", "87", "83", "85", "88", "61", "AD", "CM", "NC", "RS","89", "90", "92", "93","94","95","96","97"]
-BuildingPmtDesc = ["UNSPECIFIED", "UNSPECIFIED", "REVIEW REQUESTED", "ADDITION", "ADDITION TO BUSINESS", "ADDITION TO GARAGE", "ADDITION TO HOSPITAL", "ADDITION TO PORCH", "AGRICULTURAL BUILDING", "BANK", "BARN", "COMMERCIAL BASEMENT", "BASEMENT DWELLING", "RESIDENTIAL BASEMENT", "CARPORT", "CELL TOWER", "CHURCH", "DECK", "DEMOLISH - OTHER", "DEMOLISH MULTI-RESIDENTIAL STRUCTURE", "DEMOLISH SINGLE FAMILY DWELLING", "DWELLING & GARAGE", "DWELLING", "DOUBLEWIDE MOBILE HOME", "ENCLOSED PORCH", "ENTRY WAY", "FENCE", "GARAGE", "GARAGE & BREEZEWAY", "COMMERCIAL GARAGE", "GAZEBO", "GREENHOUSE", "HANDICAPPED ACCESSABLE RAMP", "HOSPITAL", "INDUSTRIAL BUILDING", "LEAN TO", "MOBILE HOME", "MOBILE HOME STORAGE", "MODULAR DWELLING", "MULTI-RESIDENTIAL STRUCTURE", "OFFICE", "PARKING LOT/PARKING GARAGE", "PATIO", "PAVILION", "PAVING", "PICNIC SHELTER", "POLE BUILDING", "ABOVE GROUND POOL", "INGROUND POOL", "PORCH", "PUBLIC WORKS", "REMOVE DUE TO FIRE DAMAGE", "REPAIR DWELLING", "REPAIR OUTBUILDING", "ROOF", "SCHOOL", "ADDITION TO SCHOOL", "SERVICE STATION", "SHED", "ADDITION TO STORAGE BUILDING", "REPAIR BUSINESS", "REPAIR GARAGE", "SEASONAL STRUCTURE", "WORK SHOP", "CONCRETE PAD", "CARPORT", "ADDITION TO AGRICULTURAL BUILDING", "STORE", "WAREHOUSE", "COMMERCIAL ADDITION", "NON-ASSESSIBLE STRUCTURE", "REMODEL COMMERICAL STRUCTURE", "REMODEL RESIDENTIAL STRUCTURE", "STORAGE BUILDING", "KILN", "IMPROVEMENTS", "CLUB", "SAWMILL", "COVERALL", "CABIN/COTTAGE", "SIGN", "DRIVEWAY", "STAIRWAY", "CARWASH", "ZONING PERMIT", "911 NOTIFICATION", "PICTOMETRY CHECK", "CONSTRUCTION WITH NO PERMIT", "MISCELLANEOUS", "ADDITION", "COMMERCIAL", "NEW CONSTRUCTION", "RESIDENTIAL","SOLAR FARM","REPORTED STORM DAMAGE","ALTERATIONS","LIMITED SCOPE OPINION","CONTINUED REVIEW","MOBILE HOME REMOVAL","MOBILE HOME PARK","MOBILE HOME ADDED"]
-    
 try:    
-    with arcpy.da.UpdateCursor(VISION_BLDGPERM_SDE, 'BPE_DESC') as cursor:
-        for row in cursor:
-            if row[0] in BuildingPmtCode:
-                row[0] = BuildingPmtDesc[BuildingPmtCode.index(row[0])]
-                cursor.updateRow(row)
-            elif row[0] is None:
-                row[0] = "UNSPECIFIED"
-                cursor.updateRow(row)
-            else:
-                pass
-        del row 
-        del cursor
-        print ("    Building Permit codes converted to descriptions at " + time.strftime("%I:%M:%S %p", time.localtime()))
-        write_log("    Building Permit codes converted to descriptions at "+time.strftime("%I:%M:%S %p", time.localtime()), logfile)
+    permit_result = Code_Translator.translate(VISION_BLDGPERM_SDE, code_tables, [("BPE_DESC", "BuildingPermit_Code_Desc")])
+    print ("    Building Permit codes converted to descriptions at " + time.strftime("%I:%M:%S %p", time.localtime()) + ": " + permit_result.summary())
+    write_log("    Building Permit codes converted to descriptions at "+time.strftime("%I:%M:%S %p", time.localtime()) + ": " + permit_result.summary(), logfile)
+    if permit_result.unmapped_summary():
+        write_log("    Building Permit codes with no description: " + permit_result.unmapped_summary(), logfile)
 except:
     print ("\n Unable to Convert building permit codes to descriptions in BLDGPERM table")
     write_log("Unable to Convert building permit codes to descriptions in BLDGPERM table", logfile)
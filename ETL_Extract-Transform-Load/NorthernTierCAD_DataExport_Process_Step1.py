@@ -7,36 +7,39 @@
 #
 # After this tool is completed, you must connect to the Elk Co. VPN to run the next step
 #
+# Road class, police ORI, directional and post type conversions are translated with Code_Translator (code tables in Manifests\Code_Tables.json)
+#
 # STEP 1 of 2
 # Author: Phil Baranyai/Crawford County GIS Manager
 # Created on: 2019-02-28 
-# Updated on 2021-12-09
+# Updated on 2026-10-18
 # Works in ArcGIS Pro
 # ---------------------------------------------------------------------------
 
 import sys,arcpy,datetime,logging, time
 
+# Shared modules folder (code table translation)
+Shared_Modules = r"\\FILELOCATION\\GIS\\ArcAutomations\\Shared_Modules"
+sys.path.append(Shared_Modules)
+import Code_Translator,Run_Log
+
+# Manifest folder (code tables)
+Manifests = r"\\FILELOCATION\\GIS\\ArcAutomations\\Manifests"
+
 # Stop geoprocessing log history in metadata (stops program from filling up geoprocessing history in metadata with every run)
 arcpy.SetLogHistory(False)
 
-# Setup error logging (configure logging location, type, and filemode -- overwrite every run)
+# Setup run log (JSON-lines records, local copy mirrored to a .jsonl next to logfile on the share -- overwrite every run)
 logfile = r"\\FILELOCATION\\GIS\\GIS_LOGS\\911\\NorthernTierCAD_DataExport.log"  # Run Log
-logging.basicConfig(filename=logfile, filemode='w', level=logging.DEBUG)
+run_log = Run_Log.start("NorthernTierCAD_DataExport_Process_Step1", logfile)
 
 # Setup Date (and day/time)
 date = datetime.date.today().strftime("%Y%m%d")
 Day = time.strftime("%m-%d-%Y", time.localtime())
 Time = time.strftime("%I:%M:%S %p", time.localtime())
 
-try:
-    # Write Logfile (define logfile write process, each step will append to the log)
-    def write_log(text, file):
-        f = open(file, 'a')           # 'a' will append to an existing file if it exists
-        f.write("{}\n".format(text))  # write the text to the logfile and move to next line
-        return
-except:
-    print ("\n Unable to write log file")
-    sys.exit ()
+# Write Logfile (run log records - Run_Log writes them locally and mirrors them to the share in batches, logging.exception goes to the same log)
+write_log = run_log.write_log
 
 # Define Work Paths for FGDB:
 NORTHERN_TIER_CAD_FLDR = r"\\FILELOCATION\\GIS\\NorthernTierCAD_GIS\\Exported FGDB to NorthernTier"
@@ -44,6 +47,17 @@ NORTHERN_TIER_COUNTY_DATA_XML = r"\\FILELOCATION\\GIS\\NorthernTierCAD_GIS\\XML_
 NORTHERN_TIER_CAD_FGDB_OLD = NORTHERN_TIER_CAD_FLDR+ "\\Northern_Tier_County_Data_YYYYMMDD.gdb"
 PA_NG911_EXPORT_FLDR = r"\\FILELOCATION\\GIS\\NorthernTierCAD_GIS\\Exported FGDB to NorthernTier\\PA_NG911_Exports"
 PA_NG911_EXPORT_FGDB_OLD = PA_NG911_EXPORT_FLDR + "\\PA_NG911_Export_YYYYMMDD.gdb"
+CODE_TABLES = Manifests + "\\Code_Tables.json"
+
+try:
+    # Load code tables (road class, police ORI, directional and post type conversions)
+    code_tables = Code_Translator.load_tables(CODE_TABLES)
+except:
+    print ("\n Unable to load code tables from " + CODE_TABLES)
+    write_log("Unable to load code tables from " + CODE_TABLES, logfile)
+    logging.exception('Got exception on load code tables logged at:'  + str(Day) + " " + str(Time))
+    raise
+    sys.exit ()
 
 start_time = time.time()
 
@@ -312,24 +326,13 @@ except:
     raise
     sys.exit ()
 
-# Convert Road Classification (iterate through centerline export and convert road classification from Crawford County system to Northern Tier System)
-Crawford_Road_Class = ["INTERSTATE", "RAMP", "MAJOR ARTERIAL", "MINOR ARTERIAL", "COLLECTOR", "LOCAL", "SERVICE", "4 WHEEL DRIVE", "RECREATION", "RESOURCE", "OTHER", "UNKNOWN", "MINOR COLLECTOR"]
-NT_Road_Class = ["Interstate", "Other Road", "US Highway", "State Highway", "State Road", "Local Road", "Other Road", "Other Road", "Other Road", "Other Road", "Other Road", "Other Road", "State Road"]
-    
+# Convert Road Classification (convert road classification from Crawford County system to Northern Tier System - code table Crawford_Road_Class_NT in Manifests\Code_Tables.json)
 try:    
-    with arcpy.da.UpdateCursor(Centerline_CrawfordCo, 'RoadClass') as cursor:
-        for row in cursor:
-            if row[0] in Crawford_Road_Class:
-                row[0] = NT_Road_Class[Crawford_Road_Class.index(row[0])]
-                cursor.updateRow(row)
-            elif row[0] is None:
-                row[0] = "Local Road"
-                cursor.updateRow(row)
-            else:
-                pass
-        del row 
-        del cursor
-        print ("    Road classification converted to Northern Tier standards...")
+    road_class_result = Code_Translator.translate(Centerline_CrawfordCo, code_tables, [("RoadClass", "Crawford_Road_Class_NT")])
+    print ("    Road classification converted to Northern Tier standards: " + road_class_result.summary())
+    write_log("    Road classification converted to Northern Tier standards: " + road_class_result.summary(), logfile)
+    if road_class_result.unmapped_summary():
+        write_log("    Road classes with no Northern Tier class: " + road_class_result.unmapped_summary(), logfile)
 except:
     print ("\n Unable to convert Road Classification")
     write_log("Unable to convert Road Classification", logfile)
@@ -619,18 +622,12 @@ except:
     raise
     sys.exit ()
 
-# Calculate Description Field - ORI CODES (iterate through records, change police dept names into ORIs in POLICE_DEPT field, using dictonaries below)
-Police_ID_Pre = ["PA STATE POLICE - MEADVILLE", "PA STATE POLICE - CORRY", "CAMBRIDGE SPRINGS POLICE", "COCHRANTON POLICE", "CONNEAUT LAKE REGIONAL POLICE", "LINESVILLE POLICE", "MEADVILLE CITY POLICE", "VERNON POLICE", "WEST MEAD POLICE", "TITUSVILLE CITY POLICE", "CAMBRIDGE SPRINGS POLICE"]
-Police_ID_Post = ["PAPSP5500", "PAPSP1400", "PA200300", "PA200500", "PA201800", "PA200800", "PA200100", "PA201100", "PA201400", "PA200200", "PA0200300"]
-    
+# Calculate Description Field - ORI CODES (change police dept names into ORIs in POLICE_DEPT field - code table Police_Dept_ORI in Manifests\Code_Tables.json)
 try:    
-    with arcpy.da.UpdateCursor(POLICE_DEPT_COVERAGE_DELETE, 'POLICE_DEPT') as cursor:
-        for row in cursor:
-            if row[0] in Police_ID_Pre:
-                row[0] = Police_ID_Post[Police_ID_Pre.index(row[0])]
-                cursor.updateRow(row)
-        del row 
-        del cursor
+    ori_result = Code_Translator.translate(POLICE_DEPT_COVERAGE_DELETE, code_tables, [("POLICE_DEPT", "Police_Dept_ORI")])
+    write_log("    Police departments converted to ORI codes: " + ori_result.summary(), logfile)
+    if ori_result.unmapped_summary():
+        write_log("    Police departments with no ORI code: " + ori_result.unmapped_summary(), logfile)
 except:
     print ("\n Unable to Calculate Description Field - ORI CODES")
     write_log("Unable to Calculate Description Field - ORI CODES", logfile)
@@ -1034,56 +1031,20 @@ except:
 print ("\n  Convert Pre & Post Directional as well as Post Type in Centerline FC within PA NG911 FGDB")
 write_log ("\n  Convert Pre & Post Directional as well as Post Type in Centerline FC within PA NG911 FGDB",logfile)
 
-# Convert Centerline Pre & Post Directional as well as Post Type (iterate through centerline export and convert fields from Crawford County system to NG911 standards)
-Directionals_ABRV = ["E", "N", "S", "W", "NW", "SW", "NE", "SE"]
-Directionals_NG911 = ["EAST", "NORTH", "SOUTH", "WEST", "NORTHWEST", "SOUTHWEST", "NORTHEAST", "SOUTHEAST"]
-PostType_ABRV = ["ALY","AVE","BCH","BLVD","CIR","CLB","CP","CT","DR","EXT","HOLW","HTS","HWY","KNL","LK","LN","LNDG","MDWS","MNR","PKWY","PL","PLZ","PT","RD","RDG","RTE","SQ","ST","TER","TRL","XING"]
-PostType_NG911 = ["ALLEY","AVENUE","BEACH","BOULEVARD","CIRCLE","CLUB","CAMP","COURT","DRIVE","EXTENSION","HOLLOW","HEIGHTS","HIGHWAY","KNOLL","LAKE","LANE","LANDING","MEADOWS","MANOR","PARKWAY","PLACE","PLAZA","POINT","ROAD","RIDGE","ROUTE","SQUARE","STREET","TERRACE","TRAIL","CROSSING"]
-    
-try:    
-    with arcpy.da.UpdateCursor(Centerline_NG911, 'St_PreDir') as cursor:
-        for row in cursor:
-            if row[0] in Directionals_ABRV:
-                row[0] = Directionals_NG911[Directionals_ABRV.index(row[0])]
-                cursor.updateRow(row)
-            else:
-                pass
-        del row 
-        del cursor
-        print ("    Centerline Pre directional field converted to NG911 standards...")
-    with arcpy.da.UpdateCursor(Centerline_NG911, 'St_PosDir') as cursor:
-        for row in cursor:
-            if row[0] in Directionals_ABRV:
-                row[0] = Directionals_NG911[Directionals_ABRV.index(row[0])]
-                cursor.updateRow(row)
-            else:
-                pass
-        del row 
-        del cursor
-        print ("    Centerline Post directional field converted to NG911 standards...")
-except:
-    print ("\n Unable to convert Centerline Directional Fields")
-    write_log("Unable to convert Centerline Directional Fields", logfile)
-    logging.exception('Got exception on convert Centerline Directional Fields logged at:'  + str(Day) + " " + str(Time))
-    raise
-    pass
-    sys.exit ()
+# Convert Centerline Pre & Post Directional as well as Post Type (convert fields from Crawford County system to NG911 standards - code tables
+# Directionals_NG911 & PostType_NG911 in Manifests\Code_Tables.json, all three fields in one cursor pass)
+NG911_STREET_TRANSLATIONS = [("St_PreDir", "Directionals_NG911"), ("St_PosDir", "Directionals_NG911"), ("St_PosTyp", "PostType_NG911")]
 
 try:    
-    with arcpy.da.UpdateCursor(Centerline_NG911, 'St_PosTyp') as cursor:
-        for row in cursor:
-            if row[0] in PostType_ABRV:
-                row[0] = PostType_NG911[PostType_ABRV.index(row[0])]
-                cursor.updateRow(row)
-            else:
-                pass
-        del row 
-        del cursor
-        print ("    Centerline post type field converted to NG911 standards...")
-except:
-    print ("\n Unable to convert Centerline Post Type Field")
-    write_log("Unable to convert Centerline Post Type Field", logfile)
-    logging.exception('Got exception on convert Centerline Post Type Field logged at:'  + str(Day) + " " + str(Time))
+    centerline_ng911_result = Code_Translator.translate(Centerline_NG911, code_tables, NG911_STREET_TRANSLATIONS)
+    print ("    Centerline pre/post directional and post type fields converted to NG911 standards: " + centerline_ng911_result.summary())
+    write_log("    Centerline pre/post directional and post type fields converted to NG911 standards: " + centerline_ng911_result.summary(), logfile)
+    if centerline_ng911_result.unmapped_summary():
+        write_log("    Centerline values with no NG911 equivalent: " + centerline_ng911_result.unmapped_summary(), logfile)
+except:
+    print ("\n Unable to convert Centerline Directional & Post Type Fields")
+    write_log("Unable to convert Centerline Directional & Post Type Fields", logfile)
+    logging.exception('Got exception on convert Centerline Directional & Post Type Fields logged at:'  + str(Day) + " " + str(Time))
     raise
     pass
     sys.exit ()
@@ -1092,49 +1053,15 @@ print ("\n  Convert Pre & Post Directional as well as Post Type in Adress Point
 write_log ("\n  Convert Pre & Post Directional as well as Post Type in Address Point FC within PA NG911 FGDB",logfile)
 
 try:    
-    with arcpy.da.UpdateCursor(AddressPoint_NG911, 'St_PreDir') as cursor:
-        for row in cursor:
-            if row[0] in Directionals_ABRV:
-                row[0] = Directionals_NG911[Directionals_ABRV.index(row[0])]
-                cursor.updateRow(row)
-            else:
-                pass
-        del row 
-        del cursor
-        print ("    Address Points street pre directional field converted to NG911 standards...")
-    with arcpy.da.UpdateCursor(AddressPoint_NG911, 'St_PosDir') as cursor:
-        for row in cursor:
-            if row[0] in Directionals_ABRV:
-                row[0] = Directionals_NG911[Directionals_ABRV.index(row[0])]
-                cursor.updateRow(row)
-            else:
-                pass
-        del row 
-        del cursor
-        print ("    Address Points street post directional fields converted to NG911 standards...")
-except:
-    print ("\n Unable to convert Address Points Street Directional Fields")
-    write_log("Unable to convert Address Points Street Directional Fields", logfile)
-    logging.exception('Got exception on convert Address Points Street Directional Fields logged at:'  + str(Day) + " " + str(Time))
-    raise
-    pass
-    sys.exit ()
-
-try:    
-    with arcpy.da.UpdateCursor(AddressPoint_NG911, 'St_PosTyp') as cursor:
-        for row in cursor:
-            if row[0] in PostType_ABRV:
-                row[0] = PostType_NG911[PostType_ABRV.index(row[0])]
-                cursor.updateRow(row)
-            else:
-                pass
-        del row 
-        del cursor
-        print ("    Address Points street post type field converted to NG911 standards...")
-except:
-    print ("\n Unable to convert Address Points Street Post Type Field")
-    write_log("Unable to convert Address Points Street Post Type Field", logfile)
-    logging.exception('Got exception on convert Address Points Street Post Type Field logged at:'  + str(Day) + " " + str(Time))
+    address_ng911_result = Code_Translator.translate(AddressPoint_NG911, code_tables, NG911_STREET_TRANSLATIONS)
+    print ("    Address Points street pre/post directional and post type fields converted to NG911 standards: " + address_ng911_result.summary())
+    write_log("    Address Points street pre/post directional and post type fields converted to NG911 standards: " + address_ng911_result.summary(), logfile)
+    if address_ng911_result.unmapped_summary():
+        write_log("    Address Point values with no NG911 equivalent: " + address_ng911_result.unmapped_summary(), logfile)
+except:
+    print ("\n Unable to convert Address Points Street Directional & Post Type Fields")
+    write_log("Unable to convert Address Points Street Directional & Post Type Fields", logfile)
+    logging.exception('Got exception on convert Address Points Street Directional & Post Type Fields logged at:'  + str(Day) + " " + str(Time))
     raise
     pass
     sys.exit ()
@@ -1,7 +1,7 @@
 # ---------------------------------------------------------------------------
 # Parcel_Builder.py
 # Created on: 2019-05-09 
-# Updated on 2022-01-26
+# Updated on 2026-10-18
 # Works in ArcGIS Pro
 #
 # Author: Phil Baranyai/GIS Manager
@@ -17,32 +17,40 @@
 # Sections
 # Meadville Blocks
 # Titusville Blocks
+#
+#   LANDEX_URL is calculated with Landex_URLs (Shared_Modules) - one read of the URL columns,
+#   links built as a column transform, only changed rows written back
+#
+#   Tax Parcels are patched incrementally (Parcel_Changes) - only parcels whose hardlines, PIN or
+#   VISION record changed since the last run are rebuilt.  The full rebuild runs with --full, on
+#   FULL_REBUILD_WEEKDAY, on the first run, when too many parcels changed, or if the patch fails.
+#
+#   VISION tables are joined with Hash_Join (Shared_Modules) instead of JoinField - VISIDATA is read
+#   once into a lookup and the joined fields written back in one pass
 # ---------------------------------------------------------------------------
 
 # Import modules
 import sys,arcpy,datetime,logging,time
 
+# Shared modules folder (Landex URL builder, parcel change tracking, VISION hash join)
+Shared_Modules = r"\\FILELOCATION\\GIS\\ArcAutomations\\Shared_Modules"
+sys.path.append(Shared_Modules)
+import Hash_Join,Landex_URLs,Parcel_Changes,Run_Log,Sync_Engine
+
 # Stop geoprocessing log history in metadata
 arcpy.SetLogHistory(False)
 
-# Setup error logging
+# Setup run log (JSON-lines records, local copy mirrored to a .jsonl next to logfile on the share -- overwrite every run)
 logfile = r"\\FILELOCATION\\GIS\\GIS_LOGS\\Assessment\\Parcel_Builder.log"  
-logging.basicConfig(filename= logfile, filemode='w', level=logging.DEBUG)
+run_log = Run_Log.start("Parcel_Builder", logfile)
 
 # Setup Date (and day/time)
 date = datetime.date.today().strftime("%Y%m%d")
 Day = time.strftime("%m-%d-%Y", time.localtime())
 Time = time.strftime("%I:%M:%S %p", time.localtime())
 
-try:
-    # Write Logfile
-    def write_log(text, file):
-        f = open(file, 'a')           # 'a' will append to an existing file if it exists
-        f.write("{}\n".format(text))  # write the text to the logfile and move to next line
-        return
-except:
-    print ("\n Unable to write log file")
-    sys.exit ()
+# Write Logfile (run log records - Run_Log writes them locally and mirrors them to the share in batches, logging.exception goes to the same log)
+write_log = run_log.write_log
 
 #Database Connection Folder
 Database_Connections = r"\\FILELOCATION\\GIS\\ArcAutomations\\Database_Connections"
@@ -89,6 +97,12 @@ VISION_TEMP_JOIN_SDE = AUTOWORKSPACE + "\\CCSDE.AUTO_WORKSPACE.VISION_TEMP_JOIN_
 VISION_OWNER_TBL_WEBTemp = AUTOWORKSPACE + "\\CCSDE.AUTO_WORKSPACE.VISION_OWNER_TBL_WEBTemp"
 VISIDATA_TEMP = AUTOWORKSPACE + "\\CCSDE.AUTO_WORKSPACE.VISIDATA_Temp"
 
+# Incremental rebuild - snapshot of hardlines, PINs and VISION records from the last run
+Parcel_State = r"\\FILELOCATION\\GIS\\ArcAutomations\\State\\Parcel_Builder_State.sqlite"
+
+# Day the full rebuild runs even when only a few parcels changed (0 = Monday ... 6 = Sunday)
+FULL_REBUILD_WEEKDAY = 6
+
 start_time = time.time()
 
 print ("============================================================================")
@@ -118,182 +132,232 @@ write_log("Titusville Blocks Feature Class", logfile)
 write_log("Works in ArcGIS Pro", logfile)
 write_log("============================================================================", logfile)
 
-print ("\n Archiving Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE")
-write_log("\n Archiving Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE: " + str(Day) + " " + str(Time), logfile)
-
-try:
-    # Delete Tax_Parcel_Joined_Old - AUTO_WORKSPACE, rename the current Tax_Parcel_Joined as old.
-    if arcpy.Exists(TAXPARCEL_JOINED_OLD_AUTOWKSP):
-        arcpy.Delete_management(TAXPARCEL_JOINED_OLD_AUTOWKSP, "FeatureClass")
-    if arcpy.Exists(TAXPARCEL_JOINED_AUTOWKSP):
-        arcpy.Rename_management(TAXPARCEL_JOINED_AUTOWKSP, TAXPARCEL_JOINED_OLD_AUTOWKSP, "FeatureClass")
-except:
-    print ("\n Unable to archive Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE")
-    write_log("\n Unable to archive Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE", logfile)
-    logging.exception('Got exception on archive Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE logged at:' + str(Day) + " " + str(Time))
-    raise
-    sys.exit ()
-
-print ("       Archiving Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE completed")
-write_log("       Archiving Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE completed", logfile)
-
-print ("\n Creating Tax Parcels from Hardlines and PINs - Tax_Parcel_Joined - AUTO_WORKSPACE")
-write_log("\n Creating Tax Parcels from Hardlines and PINs - Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
-
-try:
-    # Create tax parcels from hardlines (TAX_PARCEL_TEMP) - creating polygons from hardlines
-    TAX_PARCEL_TEMP = arcpy.FeatureToPolygon_management(HARDLINES_AST, "in_memory/TAX_PARCEL_TEMP", "","NO_ATTRIBUTES", "")
-except:
-    print ("\n Unable to create tax parcels from hardlines (TAX_PARCEL_TEMP)")
-    write_log("\n Unable to create tax parcels from hardlines (TAX_PARCEL_TEMP)", logfile)
-    logging.exception('Got exception on Unable to create tax parcels from hardlines (TAX_PARCEL_TEMP) logged at:' + str(Day) + " " + str(Time))
-    raise
-    sys.exit ()
-
-try:
-    # Join TAX_PARCEL_TEMP to PIN feature class - joining in basic information (including PID) to polygons created via hardlines.  Once PID is part of polygon, will be able to join vision records to polygons to make parcels.
-    TAX_PARCEL_TEMP_JOIN = arcpy.SpatialJoin_analysis(TAX_PARCEL_TEMP, PIN_AST, "in_memory/TAX_PARCEL_TEMP_JOIN", "JOIN_ONE_TO_ONE", "KEEP_ALL", 'SHAPE_Length "SHAPE_Length" false true true 8 Double 0 0 ,First,#,in_memory/TAX_PARCEL_TEMP,SHAPE_Length,-1,-1;SHAPE_Area "SHAPE_Area" false true true 8 Double 0 0 ,First,#,in_memory/TAX_PARCEL_TEMP,SHAPE_Area,-1,-1;CAMA_PIN "CAMA_PIN" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,CAMA_PIN,-1,-1;MAP "MAP" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,MAP,-1,-1;PARCEL "PARCEL" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,PARCEL,-1,-1;LOT "LOT" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,LOT,-1,-1;GLOBALID "GLOBALID" false false false 38 GlobalID 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,GLOBALID,-1,-1;ID_PIN "ID_PIN" true true false 2 Short 0 5 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,ID_PIN,-1,-1;MAPTYPE "MAPTYPE" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,MAPTYPE,-1,-1;CITY "CITY" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,CITY,-1,-1;MEADVILLE "MEADVILLE" true true false 10 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,MEADVILLE,-1,-1;TITUSVILLE "TITUSVILLE" true true false 10 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,TITUSVILLE,-1,-1;EDITOR "EDITOR" false true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,EDITOR,-1,-1;DATEMODIFY "DATEMODIFY" false true false 8 Date 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,DATEMODIFY,-1,-1;LANDEX_URL_TYPE "Landex URL Type" true true false 20 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,LANDEX_URL_TYPE,-1,-1;PLANS_AVAILABLE "Plans Available" true true false 5 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,PLANS_AVAILABLE,-1,-1;BLK_MAP "Block Map" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,BLK_MAP,-1,-1;BLK_PARCEL "Block Parcel" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,BLK_PARCEL,-1,-1;BLK_MAPTYPE "Block Maptype" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,BLK_MAPTYPE,-1,-1;INS_MAP "Insert Map" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,INS_MAP,-1,-1;INS_DESCRIPTION "Insert Description" true true false 255 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,INS_DESCRIPTION,-1,-1;INS_SECTION_MAP "Insert Section Map" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,INS_SECTION_MAP,-1,-1;INS_SCALE "Insert Scale" true true false 8 Double 8 38 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,INS_SCALE,-1,-1;INS_ROTATION "Insert Rotation" true true false 8 Double 8 38 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,INS_ROTATION,-1,-1;SEC_MAP "Section Map" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,SEC_MAP,-1,-1;SEC_MUNI_NAME "Municipal Name" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,SEC_MUNI_NAME,-1,-1;SEC_ANGLE "Section Angle" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,SEC_ANGLE,-1,-1;SEC_SCALE "Section Scale" true true false 8 Double 8 38 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,SEC_SCALE,-1,-1;SEC_ROTATION "Section Rotation" true true false 8 Double 8 38 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,SEC_ROTATION,-1,-1;SEC_WARD "Section Ward" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,SEC_WARD,-1,-1;MDVL_BLK_MAP "Meadville Block Map" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,MDVL_BLK_MAP,-1,-1;MDVL_BLK_PARCEL "Meadvile Block Parcel" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,MDVL_BLK_PARCEL,-1,-1;MDVL_BLK_MAPTYPE "Meadvile Block Maptype" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,MDVL_BLK_MAPTYPE,-1,-1;TSVL_BLK_MAP "Titusville Block Map" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,TSVL_BLK_MAP,-1,-1;TSVL_BLK_PARCEL "Titusville Block Parcel" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,TSVL_BLK_PARCEL,-1,-1;TSVL_BLK_MAPTYPE "Titusville Block Maptype" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,TSVL_BLK_MAPTYPE,-1,-1;TSVL_BLK_ID "Titusville Block ID" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,TSVL_BLK_ID,-1,-1;UPI "UPI #" true true false 60 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,UPI,-1,-1;PID "PID" true true false 4 Long 0 10 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,PID,-1,-1;LONGITUDE_X "Longitude-X" true true false 8 Double 8 38 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,LONGITUDE_X,-1,-1;LATITUDE_Y "Latitude-Y" true true false 8 Double 8 38 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,LATITUDE_Y,-1,-1', "INTERSECT", "", "")
-except:
-    print ("\n Unable to Join TAX_PARCEL_TEMP to PIN feature class")
-    write_log("\n Unable to Join TAX_PARCEL_TEMP to PIN feature class", logfile)
-    logging.exception('Got exception on Join TAX_PARCEL_TEMP to PIN feature class logged at:' + str(Day) + " " + str(Time))
-    raise
-    sys.exit ()
-
-try:
-    # Delete excess fields from TAX_PARCEL_TEMP_JOIN  (Delete extra fields from AST.PIN)
-    arcpy.DeleteField_management(TAX_PARCEL_TEMP_JOIN, "Join_Count;TARGET_FID;EDITOR")
-except:
-    print ("\n Unable to delete excess fields from TAX_PARCEL_TEMP_JOIN")
-    write_log("\n Unable to delete excess fields from TAX_PARCEL_TEMP_JOIN", logfile)
-    logging.exception('Got exception on delete excess fields from TAX_PARCEL_TEMP_JOIN logged at:' + str(Day) + " " + str(Time))
-    raise
-    sys.exit ()
-
-try:    
-    # Dissolve TAX_PARCEL_TEMP_JOIN - in_memory to Tax_Parcel_Joined - AUTO_WORKSPACE  (joins parcels that are hooked together by softline hooks - dissolved by identical data in fields)
-    arcpy.Dissolve_management(TAX_PARCEL_TEMP_JOIN, TAXPARCEL_JOINED_AUTOWKSP, "CAMA_PIN;MAP;PARCEL;LOT;ID_PIN;MAPTYPE;CITY;MEADVILLE;TITUSVILLE;LANDEX_URL_TYPE;PLANS_AVAILABLE;BLK_MAP;BLK_PARCEL;BLK_MAPTYPE;INS_MAP;INS_DESCRIPTION;INS_SECTION_MAP;INS_SCALE;INS_ROTATION;SEC_MAP;SEC_MUNI_NAME;SEC_ANGLE;SEC_SCALE;SEC_ROTATION;SEC_WARD;MDVL_BLK_MAP;MDVL_BLK_PARCEL;MDVL_BLK_MAPTYPE;TSVL_BLK_MAP;TSVL_BLK_PARCEL;TSVL_BLK_MAPTYPE;TSVL_BLK_ID;PID", "", "MULTI_PART", "DISSOLVE_LINES")
-except:
-    print ("\n Unable to Dissolve TAX_PARCEL_TEMP_JOIN - in_memory to Tax_Parcel_Joined - AUTO_WORKSPACE")
-    write_log("\n Unable to Dissolve TAX_PARCEL_TEMP_JOIN - in_memory to Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
-    logging.exception('Got exception on Dissolve TAX_PARCEL_TEMP_JOIN - in_memory to Tax_Parcel_Joined - AUTO_WORKSPACE logged at:' + str(Day) + " " + str(Time))
-    raise
-    sys.exit ()
-
-try:
-    # Clear "in_memory" for next process
-    arcpy.Delete_management("in_memory")
-except:
-    print ("\n Unable to clear TAX_PARCEL_TEMP from in_memory")
-    write_log("\n Unable to clear TAX_PARCEL_TEMP from in_memory", logfile)
-    logging.exception('Got exception on clear TAX_PARCEL_TEMP from in_memory logged at:' + str(Day) + " " + str(Time))
-    raise
-    sys.exit ()
-
-print ("       Creating Tax Parcels from Hardlines and PINs - Tax_Parcel_Joined - AUTO_WORKSPACE completed")
-write_log("       Creating Tax Parcels from Hardlines and PINs - Tax_Parcel_Joined - AUTO_WORKSPACE completed", logfile)
-
-print ("\n Joining VISION tables to Tax_Parcel_Joined - AUTO_WORKSPACE")
-write_log("\n Joining VISION tables to Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
-
-try:
-    # Join VISIDATA_TEMP to Tax_Parcel_Joined - AUTO_WORKSPACE  (joins vision data from above steps to polygons created by hardlines)
-    arcpy.management.JoinField(TAXPARCEL_JOINED_AUTOWKSP, "PID", VISIDATA_TEMP, "REM_PID", None)
-    print ("   VISION_OWNER_TBL joined to Tax_Parcel_Joined...")
-    write_log("   VISION_OWNER_TBL joined to Tax_Parcel_Joined...", logfile)
-except:
-    print ("\n Unable to join VISIDATA_TEMP to Tax_Parcel_Joined - AUTO_WORKSPACE")
-    write_log("\n Unable to join VISIDATA_TEMP to Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
-    logging.exception('Got exception on join VISIDATA_TEMP to Tax_Parcel_Joined - AUTO_WORKSPACE logged at:' + str(Day) + " " + str(Time))
-    raise
-    sys.exit ()
-
-try:
-    # Add GIS_ACRES field to Tax_Parcel_Joined - AUTO_WORKSPACE 
-    arcpy.AddField_management(TAXPARCEL_JOINED_AUTOWKSP, "GIS_ACRES", "DOUBLE", "", "", "", "GIS Calculated Acres - not legal", "NULLABLE", "NON_REQUIRED", "")
-    print ("    GIS Acres field added to Tax Parcel Joined - AUTO_WORKSPACE")
-    write_log("    GIS Acres field added to Tax Parcel Joined - AUTO_WORKSPACE",logfile)
-except:
-    print ("\n Unable to Add GIS_ACRES field to Tax_Parcel_Joined - AUTO_WORKSPACE")
-    write_log("\n Unable to Add GIS_ACRES field to Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
-    logging.exception('Got exception on Add GIS_ACRES field to Tax_Parcel_Joined - AUTO_WORKSPACE logged at:' + str(Day) + " " + str(Time))
-    raise
-    sys.exit ()
-try:
-    # Calculate GIS_ACRES field in Tax_Parcel_Joined - AUTO_WORKSPACE from polygon shape acres  (adds GIS acres field - for QA/QC process of checking actual acreage from vision against polygon acreage.  will not be 100%, however large variances can be caught)
-    arcpy.CalculateField_management(TAXPARCEL_JOINED_AUTOWKSP, "GIS_ACRES", "!shape.area@acres!", "PYTHON", "")
-    TaxParcel_result = arcpy.GetCount_management(TAXPARCEL_JOINED_AUTOWKSP)
-    print ('    {} has {} records calculated'.format(TAXPARCEL_JOINED_AUTOWKSP, TaxParcel_result[0]))
-    write_log('    {} has {} records calculated'.format(TAXPARCEL_JOINED_AUTOWKSP, TaxParcel_result[0]), logfile)
-except:
-    print ("\n Unable to Calculate GIS_ACRES field in Tax_Parcel_Joined - AUTO_WORKSPACE from polygon shape acres")
-    write_log("\n Unable to Calculate GIS_ACRES field in Tax_Parcel_Joined - AUTO_WORKSPACE from polygon shape acres", logfile)
-    logging.exception('Got exception on Calculate GIS_ACRES field in Tax_Parcel_Joined - AUTO_WORKSPACE from polygon shape acres logged at:' + str(Day) + " " + str(Time))
-    raise
-    sys.exit ()
-
-try:
-    # Add Landex_URL field to Tax_Parcel_Joined - AUTO_WORKSPACE
-    arcpy.AddField_management(TAXPARCEL_JOINED_AUTOWKSP, "LANDEX_URL", "TEXT", "", "", "600", "Landex URL", "NULLABLE", "NON_REQUIRED", "")
-    print ("     Landex URL field added to Tax Parcel Joined - AUTO_WORKSPACE")
-    write_log("     Landex URL field added to Tax Parcel Joined - AUTO_WORKSPACE",logfile)
-except:
-    print ("\n Unable to Add Landex_URL field to Tax_Parcel_Joined - AUTO_WORKSPACE")
-    write_log("\n Unable to Add Landex_URL field to Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
-    logging.exception('Got exception on Add Landex_URL field to Tax_Parcel_Joined - AUTO_WORKSPACE logged at:' + str(Day) + " " + str(Time))
-    raise
-    sys.exit ()
-try:
-    # Calculate Landex URL Field in Tax_Parcel_Joined - AUTO_WORKSPACE (calculates custom URL per record for landex use based on fields from parcels)
-    URLFIELDS = ['LANDEX_URL','SLH_BOOK','SLH_PAGE',str('REM_MBLU_MAP'),str('REM_MBLU_BLOCK'),str('REM_MBLU_LOT'),'PID','LANDEX_URL_TYPE']
-    cursor =  arcpy.da.UpdateCursor(TAXPARCEL_JOINED_AUTOWKSP,URLFIELDS)
-    for row in cursor:
-        if  row[6] == None:
-            continue
-        if (row[7] == 'Book_Page' and row[6] > 0):
-            row[0] = "http://172.16.154.36/SearchResultsList.asp?bookNumber={}&pageNumber={}&submit=SEARCH&forwardRequest=SearchResultsList.asp&displayPage=1&displayItemsPerPage=50&maximumMatches=1000&getCustomerData=TRUE".format(row[1],row[2])
-            cursor.updateRow(row)
-        if  row[6] == None:
-            continue
-        if (row[7] == 'UPI' and row[6] > 0):
-            row[0] = "http://172.16.154.36/SearchResultsList.asp?parcelNumber1=20&parcelNumber2={}&parcelNumber3={}&parcelNumber4={}&parcelNumber5={}&submit=SEARCH&parcelNumberFieldCount=5&parcelNumberFormat=2+4+3+17+6+&forwardRequest=SearchResultsList.asp&displayPage=1&displayItemsPerPage=50&maximumMatches=1000&getCustomerData=TRUE".format(row[3],row[4],row[5],row[6])
-            cursor.updateRow(row)
-        if (row[7] == None):
-            row = ""
-            pass
+print ("\n Checking parcel inputs for changes since the last run")
+write_log("\n Checking parcel inputs for changes since the last run", logfile)
+
+# Full rebuild when asked (--full), on FULL_REBUILD_WEEKDAY, with no snapshot from a previous run, or when too many parcels changed
+full_rebuild = "--full" in sys.argv or datetime.date.today().weekday() == FULL_REBUILD_WEEKDAY or not arcpy.Exists(TAXPARCEL_JOINED_AUTOWKSP)
+parcel_tracker = None
+affected_parcels = set()
+try:
+    # Compare hardlines, PINs and VISIDATA_TEMP with the snapshot saved by the last run
+    parcel_tracker = Parcel_Changes.ParcelChangeTracker(Parcel_State, HARDLINES_AST, PIN_AST, VISIDATA_TEMP, lambda text: (print (text), write_log(text, logfile)))
+    parcel_changes = parcel_tracker.find_changes()
+    if parcel_changes is None:
+        full_rebuild = True
+        print ("    No snapshot from a previous run - full rebuild")
+        write_log("    No snapshot from a previous run - full rebuild", logfile)
+    elif not full_rebuild:
+        print ("    " + parcel_changes.summary())
+        write_log("    " + parcel_changes.summary(), logfile)
+        affected_parcels = parcel_tracker.affected_parcels(TAXPARCEL_JOINED_AUTOWKSP, parcel_changes)
+        if len(affected_parcels) > Parcel_Changes.MAX_INCREMENTAL_PARCELS:
+            full_rebuild = True
+            print ("    {} parcels affected - full rebuild".format(len(affected_parcels)))
+            write_log("    {} parcels affected - full rebuild".format(len(affected_parcels)), logfile)
+except:
+    full_rebuild = True
+    print ("\n Unable to check parcel inputs for changes - full rebuild")
+    write_log("\n Unable to check parcel inputs for changes - full rebuild", logfile)
+    logging.exception('Got exception on check parcel inputs for changes logged at:' + str(Day) + " " + str(Time))
+
+archived = False
+if not full_rebuild:
+    print ("\n Patching {} changed parcels in Tax_Parcel_Joined - AUTO_WORKSPACE".format(len(affected_parcels)))
+    write_log("\n Patching {} changed parcels in Tax_Parcel_Joined - AUTO_WORKSPACE".format(len(affected_parcels)), logfile)
+    try:
+        # Copy Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE (the archive still holds last night's parcels)
+        if arcpy.Exists(TAXPARCEL_JOINED_OLD_AUTOWKSP):
+            arcpy.Delete_management(TAXPARCEL_JOINED_OLD_AUTOWKSP, "FeatureClass")
+        arcpy.Copy_management(TAXPARCEL_JOINED_AUTOWKSP, TAXPARCEL_JOINED_OLD_AUTOWKSP)
+        archived = True
+        # Rebuild only the affected parcels (and the parcels hooked to them) and patch them into Tax_Parcel_Joined
+        if affected_parcels:
+            deleted_parcels, inserted_parcels = parcel_tracker.patch_parcels(TAXPARCEL_JOINED_AUTOWKSP, affected_parcels, parcel_changes)
         else:
-            pass
-    del row 
-    del cursor
-    print ("      Landex URL field calculated")
-    write_log("      Landex URL field calculated",logfile)
-except:
-    print ("\n Unable to calculate Landex URL Field in Tax_Parcel_Joined - AUTO_WORKSPACE")
-    write_log("\n Unable to calculate Landex URL Field in Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
-    logging.exception('Got exception on calculate Landex URL Field in Tax_Parcel_Joined - AUTO_WORKSPACE with MBLU logged at:' + str(Day) + " " + str(Time))
-    raise
-    sys.exit()
-
-print ("       Joining VISION tables to Tax_Parcel_Joined - AUTO_WORKSPACE completed")
-write_log("       Joining VISION tables to Tax_Parcel_Joined - AUTO_WORKSPACE completed", logfile)
-
-print ("\n Joining Lat/Long fields to Tax_Parcel_Joined - AUTO_WORKSPACE from PIN - AST")
-write_log("\n Joining Lat/Long fields to Tax_Parcel_Joined - AUTO_WORKSPACE from PIN - AST", logfile)
-
-try:
-    # Joining Lat/Long fields to Tax_Parcel_Joined - AUTO_WORKSPACE from PIN - AST
-    arcpy.JoinField_management(TAXPARCEL_JOINED_AUTOWKSP, "PID", PIN_AST, "PID", "LONGITUDE_X;LATITUDE_Y")
-    print ("     Lat/Long fields joined to Tax Parcel Joined - AUTO_WORKSPACE from PIN - AST")
-    write_log("     Lat/Long fields joined to Tax Parcel Joined - AUTO_WORKSPACE from PIN - AST",logfile)
-except:
-    print ("\n Unable to Add Lat/Long fields joined to Tax Parcel Joined - AUTO_WORKSPACE from PIN - AST")
-    write_log("\n Unable to Add Lat/Long fields joined to Tax Parcel Joined - AUTO_WORKSPACE from PIN - AST", logfile)
-    logging.exception('Got exception on Add Lat/Long fields joined to Tax Parcel Joined - AUTO_WORKSPACE from PIN - AST logged at:' + str(Day) + " " + str(Time))
-    raise
-    sys.exit ()
-
-print ("        Joining Lat/Long fields to Tax_Parcel_Joined - AUTO_WORKSPACE from PIN - AST completed")
-write_log("        Joining Lat/Long fields to Tax_Parcel_Joined - AUTO_WORKSPACE from PIN - AST completed", logfile)
+            deleted_parcels, inserted_parcels = 0, 0
+        Landex_URL_result = Landex_URLs.update_landex_urls(TAXPARCEL_JOINED_AUTOWKSP, "LANDEX_URL_TYPE")
+        print ("    {} parcels removed, {} rebuilt parcels inserted, {} Landex URLs updated".format(deleted_parcels, inserted_parcels, Landex_URL_result))
+        write_log("    {} parcels removed, {} rebuilt parcels inserted, {} Landex URLs updated".format(deleted_parcels, inserted_parcels, Landex_URL_result), logfile)
+    except:
+        full_rebuild = True
+        print ("\n Unable to patch changed parcels in Tax_Parcel_Joined - AUTO_WORKSPACE - running full rebuild")
+        write_log("\n Unable to patch changed parcels in Tax_Parcel_Joined - AUTO_WORKSPACE - running full rebuild", logfile)
+        logging.exception('Got exception on patch changed parcels in Tax_Parcel_Joined - AUTO_WORKSPACE logged at:' + str(Day) + " " + str(Time))
+    else:
+        print ("       Patching changed parcels in Tax_Parcel_Joined - AUTO_WORKSPACE completed")
+        write_log("       Patching changed parcels in Tax_Parcel_Joined - AUTO_WORKSPACE completed", logfile)
+
+if full_rebuild:
+    print ("\n Archiving Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE")
+    write_log("\n Archiving Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE: " + str(Day) + " " + str(Time), logfile)
+
+    try:
+        # Delete Tax_Parcel_Joined_Old - AUTO_WORKSPACE, rename the current Tax_Parcel_Joined as old.  (If a failed incremental patch already archived it, keep that copy.)
+        if arcpy.Exists(TAXPARCEL_JOINED_OLD_AUTOWKSP) and not archived:
+            arcpy.Delete_management(TAXPARCEL_JOINED_OLD_AUTOWKSP, "FeatureClass")
+        if arcpy.Exists(TAXPARCEL_JOINED_AUTOWKSP):
+            if archived:
+                arcpy.Delete_management(TAXPARCEL_JOINED_AUTOWKSP, "FeatureClass")
+            else:
+                arcpy.Rename_management(TAXPARCEL_JOINED_AUTOWKSP, TAXPARCEL_JOINED_OLD_AUTOWKSP, "FeatureClass")
+    except:
+        print ("\n Unable to archive Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE")
+        write_log("\n Unable to archive Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE", logfile)
+        logging.exception('Got exception on archive Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE logged at:' + str(Day) + " " + str(Time))
+        raise
+        sys.exit ()
+
+    print ("       Archiving Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE completed")
+    write_log("       Archiving Tax_Parcel_Joined to Tax_Parcel_Joined_Old - AUTO_WORKSPACE completed", logfile)
+
+    print ("\n Creating Tax Parcels from Hardlines and PINs - Tax_Parcel_Joined - AUTO_WORKSPACE")
+    write_log("\n Creating Tax Parcels from Hardlines and PINs - Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
+
+    try:
+        # Create tax parcels from hardlines (TAX_PARCEL_TEMP) - creating polygons from hardlines
+        TAX_PARCEL_TEMP = arcpy.FeatureToPolygon_management(HARDLINES_AST, "in_memory/TAX_PARCEL_TEMP", "","NO_ATTRIBUTES", "")
+    except:
+        print ("\n Unable to create tax parcels from hardlines (TAX_PARCEL_TEMP)")
+        write_log("\n Unable to create tax parcels from hardlines (TAX_PARCEL_TEMP)", logfile)
+        logging.exception('Got exception on Unable to create tax parcels from hardlines (TAX_PARCEL_TEMP) logged at:' + str(Day) + " " + str(Time))
+        raise
+        sys.exit ()
+
+    try:
+        # Join TAX_PARCEL_TEMP to PIN feature class - joining in basic information (including PID) to polygons created via hardlines.  Once PID is part of polygon, will be able to join vision records to polygons to make parcels.
+        TAX_PARCEL_TEMP_JOIN = arcpy.SpatialJoin_analysis(TAX_PARCEL_TEMP, PIN_AST, "in_memory/TAX_PARCEL_TEMP_JOIN", "JOIN_ONE_TO_ONE", "KEEP_ALL", 'SHAPE_Length "SHAPE_Length" false true true 8 Double 0 0 ,First,#,in_memory/TAX_PARCEL_TEMP,SHAPE_Length,-1,-1;SHAPE_Area "SHAPE_Area" false true true 8 Double 0 0 ,First,#,in_memory/TAX_PARCEL_TEMP,SHAPE_Area,-1,-1;CAMA_PIN "CAMA_PIN" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,CAMA_PIN,-1,-1;MAP "MAP" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,MAP,-1,-1;PARCEL "PARCEL" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,PARCEL,-1,-1;LOT "LOT" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,LOT,-1,-1;GLOBALID "GLOBALID" false false false 38 GlobalID 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,GLOBALID,-1,-1;ID_PIN "ID_PIN" true true false 2 Short 0 5 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,ID_PIN,-1,-1;MAPTYPE "MAPTYPE" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,MAPTYPE,-1,-1;CITY "CITY" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,CITY,-1,-1;MEADVILLE "MEADVILLE" true true false 10 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,MEADVILLE,-1,-1;TITUSVILLE "TITUSVILLE" true true false 10 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,TITUSVILLE,-1,-1;EDITOR "EDITOR" false true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,EDITOR,-1,-1;DATEMODIFY "DATEMODIFY" false true false 8 Date 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,DATEMODIFY,-1,-1;LANDEX_URL_TYPE "Landex URL Type" true true false 20 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,LANDEX_URL_TYPE,-1,-1;PLANS_AVAILABLE "Plans Available" true true false 5 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,PLANS_AVAILABLE,-1,-1;BLK_MAP "Block Map" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,BLK_MAP,-1,-1;BLK_PARCEL "Block Parcel" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,BLK_PARCEL,-1,-1;BLK_MAPTYPE "Block Maptype" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,BLK_MAPTYPE,-1,-1;INS_MAP "Insert Map" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,INS_MAP,-1,-1;INS_DESCRIPTION "Insert Description" true true false 255 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,INS_DESCRIPTION,-1,-1;INS_SECTION_MAP "Insert Section Map" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,INS_SECTION_MAP,-1,-1;INS_SCALE "Insert Scale" true true false 8 Double 8 38 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,INS_SCALE,-1,-1;INS_ROTATION "Insert Rotation" true true false 8 Double 8 38 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,INS_ROTATION,-1,-1;SEC_MAP "Section Map" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,SEC_MAP,-1,-1;SEC_MUNI_NAME "Municipal Name" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,SEC_MUNI_NAME,-1,-1;SEC_ANGLE "Section Angle" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,SEC_ANGLE,-1,-1;SEC_SCALE "Section Scale" true true false 8 Double 8 38 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,SEC_SCALE,-1,-1;SEC_ROTATION "Section Rotation" true true false 8 Double 8 38 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,SEC_ROTATION,-1,-1;SEC_WARD "Section Ward" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,SEC_WARD,-1,-1;MDVL_BLK_MAP "Meadville Block Map" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,MDVL_BLK_MAP,-1,-1;MDVL_BLK_PARCEL "Meadvile Block Parcel" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,MDVL_BLK_PARCEL,-1,-1;MDVL_BLK_MAPTYPE "Meadvile Block Maptype" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,MDVL_BLK_MAPTYPE,-1,-1;TSVL_BLK_MAP "Titusville Block Map" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,TSVL_BLK_MAP,-1,-1;TSVL_BLK_PARCEL "Titusville Block Parcel" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,TSVL_BLK_PARCEL,-1,-1;TSVL_BLK_MAPTYPE "Titusville Block Maptype" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,TSVL_BLK_MAPTYPE,-1,-1;TSVL_BLK_ID "Titusville Block ID" true true false 50 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,TSVL_BLK_ID,-1,-1;UPI "UPI #" true true false 60 Text 0 0 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,UPI,-1,-1;PID "PID" true true false 4 Long 0 10 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,PID,-1,-1;LONGITUDE_X "Longitude-X" true true false 8 Double 8 38 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,LONGITUDE_X,-1,-1;LATITUDE_Y "Latitude-Y" true true false 8 Double 8 38 ,First,#,Database Connections\AST@ccsde.sde\CCSDE.AST.Crawford_Parcels\CCSDE.AST.PIN,LATITUDE_Y,-1,-1', "INTERSECT", "", "")
+    except:
+        print ("\n Unable to Join TAX_PARCEL_TEMP to PIN feature class")
+        write_log("\n Unable to Join TAX_PARCEL_TEMP to PIN feature class", logfile)
+        logging.exception('Got exception on Join TAX_PARCEL_TEMP to PIN feature class logged at:' + str(Day) + " " + str(Time))
+        raise
+        sys.exit ()
+
+    try:
+        # Delete excess fields from TAX_PARCEL_TEMP_JOIN  (Delete extra fields from AST.PIN)
+        arcpy.DeleteField_management(TAX_PARCEL_TEMP_JOIN, "Join_Count;TARGET_FID;EDITOR")
+    except:
+        print ("\n Unable to delete excess fields from TAX_PARCEL_TEMP_JOIN")
+        write_log("\n Unable to delete excess fields from TAX_PARCEL_TEMP_JOIN", logfile)
+        logging.exception('Got exception on delete excess fields from TAX_PARCEL_TEMP_JOIN logged at:' + str(Day) + " " + str(Time))
+        raise
+        sys.exit ()
+
+    try:    
+        # Dissolve TAX_PARCEL_TEMP_JOIN - in_memory to Tax_Parcel_Joined - AUTO_WORKSPACE  (joins parcels that are hooked together by softline hooks - dissolved by identical data in fields)
+        arcpy.Dissolve_management(TAX_PARCEL_TEMP_JOIN, TAXPARCEL_JOINED_AUTOWKSP, "CAMA_PIN;MAP;PARCEL;LOT;ID_PIN;MAPTYPE;CITY;MEADVILLE;TITUSVILLE;LANDEX_URL_TYPE;PLANS_AVAILABLE;BLK_MAP;BLK_PARCEL;BLK_MAPTYPE;INS_MAP;INS_DESCRIPTION;INS_SECTION_MAP;INS_SCALE;INS_ROTATION;SEC_MAP;SEC_MUNI_NAME;SEC_ANGLE;SEC_SCALE;SEC_ROTATION;SEC_WARD;MDVL_BLK_MAP;MDVL_BLK_PARCEL;MDVL_BLK_MAPTYPE;TSVL_BLK_MAP;TSVL_BLK_PARCEL;TSVL_BLK_MAPTYPE;TSVL_BLK_ID;PID", "", "MULTI_PART", "DISSOLVE_LINES")
+    except:
+        print ("\n Unable to Dissolve TAX_PARCEL_TEMP_JOIN - in_memory to Tax_Parcel_Joined - AUTO_WORKSPACE")
+        write_log("\n Unable to Dissolve TAX_PARCEL_TEMP_JOIN - in_memory to Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
+        logging.exception('Got exception on Dissolve TAX_PARCEL_TEMP_JOIN - in_memory to Tax_Parcel_Joined - AUTO_WORKSPACE logged at:' + str(Day) + " " + str(Time))
+        raise
+        sys.exit ()
+
+    try:
+        # Clear "in_memory" for next process
+        arcpy.Delete_management("in_memory")
+    except:
+        print ("\n Unable to clear TAX_PARCEL_TEMP from in_memory")
+        write_log("\n Unable to clear TAX_PARCEL_TEMP from in_memory", logfile)
+        logging.exception('Got exception on clear TAX_PARCEL_TEMP from in_memory logged at:' + str(Day) + " " + str(Time))
+        raise
+        sys.exit ()
+
+    print ("       Creating Tax Parcels from Hardlines and PINs - Tax_Parcel_Joined - AUTO_WORKSPACE completed")
+    write_log("       Creating Tax Parcels from Hardlines and PINs - Tax_Parcel_Joined - AUTO_WORKSPACE completed", logfile)
+
+    print ("\n Joining VISION tables to Tax_Parcel_Joined - AUTO_WORKSPACE")
+    write_log("\n Joining VISION tables to Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
+
+    try:
+        # Join VISIDATA_TEMP to Tax_Parcel_Joined - AUTO_WORKSPACE  (joins vision data from above steps to polygons created by hardlines)
+        VISION_join_result = Hash_Join.join_field(Sync_Engine.ArcpyBackend(), TAXPARCEL_JOINED_AUTOWKSP, "PID", VISIDATA_TEMP, "REM_PID")
+        print ("   VISION_OWNER_TBL joined to Tax_Parcel_Joined ({} of {} parcels matched)...".format(VISION_join_result.matched, VISION_join_result.target_rows))
+        write_log("   VISION_OWNER_TBL joined to Tax_Parcel_Joined ({} of {} parcels matched)...".format(VISION_join_result.matched, VISION_join_result.target_rows), logfile)
+    except:
+        print ("\n Unable to join VISIDATA_TEMP to Tax_Parcel_Joined - AUTO_WORKSPACE")
+        write_log("\n Unable to join VISIDATA_TEMP to Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
+        logging.exception('Got exception on join VISIDATA_TEMP to Tax_Parcel_Joined - AUTO_WORKSPACE logged at:' + str(Day) + " " + str(Time))
+        raise
+        sys.exit ()
+
+    try:
+        # Add GIS_ACRES field to Tax_Parcel_Joined - AUTO_WORKSPACE 
+        arcpy.AddField_management(TAXPARCEL_JOINED_AUTOWKSP, "GIS_ACRES", "DOUBLE", "", "", "", "GIS Calculated Acres - not legal", "NULLABLE", "NON_REQUIRED", "")
+        print ("    GIS Acres field added to Tax Parcel Joined - AUTO_WORKSPACE")
+        write_log("    GIS Acres field added to Tax Parcel Joined - AUTO_WORKSPACE",logfile)
+    except:
+        print ("\n Unable to Add GIS_ACRES field to Tax_Parcel_Joined - AUTO_WORKSPACE")
+        write_log("\n Unable to Add GIS_ACRES field to Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
+        logging.exception('Got exception on Add GIS_ACRES field to Tax_Parcel_Joined - AUTO_WORKSPACE logged at:' + str(Day) + " " + str(Time))
+        raise
+        sys.exit ()
+    try:
+        # Calculate GIS_ACRES field in Tax_Parcel_Joined - AUTO_WORKSPACE from polygon shape acres  (adds GIS acres field - for QA/QC process of checking actual acreage from vision against polygon acreage.  will not be 100%, however large variances can be caught)
+        arcpy.CalculateField_management(TAXPARCEL_JOINED_AUTOWKSP, "GIS_ACRES", "!shape.area@acres!", "PYTHON", "")
+        TaxParcel_result = arcpy.GetCount_management(TAXPARCEL_JOINED_AUTOWKSP)
+        print ('    {} has {} records calculated'.format(TAXPARCEL_JOINED_AUTOWKSP, TaxParcel_result[0]))
+        write_log('    {} has {} records calculated'.format(TAXPARCEL_JOINED_AUTOWKSP, TaxParcel_result[0]), logfile)
+    except:
+        print ("\n Unable to Calculate GIS_ACRES field in Tax_Parcel_Joined - AUTO_WORKSPACE from polygon shape acres")
+        write_log("\n Unable to Calculate GIS_ACRES field in Tax_Parcel_Joined - AUTO_WORKSPACE from polygon shape acres", logfile)
+        logging.exception('Got exception on Calculate GIS_ACRES field in Tax_Parcel_Joined - AUTO_WORKSPACE from polygon shape acres logged at:' + str(Day) + " " + str(Time))
+        raise
+        sys.exit ()
+
+    try:
+        # Add Landex_URL field to Tax_Parcel_Joined - AUTO_WORKSPACE
+        arcpy.AddField_management(TAXPARCEL_JOINED_AUTOWKSP, "LANDEX_URL", "TEXT", "", "", "600", "Landex URL", "NULLABLE", "NON_REQUIRED", "")
+        print ("     Landex URL field added to Tax Parcel Joined - AUTO_WORKSPACE")
+        write_log("     Landex URL field added to Tax Parcel Joined - AUTO_WORKSPACE",logfile)
+    except:
+        print ("\n Unable to Add Landex_URL field to Tax_Parcel_Joined - AUTO_WORKSPACE")
+        write_log("\n Unable to Add Landex_URL field to Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
+        logging.exception('Got exception on Add Landex_URL field to Tax_Parcel_Joined - AUTO_WORKSPACE logged at:' + str(Day) + " " + str(Time))
+        raise
+        sys.exit ()
+    try:
+        # Calculate Landex URL Field in Tax_Parcel_Joined - AUTO_WORKSPACE (calculates custom URL per record for landex use based on fields from parcels)
+        Landex_URL_result = Landex_URLs.update_landex_urls(TAXPARCEL_JOINED_AUTOWKSP, "LANDEX_URL_TYPE")
+        print ("      Landex URL field calculated ({} records updated)".format(Landex_URL_result))
+        write_log("      Landex URL field calculated ({} records updated)".format(Landex_URL_result),logfile)
+    except:
+        print ("\n Unable to calculate Landex URL Field in Tax_Parcel_Joined - AUTO_WORKSPACE")
+        write_log("\n Unable to calculate Landex URL Field in Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
+        logging.exception('Got exception on calculate Landex URL Field in Tax_Parcel_Joined - AUTO_WORKSPACE with MBLU logged at:' + str(Day) + " " + str(Time))
+        raise
+        sys.exit()
+
+    print ("       Joining VISION tables to Tax_Parcel_Joined - AUTO_WORKSPACE completed")
+    write_log("       Joining VISION tables to Tax_Parcel_Joined - AUTO_WORKSPACE completed", logfile)
+
+    print ("\n Joining Lat/Long fields to Tax_Parcel_Joined - AUTO_WORKSPACE from PIN - AST")
+    write_log("\n Joining Lat/Long fields to Tax_Parcel_Joined - AUTO_WORKSPACE from PIN - AST", logfile)
+
+    try:
+        # Joining Lat/Long fields to Tax_Parcel_Joined - AUTO_WORKSPACE from PIN - AST
+        arcpy.JoinField_management(TAXPARCEL_JOINED_AUTOWKSP, "PID", PIN_AST, "PID", "LONGITUDE_X;LATITUDE_Y")
+        print ("     Lat/Long fields joined to Tax Parcel Joined - AUTO_WORKSPACE from PIN - AST")
+        write_log("     Lat/Long fields joined to Tax Parcel Joined - AUTO_WORKSPACE from PIN - AST",logfile)
+    except:
+        print ("\n Unable to Add Lat/Long fields joined to Tax Parcel Joined - AUTO_WORKSPACE from PIN - AST")
+        write_log("\n Unable to Add Lat/Long fields joined to Tax Parcel Joined - AUTO_WORKSPACE from PIN - AST", logfile)
+        logging.exception('Got exception on Add Lat/Long fields joined to Tax Parcel Joined - AUTO_WORKSPACE from PIN - AST logged at:' + str(Day) + " " + str(Time))
+        raise
+        sys.exit ()
+
+    print ("        Joining Lat/Long fields to Tax_Parcel_Joined - AUTO_WORKSPACE from PIN - AST completed")
+    write_log("        Joining Lat/Long fields to Tax_Parcel_Joined - AUTO_WORKSPACE from PIN - AST completed", logfile)
+
+if parcel_tracker is not None:
+    try:
+        # Save the snapshot of hardlines, PINs and VISIDATA_TEMP for the next run's change check
+        parcel_tracker.save()
+    except:
+        print ("\n Unable to save parcel change snapshot - next run compares with the previous snapshot")
+        write_log("\n Unable to save parcel change snapshot - next run compares with the previous snapshot", logfile)
+        logging.exception('Got exception on save parcel change snapshot logged at:' + str(Day) + " " + str(Time))
 
 print ("\n Creating Tax_Parcel_Air_Joined - AUTOWORKSPACE from Tax_Parcel_Air - AST & VISION tables")
 write_log("\n Creating Tax_Parcel_Air_Joined - AUTOWORKSPACE from Tax_Parcel_Air - AST & VISION tables", logfile)
@@ -320,9 +384,9 @@ except:
 
 try:   
     # Join AirParcel_Temp to VISIDATA_TEMP (joins Tax Parcels - Air from assessment workspace to vision data)
-    arcpy.management.JoinField(AirParcel_Temp, "PID", VISIDATA_TEMP, "REM_PID", "REM_USRFLD;REM_BLDG_NAME;REM_MBLU_BLOCK;REM_MBLU_BLOCK_CUT;PRC_CENSUS;PRC_CMPLX_DESC;REM_CMPLX_NAME;PRC_CMPLX_PID;REM_USRFLD_DESC;SLH_BOOK;SLH_PAGE;LND_DSTRCT;REM_INET_SUPPRESS;REM_INET_SUPPRESS_1;REM_IS_CONDO_MAIN;LND_USE_CODE;LND_USE_DESC;REM_LAST_UPDATE;REM_LEGAL_AREA;REM_MBLU_LOT;REM_MBLU_LOT_CUT;MAD_ID;REM_MBLU_MAP;REM_MBLU_MAP_CUT;MUNI_NAME;REM_ALT_PRCL_ID;OWN_ID;OWN_LINE;OWN_NAME1;OWN_NAME2;REM_OWN_NAME;REM_PRCL_LOCN;REM_PRCL_LOCN_CITY;REM_PRCL_LOCN_STT;REM_PRCL_LOCN_ZIP;REM_PRCL_STATUS_DATE;REM_PARCEL_STATUS;PRC_VALUE;REM_PID;PID_TEXT;REM_MNC;ROW_CREATE_DATE;ROW_LINE_NUM;ROW_MAD_ID;ROW_MAD_ISPRIMARY;ROW_OWN_ID;ROW_OWN_PCT;ROW_PID;ROW_PRIMARY;SLH_SALE_DATE;SLH_PRICE;SLH_CURRENT_OWNER;SLH_LINE_NUM;SLH_PID;PRC_PF_LOCN_DESC;PRC_PF_LOCN;REM_STATUS_DATE;MAD_MAIL_ADDR1;MAD_MAIL_ADDR2;MAD_MAIL_CITY;MAD_MAIL_NAME1;MAD_MAIL_NAME2;MAD_MAIL_STATE;MAD_MAIL_ZIP;PRC_TTL_ASSESS;PRC_TTL_ASSESS_BLDG;PRC_TTL_ASSESS_IMPROVEMENTS;PRC_TTL_ASSESS_LND;PRC_TTL_MRKT_ASSESS;PRC_TTL_ASSESS_OB;REM_MBLU_UNIT;REM_MBLU_UNIT_CUT;REM_PIN;REM_USE_CODE;PRC_USRFLD_10;PRC_USRFLD_09")
-    print ("  VISIDATA_TEMP joined to AirParcel_Temp...")
-    write_log("  VISIDATA_TEMP joined to AirParcel_Temp...", logfile)
+    Air_join_result = Hash_Join.join_field(Sync_Engine.ArcpyBackend(), AirParcel_Temp, "PID", VISIDATA_TEMP, "REM_PID", "REM_USRFLD;REM_BLDG_NAME;REM_MBLU_BLOCK;REM_MBLU_BLOCK_CUT;PRC_CENSUS;PRC_CMPLX_DESC;REM_CMPLX_NAME;PRC_CMPLX_PID;REM_USRFLD_DESC;SLH_BOOK;SLH_PAGE;LND_DSTRCT;REM_INET_SUPPRESS;REM_INET_SUPPRESS_1;REM_IS_CONDO_MAIN;LND_USE_CODE;LND_USE_DESC;REM_LAST_UPDATE;REM_LEGAL_AREA;REM_MBLU_LOT;REM_MBLU_LOT_CUT;MAD_ID;REM_MBLU_MAP;REM_MBLU_MAP_CUT;MUNI_NAME;REM_ALT_PRCL_ID;OWN_ID;OWN_LINE;OWN_NAME1;OWN_NAME2;REM_OWN_NAME;REM_PRCL_LOCN;REM_PRCL_LOCN_CITY;REM_PRCL_LOCN_STT;REM_PRCL_LOCN_ZIP;REM_PRCL_STATUS_DATE;REM_PARCEL_STATUS;PRC_VALUE;REM_PID;PID_TEXT;REM_MNC;ROW_CREATE_DATE;ROW_LINE_NUM;ROW_MAD_ID;ROW_MAD_ISPRIMARY;ROW_OWN_ID;ROW_OWN_PCT;ROW_PID;ROW_PRIMARY;SLH_SALE_DATE;SLH_PRICE;SLH_CURRENT_OWNER;SLH_LINE_NUM;SLH_PID;PRC_PF_LOCN_DESC;PRC_PF_LOCN;REM_STATUS_DATE;MAD_MAIL_ADDR1;MAD_MAIL_ADDR2;MAD_MAIL_CITY;MAD_MAIL_NAME1;MAD_MAIL_NAME2;MAD_MAIL_STATE;MAD_MAIL_ZIP;PRC_TTL_ASSESS;PRC_TTL_ASSESS_BLDG;PRC_TTL_ASSESS_IMPROVEMENTS;PRC_TTL_ASSESS_LND;PRC_TTL_MRKT_ASSESS;PRC_TTL_ASSESS_OB;REM_MBLU_UNIT;REM_MBLU_UNIT_CUT;REM_PIN;REM_USE_CODE;PRC_USRFLD_10;PRC_USRFLD_09")
+    print ("  VISIDATA_TEMP joined to AirParcel_Temp ({} of {} air parcels matched)...".format(Air_join_result.matched, Air_join_result.target_rows))
+    write_log("  VISIDATA_TEMP joined to AirParcel_Temp ({} of {} air parcels matched)...".format(Air_join_result.matched, Air_join_result.target_rows), logfile)
 except:
     print ("\n Unable to join AirParcel_Temp to VISIDATA_TEMP")
     write_log("\n Unable to join AirParcel_Temp to VISIDATA_TEMP", logfile)
@@ -345,28 +409,9 @@ except:
 
 try:
     # Calculate Landex URL Field in Tax_Parcel_Joined - AUTO_WORKSPACE (calculates custom URL per record for landex use based on fields from parcels)
-    URLFIELDS = ['LANDEX_URL','SLH_BOOK','SLH_PAGE',str('REM_MBLU_MAP'),str('REM_MBLU_BLOCK'),str('REM_MBLU_LOT'),'PID','Landex_URL_Choice']
-    cursor =  arcpy.da.UpdateCursor(AIRPARCEL_AUTOWKSP,URLFIELDS)
-    for row in cursor:
-        if  row[6] == None:
-            continue
-        if (row[7] == 'Book_Page' and row[6] > 0):
-            row[0] = "http://172.16.154.36/SearchResultsList.asp?bookNumber={}&pageNumber={}&submit=SEARCH&forwardRequest=SearchResultsList.asp&displayPage=1&displayItemsPerPage=50&maximumMatches=1000&getCustomerData=TRUE".format(row[1],row[2])
-            cursor.updateRow(row)
-        if  row[6] == None:
-            continue
-        if (row[7] == 'UPI' and row[6] > 0):
-            row[0] = "http://172.16.154.36/SearchResultsList.asp?parcelNumber1=20&parcelNumber2={}&parcelNumber3={}&parcelNumber4={}&parcelNumber5={}&submit=SEARCH&parcelNumberFieldCount=5&parcelNumberFormat=2+4+3+17+6+&forwardRequest=SearchResultsList.asp&displayPage=1&displayItemsPerPage=50&maximumMatches=1000&getCustomerData=TRUE".format(row[3],row[4],row[5],row[6])
-            cursor.updateRow(row)
-        if (row[7] == None):
-            row = ""
-            pass
-        else:
-            pass
-    del row 
-    del cursor
-    print ("      Landex URL field calculated")
-    write_log("      Landex URL field calculated",logfile)
+    Landex_URL_result = Landex_URLs.update_landex_urls(AIRPARCEL_AUTOWKSP, "Landex_URL_Choice")
+    print ("      Landex URL field calculated ({} records updated)".format(Landex_URL_result))
+    write_log("      Landex URL field calculated ({} records updated)".format(Landex_URL_result),logfile)
 except:
     print ("\n Unable to calculate Landex URL Field in Tax_Parcel_Joined - AUTO_WORKSPACE")
     write_log("\n Unable to calculate Landex URL Field in Tax_Parcel_Joined - AUTO_WORKSPACE", logfile)
@@ -1,7 +1,7 @@
 # ---------------------------------------------------------------------------
 # TaxClaim_Data_Spreader.py
 # Created on: 2019-08-27 
-# Updated on 2022-01-18
+# Updated on 2026-10-18
 # Works in ArcGIS Pro
 #
 # Author: Phil Baranyai/GIS Manager
@@ -13,32 +13,35 @@
 # TAX_CLAIM_AIRPARCELS
 #
 #   All processes have general components, delete rows, append from another source - due to most layers are connected to services
+#   Append field maps come from Field_Map_Registry (Manifests\Field_Maps.json), compiled once and re-checked when a schema changes
+#   TAX_CLAIM_TBL is joined to the parcels with Hash_Join (one read of the table, one write pass) instead of JoinField
 # ---------------------------------------------------------------------------
 
 # Import modules
 import sys,arcpy,datetime,time,logging
 
+# Shared modules folder (named Append field maps, hash join)
+Shared_Modules = r"\\FILELOCATION\\GIS\\ArcAutomations\\Shared_Modules"
+sys.path.append(Shared_Modules)
+import Field_Map_Registry,Hash_Join,Run_Log,Sync_Engine
+
+# Manifest folder (field map definitions)
+Manifests = r"\\FILELOCATION\\GIS\\ArcAutomations\\Manifests"
+
 # Stop geoprocessing log history in metadata (stops program from filling up geoprocessing history in metadata with every run)
 arcpy.SetLogHistory(False)
 
-# Setup error logging (configure logging location, type, and filemode -- overwrite every run)
+# Setup run log (JSON-lines records, local copy mirrored to a .jsonl next to logfile on the share -- overwrite every run)
 logfile = r"\\FILELOCATION\\GIS\\GIS_LOGS\\GIS\\TaxClaim_Data_Spreader.log"  
-logging.basicConfig(filename= logfile, filemode='w', level=logging.DEBUG)
+run_log = Run_Log.start("TaxClaim_Data_Spreader", logfile)
 
 # Setup Date (and day/time)
 date = datetime.date.today().strftime("%Y%m%d")
 Day = time.strftime("%m-%d-%Y", time.localtime())
 Time = time.strftime("%I:%M:%S %p", time.localtime())
 
-try:
-    # Write Logfile (define logfile write process, each step will append to the log, if program is started over, it will wipe the log and re-start fresh)
-    def write_log(text, file):
-        f = open(file, 'a')           # 'a' will append to an existing file if it exists
-        f.write("{}\n".format(text))  # write the text to the logfile and move to next line
-        return
-except:
-    print ("\n Unable to write log file")
-    sys.exit ()
+# Write Logfile (run log records - Run_Log writes them locally and mirrors them to the share in batches, logging.exception goes to the same log)
+write_log = run_log.write_log
 
 #Database Connection Folder
 Database_Connections = r"\\FILELOCATION\\GIS\\ArcAutomations\\Database_Connections"
@@ -60,6 +63,16 @@ TAX_CLAIM_PARCELS_INTERNAL = CRAW_INTERNAL + "\\CCSDE.CRAW_INTERNAL.Property_Sal
 TAX_CLAIM_AIRPARCELS = AUTOWORKSPACE_TREAS + "\\CCSDE.AUTO_WORKSPACE.TAX_CLAIM_AIRPARCELS"
 TAXCLAIM_TBL_TEMP = AUTOWORKSPACE + "\\TAX_CLAIM_TBL_TEMP"
 
+try:
+    # Load named field maps (compiled cache is re-checked against the current schemas on use)
+    field_maps = Field_Map_Registry.FieldMapRegistry(Manifests + "\\Field_Maps.json", log=lambda text: write_log(text, logfile))
+except:
+    print ("\n Unable to load Field_Maps.json")
+    write_log("Unable to load Field_Maps.json", logfile)
+    logging.exception('Got exception on load Field_Maps.json logged at:' + str(Day) + " " + str(Time))
+    raise
+    sys.exit ()
+
 start_time = time.time()
 
 print ("============================================================================")
@@ -154,7 +167,9 @@ write_log("\n Join TAX_CLAIM_TBL_TEMP - AUTOWORKSPACE to TAX_CLAIM_PARCELS - AUT
 
 try:
     # Join TAX_CLAIM_TBL_TEMP - AUTOWORKSPACE to TAX_CLAIM_PARCELS - AUTOWORKSPACE
-    arcpy.management.JoinField(TAX_CLAIM_PARCELS, "REM_USRFLD", TAXCLAIM_TBL_TEMP, "Control", "Salenum;District;Ward;Control;Year;SaleYear;Map;Map3;Map4;Map5;Name;CoOwner;Addr1;Addr2;City;State;ZipCode;ZipCode2;MastName;MastCoOwner;Acreage;Desc1;Desc2;Desc3;AssLand;AssImpr;DeedRef;DeedBook;DeedPage;Amount;SaleType;BName")
+    TaxClaim_join_result = Hash_Join.join_field(Sync_Engine.ArcpyBackend(), TAX_CLAIM_PARCELS, "REM_USRFLD", TAXCLAIM_TBL_TEMP, "Control", "Salenum;District;Ward;Control;Year;SaleYear;Map;Map3;Map4;Map5;Name;CoOwner;Addr1;Addr2;City;State;ZipCode;ZipCode2;MastName;MastCoOwner;Acreage;Desc1;Desc2;Desc3;AssLand;AssImpr;DeedRef;DeedBook;DeedPage;Amount;SaleType;BName")
+    print ("   " + TaxClaim_join_result.summary())
+    write_log("   " + TaxClaim_join_result.summary(), logfile)
 except:
     print ("\n Unable to Join TAX_CLAIM_TBL_TEMP - AUTOWORKSPACE to TAX_CLAIM_PARCELS - AUTOWORKSPACE")
     write_log("Unable to Join TAX_CLAIM_TBL_TEMP - AUTOWORKSPACE to TAX_CLAIM_PARCELS - AUTOWORKSPACE", logfile)
@@ -167,7 +182,9 @@ write_log("       Join TAX_CLAIM_TBL_TEMP - AUTOWORKSPACE to TAX_CLAIM_PARCELS -
 
 try:
     # Join TAX_CLAIM_TBL_TEMP - AUTOWORKSPACE to TAX_CLAIM_AIRPARCELS - AUTOWORKSPACE
-    arcpy.management.JoinField(TAX_CLAIM_AIRPARCELS, "REM_USRFLD", TAXCLAIM_TBL_TEMP, "Control", "Acreage;Addr1;Addr2;Amount;AssImpr;AssLand;BName;City;Control;CoOwner;DeedBook;DeedPage;DeedRef;Desc1;Desc2;Desc3;District;Map;Map3;Map4;Map5;MastCoOwner;MastName;Name;Salenum;SaleType;SaleYear;State;Ward;Year;ZipCode;ZipCode2")
+    TaxClaim_join_result = Hash_Join.join_field(Sync_Engine.ArcpyBackend(), TAX_CLAIM_AIRPARCELS, "REM_USRFLD", TAXCLAIM_TBL_TEMP, "Control", "Acreage;Addr1;Addr2;Amount;AssImpr;AssLand;BName;City;Control;CoOwner;DeedBook;DeedPage;DeedRef;Desc1;Desc2;Desc3;District;Map;Map3;Map4;Map5;MastCoOwner;MastName;Name;Salenum;SaleType;SaleYear;State;Ward;Year;ZipCode;ZipCode2")
+    print ("   " + TaxClaim_join_result.summary())
+    write_log("   " + TaxClaim_join_result.summary(), logfile)
 except:
     print ("\n Unable to Join TAX_CLAIM_TBL_TEMP - AUTOWORKSPACE to TAX_CLAIM_AIRPARCELS - AUTOWORKSPACE")
     write_log("Unable to Join TAX_CLAIM_TBL_TEMP - AUTOWORKSPACE to TAX_CLAIM_AIRPARCELS - AUTOWORKSPACE", logfile)
@@ -237,7 +254,7 @@ except:
 
 try:
     # Append TAX_CLAIM_PARCELS_INTERNAL - CRAW_INTERNAL from AUTOWORKSPACE\TREASURERS
-    arcpy.management.Append(TAX_CLAIM_PARCELS, TAX_CLAIM_PARCELS_INTERNAL, "NO_TEST", r'CAMA_PIN "CAMA_PIN" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',CAMA_PIN,0,50;MAP "MAP" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',MAP,0,50;PARCEL "PARCEL" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',PARCEL,0,50;LOT "LOT" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',LOT,0,50;ID_PIN "ID_PIN" true true false 2 Short 0 5,First,#,'+TAX_CLAIM_PARCELS+',ID_PIN,-1,-1;REM_PID "PID Number" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_PARCELS+',REM_PID,-1,-1;REM_PIN "UPI Number" true true false 35 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_PIN,0,35;REM_OWN_NAME "Owner Name" true true false 85 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_OWN_NAME,0,85;REM_PRCL_LOCN "Parcel Location" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_PRCL_LOCN,0,50;REM_PRCL_LOCN_CITY "Parcel Location City" true true false 18 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_PRCL_LOCN_CITY,0,18;REM_PRCL_LOCN_STT "Parcel Location State" true true false 2 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_PRCL_LOCN_STT,0,2;REM_PRCL_LOCN_ZIP "Parcel Location Zipcode" true true false 12 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_PRCL_LOCN_ZIP,0,12;REM_ALT_PRCL_ID "Old IBM Number" true true false 35 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_ALT_PRCL_ID,0,35;REM_PRCL_STATUS_DATE "Parcel Status date - CAMA Software" true true false 8 Date 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_PRCL_STATUS_DATE,-1,-1;REM_MBLU_MAP "Map" true true false 7 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_MBLU_MAP,0,7;REM_MBLU_MAP_CUT "Map Cut - Not Used" true true false 3 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_MBLU_MAP_CUT,0,3;REM_MBLU_BLOCK "Block" true true false 7 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_MBLU_BLOCK,0,7;REM_MBLU_BLOCK_CUT "Block Cut - Not Used" true true false 3 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_MBLU_BLOCK_CUT,0,3;REM_MBLU_LOT "Lot" true true false 7 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_MBLU_LOT,0,7;REM_MBLU_LOT_CUT "Lot Cut - Not Used" true true false 3 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_MBLU_LOT_CUT,0,3;REM_MBLU_UNIT "Unit" true true false 7 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_MBLU_UNIT,0,7;REM_MBLU_UNIT_CUT "Unit Cut - Not Used" true true false 3 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_MBLU_UNIT_CUT,0,3;REM_STATUS_DATE "Status Date - CAMA software" true true false 8 Date 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_STATUS_DATE,-1,-1;REM_INET_SUPPRESS "Internet Suppression" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_PARCELS+',REM_INET_SUPPRESS,-1,-1;REM_IS_CONDO_MAIN "Is Condo Main Parcel" true true false 2 Short 0 5,First,#,'+TAX_CLAIM_PARCELS+',REM_IS_CONDO_MAIN,-1,-1;REM_CMPLX_NAME "Complex Name" true true false 30 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_CMPLX_NAME,0,30;REM_BLDG_NAME "Acreage and Description" true true false 60 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_BLDG_NAME,0,60;REM_USE_CODE "Use Code" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_USE_CODE,0,4;REM_LEGAL_AREA "Legal Area" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_PARCELS+',REM_LEGAL_AREA,-1,-1;REM_LAST_UPDATE "Last Update - CAMA software" true true false 8 Date 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_LAST_UPDATE,-1,-1;REM_USRFLD "6 digit PID" true true false 6 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_USRFLD,0,6;REM_USRFLD_DESC "Control Number" true true false 40 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',REM_USRFLD_DESC,0,40;LND_USE_CODE "Land Use Code" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',LND_USE_CODE,0,4;LND_USE_DESC "Land Use Description" true true false 40 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',LND_USE_DESC,0,40;LND_DSTRCT "District Number" true true false 6 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',LND_DSTRCT,0,6;PRC_PF_LOCN "School District Code" true true false 15 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',PRC_PF_LOCN,0,15;PRC_PF_LOCN_DESC "School District" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',PRC_PF_LOCN_DESC,0,50;PRC_USRFLD_09 "User Field 9 - Not Used" true true false 30 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',PRC_USRFLD_09,0,30;PRC_USRFLD_10 "User Field 10 - Not Used" true true false 30 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',PRC_USRFLD_10,0,30;PRC_TTL_ASSESS_BLDG "Total Building Assessment" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_PARCELS+',PRC_TTL_ASSESS_BLDG,-1,-1;PRC_TTL_ASSESS_IMPROVEMENTS "Total Improvements Assessment" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_PARCELS+',PRC_TTL_ASSESS_IMPROVEMENTS,-1,-1;PRC_TTL_ASSESS_LND "Total Land Assessment" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_PARCELS+',PRC_TTL_ASSESS_LND,-1,-1;PRC_TTL_ASSESS_OB "Total Out Building Assessment" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_PARCELS+',PRC_TTL_ASSESS_OB,-1,-1;PRC_VALUE "Parcel Value" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_PARCELS+',PRC_VALUE,-1,-1;PRC_CMPLX_PID "Complex PID" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_PARCELS+',PRC_CMPLX_PID,-1,-1;PRC_CMPLX_DESC "Complex Description" true true false 30 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',PRC_CMPLX_DESC,0,30;PRC_CENSUS "Census - Not Used" true true false 20 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',PRC_CENSUS,0,20;PRC_TTL_MRKT_ASSESS "Total Market Assessment" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_PARCELS+',PRC_TTL_MRKT_ASSESS,-1,-1;PRC_TTL_ASSESS "Total Assessment" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_PARCELS+',PRC_TTL_ASSESS,-1,-1;OWN_ID "OWN_ID" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_PARCELS+',OWN_ID,-1,-1;OWN_NAME1 "OWN_NAME1" true true false 85 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',OWN_NAME1,0,85;OWN_NAME2 "OWN_NAME2" true true false 85 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',OWN_NAME2,0,85;ROW_PID "ROW_PID" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_PARCELS+',ROW_PID,-1,-1;ROW_OWN_ID "ROW_OWN_ID" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_PARCELS+',ROW_OWN_ID,-1,-1;ROW_LINE_NUM "ROW_LINE_NUM" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_PARCELS+',ROW_LINE_NUM,-1,-1;ROW_OWN_PCT "ROW_OWN_PCT" true true false 2 Short 0 5,First,#,'+TAX_CLAIM_PARCELS+',ROW_OWN_PCT,-1,-1;MAD_MAIL_NAME1 "Tax Bill Mailing Address Name 1" true true false 85 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',MAD_MAIL_NAME1,0,85;MAD_MAIL_NAME2 "Tax Bill Mailing Address Name 2" true true false 85 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',MAD_MAIL_NAME2,0,85;MAD_MAIL_ADDR1 "Tax Bill Mailing Address 1" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',MAD_MAIL_ADDR1,0,50;MAD_MAIL_CITY "Tax Bill Mailing Address City" true true false 30 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',MAD_MAIL_CITY,0,30;MAD_MAIL_STATE "Tax Bill Mailing Address State" true true false 20 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',MAD_MAIL_STATE,0,20;MAD_MAIL_ZIP "Tax Bill Mailing Address Zipcode" true true false 20 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',MAD_MAIL_ZIP,0,20;MAD_MAIL_ADDR2 "Tax Bill Mailing Address 2" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',MAD_MAIL_ADDR2,0,50;MAD_ID "Mailing Address VISION ID" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_PARCELS+',MAD_ID,-1,-1;SLH_PID "Sales History PID" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_PARCELS+',SLH_PID,-1,-1;SLH_LINE_NUM "Sales History Line Number" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_PARCELS+',SLH_LINE_NUM,-1,-1;SLH_SALE_DATE "Sale Date" true true false 8 Date 0 0,First,#,'+TAX_CLAIM_PARCELS+',SLH_SALE_DATE,-1,-1;SLH_BOOK "Deed Book / Instrument Number" true true false 15 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',SLH_BOOK,0,15;SLH_PAGE "Deed Page" true true false 15 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',SLH_PAGE,0,15;SLH_PRICE "Sale Price" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_PARCELS+',SLH_PRICE,-1,-1;SLH_CURRENT_OWNER "Sales History Current Owner Designation" true true false 2 Short 0 5,First,#,'+TAX_CLAIM_PARCELS+',SLH_CURRENT_OWNER,-1,-1;LONGITUDE_X "Longitude-X" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_PARCELS+',LONGITUDE_X,-1,-1;LATITUDE_Y "Latitude-Y" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_PARCELS+',LATITUDE_Y,-1,-1;Salenum "Salenum" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_PARCELS+',Salenum,-1,-1;District "District" true true false 2 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',District,0,2;Ward "Ward" true true false 1 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Ward,0,1;Control "Control" true true false 6 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Control,0,6;Year "Year" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Year,0,4;SaleYear "SaleYear" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',SaleYear,0,4;Map_1 "Map" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Map_1,0,50;Map3 "Map3" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Map3,0,4;Map4 "Map4" true true false 3 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Map4,0,3;Map5 "Map5" true true false 5 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Map5,0,5;Name "Name" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Name,0,75;CoOwner "CoOwner" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',CoOwner,0,75;Addr1 "Addr1" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Addr1,0,75;Addr2 "Addr2" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Addr2,0,75;City_1 "City" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',City_1,0,50;State "State" true true false 2 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',State,0,2;ZipCode "ZipCode" true true false 5 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',ZipCode,0,5;ZipCode2 "ZipCode2" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',ZipCode2,0,4;MastName "MastName" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',MastName,0,75;MastCoOwner "MastCoOwner" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',MastCoOwner,0,75;Acreage "Acreage" true true false 20 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Acreage,0,20;Desc1 "Desc1" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Desc1,0,75;Desc2 "Desc2" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Desc2,0,75;Desc3 "Desc3" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',Desc3,0,75;AssLand "AssLand" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_PARCELS+',AssLand,-1,-1;AssImpr "AssImpr" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_PARCELS+',AssImpr,-1,-1;DeedRef "DeedRef" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',DeedRef,0,50;DeedBook "DeedBook" true true false 9 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',DeedBook,0,9;DeedPage "DeedPage" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',DeedPage,0,4;Amount "Amount" true true false 8 Double 4 19,First,#,'+TAX_CLAIM_PARCELS+',Amount,-1,-1;SaleType "SaleType" true true false 1 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',SaleType,0,1;GlobalID "GlobalID" false false true 38 GlobalID 0 0,First,#;BName "Judicial Sale Type" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',BName,0,75;MuniName "Municipality Name" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_PARCELS+',SEC_MUNI_NAME,0,50', '', '')
+    arcpy.management.Append(TAX_CLAIM_PARCELS, TAX_CLAIM_PARCELS_INTERNAL, "NO_TEST", field_maps.field_map("TaxClaim_Parcels_Internal", TAX_CLAIM_PARCELS, TAX_CLAIM_PARCELS_INTERNAL))
     TaxClaim_Parcel_Internal_result = arcpy.GetCount_management(TAX_CLAIM_PARCELS_INTERNAL)
     print (('{} has {} records'.format(TAX_CLAIM_PARCELS_INTERNAL,  TaxClaim_Parcel_Internal_result[0])))
     write_log('{} has {} records'.format(TAX_CLAIM_PARCELS_INTERNAL,  TaxClaim_Parcel_Internal_result[0]), logfile)  
@@ -266,7 +283,7 @@ except:
 
 try:
     # Append TAX_CLAIM_AIRPARCELS_INTERNAL - CRAW_INTERNAL from AUTOWORKSPACE\TREASURERS
-    arcpy.management.Append(TAX_CLAIM_AIRPARCELS, TAX_PARCELS_AIR_INTERNAL, "NO_TEST", r'PID "PID Number" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',PID,-1,-1;CAMA_PIN "MBLU (Map Block Lot Unit) #" true true false 100 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',CAMA_PIN,0,100;Type "Type of air parcel" true true false 255 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Type,0,255;Elevation "Elevation (in feet)" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',Elevation,-1,-1;Building "Building designation (if needed)" true true false 255 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Building,0,255;Floor "Floor (if needed)" true true false 100 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Floor,0,100;Unit "Unit (if needed)" true true false 100 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Unit,0,100;Landex_URL_Choice "Landex URL (choose one)" true true false 100 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Landex_URL_Choice,0,100;created_user "created_user" true true false 255 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',created_user,0,255;created_date "created_date" true true false 8 Date 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',created_date,-1,-1;last_edited_user "last_edited_user" true true false 255 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',last_edited_user,0,255;last_edited_date "last_edited_date" true true false 8 Date 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',last_edited_date,-1,-1;REM_MNC "REM_MNC" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_MNC,-1,-1;REM_PID "PID Number" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_PID,-1,-1;REM_PIN "UPI Number" true true false 35 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_PIN,0,35;REM_OWN_NAME "Owner Name" true true false 85 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_OWN_NAME,0,85;REM_PRCL_LOCN "Parcel Location" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_PRCL_LOCN,0,50;REM_PRCL_LOCN_CITY "Parcel Location City" true true false 18 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_PRCL_LOCN_CITY,0,18;REM_PRCL_LOCN_STT "Parcel Location State" true true false 2 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_PRCL_LOCN_STT,0,2;REM_PRCL_LOCN_ZIP "Parcel Location Zipcode" true true false 12 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_PRCL_LOCN_ZIP,0,12;REM_ALT_PRCL_ID "Old IBM Number" true true false 35 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_ALT_PRCL_ID,0,35;REM_PRCL_STATUS_DATE "Parcel Status date - CAMA Software" true true false 8 Date 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_PRCL_STATUS_DATE,-1,-1;REM_MBLU_MAP "Map" true true false 7 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_MBLU_MAP,0,7;REM_MBLU_MAP_CUT "Map Cut - Not Used" true true false 3 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_MBLU_MAP_CUT,0,3;REM_MBLU_BLOCK "Block" true true false 7 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_MBLU_BLOCK,0,7;REM_MBLU_BLOCK_CUT "Block Cut - Not Used" true true false 3 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_MBLU_BLOCK_CUT,0,3;REM_MBLU_LOT "Lot" true true false 7 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_MBLU_LOT,0,7;REM_MBLU_LOT_CUT "Lot Cut - Not Used" true true false 3 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_MBLU_LOT_CUT,0,3;REM_MBLU_UNIT "Unit" true true false 7 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_MBLU_UNIT,0,7;REM_MBLU_UNIT_CUT "Unit Cut - Not Used" true true false 3 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_MBLU_UNIT_CUT,0,3;REM_STATUS_DATE "Status Date - CAMA software" true true false 8 Date 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_STATUS_DATE,-1,-1;REM_INET_SUPPRESS "Internet Suppression" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_INET_SUPPRESS,-1,-1;REM_IS_CONDO_MAIN "Is Condo Main Parcel" true true false 2 Short 0 5,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_IS_CONDO_MAIN,-1,-1;REM_CMPLX_NAME "Complex Name" true true false 30 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_CMPLX_NAME,0,30;REM_BLDG_NAME "Acreage and Description" true true false 60 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_BLDG_NAME,0,60;REM_USE_CODE "Use Code" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_USE_CODE,0,4;REM_LEGAL_AREA "Legal Area" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_LEGAL_AREA,-1,-1;REM_LAST_UPDATE "Last Update - CAMA software" true true false 8 Date 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_LAST_UPDATE,-1,-1;REM_USRFLD "6 digit PID" true true false 6 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_USRFLD,0,6;REM_USRFLD_DESC "Control Number" true true false 40 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_USRFLD_DESC,0,40;PID_TEXT "PID Text format" true true false 15 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',PID_TEXT,0,15;REM_PARCEL_STATUS "Parcel Status in CAMA" true true false 1 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_PARCEL_STATUS,0,1;LND_USE_CODE "Land Use Code" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',LND_USE_CODE,0,4;LND_USE_DESC "Land Use Description" true true false 40 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',LND_USE_DESC,0,40;LND_DSTRCT "District Number" true true false 6 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',LND_DSTRCT,0,6;MUNI_NAME "Municipality Name" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',MUNI_NAME,0,75;PRC_PF_LOCN "School District Code" true true false 15 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_PF_LOCN,0,15;PRC_PF_LOCN_DESC "School District" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_PF_LOCN_DESC,0,50;PRC_USRFLD_09 "User Field 9 - Not Used" true true false 30 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_USRFLD_09,0,30;PRC_USRFLD_10 "User Field 10 - Not Used" true true false 30 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_USRFLD_10,0,30;PRC_TTL_ASSESS_BLDG "Total Building Assessment" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_TTL_ASSESS_BLDG,-1,-1;PRC_TTL_ASSESS_IMPROVEMENTS "Total Improvements Assessment" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_TTL_ASSESS_IMPROVEMENTS,-1,-1;PRC_TTL_ASSESS_LND "Total Land Assessment" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_TTL_ASSESS_LND,-1,-1;PRC_TTL_ASSESS_OB "Total Out Building Assessment" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_TTL_ASSESS_OB,-1,-1;PRC_VALUE "Parcel Value" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_VALUE,-1,-1;PRC_CMPLX_PID "Complex PID" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_CMPLX_PID,-1,-1;PRC_CMPLX_DESC "Complex Description" true true false 30 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_CMPLX_DESC,0,30;PRC_CENSUS "Census - Not Used" true true false 20 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_CENSUS,0,20;PRC_TTL_MRKT_ASSESS "Total Market Assessment" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_TTL_MRKT_ASSESS,-1,-1;PRC_TTL_ASSESS "Total Assessment" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_AIRPARCELS+',PRC_TTL_ASSESS,-1,-1;OWN_ID "OWN_ID" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',OWN_ID,-1,-1;OWN_NAME1 "OWN_NAME1" true true false 85 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',OWN_NAME1,0,85;OWN_NAME2 "OWN_NAME2" true true false 85 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',OWN_NAME2,0,85;ROW_PID "ROW_PID" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',ROW_PID,-1,-1;ROW_OWN_ID "ROW_OWN_ID" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',ROW_OWN_ID,-1,-1;ROW_LINE_NUM "ROW_LINE_NUM" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',ROW_LINE_NUM,-1,-1;ROW_OWN_PCT "ROW_OWN_PCT" true true false 2 Short 0 5,First,#,'+TAX_CLAIM_AIRPARCELS+',ROW_OWN_PCT,-1,-1;ROW_PRIMARY "ROW_PRIMARY" true true false 2 Short 0 5,First,#,'+TAX_CLAIM_AIRPARCELS+',ROW_PRIMARY,-1,-1;ROW_CREATE_DATE "ROW_CREATE_DATE" true true false 8 Date 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',ROW_CREATE_DATE,-1,-1;ROW_MAD_ID "ROW_MAD_ID" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',ROW_MAD_ID,-1,-1;ROW_MAD_ISPRIMARY "ROW_MAD_ISPRIMARY" true true false 2 Short 0 5,First,#,'+TAX_CLAIM_AIRPARCELS+',ROW_MAD_ISPRIMARY,-1,-1;OWN_LINE "OWN_LINE" true true false 255 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',OWN_LINE,0,255;MAD_MAIL_NAME1 "Tax Bill Mailing Address Name 1" true true false 85 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',MAD_MAIL_NAME1,0,85;MAD_MAIL_NAME2 "Tax Bill Mailing Address Name 2" true true false 85 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',MAD_MAIL_NAME2,0,85;MAD_MAIL_ADDR1 "Tax Bill Mailing Address 1" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',MAD_MAIL_ADDR1,0,50;MAD_MAIL_CITY "Tax Bill Mailing Address City" true true false 30 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',MAD_MAIL_CITY,0,30;MAD_MAIL_STATE "Tax Bill Mailing Address State" true true false 20 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',MAD_MAIL_STATE,0,20;MAD_MAIL_ZIP "Tax Bill Mailing Address Zipcode" true true false 20 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',MAD_MAIL_ZIP,0,20;MAD_MAIL_ADDR2 "Tax Bill Mailing Address 2" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',MAD_MAIL_ADDR2,0,50;MAD_ID "Mailing Address VISION ID" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',MAD_ID,-1,-1;SLH_PID "Sales History PID" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',SLH_PID,-1,-1;SLH_LINE_NUM "Sales History Line Number" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',SLH_LINE_NUM,-1,-1;SLH_SALE_DATE "Sale Date" true true false 8 Date 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',SLH_SALE_DATE,-1,-1;SLH_BOOK "Deed Book / Instrument Number" true true false 15 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',SLH_BOOK,0,15;SLH_PAGE "Deed Page" true true false 15 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',SLH_PAGE,0,15;SLH_PRICE "Sale Price" true true false 8 Double 8 38,First,#,'+TAX_CLAIM_AIRPARCELS+',SLH_PRICE,-1,-1;SLH_CURRENT_OWNER "Sales History Current Owner Designation" true true false 2 Short 0 5,First,#,'+TAX_CLAIM_AIRPARCELS+',SLH_CURRENT_OWNER,-1,-1;REM_INET_SUPPRESS_1 "Internet Suppression" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',REM_INET_SUPPRESS_1,-1,-1;LANDEX_URL "Landex URL" true true false 600 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',LANDEX_URL,0,600;Salenum "Salenum" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',Salenum,-1,-1;District "District" true true false 2 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',District,0,2;Ward "Ward" true true false 1 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Ward,0,1;Control "Control" true true false 6 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Control,0,6;Year "Year" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Year,0,4;SaleYear "SaleYear" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',SaleYear,0,4;Map "Map" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Map,0,50;Map3 "Map3" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Map3,0,4;Map4 "Map4" true true false 3 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Map4,0,3;Map5 "Map5" true true false 5 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Map5,0,5;Name "Name" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Name,0,75;CoOwner "CoOwner" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',CoOwner,0,75;Addr1 "Addr1" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Addr1,0,75;Addr2 "Addr2" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Addr2,0,75;City "City" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',City,0,50;State "State" true true false 2 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',State,0,2;ZipCode "ZipCode" true true false 5 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',ZipCode,0,5;ZipCode2 "ZipCode2" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',ZipCode2,0,4;MastName "MastName" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',MastName,0,75;MastCoOwner "MastCoOwner" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',MastCoOwner,0,75;BName "BName" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',BName,0,75;Acreage "Acreage" true true false 20 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Acreage,0,20;Desc1 "Desc1" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Desc1,0,75;Desc2 "Desc2" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Desc2,0,75;Desc3 "Desc3" true true false 75 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',Desc3,0,75;AssLand "AssLand" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',AssLand,-1,-1;AssImpr "AssImpr" true true false 4 Long 0 10,First,#,'+TAX_CLAIM_AIRPARCELS+',AssImpr,-1,-1;DeedRef "DeedRef" true true false 50 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',DeedRef,0,50;DeedBook "DeedBook" true true false 9 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',DeedBook,0,9;DeedPage "DeedPage" true true false 4 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',DeedPage,0,4;Amount "Amount" true true false 8 Double 4 19,First,#,'+TAX_CLAIM_AIRPARCELS+',Amount,-1,-1;SaleType "SaleType" true true false 1 Text 0 0,First,#,'+TAX_CLAIM_AIRPARCELS+',SaleType,0,1;GlobalID "GlobalID" false false true 38 GlobalID 0 0,First,#', '', '')
+    arcpy.management.Append(TAX_CLAIM_AIRPARCELS, TAX_PARCELS_AIR_INTERNAL, "NO_TEST", field_maps.field_map("TaxClaim_AirParcels_Internal", TAX_CLAIM_AIRPARCELS, TAX_PARCELS_AIR_INTERNAL))
     TaxClaim_AirParcels_Internal_result = arcpy.GetCount_management(TAX_CLAIM_AIRPARCELS)
     print (('{} has {} records'.format(TAX_PARCELS_AIR_INTERNAL,  TaxClaim_AirParcels_Internal_result[0])))
     write_log('{} has {} records'.format(TAX_PARCELS_AIR_INTERNAL,  TaxClaim_AirParcels_Internal_result[0]), logfile)  
@@ -1,7 +1,7 @@
 # ---------------------------------------------------------------------------
 # Active_TaxClaim_Missing_GIS.py
 # Created on: 2022-01-21
-# Updated on 2022-01-21
+# Updated on 2026-10-18
 # Works in ArcGIS Pro
 #
 # Author: Phil Baranyai/GIS Manager
@@ -10,32 +10,34 @@
 # Description: 
 # Geocode the GSSCrawford.dbo.CollTaxSaleWeb, filter out unmatched records and export to R:\GIS\Assessment\Reports as excel file
 #
+#   PIDs are matched to the tax parcel/air parcel PIDs with PID_Match (Shared_Modules) - only the PIDs not found there
+#   are geocoded against CAMA_PID_Locator, and only when they weren't geocoded against the same parcel PIDs last run
+#   (PID match cache).  The report lists the unmatched GSS_TaxClaim_Temp_Tbl records.
+#
 # ---------------------------------------------------------------------------
 
 # Import modules
 import sys,arcpy,datetime,time,os,logging
 
+# Shared modules folder (PID matching)
+Shared_Modules = r"\\FILELOCATION\\GIS\\ArcAutomations\\Shared_Modules"
+sys.path.append(Shared_Modules)
+import PID_Match,Run_Log,Sync_Engine
+
 # Stop geoprocessing log history in metadata (stops program from filling up geoprocessing history in metadata with every run)
 arcpy.SetLogHistory(False)
 
-# Setup error logging (configure logging location, type, and filemode -- overwrite every run)
+# Setup run log (JSON-lines records, local copy mirrored to a .jsonl next to logfile on the share -- overwrite every run)
 logfile = r"\\FILELOCATION\\GIS\\GIS_LOGS\\Assessment\\Active_TaxClaim_Missing_GIS.log"  
-logging.basicConfig(filename= logfile, filemode='w', level=logging.DEBUG)
+run_log = Run_Log.start("Active_TaxClaim_Missing_GIS", logfile)
 
 # Setup Date (and day/time)
 date = datetime.date.today().strftime("%Y%m%d")
 Day = time.strftime("%m-%d-%Y", time.localtime())
 Time = time.strftime("%I:%M:%S %p", time.localtime())
 
-try:
-    # Write Logfile (define logfile write process, each step will append to the log, if program is started over, it will wipe the log and re-start fresh)
-    def write_log(text, file):
-        f = open(file, 'a')           # 'a' will append to an existing file if it exists
-        f.write("{}\n".format(text))  # write the text to the logfile and move to next line
-        return
-except:
-    print ("\n Unable to write log file")
-    sys.exit ()
+# Write Logfile (run log records - Run_Log writes them locally and mirrors them to the share in batches, logging.exception goes to the same log)
+write_log = run_log.write_log
 
 #Database Connection Folder
 Database_Connections = r"\\FILELOCATION\\GIS\\ArcAutomations\\Database_Connections"
@@ -43,6 +45,7 @@ Database_Connections = r"\\FILELOCATION\\GIS\\ArcAutomations\\Database_Connectio
 #Database variables:
 ASMT_REPORT_WORKSPACE = r"\\FILELOCATION\\GIS\\Assessment\\Workspace"
 AUTOWORKSPACE = Database_Connections + "\\auto_workspace@ccsde.sde"
+CRAW_INTERNAL = Database_Connections + "\\craw_internal@ccsde.sde"
 ASMT_REPORT_FLDR = r"\\\FILELOCATION\\GIS\\Assessment\\Reports"
 GSS_DB = Database_Connections + "\\GSS_Database.sde"
 LOCATOR_WKSP = r"\\FILELOCATION\\GIS\\CurrentWebsites\\Locators\\Intranet_Locators"
@@ -52,7 +55,11 @@ ASMT_TEMP_FGDB = ASMT_REPORT_WORKSPACE + "\\Assessment_TCReport_TempFGDB.gdb"
 MISSING_GIS_REPORT = ASMT_REPORT_FLDR + "\\Active_TaxClaim_Missing_GIS.xls"
 CC_PARCEL_LOC = LOCATOR_WKSP + "\\CAMA_PID_Locator"
 TaxClaim_TBL = GSS_DB + "\\dtaGSSCrawford.dbo.CollTaxSaleWeb"
-TaxClaim_TBL_GEOCODE = ASMT_TEMP_FGDB + "\\TaxClaim_TBL_GEOCODE"
+TAX_PARCELS_INTERNAL = CRAW_INTERNAL + "\\CCSDE.CRAW_INTERNAL.Land_Records\\CCSDE.CRAW_INTERNAL.TAX_PARCELS_INTERNAL"
+TAX_PARCELS_AIR_INTERNAL = CRAW_INTERNAL + "\\CCSDE.CRAW_INTERNAL.Land_Records\\CCSDE.CRAW_INTERNAL.TaxParcel_Air_INTERNAL"
+
+# Geocoder results for PIDs not found in the parcel layers (PID_Match - kept outside the temp FGDB, safe to delete)
+PID_MATCH_CACHE = ASMT_REPORT_WORKSPACE + "\\Active_TaxClaim_Missing_GIS_PID_Match.json"
 
 # Local variables - tables:
 VISION_REALMAST_TBL_SDE = AUTOWORKSPACE + "\\CCSDE.AUTO_WORKSPACE.VIS_REALMAST_TBL"
@@ -70,8 +77,8 @@ write_log("Located at: "+ASMT_REPORT_FLDR, logfile)
 write_log("Works in ArcGIS Pro", logfile)
 write_log("============================================================================", logfile)
 
-print ("\n Deleting excel file & Geocoding all Tax Claim records")
-write_log("\n Deleting excel file & Geocoding all Tax Claim records",logfile)
+print ("\n Deleting excel file & matching Tax Claim records to GIS parcels")
+write_log("\n Deleting excel file & matching Tax Claim records to GIS parcels",logfile)
 
 try:
     # Delete excel file so it can be replaced
@@ -133,30 +140,36 @@ except:
     sys.exit ()
 
 try:
-    # Geocode GSS_TaxClaim_Temp_Tbl in ASMT_TEMP_FGDB against CC_PARCEL_Locator, into ASMT_TEMP_FGDB
-    TaxClaim_TBL_GEOCODE = arcpy.geocoding.GeocodeAddresses(GSS_TaxClaim_Temp_Tbl, CC_PARCEL_LOC, "'Single Line Input' PID VISIBLE NONE", TaxClaim_TBL_GEOCODE, "STATIC", None, '', None, "ALL")
-    print ("\n Geocoding REALMAST Table into ASMT_TEMP_FGDB")
-    write_log ("\n Geocoding REALMAST Table into ASMT_TEMP_FGDB", logfile)
+    # Match PIDs to the tax parcel/air parcel PIDs, geocoding only the left-over PIDs against CC_PARCEL_Locator (cached per parcel-layer version)
+    backend = Sync_Engine.ArcpyBackend()
+    parcels = PID_Match.ParcelPIDs.read(backend, [TAX_PARCELS_INTERNAL, TAX_PARCELS_AIR_INTERNAL])
+    match_cache = PID_Match.MatchCache(PID_MATCH_CACHE, lambda text: write_log(text, logfile))
+    match_result = match_cache.match(PID_Match.record_pids(backend, str(GSS_TaxClaim_Temp_Tbl), "PID"), parcels,
+                                     geocode=lambda pids: PID_Match.geocode_pids(pids, CC_PARCEL_LOC))
+    print ("\n Matching Tax Claim PIDs to parcel PIDs: " + match_result.summary())
+    write_log ("\n Matching Tax Claim PIDs to parcel PIDs: " + match_result.summary(), logfile)
 except:
-    print ("\n Unable to Geocode GSS_TaxClaim_Temp_Tbl in ASMT_TEMP_FGDB against CC_PARCEL_Locator, into ASMT_TEMP_FGDB")
-    write_log("\n Unable to Geocode GSS_TaxClaim_Temp_Tbl in ASMT_TEMP_FGDB against CC_PARCEL_Locator, into ASMT_TEMP_FGDB", logfile)
-    logging.exception('Got exception on Geocode GSS_TaxClaim_Temp_Tbl in ASMT_TEMP_FGDB against CC_PARCEL_Locator, into ASMT_TEMP_FGDB logged at:' + str(Day) + " " + str(Time))
+    print ("\n Unable to match GSS_TaxClaim_Temp_Tbl PIDs to parcel PIDs / geocode against CC_PARCEL_Locator")
+    write_log("\n Unable to match GSS_TaxClaim_Temp_Tbl PIDs to parcel PIDs / geocode against CC_PARCEL_Locator", logfile)
+    logging.exception('Got exception on match GSS_TaxClaim_Temp_Tbl PIDs to parcel PIDs / geocode against CC_PARCEL_Locator logged at:' + str(Day) + " " + str(Time))
     raise
     sys.exit ()
 
 try:
-    # Make Feature Layer of MISSING_GIS_GEOCODE, selecting only unmatched records
-    Unmatched_Geocoded_TaxClaim_Records = arcpy.management.MakeFeatureLayer(TaxClaim_TBL_GEOCODE, "Unmatched_Geocoded_TaxClaim_Records", "Status = 'U'", None, "ObjectID ObjectID HIDDEN NONE;Loc_name Loc_name HIDDEN NONE;Shape Shape HIDDEN NONE;Status Status VISIBLE NONE;Score Score HIDDEN NONE;Match_type Match_type HIDDEN NONE;Match_addr Match_addr HIDDEN NONE;LongLabel LongLabel HIDDEN NONE;ShortLabel ShortLabel HIDDEN NONE;Addr_type Addr_type HIDDEN NONE;Type Type HIDDEN NONE;PlaceName PlaceName HIDDEN NONE;Place_addr Place_addr HIDDEN NONE;Phone Phone HIDDEN NONE;URL URL HIDDEN NONE;Rank Rank HIDDEN NONE;AddBldg AddBldg HIDDEN NONE;AddNum AddNum HIDDEN NONE;AddNumFrom AddNumFrom HIDDEN NONE;AddNumTo AddNumTo HIDDEN NONE;AddRange AddRange HIDDEN NONE;Side Side HIDDEN NONE;StPreDir StPreDir HIDDEN NONE;StPreType StPreType HIDDEN NONE;StName StName HIDDEN NONE;StType StType HIDDEN NONE;StDir StDir HIDDEN NONE;BldgType BldgType HIDDEN NONE;BldgName BldgName HIDDEN NONE;LevelType LevelType HIDDEN NONE;LevelName LevelName HIDDEN NONE;UnitType UnitType HIDDEN NONE;UnitName UnitName HIDDEN NONE;SubAddr SubAddr HIDDEN NONE;StAddr StAddr HIDDEN NONE;Block Block HIDDEN NONE;Sector Sector HIDDEN NONE;Nbrhd Nbrhd HIDDEN NONE;District District HIDDEN NONE;City City HIDDEN NONE;MetroArea MetroArea HIDDEN NONE;Subregion Subregion HIDDEN NONE;Region Region HIDDEN NONE;RegionAbbr RegionAbbr HIDDEN NONE;Territory Territory HIDDEN NONE;Zone Zone HIDDEN NONE;Postal Postal HIDDEN NONE;PostalExt PostalExt HIDDEN NONE;Country Country HIDDEN NONE;LangCode LangCode HIDDEN NONE;Distance Distance HIDDEN NONE;X X HIDDEN NONE;Y Y HIDDEN NONE;DisplayX DisplayX HIDDEN NONE;DisplayY DisplayY HIDDEN NONE;Xmin Xmin HIDDEN NONE;Xmax Xmax HIDDEN NONE;Ymin Ymin HIDDEN NONE;Ymax Ymax HIDDEN NONE;ExInfo ExInfo HIDDEN NONE;IN_SingleLine IN_SingleLine HIDDEN NONE;USER_Certmail USER_Certmail HIDDEN NONE;USER_Salenum USER_Salenum HIDDEN NONE;USER_District USER_District HIDDEN NONE;USER_Ward USER_Ward HIDDEN NONE;USER_Control USER_Control VISIBLE NONE;USER_EtuxID USER_EtuxID HIDDEN NONE;USER_Year USER_Year HIDDEN NONE;USER_SaleYear USER_SaleYear HIDDEN NONE;USER_Map USER_Map HIDDEN NONE;USER_Map3 USER_Map3 HIDDEN NONE;USER_Map4 USER_Map4 HIDDEN NONE;USER_Map5 USER_Map5 HIDDEN NONE;USER_Name USER_Name HIDDEN NONE;USER_CoOwner USER_CoOwner HIDDEN NONE;USER_CareOf USER_CareOf HIDDEN NONE;USER_Addr1 USER_Addr1 HIDDEN NONE;USER_Addr2 USER_Addr2 HIDDEN NONE;USER_Addr3 USER_Addr3 HIDDEN NONE;USER_City USER_City HIDDEN NONE;USER_State USER_State HIDDEN NONE;USER_ZipCode USER_ZipCode HIDDEN NONE;USER_ZipCode2 USER_ZipCode2 HIDDEN NONE;USER_MastName USER_MastName HIDDEN NONE;USER_MastCoOwner USER_MastCoOwner HIDDEN NONE;USER_MastAddr1 USER_MastAddr1 HIDDEN NONE;USER_MastAddr2 USER_MastAddr2 HIDDEN NONE;USER_MastCity USER_MastCity HIDDEN NONE;USER_MastState USER_MastState HIDDEN NONE;USER_MastZipCode USER_MastZipCode HIDDEN NONE;USER_MastZipCode2 USER_MastZipCode2 HIDDEN NONE;USER_BName USER_BName HIDDEN NONE;USER_Acreage USER_Acreage HIDDEN NONE;USER_Landuse USER_Landuse HIDDEN NONE;USER_LDesc USER_LDesc HIDDEN NONE;USER_Desc1 USER_Desc1 HIDDEN NONE;USER_Desc2 USER_Desc2 HIDDEN NONE;USER_Desc3 USER_Desc3 HIDDEN NONE;USER_SitusDesc USER_SitusDesc HIDDEN NONE;USER_AssLand USER_AssLand HIDDEN NONE;USER_AssImpr USER_AssImpr HIDDEN NONE;USER_MVLand USER_MVLand HIDDEN NONE;USER_MVImpr USER_MVImpr HIDDEN NONE;USER_DeedRef USER_DeedRef HIDDEN NONE;USER_DeedBook USER_DeedBook HIDDEN NONE;USER_DeedPage USER_DeedPage HIDDEN NONE;USER_Amount USER_Amount HIDDEN NONE;USER_CurrentCounty USER_CurrentCounty HIDDEN NONE;USER_CurrentTwp USER_CurrentTwp HIDDEN NONE;USER_CurrentSchool USER_CurrentSchool HIDDEN NONE;USER_CurrentFee USER_CurrentFee HIDDEN NONE;USER_Lien USER_Lien HIDDEN NONE;USER_LienDesc USER_LienDesc HIDDEN NONE;USER_SignedFor USER_SignedFor HIDDEN NONE;USER_SheriffService USER_SheriffService HIDDEN NONE;USER_PostFlag USER_PostFlag HIDDEN NONE;USER_SentToPalmetto USER_SentToPalmetto HIDDEN NONE;USER_PalmettoIneligible USER_PalmettoIneligible HIDDEN NONE;USER_SaleType USER_SaleType VISIBLE NONE;USER_CarrierRoute USER_CarrierRoute HIDDEN NONE;USER_DeliveryPoint USER_DeliveryPoint HIDDEN NONE;USER_CheckDigit USER_CheckDigit HIDDEN NONE;USER_Job USER_Job HIDDEN NONE;USER_Tray USER_Tray HIDDEN NONE;USER_Package USER_Package HIDDEN NONE;USER_Sequence USER_Sequence HIDDEN NONE;USER_ZipCodeNumber USER_ZipCodeNumber HIDDEN NONE;USER_ZipCodeNumber2 USER_ZipCodeNumber2 HIDDEN NONE;USER_IMBNumeric USER_IMBNumeric HIDDEN NONE;USER_IMBAlpha USER_IMBAlpha HIDDEN NONE;USER_PID USER_PID VISIBLE NONE")
+    # Make Table View of GSS_TaxClaim_Temp_Tbl, selecting only unmatched records (and records whose Control didn't calculate to a PID), showing Control, SaleType and PID only
+    report_fields = ";".join("{0} {0} {1} NONE".format(field.name, "VISIBLE" if field.name in ("Control", "SaleType", "PID") else "HIDDEN")
+                             for field in arcpy.ListFields(GSS_TaxClaim_Temp_Tbl))
+    Unmatched_TaxClaim_Records = arcpy.management.MakeTableView(GSS_TaxClaim_Temp_Tbl, "Unmatched_TaxClaim_Records", PID_Match.where_clause("PID", match_result.unmatched, include_null=True), None, report_fields)
 except:
-    print ("\n Unable to Append VIS_REALMAST_GEOCODE from memory to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT")
-    write_log("\n Unable to Append VIS_REALMAST_GEOCODE from memory to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT", logfile)
-    logging.exception('Got exception on Append VIS_REALMAST_GEOCODE from memory to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT logged at:' + str(Day) + " " + str(Time))
+    print ("\n Unable to make table view of unmatched GSS_TaxClaim_Temp_Tbl records")
+    write_log("\n Unable to make table view of unmatched GSS_TaxClaim_Temp_Tbl records", logfile)
+    logging.exception('Got exception on make table view of unmatched GSS_TaxClaim_Temp_Tbl records logged at:' + str(Day) + " " + str(Time))
     raise
     sys.exit ()
 
 try:
     # Export unmatched records to excel
-    arcpy.TableToExcel_conversion(Unmatched_Geocoded_TaxClaim_Records, MISSING_GIS_REPORT, "ALIAS", "DESCRIPTION")
+    arcpy.TableToExcel_conversion(Unmatched_TaxClaim_Records, MISSING_GIS_REPORT, "ALIAS", "DESCRIPTION")
     print ("\n Exporting unmatched records report to: \\FILELOCATION\GIS\Assessment\Reports")
     write_log("\n Exporting unmatched records report to: \\FILELOCATION\GIS\Assessment\Reports", logfile)
 except:
@@ -1,7 +1,7 @@
 # ---------------------------------------------------------------------------
 # Active_VISION_Missing_GIS.py
 # Created on: 2021-07-19
-# Updated on 2022-01-26
+# Updated on 2026-10-18
 # Works in ArcGIS Pro
 #
 # Author: Phil Baranyai/GIS Manager
@@ -10,38 +10,42 @@
 # Description: 
 # Geocode the VIS_REALMAST_TBL (active records only), filter out unmatched records and export to R:\GIS\Assessment\Reports as excel file
 #
+#   REM_PIDs are matched to the tax parcel/air parcel PIDs with PID_Match (Shared_Modules) - only the PIDs not found there
+#   are geocoded against CAMA_PID_Locator, and only when they weren't geocoded against the same parcel PIDs last run
+#   (PID match cache).  MISSING_GIS_GEOCODE now holds the unmatched records only.
+#
 # ---------------------------------------------------------------------------
 
 # Import modules
 import sys,arcpy,datetime,time,os,logging
 
+# Shared modules folder (PID matching)
+Shared_Modules = r"\\FILELOCATION\\GIS\\ArcAutomations\\Shared_Modules"
+sys.path.append(Shared_Modules)
+import PID_Match,Run_Log,Sync_Engine
+
 # Stop geoprocessing log history in metadata (stops program from filling up geoprocessing history in metadata with every run)
 arcpy.SetLogHistory(False)
 
-# Setup error logging (configure logging location, type, and filemode -- overwrite every run)
+# Setup run log (JSON-lines records, local copy mirrored to a .jsonl next to logfile on the share -- overwrite every run)
 logfile = r"\\FILELOCATION\\GIS\\GIS_LOGS\\Assessment\\Active_VISION_Missing_GIS.log"  
-logging.basicConfig(filename= logfile, filemode='w', level=logging.DEBUG)
+run_log = Run_Log.start("Active_VISION_Missing_GIS", logfile)
 
 # Setup Date (and day/time)
 date = datetime.date.today().strftime("%Y%m%d")
 Day = time.strftime("%m-%d-%Y", time.localtime())
 Time = time.strftime("%I:%M:%S %p", time.localtime())
 
-try:
-    # Write Logfile (define logfile write process, each step will append to the log, if program is started over, it will wipe the log and re-start fresh)
-    def write_log(text, file):
-        f = open(file, 'a')           # 'a' will append to an existing file if it exists
-        f.write("{}\n".format(text))  # write the text to the logfile and move to next line
-        return
-except:
-    print ("\n Unable to write log file")
-    sys.exit ()
+# Write Logfile (run log records - Run_Log writes them locally and mirrors them to the share in batches, logging.exception goes to the same log)
+write_log = run_log.write_log
 
 #Database Connection Folder
 Database_Connections = r"\\FILELOCATION\\GIS\\ArcAutomations\\Database_Connections"
 
 #Database variables:
 AUTOWORKSPACE = Database_Connections + "\\auto_workspace@ccsde.sde"
+CRAW_INTERNAL = Database_Connections + "\\craw_internal@ccsde.sde"
+ASMT_REPORT_WORKSPACE = r"\\FILELOCATION\\GIS\\Assessment\\Workspace"
 ASMT_REPORT_FLDR = r"\\FILELOCATION\\GIS\\Assessment\\Reports"
 LOCATOR_WKSP = r"\\FILELOCATION\\GIS\\CurrentWebsites\\Locators\\Intranet_Locators"
 
@@ -49,6 +53,11 @@ LOCATOR_WKSP = r"\\FILELOCATION\\GIS\\CurrentWebsites\\Locators\\Intranet_Locato
 MISSING_GIS_REPORT = ASMT_REPORT_FLDR + "\\Active_VISION_Missing_GIS.xls"
 MISSING_GIS_GEOCODE = AUTOWORKSPACE + "\\CCSDE.AUTO_WORKSPACE.Assessment\\CCSDE.AUTO_WORKSPACE.Active_VISION_Missing_GIS_Geocode"
 CC_PARCEL_LOC = LOCATOR_WKSP + "\\CAMA_PID_Locator"
+TAX_PARCELS_INTERNAL = CRAW_INTERNAL + "\\CCSDE.CRAW_INTERNAL.Land_Records\\CCSDE.CRAW_INTERNAL.TAX_PARCELS_INTERNAL"
+TAX_PARCELS_AIR_INTERNAL = CRAW_INTERNAL + "\\CCSDE.CRAW_INTERNAL.Land_Records\\CCSDE.CRAW_INTERNAL.TaxParcel_Air_INTERNAL"
+
+# Geocoder results for REM_PIDs not found in the parcel layers (PID_Match - safe to delete, they are geocoded again)
+PID_MATCH_CACHE = ASMT_REPORT_WORKSPACE + "\\Active_VISION_Missing_GIS_PID_Match.json"
 
 # Local variables - tables:
 VISIDATA_TEMP = AUTOWORKSPACE + "\\CCSDE.AUTO_WORKSPACE.VISIDATA_TEMP"
@@ -66,8 +75,8 @@ write_log("Located at: "+ASMT_REPORT_FLDR, logfile)
 write_log("Works in ArcGIS Pro", logfile)
 write_log("============================================================================", logfile)
 
-print ("\n Deleting excel file & Geocoding all VISION records")
-write_log("\n Deleting excel file & Geocoding all VISION records",logfile)
+print ("\n Deleting excel file & matching VISION records to GIS parcels")
+write_log("\n Deleting excel file & matching VISION records to GIS parcels",logfile)
 
 try:
     # Delete excel file so it can be replaced
@@ -93,36 +102,33 @@ except:
     sys.exit ()
 
 try:
-    # Geocode VIS_REALMAST_TBL in AUTOWORKSPACE against CC_PARCEL_Locator, into "memory"
-    VIS_REALMAST_GEOCODE = arcpy.geocoding.GeocodeAddresses(VISIDATA_TEMP, CC_PARCEL_LOC, "'Single Line Input' REM_PID VISIBLE NONE", "in_memory/VIS_REALMAST_GEOCODE", "STATIC", None, '', None, "ALL")
-    print ("\n Geocoding REALMAST Table into memory")
-    write_log ("\n Geocoding REALMAST Table into memory", logfile)
+    # Match REM_PIDs to the tax parcel/air parcel PIDs, geocoding only the left-over PIDs against CC_PARCEL_Locator (cached per parcel-layer version)
+    backend = Sync_Engine.ArcpyBackend()
+    parcels = PID_Match.ParcelPIDs.read(backend, [TAX_PARCELS_INTERNAL, TAX_PARCELS_AIR_INTERNAL])
+    match_cache = PID_Match.MatchCache(PID_MATCH_CACHE, lambda text: write_log(text, logfile))
+    match_result = match_cache.match(PID_Match.record_pids(backend, VISIDATA_TEMP, "REM_PID"), parcels,
+                                     geocode=lambda pids: PID_Match.geocode_pids(pids, CC_PARCEL_LOC))
+    print ("\n Matching REALMAST PIDs to parcel PIDs: " + match_result.summary())
+    write_log ("\n Matching REALMAST PIDs to parcel PIDs: " + match_result.summary(), logfile)
 except:
-    print ("\n Unable to Geocode VIS_REALMAST_TBL in AUTOWORKSPACE against CC_PARCEL_Locator, into memory")
-    write_log("\n Unable to Geocode VIS_REALMAST_TBL in AUTOWORKSPACE against CC_PARCEL_Locator, into memory", logfile)
-    logging.exception('Got exception on Geocode VIS_REALMAST_TBL in AUTOWORKSPACE against CC_PARCEL_Locator, into memory logged at:' + str(Day) + " " + str(Time))
-    raise
-    sys.exit ()
-
-try:
-    # Append VISIDATA_TEMP_GEOCODE from memory to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT
-    arcpy.management.Append(VIS_REALMAST_GEOCODE, MISSING_GIS_GEOCODE, "NO_TEST", r'REM_MNC "REM_MNC" true false false 4 Long 0 10,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_MNC,-1,-1;REM_PID "PID Number" true false false 4 Long 0 10,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_PID,-1,-1;REM_PIN "UPI Number" true true false 35 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_PIN,0,35;REM_OWN_NAME "Owner Name" true true false 85 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_OWN_NAME,0,85;REM_PRCL_LOCN "Parcel Location" true true false 50 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_PRCL_LOCN,0,50;REM_PRCL_LOCN_CITY "Parcel Location City" true true false 18 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_PRCL_LOCN_CITY,0,18;REM_PRCL_LOCN_STT "Parcel Location State" true true false 2 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_PRCL_LOCN_STT,0,2;REM_PRCL_LOCN_ZIP "Parcel Location Zipcode" true true false 12 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_PRCL_LOCN_ZIP,0,12;REM_ALT_PRCL_ID "Old IBM Number" true true false 35 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_ALT_PRCL_ID,0,35;REM_PRCL_STATUS_DATE "Parcel Status date - CAMA Software" true true false 8 Date 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_PRCL_STATUS_DATE,-1,-1;REM_MBLU_MAP "Map" true true false 7 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_MBLU_MAP,0,7;REM_MBLU_MAP_CUT "Map Cut - Not Used" true true false 3 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_MBLU_MAP_CUT,0,3;REM_MBLU_BLOCK "Block" true true false 7 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_MBLU_BLOCK,0,7;REM_MBLU_BLOCK_CUT "Block Cut - Not Used" true true false 3 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_MBLU_BLOCK_CUT,0,3;REM_MBLU_LOT "Lot" true true false 7 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_MBLU_LOT,0,7;REM_MBLU_LOT_CUT "Lot Cut - Not Used" true true false 3 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_MBLU_LOT_CUT,0,3;REM_MBLU_UNIT "Unit" true true false 7 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_MBLU_UNIT,0,7;REM_MBLU_UNIT_CUT "Unit Cut - Not Used" true true false 3 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_MBLU_UNIT_CUT,0,3;REM_STATUS_DATE "Status Date - CAMA software" true true false 8 Date 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_STATUS_DATE,-1,-1;REM_INET_SUPPRESS "Internet Suppression" true true false 4 Long 0 10,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_INET_SUPPRESS,-1,-1;REM_IS_CONDO_MAIN "Is Condo Main Parcel" true true false 2 Short 0 5,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_IS_CONDO_MAIN,-1,-1;REM_CMPLX_NAME "Complex Name" true true false 30 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_CMPLX_NAME,0,30;REM_BLDG_NAME "Acreage and Description" true true false 60 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_BLDG_NAME,0,60;REM_USE_CODE "Use Code" true true false 4 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_USE_CODE,0,4;REM_LEGAL_AREA "Legal Area" true true false 8 Double 8 38,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_LEGAL_AREA,-1,-1;REM_LAST_UPDATE "Last Update - CAMA software" true true false 8 Date 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_LAST_UPDATE,-1,-1;REM_USRFLD "6 digit PID" true true false 6 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_USRFLD,0,6;REM_USRFLD_DESC "Control Number" true true false 40 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_USRFLD_DESC,0,40;PID_TEXT "PID Text format" true true false 15 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PID_TEXT,0,15;REM_PARCEL_STATUS "Parcel Status in CAMA" true true false 1 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_PARCEL_STATUS,0,1;LND_USE_CODE "Land Use Code" true true false 4 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_LND_USE_CODE,0,4;LND_USE_DESC "Land Use Description" true true false 40 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_LND_USE_DESC,0,40;LND_DSTRCT "District Number" true true false 6 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_LND_DSTRCT,0,6;MUNI_NAME "Municipality Name" true true false 75 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_MUNI_NAME,0,75;PRC_PF_LOCN "School District Code" true true false 15 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_PF_LOCN,0,15;PRC_PF_LOCN_DESC "School District" true true false 50 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_PF_LOCN_DESC,0,50;PRC_USRFLD_09 "User Field 9 - Not Used" true true false 30 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_USRFLD_09,0,30;PRC_USRFLD_10 "User Field 10 - Not Used" true true false 30 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_USRFLD_10,0,30;PRC_TTL_ASSESS_BLDG "Total Building Assessment" true true false 8 Double 8 38,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_TTL_ASSESS_BLDG,-1,-1;PRC_TTL_ASSESS_IMPROVEMENTS "Total Improvements Assessment" true true false 8 Double 8 38,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_TTL_ASSESS_IMPROVEMENTS,-1,-1;PRC_TTL_ASSESS_LND "Total Land Assessment" true true false 8 Double 8 38,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_TTL_ASSESS_LND,-1,-1;PRC_TTL_ASSESS_OB "Total Out Building Assessment" true true false 8 Double 8 38,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_TTL_ASSESS_OB,-1,-1;PRC_VALUE "Parcel Value" true true false 8 Double 8 38,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_VALUE,-1,-1;PRC_CMPLX_PID "Complex PID" true true false 4 Long 0 10,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_CMPLX_PID,-1,-1;PRC_CMPLX_DESC "Complex Description" true true false 30 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_CMPLX_DESC,0,30;PRC_CENSUS "Census - Not Used" true true false 20 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_CENSUS,0,20;PRC_TTL_MRKT_ASSESS "Total Market Assessment" true true false 8 Double 8 38,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_TTL_MRKT_ASSESS,-1,-1;PRC_TTL_ASSESS "Total Assessment" true true false 8 Double 8 38,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_PRC_TTL_ASSESS,-1,-1;OWN_ID "OWN_ID" true true false 4 Long 0 10,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_OWN_ID,-1,-1;OWN_NAME1 "OWN_NAME1" true true false 85 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_OWN_NAME1,0,85;OWN_NAME2 "OWN_NAME2" true true false 85 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_OWN_NAME2,0,85;ROW_PID "ROW_PID" true true false 4 Long 0 10,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_ROW_PID,-1,-1;ROW_OWN_ID "ROW_OWN_ID" true true false 4 Long 0 10,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_OWN_ID,-1,-1;ROW_LINE_NUM "ROW_LINE_NUM" true true false 4 Long 0 10,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_ROW_LINE_NUM,-1,-1;ROW_OWN_PCT "ROW_OWN_PCT" true true false 2 Short 0 5,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_ROW_OWN_PCT,-1,-1;ROW_PRIMARY "ROW_PRIMARY" true true false 2 Short 0 5,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_ROW_PRIMARY,-1,-1;ROW_CREATE_DATE "ROW_CREATE_DATE" true true false 8 Date 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_ROW_CREATE_DATE,-1,-1;ROW_MAD_ID "ROW_MAD_ID" true true false 4 Long 0 10,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_ROW_MAD_ID,-1,-1;ROW_MAD_ISPRIMARY "ROW_MAD_ISPRIMARY" true true false 2 Short 0 5,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_ROW_MAD_ISPRIMARY,-1,-1;OWN_LINE "OWN_LINE" true true false 255 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_OWN_LINE,0,255;MAD_MAIL_NAME1 "Tax Bill Mailing Address Name 1" true true false 85 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_MAD_MAIL_NAME1,0,85;MAD_MAIL_NAME2 "Tax Bill Mailing Address Name 2" true true false 85 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_MAD_MAIL_NAME2,0,85;MAD_MAIL_ADDR1 "Tax Bill Mailing Address 1" true true false 50 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_MAD_MAIL_ADDR1,0,50;MAD_MAIL_CITY "Tax Bill Mailing Address City" true true false 30 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_MAD_MAIL_CITY,0,30;MAD_MAIL_STATE "Tax Bill Mailing Address State" true true false 20 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_MAD_MAIL_STATE,0,20;MAD_MAIL_ZIP "Tax Bill Mailing Address Zipcode" true true false 20 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_MAD_MAIL_ZIP,0,20;MAD_MAIL_ADDR2 "Tax Bill Mailing Address 2" true true false 50 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_MAD_MAIL_ADDR2,0,50;MAD_ID "Mailing Address VISION ID" true true false 4 Long 0 10,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_MAD_ID,-1,-1;SLH_PID "Sales History PID" true true false 4 Long 0 10,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_SLH_PID,-1,-1;SLH_LINE_NUM "Sales History Line Number" true true false 4 Long 0 10,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_SLH_LINE_NUM,-1,-1;SLH_SALE_DATE "Sale Date" true true false 8 Date 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_SLH_SALE_DATE,-1,-1;SLH_BOOK "Deed Book / Instrument Number" true true false 15 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_SLH_BOOK,0,15;SLH_PAGE "Deed Page" true true false 15 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_SLH_PAGE,0,15;SLH_PRICE "Sale Price" true true false 8 Double 8 38,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_SLH_PRICE,-1,-1;SLH_CURRENT_OWNER "Sales History Current Owner Designation" true true false 2 Short 0 5,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_SLH_CURRENT_OWNER,-1,-1;REM_INET_SUPPRESS_1 "Internet Suppression" true true false 4 Long 0 10,First,#,"in_memory/VIS_REALMAST_GEOCODE",USER_REM_INET_SUPPRESS_1,-1,-1;Match "Match" true true false 255 Text 0 0,First,#,"in_memory/VIS_REALMAST_GEOCODE",Status,0,1', '', '')
-    print ("\n   Appending VISIDATA_TEMP_GEOCODE from memory to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT")
-    write_log ("\n   Appending VISIDATA_TEMP_GEOCODE from memory to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT", logfile)
-except:
-    print ("\n Unable to Append VISIDATA_TEMP_GEOCODE from memory to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT")
-    write_log("\n Unable to Append VISIDATA_TEMP_GEOCODE from memory to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT", logfile)
-    logging.exception('Got exception on Append VISIDATA_TEMP_GEOCODE from memory to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT logged at:' + str(Day) + " " + str(Time))
+    print ("\n Unable to match VISIDATA_TEMP PIDs to parcel PIDs / geocode against CC_PARCEL_Locator")
+    write_log("\n Unable to match VISIDATA_TEMP PIDs to parcel PIDs / geocode against CC_PARCEL_Locator", logfile)
+    logging.exception('Got exception on match VISIDATA_TEMP PIDs to parcel PIDs / geocode against CC_PARCEL_Locator logged at:' + str(Day) + " " + str(Time))
     raise
     sys.exit ()
 
 try:
-    # Clear "in_memory" for (keeps in_memory from getting overloaded or corrupted)
-    arcpy.Delete_management("in_memory")
+    # Append unmatched VISIDATA_TEMP records (and records with no REM_PID) to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT and flag them unmatched
+    Unmatched_VISIDATA_View = arcpy.management.MakeTableView(VISIDATA_TEMP, "Unmatched_VISIDATA_View", PID_Match.where_clause("REM_PID", match_result.unmatched, include_null=True))
+    arcpy.management.Append(Unmatched_VISIDATA_View, MISSING_GIS_GEOCODE, "NO_TEST")
+    arcpy.management.CalculateField(MISSING_GIS_GEOCODE, "Match", "'U'", "PYTHON3", '', "TEXT", "NO_ENFORCE_DOMAINS")
+    arcpy.management.Delete(Unmatched_VISIDATA_View)
+    print ("\n   Appending unmatched VISIDATA_TEMP records to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT")
+    write_log ("\n   Appending unmatched VISIDATA_TEMP records to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT", logfile)
 except:
-    print ("\n Unable to clear VIS_REALMAST_GEOCODE from in_memory")
-    write_log("Unable to clear VIS_REALMAST_GEOCODE from in_memory", logfile)
-    logging.exception('Got exception on clear VIS_REALMAST_GEOCODE from in_memory logged at:' + time.strftime("%I:%M:%S %p", time.localtime()))
+    print ("\n Unable to Append unmatched VISIDATA_TEMP records to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT")
+    write_log("\n Unable to Append unmatched VISIDATA_TEMP records to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT", logfile)
+    logging.exception('Got exception on Append unmatched VISIDATA_TEMP records to MISSING_GIS_GEOCODE in AUTOWORKSPACE/ASSESSMENT logged at:' + str(Day) + " " + str(Time))
     raise
     sys.exit ()
 
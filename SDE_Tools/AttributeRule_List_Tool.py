@@ -8,7 +8,9 @@
 #
 # Author: Phil Baranyai
 # Created on: 2023-03-29
-# Updated on 2024-03-29
+# Updated on 2026-10-18
+#
+# The report is streamed to excel with column widths and filter set as it is written (Shared_Modules\Excel_Report.py)
 # ---------------------------------------------------------------------------
 print("This tool will check all attribute rules within the SDE connection workspace entered below, and provide a list of exported in excel")
 print("\nLoading python modules, please wait...")
@@ -17,7 +19,9 @@ print("\nLoading python modules, please wait...")
 import arcpy,os,logging,datetime,sys,time
 from arcpy import env
 import pandas as pd
-from openpyxl import load_workbook
+# Shared modules folder (streaming excel report writer) - Shared_Modules next to this tools folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Excel_Report
 
 # Allows user to enter SDE connection name
 print("Enter SDE Connection below (no need to add _SDE, the script will do this automatically): \n Example: SDENAME \n ****Leaving blank will run domain list for ALL 'SDE Connection'_SDE*.sde connections in SDE_Connection folder****")
@@ -203,16 +207,16 @@ attributeRules_Validation_df = pd.DataFrame(attributeRules_Validation)
 
 # Set Excel spreadsheet output name
 ExcelOutput = os.path.join(ReportDirectory,str(SDEConnection)+'__Attribute_Rules_Usage_report__'+str(date)+"_"+str(Time)+'.xlsx')
-XLWriter = pd.ExcelWriter(ExcelOutput)
 
 # Exporting attribute rules dataframes to excel
 try:
     print('\nExporting to Excel, located at: '+ExcelOutput)
     write_log('\nExporting to Excel, located at: '+ExcelOutput,logfile)
-    attributeRules_Calculation_df.to_excel(XLWriter, sheet_name='Calculation Rules', index=False)
-    attributeRules_Constraint_df.to_excel(XLWriter, sheet_name='Constraint Rules', index=False)
-    attributeRules_Validation_df.to_excel(XLWriter, sheet_name='Validation Rules', index=False)
-    XLWriter.close()
+    XLReport = Excel_Report.ReportWriter(ExcelOutput)
+    XLReport.add_frame('Calculation Rules', attributeRules_Calculation_df)
+    XLReport.add_frame('Constraint Rules', attributeRules_Constraint_df)
+    XLReport.add_frame('Validation Rules', attributeRules_Validation_df)
+    XLReport.close()
 except:
     print('\n Unable to export dataframes to excel')
     write_log('\n Unable to export dataframes to excel',logfile)
@@ -220,32 +224,6 @@ except:
     raise
     sys.exit()
 
-# Access exported excel workbook, and auto-size columns for easier read
-try:
-    print("\n Resizing excel columns to autofit columns")
-    write_log("\n Resizing excel columns to autofit columns",logfile)
-    wb = load_workbook(ExcelOutput)
-    for sheet in wb.worksheets:
-        for column in sheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(cell.value)
-                except:
-                    pass
-            adjusted_width = (max_length + 2) * 1.2
-            sheet.column_dimensions[column_letter].width = adjusted_width
-            sheet.auto_filter.ref = sheet.dimensions
-    wb.save(ExcelOutput)
-except:
-    print('\n Unable to resize excel columns to fit data')
-    write_log('\n Unable to resize excel columns to fit data',logfile)
-    logging.exception('Got exception on resize excel columns to fit data logged at:' + time.strftime("%I:%M:%S %p", time.localtime()))
-    raise
-    sys.exit()
-
 # Provide elapsed time calculation for completed statement below.
 elapsed_time = time.time() - start_time
 
@@ -6,15 +6,19 @@
 #
 # Author: Phil Baranyai
 # Created on: 2022-12-16 
-# Updated on 2024-03-08
+# Updated on 2026-10-18
+#
+# The report is streamed to excel with column widths and filter set as it is written (Shared_Modules\Excel_Report.py)
 # ---------------------------------------------------------------------------
 
 print("This tool will iterate through the user provided SDE connection, and provide a report of all items, within it.")
 print("\nLoading python modules, please wait...")
 import arcpy, os, sys, logging, datetime,time
 import pandas as pd
-from openpyxl import load_workbook
 from arcpy import env
+# Shared modules folder (streaming excel report writer) - Shared_Modules next to this tools folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Shared_Modules"))
+import Excel_Report
 
 print("Enter SDE Connection below (no need to add _SDE, the script will do this automatically): \n Example: YOUR_DATABASE_NAME \n ****Leaving blank will run domain list for ALL 'SDE Connection'_SDE*.sde connections in SDE_Connection folder****")
 SDEConnection = input('\n    Enter SDE Connection Name (not the path): ')
@@ -145,7 +149,9 @@ except:
 try:
     print('\nExporting to Excel, located at: '+ExcelOutput)
     write_log('\nExporting to Excel, located at: '+ExcelOutput,logfile)
-    SDEinventory_df.to_excel(ExcelOutput, 'Items', index=False)
+    XLReport = Excel_Report.ReportWriter(ExcelOutput)
+    XLReport.add_frame('Items', SDEinventory_df)
+    XLReport.close()
 except:
     print('\n Unable to export excel spreadsheet to: '+ExcelOutput)
     write_log('\n Unable to export excel spreadsheet to: '+ExcelOutput,logfile)
@@ -153,32 +159,6 @@ except:
     raise
     sys.exit()
 
-# Access exported excel workbook, and auto-size columns for easier read
-try:
-    print("\n Resizing excel columns to autofit columns")
-    write_log("\n Resizing excel columns to autofit columns",logfile)
-    wb = load_workbook(ExcelOutput)
-    ws = wb['Items']
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(cell.value)
-            except:
-                pass
-        adjusted_width = (max_length + 2) * 1.2
-        ws.column_dimensions[column_letter].width = adjusted_width
-        ws.auto_filter.ref = ws.dimensions
-    wb.save(ExcelOutput)
-except:
-    print('\n Unable to resize excel columns to fit data')
-    write_log('\n Unable to resize excel columns to fit data',logfile)
-    logging.exception('Got exception on resize excel columns to fit data logged at:' + time.strftime("%I:%M:%S %p", time.localtime()))
-    raise
-    sys.exit()
-
 # Provides stop time and elapsed time variables
 end_time = time.strftime("%I:%M:%S %p", time.localtime())
 elapsed_time = time.time() - start_time
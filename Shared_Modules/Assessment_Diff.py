@@ -0,0 +1,118 @@
+# ---------------------------------------------------------------------------
+# Assessment_Diff.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Total assessment differences for Vision_Reconcile_Report, worked out on numpy arrays.
+#  The report copied VISION.REAL_PROP.PARCEL into a temp FGDB, joined the weekly VISION_OTHER_TBL
+#  values on, appended everything to VISION_TTLASSMT_RECONCILE_TBL, then ran one UpdateCursor
+#  deleting every row not costed today and calculating the difference row by row, and a second
+#  one deleting the zero/null differences - thousands of deleteRow calls per run.  Here:
+#
+#   - PRC_PID, PRC_TTL_ASSESS and PRC_COST_DATE of the parcel table are read into arrays and
+#     filtered to today's cost date
+#   - the weekly values (VISION_OTHER_TBL) are looked up for those PIDs with a sorted-key
+#     search (first row of a repeated PID, as the join did)
+#   - difference = current - weekly (current when there is no weekly total), and only the
+#     nonzero, non-null differences are returned - written to the reconcile table in one insert
+#
+#  Data is read through a Sync_Engine backend (ArcpyBackend in the report).
+#
+#  Usage in a script:
+#
+#   import Assessment_Diff,Sync_Engine
+#   result = Assessment_Diff.assessment_differences(Sync_Engine.ArcpyBackend(), PARCEL_VISION, VISION_OTHER_TBL_SDE)
+#   Sync_Engine.ArcpyBackend().apply_changes(ASMT_RECONCILE_TBL, Assessment_Diff.OUTPUT_FIELDS, result.rows, {}, set())
+# ---------------------------------------------------------------------------
+
+import datetime,time
+
+import numpy as np
+
+# Parcel table fields: PID, current assessment total, assessment (cost) date
+PARCEL_FIELDS = ["PRC_PID", "PRC_TTL_ASSESS", "PRC_COST_DATE"]
+
+# Weekly table fields: PID, map/block/lot, weekly assessment total, weekly assessment date
+WEEKLY_FIELDS = ["REM_PID", "REM_MBLU_MAP", "REM_MBLU_BLOCK", "REM_MBLU_LOT", "PRC_TTL_ASSESS", "REM_PRCL_STATUS_DATE"]
+
+# VISION_TTLASSMT_RECONCILE_TBL fields, in the order of the rows returned
+OUTPUT_FIELDS = ["REM_PID", "REM_MBLU_MAP", "REM_MBLU_BLOCK", "REM_MBLU_LOT", "WEEKLY_ASSESSMENT_TOTAL", "WEEKLY_ASSESSMENT_DATE",
+                 "CURRENT_ASSESSMENT_TOTAL", "CURRENT_ASSESSMENT_DATE", "TOTAL_ASSESSMENT_DIFFERENCE"]
+
+
+class DiffResult(object):
+    """Rows (OUTPUT_FIELDS order) with a nonzero total assessment difference today, plus counts."""
+
+    def __init__(self):
+        self.rows = []
+        self.parcels = 0
+        self.costed_today = 0
+        self.no_weekly = 0             # costed today with no weekly record (difference = current total)
+        self.seconds = 0.0
+
+    def summary(self):
+        return "{} parcels, {} costed today ({} with no weekly total), {} with an assessment difference in {}".format(
+            self.parcels, self.costed_today, self.no_weekly, len(self.rows), time.strftime("%H:%M:%S", time.gmtime(self.seconds)))
+
+
+def _float(value):
+    return np.nan if value is None else float(value)
+
+
+def read_columns(backend, dataset, fields, where_clause=None):
+    """Columns of a table as python lists (one cursor pass)."""
+    columns = [[] for field in fields]
+    for row_id, values in backend.read_rows(dataset, fields, where_clause):
+        for column, value in zip(columns, values):
+            column.append(value)
+    return columns
+
+
+def _days(values):
+    # datetime/date values -> datetime64[D] (nulls -> NaT)
+    return np.array([None if value is None else value.date() if isinstance(value, datetime.datetime) else value for value in values],
+                    dtype="datetime64[D]")
+
+
+def assessment_differences(backend, parcel_table, weekly_table, today=None, parcel_fields=PARCEL_FIELDS, weekly_fields=WEEKLY_FIELDS):
+    """Today's nonzero assessment differences between parcel_table (current) and weekly_table (weekly) - a DiffResult."""
+    started = time.time()
+    result = DiffResult()
+    today = np.datetime64(today or datetime.date.today(), "D")
+
+    pids, current, cost_dates = read_columns(backend, parcel_table, parcel_fields)
+    result.parcels = len(pids)
+    costed = _days(cost_dates) == today
+    index = np.flatnonzero(costed)
+    result.costed_today = len(index)
+    if not len(index):
+        result.seconds = time.time() - started
+        return result
+    today_pids = np.array([pids[position] for position in index], dtype=np.float64)
+    today_current = np.array([_float(current[position]) for position in index])
+
+    # Weekly values by PID - first row of a repeated PID (stable sort keeps the table order)
+    weekly = read_columns(backend, weekly_table, weekly_fields)
+    weekly_pids = np.array([_float(value) for value in weekly[0]])
+    order = np.argsort(weekly_pids, kind="stable")
+    sorted_pids = weekly_pids[order]
+    found_at = np.searchsorted(sorted_pids, today_pids, side="left")
+    found = found_at < len(sorted_pids)
+    found[found] = sorted_pids[found_at[found]] == today_pids[found]
+    weekly_rows = np.where(found, order[np.minimum(found_at, len(order) - 1)], -1)
+    weekly_totals = np.array([_float(weekly[4][row]) if row >= 0 else np.nan for row in weekly_rows])
+    result.no_weekly = int((~found).sum())
+
+    difference = np.where(np.isnan(weekly_totals), today_current, today_current - weekly_totals)
+    keep = np.flatnonzero(~np.isnan(difference) & (difference != 0))
+    for position in keep:
+        row = weekly_rows[position]
+        source = index[position]
+        weekly_values = [weekly[column][row] for column in range(1, 6)] if row >= 0 else [None] * 5
+        result.rows.append([pids[source]] + weekly_values[:3] + [None if np.isnan(weekly_totals[position]) else float(weekly_totals[position]),
+                                                                  weekly_values[4], current[source], cost_dates[source], float(difference[position])])
+    result.seconds = time.time() - started
+    return result
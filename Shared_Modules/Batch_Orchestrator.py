@@ -0,0 +1,341 @@
+# ---------------------------------------------------------------------------
+# Batch_Orchestrator.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Runs the scripts launched by the Batch Files masters from a declared dependency graph
+#  (Manifests\Nightly_Script_Graph.json) instead of one propy call after another.
+#  Scripts with no dependency between them run at the same time in a bounded pool of
+#  propy processes:
+#
+#   - depends_on   : scripts that must finish successfully first (Parcel_Builder before LandRecords/TaxClaim)
+#   - targets      : datasets the script writes - two scripts sharing a target never run at the same
+#                    time (lock files in lock_folder also keep separate masters from colliding)
+#   - timeout      : minutes before a hung script is killed - the whole process tree (propy.bat starts
+#                    cmd.exe, which starts python.exe); if it can't be stopped the job is "hung" and
+#                    its target locks are kept so nothing else writes the same datasets
+#
+#  With "warm_worker" in the graph (true, or the path of a Warm_Worker settings file) scripts are
+#  sent to the Warm_Worker server, which already has arcpy and the connections loaded, instead of
+#  a new propy each - jobs marked "cold" (scripts with their own process pools) and every job when
+#  no server is running still get their own propy.
+#
+#  Each script's output goes to its own log in log_folder, and a timing report with the
+#  critical path (the chain of scripts that decided the length of the run) is written at the end.
+#
+#  Usage (from a batch file):
+#
+#   propy Batch_Orchestrator.py \\FILELOCATION\GIS\ArcAutomations\Manifests\Nightly_Script_Graph.json
+#   propy Batch_Orchestrator.py <graph> --only Parcel_Builder LandRecords_Data_Spreader --workers 2
+#   propy Batch_Orchestrator.py <graph> --dry-run
+# ---------------------------------------------------------------------------
+
+import argparse,concurrent.futures,json,os,subprocess,sys,time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import Pipeline_Runner
+import Warm_Worker
+
+DEFAULT_PROPY = r"C:\Program Files\ArcGIS\Pro\bin\Python\Scripts\propy.bat"
+
+
+class JobResult(object):
+    """Outcome and timing of one script."""
+
+    def __init__(self, name):
+        self.name = name
+        self.status = "pending"        # pending, completed, failed, timeout, hung (timed out, still running), skipped
+        self.returncode = None
+        self.ready = None              # seconds after start when dependencies were satisfied
+        self.started = None
+        self.finished = None
+
+    @property
+    def seconds(self):
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    @property
+    def waited(self):
+        # Time spent waiting on a target lock or a free worker after dependencies finished
+        if self.ready is None or self.started is None:
+            return 0.0
+        return self.started - self.ready
+
+    def as_dict(self):
+        return {"name": self.name, "status": self.status, "returncode": self.returncode, "started": self.started,
+                "finished": self.finished, "seconds": round(self.seconds, 3), "waited": round(self.waited, 3)}
+
+
+def load_graph(path, overrides=None):
+    """Read a script graph, substitute variables and validate dependencies (no unknown names or cycles)."""
+    with open(path) as graph_file:
+        graph = json.load(graph_file)
+    variables = Pipeline_Runner.resolve_variables(graph.get("variables", {}), overrides)
+    jobs = []
+    for job in graph.get("jobs", []):
+        job = Pipeline_Runner.substitute_variables(dict(job), variables)
+        if not job.get("script") and not job.get("command"):
+            raise Pipeline_Runner.ManifestError("Job {} needs a script or a command".format(job.get("name")))
+        job.setdefault("name", os.path.splitext(os.path.basename(job.get("script", "")))[0])
+        job.setdefault("depends_on", [])
+        job.setdefault("targets", [])
+        jobs.append(job)
+    graph = dict((key, Pipeline_Runner.substitute_variables(value, variables)) for key, value in graph.items() if key not in ("variables", "jobs"))
+    graph["variables"] = variables
+    graph["jobs"] = jobs
+    graph["dependencies"] = Pipeline_Runner.build_graph(jobs)
+    return graph
+
+
+def select_jobs(graph, names):
+    """Limit a graph to the named jobs - dependencies outside the selection are treated as already done."""
+    unknown = [name for name in names if name not in graph["dependencies"]]
+    if unknown:
+        raise Pipeline_Runner.ManifestError("Unknown job(s): {}".format(", ".join(unknown)))
+    graph = dict(graph)
+    graph["jobs"] = [job for job in graph["jobs"] if job["name"] in names]
+    graph["dependencies"] = dict((name, set(dependency for dependency in dependencies if dependency in names))
+                                 for name, dependencies in graph["dependencies"].items() if name in names)
+    return graph
+
+
+def _command(graph, job):
+    if job.get("command"):
+        return job["command"] if isinstance(job["command"], list) else [job["command"]]
+    return [graph.get("propy", DEFAULT_PROPY), job["script"]] + list(job.get("arguments", []))
+
+
+def _lock_path(lock_folder, target):
+    return os.path.join(lock_folder, "".join(character if character.isalnum() else "_" for character in target) + ".lock")
+
+
+def _acquire_locks(lock_folder, job, stale_seconds):
+    # Lock files are created exclusively, so another master running the same target makes this return False
+    taken = []
+    for target in sorted(job["targets"]):
+        path = _lock_path(lock_folder, target)
+        try:
+            if os.path.exists(path) and time.time() - os.path.getmtime(path) > stale_seconds:
+                os.remove(path)
+            handle = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.write(handle, "{} {}".format(job["name"], os.getpid()).encode("utf-8"))
+            os.close(handle)
+            taken.append(path)
+        except OSError:
+            for path in taken:
+                os.remove(path)
+            return False
+    job["_lock_files"] = taken
+    return True
+
+
+def _release_locks(job):
+    for path in job.pop("_lock_files", []):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _warm_config(graph):
+    # "warm_worker": true (default settings) or the path of a Warm_Worker settings file
+    setting = graph.get("warm_worker")
+    if not setting:
+        return None
+    if "_warm_config" not in graph:
+        graph["_warm_config"] = Warm_Worker.load_config(setting if isinstance(setting, str) else None)
+    return graph["_warm_config"]
+
+
+def _kill_tree(process):
+    # propy.bat runs in a cmd.exe - killing that alone leaves the script's python.exe running
+    if os.name == "nt":
+        kill = subprocess.run(["taskkill", "/T", "/F", "/PID", str(process.pid)], stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              universal_newlines=True)
+        message = kill.stdout.strip()
+    else:
+        process.kill()
+        message = ""
+    try:
+        process.wait(timeout=60)
+    except subprocess.TimeoutExpired:
+        return False, message
+    return os.name != "nt" or kill.returncode == 0, message
+
+
+def run_job(graph, job, log_folder):
+    """Run one script to completion (or its timeout) - called from the worker pool."""
+    timeout = job.get("timeout_minutes", graph.get("default_timeout_minutes", 120))
+    log_path = os.path.join(log_folder, job["name"] + ".log") if log_folder else os.devnull
+    warm_config = _warm_config(graph)
+    fallback = None
+    if warm_config and job.get("script") and not job.get("command") and not job.get("cold"):
+        try:
+            result = Warm_Worker.submit(job["script"], job.get("arguments"), log=log_path if log_folder else None, cwd=job.get("cwd"),
+                                        timeout_minutes=timeout, name=job["name"], config=warm_config)
+            return result["status"], result.get("returncode")
+        except Warm_Worker.WarmWorkerUnavailable as error:
+            fallback = error
+    with open(log_path, "w") as job_log:
+        if fallback:
+            job_log.write(" {} - running with propy\n".format(fallback))
+            job_log.flush()
+        process = subprocess.Popen(_command(graph, job), stdout=job_log, stderr=subprocess.STDOUT, cwd=job.get("cwd"))
+        try:
+            return "completed" if process.wait(timeout=timeout * 60 if timeout else None) == 0 else "failed", process.returncode
+        except subprocess.TimeoutExpired:
+            stopped, message = _kill_tree(process)
+            if message:
+                job_log.write("\n" + message + "\n")
+            if not stopped:
+                job_log.write("\n Timed out after {} minutes - Batch_Orchestrator could not stop the whole process tree, it may still be running\n".format(timeout))
+                return "hung", process.returncode
+            job_log.write("\n Killed by Batch_Orchestrator after {} minutes (process tree stopped)\n".format(timeout))
+            return "timeout", process.returncode
+
+
+def run_graph(graph, log=print, workers=None):
+    """Run every job in the graph; returns a list of JobResult in graph order."""
+    jobs = dict((job["name"], job) for job in graph["jobs"])
+    dependencies = graph["dependencies"]
+    results = dict((name, JobResult(name)) for name in jobs)
+    workers = workers or graph.get("workers", 3)
+    log_folder = graph.get("log_folder")
+    lock_folder = graph.get("lock_folder")
+    stale_seconds = 60 * max([job.get("timeout_minutes", graph.get("default_timeout_minutes", 120)) for job in jobs.values()] + [0]) + 600
+    for folder in (log_folder, lock_folder):
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder)
+
+    started = time.time()
+    held = set()
+    hung = set()                         # targets of scripts that timed out and could not be stopped
+    running = {}
+    remaining = list(jobs)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        while remaining or running:
+            for name in list(remaining):
+                job = jobs[name]
+                if any(results[dependency].status in ("failed", "timeout", "hung", "skipped") for dependency in dependencies[name]):
+                    results[name].status = "skipped"
+                    remaining.remove(name)
+                    log("Skipping {} - a script it depends on did not complete".format(name))
+                    continue
+                if not all(results[dependency].status == "completed" for dependency in dependencies[name]):
+                    continue
+                if hung & set(job["targets"]):
+                    results[name].status = "skipped"
+                    remaining.remove(name)
+                    log("Skipping {} - a script that could not be stopped may still be writing {}".format(name, ", ".join(sorted(hung & set(job["targets"])))))
+                    continue
+                if results[name].ready is None:
+                    results[name].ready = time.time() - started
+                if len(running) >= workers or held & set(job["targets"]):
+                    continue
+                if lock_folder and not _acquire_locks(lock_folder, job, stale_seconds):
+                    continue
+                held.update(job["targets"])
+                results[name].started = time.time() - started
+                log("Start Running {} {}".format(name, time.strftime("%m/%d/%Y %I:%M:%S %p", time.localtime())))
+                running[executor.submit(run_job, graph, job, log_folder)] = name
+                remaining.remove(name)
+            if not running:
+                if remaining:
+                    time.sleep(5)        # waiting on a lock held by another master
+                continue
+            done, pending = concurrent.futures.wait(list(running), timeout=5, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                result = results[name]
+                result.finished = time.time() - started
+                try:
+                    result.status, result.returncode = future.result()
+                except Exception as error:
+                    result.status = "failed"
+                    log("Unable to start {}: {}".format(name, error))
+                if result.status == "hung":
+                    # Still writing its targets - keep them locked (lock files go stale after the longest timeout)
+                    log("{} timed out and could not be stopped - keeping locks on {}".format(name, ", ".join(jobs[name]["targets"]) or "-"))
+                    hung.update(jobs[name]["targets"])
+                else:
+                    held.difference_update(jobs[name]["targets"])
+                    _release_locks(jobs[name])
+                log("End Running {} {} - {} in {}".format(name, time.strftime("%m/%d/%Y %I:%M:%S %p", time.localtime()),
+                                                          result.status, time.strftime("%H:%M:%S", time.gmtime(result.seconds))))
+    return [results[job["name"]] for job in graph["jobs"]]
+
+
+def critical_path(graph, results):
+    """Chain of jobs ending at the last finisher, each step the dependency that finished last."""
+    by_name = dict((result.name, result) for result in results if result.finished is not None)
+    if not by_name:
+        return []
+    path = [max(by_name.values(), key=lambda result: result.finished)]
+    while True:
+        dependencies = [by_name[name] for name in graph["dependencies"].get(path[-1].name, ()) if name in by_name]
+        if not dependencies:
+            break
+        path.append(max(dependencies, key=lambda result: result.finished))
+    return list(reversed(path))
+
+
+def report_lines(graph, results, seconds):
+    clock = lambda value: "-" if value is None else time.strftime("%H:%M:%S", time.gmtime(value))
+    serial = sum(result.seconds for result in results)
+    lines = ["==============================================================",
+             "Batch_Orchestrator timing report: {} scripts, wall clock {}, one-after-another would be ~{}".format(len(results), clock(seconds), clock(serial)),
+             "  {:<40} {:<10} {:>9} {:>9} {:>9} {:>9}".format("Script", "Status", "Start", "Finish", "Duration", "Waited")]
+    for result in sorted(results, key=lambda result: (result.started is None, result.started)):
+        lines.append("  {:<40} {:<10} {:>9} {:>9} {:>9} {:>9}".format(result.name, result.status, clock(result.started),
+                                                                     clock(result.finished), clock(result.seconds), clock(result.waited)))
+    path = critical_path(graph, results)
+    lines.append("Critical path ({}):".format(clock(path[-1].finished) if path else "-"))
+    for result in path:
+        lines.append("  {} ({} + {} waiting)".format(result.name, clock(result.seconds), clock(result.waited)))
+    lines.append("==============================================================")
+    return lines
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Run batch scripts from a dependency graph in a bounded process pool")
+    parser.add_argument("graph", help="script graph (JSON)")
+    parser.add_argument("--only", nargs="+", help="run just these jobs")
+    parser.add_argument("--workers", type=int, help="maximum scripts running at once")
+    parser.add_argument("--report", help="timing report path (default: report in the graph, if any)")
+    parser.add_argument("--dry-run", action="store_true", help="print the run order without starting anything")
+    options = parser.parse_args(arguments)
+
+    graph = load_graph(options.graph)
+    if options.only:
+        graph = select_jobs(graph, options.only)
+
+    if options.dry_run:
+        for job in graph["jobs"]:
+            print ("{:<40} after: {:<50} targets: {}".format(job["name"], ", ".join(sorted(graph["dependencies"][job["name"]])) or "-",
+                                                            ", ".join(job["targets"]) or "-"))
+        return 0
+
+    start_time = time.time()
+    results = run_graph(graph, workers=options.workers)
+    seconds = time.time() - start_time
+    lines = report_lines(graph, results, seconds)
+    print ("\n".join(lines))
+
+    report = options.report or graph.get("report")
+    if report:
+        with open(report, "w") as report_file:
+            report_file.write("\n".join(lines) + "\n")
+        with open(os.path.splitext(report)[0] + ".json", "w") as report_file:
+            json.dump({"seconds": round(seconds, 3), "jobs": [result.as_dict() for result in results],
+                       "critical_path": [result.name for result in critical_path(graph, results)]}, report_file, indent=2)
+
+    return 0 if all(result.status == "completed" for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
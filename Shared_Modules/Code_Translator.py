@@ -0,0 +1,202 @@
+# ---------------------------------------------------------------------------
+# Code_Translator.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Code -> description translation for the UpdateCursor conversions (land district -> municipal
+#  name, building permit code -> description, road class -> Northern Tier class, directionals and
+#  post types -> NG911, assessment land use -> planning/LBCS codes).  The scripts kept each
+#  conversion as two parallel lists and ran "if row[0] in codes: row[0] = values[codes.index(row[0])]"
+#  - two list scans per row - in a separate cursor per field, and wrote every row back.  Here:
+#
+#   - the code tables live in Manifests\Code_Tables.json and are compiled into dicts
+#   - every field of a dataset is translated in one UpdateCursor pass
+#   - updateRow is only called when a translated value differs from the one stored
+#   - translated/updated counts and the values with no code in the table are reported
+#
+#  Code tables (Manifests\Code_Tables.json - hand edited):
+#
+#   {
+#     "Crawford_Road_Class_NT": {"null": "Local Road", "codes": {"INTERSTATE": "Interstate", ...}},
+#     "AST_LandUse_LBCS": {"columns": ["LAND_USE_CATEGORY", "LBCS_ACTIVITY", ...],
+#                          "null": ["To be determined", "9900", ...], "codes": {"1050": ["Dwelling, Attached", "1100", ...], ...}}
+#   }
+#
+#   codes   - code: translated value (a list of values, one per column, for a "columns" table)
+#   null    - value used for null codes (left as is when the table has none)
+#   columns - fields a multi-value table writes (the code field itself is left as is)
+#
+#  Usage in a script:
+#
+#   import Code_Translator
+#   code_tables = Code_Translator.load_tables(Manifests + "\\Code_Tables.json")
+#   result = Code_Translator.translate(Centerline_NG911, code_tables, [("St_PreDir", "Directionals_NG911"),
+#                                                                      ("St_PosDir", "Directionals_NG911"),
+#                                                                      ("St_PosTyp", "PostType_NG911")])
+#   result.summary()   result.unmapped_summary()
+# ---------------------------------------------------------------------------
+
+import collections,json,time
+
+
+class CodeTableError(Exception):
+    """Raised when a code table is missing or doesn't fit the fields it is applied to."""
+
+
+class CodeTable(object):
+    """One compiled code table - lookup(code) gives the translated value (or a list, one per column)."""
+
+    def __init__(self, name, codes, null=None, has_null=False, columns=None):
+        self.name = name
+        self.codes = dict(codes)
+        self.null = null
+        self.has_null = has_null
+        self.columns = list(columns) if columns else None
+
+    @classmethod
+    def from_definition(cls, name, definition):
+        columns = definition.get("columns")
+        codes = definition.get("codes", {})
+        if columns:
+            for code, values in codes.items():
+                if not isinstance(values, list) or len(values) != len(columns):
+                    raise CodeTableError("Code table {}: code {} needs {} values ({})".format(name, code, len(columns), ", ".join(columns)))
+        return cls(name, codes, definition.get("null"), "null" in definition, columns)
+
+    def lookup(self, code):
+        """(True, translated value) for a code in the table, (False, None) otherwise."""
+        if code is None:
+            return self.has_null, self.null
+        if code in self.codes:
+            return True, self.codes[code]
+        return False, None
+
+
+def load_tables(path):
+    """Code tables file (JSON) -> {table name: CodeTable}."""
+    with open(path) as tables_file:
+        definitions = json.load(tables_file)
+    return dict((name, CodeTable.from_definition(name, definition)) for name, definition in definitions.items())
+
+
+class Translation(object):
+    """A field translated with a code table.
+
+    field   - field holding the code
+    table   - CodeTable (or its name in the loaded tables)
+    targets - fields written; default: the code field itself (replaced by its translation),
+              or the table's columns for a multi-value table
+    """
+
+    def __init__(self, field, table, targets=None):
+        self.field = field
+        self.table = table
+        self.targets = list(targets) if targets else None
+
+
+class TranslateResult(object):
+    """Counts from one translation pass - per translated field: rows translated, rows changed, unmapped codes."""
+
+    def __init__(self, labels):
+        self.labels = labels
+        self.rows = 0
+        self.updated = 0
+        self.translated = collections.OrderedDict((label, 0) for label in labels)
+        self.changed = collections.OrderedDict((label, 0) for label in labels)
+        self.unmapped = collections.OrderedDict((label, collections.Counter()) for label in labels)
+        self.seconds = 0.0
+
+    def summary(self):
+        fields = "; ".join("{} {} translated/{} changed/{} unmapped".format(label, self.translated[label], self.changed[label],
+                                                                          sum(self.unmapped[label].values())) for label in self.labels)
+        return "{} rows, {} updated in {} ({})".format(self.rows, self.updated, time.strftime("%H:%M:%S", time.gmtime(self.seconds)), fields)
+
+    def unmapped_summary(self, limit=10):
+        """Most common codes with no entry in their table, per field ("" when every code was found)."""
+        lines = []
+        for label in self.labels:
+            if self.unmapped[label]:
+                lines.append("{}: {}".format(label, ", ".join("{!r} x{}".format(code, count) for code, count in self.unmapped[label].most_common(limit))))
+        return "; ".join(lines)
+
+
+class Translator(object):
+    """Translations compiled against one cursor field list - translate(row) updates a row list in place."""
+
+    def __init__(self, tables, translations):
+        self.fields = []
+        self.steps = []
+        labels = []
+        for translation in translations:
+            if not isinstance(translation, Translation):
+                translation = Translation(*translation)
+            table = translation.table
+            if not isinstance(table, CodeTable):
+                if table not in tables:
+                    raise CodeTableError("No code table named {}".format(table))
+                table = tables[table]
+            targets = translation.targets or table.columns or [translation.field]
+            if table.columns and len(targets) != len(table.columns):
+                raise CodeTableError("Code table {} writes {} fields, {} given".format(table.name, len(table.columns), len(targets)))
+            if not table.columns and len(targets) != 1:
+                raise CodeTableError("Code table {} writes one field, {} given".format(table.name, len(targets)))
+            positions = [self._position(field) for field in [translation.field] + targets]
+            label = translation.field if targets == [translation.field] else "{} ({})".format(translation.field, table.name)
+            labels.append(label)
+            self.steps.append((label, table.lookup, positions[0], positions[1:], bool(table.columns)))
+        self.result = TranslateResult(labels)
+
+    def _position(self, field):
+        if field not in self.fields:
+            self.fields.append(field)
+        return self.fields.index(field)
+
+    def translate(self, row):
+        """Translate a row (list in self.fields order) in place - True when any value changed."""
+        result = self.result
+        result.rows += 1
+        row_changed = False
+        for label, lookup, source, targets, multiple in self.steps:
+            code = row[source]
+            found, values = lookup(code)
+            if not found:
+                if code is not None and code != "":          # blank codes aren't reported
+                    result.unmapped[label][code] += 1
+                continue
+            result.translated[label] += 1
+            if not multiple:
+                values = (values,)
+            changed = False
+            for target, value in zip(targets, values):
+                if row[target] != value:
+                    row[target] = value
+                    changed = True
+            if changed:
+                result.changed[label] += 1
+                row_changed = True
+        if row_changed:
+            result.updated += 1
+        return row_changed
+
+    def apply(self, dataset, where_clause=None):
+        """One UpdateCursor pass over a dataset - rows are only written back when a value changed."""
+        import arcpy
+        started = time.time()
+        with arcpy.da.UpdateCursor(dataset, self.fields, where_clause) as cursor:
+            for row in cursor:
+                if self.translate(row):
+                    cursor.updateRow(row)
+        self.result.seconds += time.time() - started
+        return self.result
+
+
+def translate(dataset, tables, translations, where_clause=None):
+    """Translate the fields of a dataset in one cursor pass - a TranslateResult.
+
+    tables       - {name: CodeTable} from load_tables()
+    translations - Translations or (field, table name[, target fields]) tuples
+    """
+    return Translator(tables, translations).apply(dataset, where_clause)
@@ -0,0 +1,156 @@
+# ---------------------------------------------------------------------------
+# Excel_Report.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Excel writer for the SDE_Tools and AGOL/Enterprise Portal reports.  The reports wrote
+#  the workbook with pandas, opened it again with load_workbook, walked every cell of every
+#  column to autosize the widths and saved it a second time - for a large inventory the
+#  whole workbook was held in memory as openpyxl cells.  This streams each sheet's rows
+#  straight to the file in openpyxl write_only mode:
+#
+#   - column widths ((longest value + 2) * 1.2, as the reports sized them) are measured
+#     from the DataFrame columns before the rows are written (a write_only sheet writes
+#     its column widths ahead of the first row)
+#   - the header is bold and the auto-filter covers the sheet
+#   - link columns hold URLs and are written as "Click here to open URL" hyperlinks
+#
+#  The workbook is never loaded back into memory.
+#
+#  Usage in a report tool:
+#
+#   import Excel_Report
+#   report = Excel_Report.ReportWriter(ExcelOutput)
+#   report.add_frame('Items', df, links={'Link to Item': 'Click here to open URL'})
+#   report.close()
+# ---------------------------------------------------------------------------
+
+import datetime,numbers
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+LINK_TEXT = "Click here to open URL"
+
+# Values shown as text in a link column that aren't links
+NO_LINK = ("", "N/A")
+
+# Excel caps column widths at 255 characters
+MAX_WIDTH = 255
+
+# Characters a date/time cell shows (openpyxl writes dates as yyyy-mm-dd h:mm:ss)
+DATE_LENGTH = 19
+
+
+def column_width(length):
+    """Width the reports gave a column whose longest value has length characters."""
+    return min((length + 2) * 1.2, MAX_WIDTH)
+
+
+def _text_length(value):
+    # Length of a value as shown in the sheet (nulls are empty cells)
+    if _is_null(value):
+        return 0
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return DATE_LENGTH
+    return len(str(value))
+
+
+def _text_lengths(values):
+    return values.map(_text_length)
+
+
+def _is_null(value):
+    if value is None:
+        return True
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def _cell_value(value):
+    # Values openpyxl writes as they are; anything else (lists of groups, dicts, ...) is written as text
+    if _is_null(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        value = value.to_pydatetime()
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    if isinstance(value, (str, bool, numbers.Number, datetime.datetime, datetime.date, datetime.time)):
+        return value
+    return str(value)
+
+
+class ReportWriter(object):
+    """Workbook written sheet by sheet in write_only mode (one pass over each sheet's rows).
+
+    path - .xlsx file written by close()
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self.sheets = []                # (sheet name, rows written)
+        self.header_font = Font(bold=True)
+        self.link_font = Font(color="0563C1", underline="single")
+
+    def add_frame(self, sheet_name, frame, links=None):
+        """Write a DataFrame (no index) to a new sheet; returns the rows written.
+
+        links - {column: link text} for columns holding URLs, written as hyperlinks showing the
+                text (LINK_TEXT when None); "N/A" and empty values are written as they are
+        """
+        links = dict(links or {})
+        columns = [str(column) for column in frame.columns]
+        sheet = self.workbook.create_sheet(title=sheet_name)
+
+        # Widths first - write_only sheets write the column widths before the first row
+        for position, column in enumerate(frame.columns):
+            lengths = [len(columns[position])]
+            if len(frame):
+                if column in links:
+                    text = links[column] or LINK_TEXT
+                    values = frame.iloc[:, position]
+                    lengths.append(int(_text_lengths(values.where(values.isin(NO_LINK) | values.isna(), text)).max()))
+                else:
+                    lengths.append(int(_text_lengths(frame.iloc[:, position]).max()))
+            sheet.column_dimensions[get_column_letter(position + 1)].width = column_width(max(lengths))
+        if len(columns):
+            sheet.auto_filter.ref = "A1:{}{}".format(get_column_letter(len(columns)), len(frame) + 1)
+
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(sheet, value=column)
+            cell.font = self.header_font
+            header.append(cell)
+        sheet.append(header)
+
+        link_positions = dict((position, links[column] or LINK_TEXT) for position, column in enumerate(frame.columns) if column in links)
+        count = 0
+        for values in frame.itertuples(index=False, name=None):
+            row = [_cell_value(value) for value in values]
+            for position, text in link_positions.items():
+                url = row[position]
+                if url is not None and url not in NO_LINK:
+                    cell = WriteOnlyCell(sheet, value=text)
+                    cell.hyperlink = str(url)
+                    cell.font = self.link_font
+                    row[position] = cell
+            sheet.append(row)
+            count += 1
+        self.sheets.append((sheet_name, count))
+        return count
+
+    def close(self):
+        """Save the workbook (a write_only workbook can only be saved once)."""
+        self.workbook.save(self.path)
+
+    def summary(self):
+        return "{} sheet(s), {} rows written to {}".format(len(self.sheets), sum(count for name, count in self.sheets), self.path)
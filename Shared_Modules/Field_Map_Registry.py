@@ -0,0 +1,253 @@
+# ---------------------------------------------------------------------------
+# Field_Map_Registry.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Named field mappings for Append, in place of the multi-kilobyte field-mapping strings
+#  pasted into each Append call.  A mapping is only the part that differs from "same field
+#  name in source and target" - the full field map is derived from the two schemas, checked,
+#  and saved in a compiled cache keyed by a hash of both schemas.  Later runs reuse the
+#  compiled string; a schema change (field added, dropped, resized, retyped) makes the hash
+#  miss, so the field map is regenerated and re-checked instead of failing inside Append.
+#
+#  Definitions (Manifests\Field_Maps.json - hand edited):
+#
+#   {
+#     "TaxClaim_Parcels_Internal": {"renames": {"MuniName": "SEC_MUNI_NAME"}},   (target field: source field)
+#     "TaxClaim_AirParcels_Internal": {"exclude": ["Notes"]}                     (target fields left empty)
+#   }
+#
+#  Compiled cache (Manifests\Field_Maps_Compiled.json - written by this module, safe to delete)
+#
+#  A mapping with no renames/excludes compiles to "" - Append then matches fields by name
+#  itself, so there is no field-map string for arcpy to parse at all.
+#
+#  Usage in a spreader:
+#
+#   import Field_Map_Registry
+#   field_maps = Field_Map_Registry.FieldMapRegistry(Manifests + "\\Field_Maps.json")
+#   arcpy.management.Append(SOURCE, TARGET, "NO_TEST", field_maps.field_map("TaxClaim_Parcels_Internal", SOURCE, TARGET))
+#
+#  From the command line (check every mapping against the live schemas, or turn an old inline
+#  field-map string into renames for a definition):
+#
+#   propy Field_Map_Registry.py <definitions> --check <name> <source> <target>
+#   propy Field_Map_Registry.py --parse "<field map string>"
+# ---------------------------------------------------------------------------
+
+import argparse,datetime,hashlib,json,os,re,sys,tempfile
+
+# ListFields type -> field-map type
+FIELD_MAP_TYPES = {"String": "Text", "Integer": "Long", "SmallInteger": "Short", "BigInteger": "BigInteger", "Double": "Double",
+                   "Single": "Float", "Date": "Date", "DateOnly": "DateOnly", "TimeOnly": "TimeOnly", "GUID": "Guid"}
+
+# Types Append maps (OID, GlobalID, Geometry, Raster and Blob are handled by the geodatabase)
+NUMERIC_TYPES = ("Integer", "SmallInteger", "BigInteger", "Double", "Single")
+SKIP_FIELD_NAMES = ("SHAPE_AREA", "SHAPE_LENGTH", "SHAPE.STAREA()", "SHAPE.STLENGTH()", "SHAPE__AREA", "SHAPE__LENGTH")
+
+# Other source type -> target type pairs Append converts (anything can go into a text field, numbers into numbers)
+COMPATIBLE_TYPES = (("Date", "DateOnly"), ("DateOnly", "Date"))
+
+
+class FieldMapError(Exception):
+    """Raised when a mapping can't be built from the current schemas (missing field, incompatible type, ...)."""
+
+
+def describe_fields(dataset):
+    """Field schema of a feature class/table as plain dicts (arcpy.ListFields)."""
+    import arcpy
+    return [{"name": field.name, "type": field.type, "length": field.length, "precision": field.precision,
+             "scale": field.scale, "alias": field.aliasName, "nullable": field.isNullable, "editable": field.editable,
+             "required": field.required} for field in arcpy.ListFields(dataset)]
+
+
+def _mappable(fields):
+    return [field for field in fields
+            if field["type"] in FIELD_MAP_TYPES and field.get("editable", True) and field["name"].upper() not in SKIP_FIELD_NAMES]
+
+
+def _compatible(source_type, target_type):
+    if source_type == target_type or target_type == "String":
+        return True
+    if source_type in NUMERIC_TYPES and target_type in NUMERIC_TYPES:
+        return True
+    return (source_type, target_type) in COMPATIBLE_TYPES
+
+
+def schema_hash(source_fields, target_fields, definition):
+    """Hash of everything a compiled field map depends on - both schemas and the mapping definition."""
+    signature = lambda fields: sorted([field["name"].upper(), field["type"], field.get("length"), field.get("precision"),
+                                       field.get("scale"), field.get("alias"), field.get("nullable"), field.get("required")]
+                                      for field in _mappable(fields))
+    text = json.dumps([signature(source_fields), signature(target_fields), definition], sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def compile_field_map(source_fields, target_fields, renames=None, exclude=None):
+    """Build an Append field map ({source} stands in for the source path) and a list of warnings.
+
+    Every mappable target field is filled from the source field of the same name unless renamed
+    or excluded.  Returns "" when that is all the mapping does (Append matches by name itself).
+    """
+    renames = dict((target.upper(), source) for target, source in (renames or {}).items())
+    exclude = set(name.upper() for name in (exclude or []))
+    sources = dict((field["name"].upper(), field) for field in _mappable(source_fields))
+    targets = _mappable(target_fields)
+    target_names = set(field["name"].upper() for field in targets)
+
+    for name in list(renames) + list(exclude):
+        if name not in target_names:
+            raise FieldMapError("Mapping names target field {} which is not in the target".format(name))
+    for source_name in renames.values():
+        if source_name.upper() not in sources:
+            raise FieldMapError("Mapping reads source field {} which is not in the source".format(source_name))
+
+    entries = []
+    warnings = []
+    by_name = True
+    for target in targets:
+        name = target["name"].upper()
+        source = None if name in exclude else sources.get(renames.get(name, name).upper())
+        if source is None:
+            if not target.get("nullable", True) and not target.get("required", False):
+                raise FieldMapError("Target field {} does not allow nulls and has no source field".format(target["name"]))
+            if name in exclude:
+                by_name = False
+            continue
+        if name in renames:
+            by_name = False
+        if not _compatible(source["type"], target["type"]):
+            raise FieldMapError("Source field {} ({}) can't be appended into target field {} ({})".format(
+                source["name"], source["type"], target["name"], target["type"]))
+        if target["type"] == "String" and source["type"] == "String" and source.get("length", 0) > target.get("length", 0):
+            warnings.append("{} ({} characters) may be truncated into {} ({} characters)".format(
+                source["name"], source.get("length"), target["name"], target.get("length")))
+        if source["type"] == "String":
+            position = "0,{}".format(source.get("length", 0))
+        else:
+            position = "-1,-1"
+        entries.append('{} "{}" {} {} {} {} {} {} {},First,#,{{source}},{},{}'.format(
+            target["name"], target.get("alias") or target["name"], str(target.get("editable", True)).lower(),
+            str(target.get("nullable", True)).lower(), str(target.get("required", False)).lower(), target.get("length", 0),
+            FIELD_MAP_TYPES[target["type"]], target.get("precision", 0), target.get("scale", 0), source["name"], position))
+    return ("" if by_name else ";".join(entries)), warnings
+
+
+def parse_field_map(text):
+    """{target field: source field} from an existing field-map string - used to write definitions for old scripts."""
+    return dict(re.findall(r'(?:^|;)(\w+) "[^"]*" \w+ \w+ \w+ \d+ \w+ \d+ \d+,\w+,[^,]*,[^,]*,(\w+)', text))
+
+
+class FieldMapRegistry(object):
+    """Named field mappings with a compiled cache keyed by schema hash.
+
+    definitions_path - hand-edited JSON of {name: {"renames": {...}, "exclude": [...]}}
+    cache_path       - compiled cache (default: <definitions>_Compiled.json next to it)
+    describe         - callable returning the field dicts of a dataset (default arcpy.ListFields)
+    log              - callable taking a line of text (regenerations and warnings), or None
+    """
+
+    def __init__(self, definitions_path, cache_path=None, describe=None, log=None):
+        self.definitions_path = definitions_path
+        self.cache_path = cache_path or os.path.splitext(definitions_path)[0] + "_Compiled.json"
+        self.describe = describe or describe_fields
+        self.log = log
+        with open(definitions_path) as definitions_file:
+            self.definitions = json.load(definitions_file)
+        self.cache = self._read_cache()
+        self.memo = {}                   # (name, source, target) -> field map, for repeat calls in one run
+        self.hits = 0
+        self.regenerated = 0
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_path) as cache_file:
+                return json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _save(self, name, entry):
+        # Re-read before writing so spreaders sharing the cache don't drop each other's entries
+        cache = self._read_cache()
+        cache[name] = entry
+        folder = os.path.dirname(os.path.abspath(self.cache_path))
+        handle, temporary = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        with os.fdopen(handle, "w") as cache_file:
+            json.dump(cache, cache_file, indent=2, sort_keys=True)
+        os.replace(temporary, self.cache_path)
+        self.cache = cache
+
+    def definition(self, name):
+        if name not in self.definitions:
+            raise FieldMapError("No field mapping named {} in {}".format(name, self.definitions_path))
+        return self.definitions[name] or {}
+
+    def compiled(self, name, source, target):
+        """Compiled cache entry for a mapping, regenerated if either schema changed."""
+        definition = self.definition(name)
+        source_fields = self.describe(source)
+        target_fields = self.describe(target)
+        key = schema_hash(source_fields, target_fields, definition)
+        entry = self.cache.get(name)
+        previous = entry is not None
+        if entry and entry.get("schema_hash") == key:
+            self.hits += 1
+            return entry
+        field_map, warnings = compile_field_map(source_fields, target_fields, definition.get("renames"), definition.get("exclude"))
+        entry = {"schema_hash": key, "field_map": field_map, "warnings": warnings,
+                 "generated": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        self._save(name, entry)
+        self.regenerated += 1
+        if self.log:
+            self.log("Field map {} {} ({})".format(name, "regenerated - schema changed" if previous else "compiled",
+                                                   "{} fields".format(field_map.count(";") + 1) if field_map else "match by name"))
+            for warning in warnings:
+                self.log("   Field map {}: {}".format(name, warning))
+        return entry
+
+    def field_map(self, name, source, target):
+        """Field-map string for Append(source, target, "NO_TEST", <this>)."""
+        key = (name, source, target)
+        if key not in self.memo:
+            self.memo[key] = self.compiled(name, source, target)["field_map"].replace("{source}", source)
+        return self.memo[key]
+
+
+_registries = {}
+
+
+def registry(definitions_path, log=None):
+    """One registry per definitions file per process (Pipeline_Runner workers share it across stages)."""
+    if definitions_path not in _registries:
+        _registries[definitions_path] = FieldMapRegistry(definitions_path, log=log)
+    return _registries[definitions_path]
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Check named Append field mappings or convert old field-map strings")
+    parser.add_argument("definitions", nargs="?", help="field mapping definitions (JSON)")
+    parser.add_argument("--check", nargs=3, metavar=("NAME", "SOURCE", "TARGET"), help="compile one mapping against the live schemas")
+    parser.add_argument("--parse", metavar="FIELD_MAP", help="print the renames in an existing field-map string")
+    options = parser.parse_args(arguments)
+
+    if options.parse:
+        renames = dict((target, source) for target, source in parse_field_map(options.parse).items() if target != source)
+        print (json.dumps({"renames": renames}, indent=2))
+        return 0
+    if not (options.definitions and options.check):
+        parser.error("give a definitions file with --check, or --parse")
+    field_maps = FieldMapRegistry(options.definitions, log=print)
+    name, source, target = options.check
+    entry = field_maps.compiled(name, source, target)
+    print ("{}: {} (schema hash {}, compiled {})".format(name, "match by name" if not entry["field_map"] else
+                                                         "{} fields".format(entry["field_map"].count(";") + 1), entry["schema_hash"], entry["generated"]))
+    for warning in entry["warnings"]:
+        print ("   " + warning)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
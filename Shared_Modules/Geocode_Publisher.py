@@ -0,0 +1,240 @@
+# ---------------------------------------------------------------------------
+# Geocode_Publisher.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Conditional republish of the geocode services for Locator_Rebuilder.  Every service was
+#  put through CreateGeocodeSDDraft -> StageService -> UploadServiceDefinition every run, one
+#  after another - minutes per service and a service restart each time, even when the
+#  locator was the same as the one already published.
+#
+#   - a content hash of what goes into each service definition (the files of the locator and
+#     of every participant locator copied with it, plus the service settings) is compared with
+#     the hash recorded when the service was last published successfully - unchanged services
+#     are not staged or uploaded.  (The .sd archive itself carries staging timestamps, so its
+#     bytes differ every time it is staged.)
+#   - changed services are staged at the same time in a process pool (Pipeline_Runner)
+#   - uploads run one at a time, in service order, so the server only restarts one service at once
+#   - drafts, .sd files and the scratch workspace go to a managed cache folder (one subfolder
+#     per service, cleared before staging) instead of the user's AppData staging folder
+#
+#  A service whose staging or upload fails keeps its old hash, so it is retried next run.
+#
+#  Usage in a script (process pool - run it under  if __name__ == "__main__": ):
+#
+#   import Geocode_Publisher
+#   services = [Geocode_Publisher.GeocodeService("CC_Address_Search", CC_Address_Search, summary, tags, inputs=[...]), ...]
+#   publisher = Geocode_Publisher.GeocodePublisher(Publish_Cache, gis_server_connection_file, print_log)
+#   result = publisher.publish(services)
+#   for line in result.report_lines():
+#       print_log(line)
+# ---------------------------------------------------------------------------
+
+import glob,hashlib,json,os,shutil,sys,tempfile,time,traceback
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import Pipeline_Runner
+
+# Services staged at once (StageService packs the locator files - disk bound, keep this small)
+DEFAULT_WORKERS = 3
+
+# CreateGeocodeSDDraft settings the locator services were published with
+DEFAULT_SETTINGS = {"max_result_size": 20, "max_batch_size": 500, "suggested_batch_size": 150}
+
+# Published hashes, kept in the cache folder
+STATE_FILE = "Published_Services.json"
+
+READ_SIZE = 1024 * 1024
+
+
+class PublishError(Exception):
+    """Raised when a service definition draft has analyzer errors."""
+
+
+def locator_files(path):
+    """Files making up a locator (X.loc, X.loz, X.lox, X.loc.xml ...) - path given with or without .loc."""
+    base = path[:-4] if path.lower().endswith(".loc") else path
+    return sorted(name for name in glob.glob(glob.escape(base) + ".*") if os.path.isfile(name))
+
+
+class GeocodeService(object):
+    """One geocode service.
+
+    name     - service name (replaces the existing service of that name)
+    locator  - locator published
+    inputs   - locator paths whose files go into the service definition (default: the locator;
+               composites list their participants too - copy_data_to_server copies them)
+    settings - CreateGeocodeSDDraft keyword settings (DEFAULT_SETTINGS)
+    """
+
+    def __init__(self, name, locator, summary="", tags="", inputs=None, **settings):
+        self.name = name
+        self.locator = locator
+        self.summary = summary
+        self.tags = tags
+        self.inputs = list(inputs or [locator])
+        self.settings = dict(DEFAULT_SETTINGS, **settings)
+
+    def content_hash(self):
+        """Hash of the input locator files (names, sizes and bytes) and the service settings."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps([self.name, self.locator, self.summary, self.tags, self.settings], sort_keys=True).encode("utf-8"))
+        for path in self.inputs:
+            files = locator_files(path)
+            if not files:
+                raise IOError("No locator files found for {}".format(path))
+            for name in files:
+                digest.update(os.path.basename(name).lower().encode("utf-8"))
+                digest.update(str(os.path.getsize(name)).encode("utf-8"))
+                with open(name, "rb") as locator_file:
+                    for block in iter(lambda: locator_file.read(READ_SIZE), b""):
+                        digest.update(block)
+        return digest.hexdigest()
+
+
+def stage_service(name, locator, summary, tags, settings, connection, folder):
+    """Draft and stage one service into its cache folder - runs inside a worker process."""
+    # Keep this service's temporary staging files in its cache folder
+    scratch = os.path.join(folder, "scratch")
+    os.makedirs(scratch, exist_ok=True)
+    import arcpy
+    arcpy.SetLogHistory(False)
+    arcpy.env.overwriteOutput = True
+    arcpy.env.scratchWorkspace = scratch
+    sddraft = os.path.join(folder, name + ".sddraft")
+    sd = os.path.join(folder, name + ".sd")
+    analyze_messages = arcpy.CreateGeocodeSDDraft(locator, sddraft, name, connection_file_path=connection, copy_data_to_server=True,
+                                                  summary=summary, tags=tags, overwrite_existing_service=True, **settings)
+    if analyze_messages["errors"] != {}:
+        raise PublishError("Errors were returned when creating the {} service definition draft: {}".format(name, analyze_messages["errors"]))
+    arcpy.server.StageService(sddraft, sd)
+    return {"rows": None, "message": "Staged {} ({:.1f} MB)".format(sd, os.path.getsize(sd) / (1024.0 * 1024.0))}
+
+
+def upload_service(sd, connection):
+    import arcpy
+    arcpy.server.UploadServiceDefinition(sd, connection)
+
+
+class PublishResult(object):
+    """What happened to each service: published, unchanged or failed (with the step and error)."""
+
+    def __init__(self):
+        self.published = []
+        self.unchanged = []
+        self.failed = []               # (service name, step, error)
+        self.stage_seconds = 0.0
+        self.upload_seconds = {}       # service name -> seconds
+
+    @property
+    def succeeded(self):
+        return not self.failed
+
+    def report_lines(self):
+        clock = lambda value: time.strftime("%H:%M:%S", time.gmtime(value))
+        lines = ["Geocode services: {} published, {} unchanged (not staged or uploaded), {} failed".format(
+            len(self.published), len(self.unchanged), len(self.failed))]
+        if self.published or self.failed:
+            lines.append("  Staging (concurrent): {}".format(clock(self.stage_seconds)))
+        for name in self.published:
+            lines.append("  Published  {} (upload {})".format(name, clock(self.upload_seconds.get(name, 0.0))))
+        for name in self.unchanged:
+            lines.append("  Unchanged  {}".format(name))
+        for name, step, error in self.failed:
+            lines.append("  FAILED     {} ({}): {}".format(name, step, error))
+        return lines
+
+
+class GeocodePublisher(object):
+    """Stages changed services concurrently and uploads them one at a time.
+
+    cache_folder - managed staging folder (one subfolder per service + the published hash file)
+    connection   - ArcGIS Server publisher/admin connection file
+    """
+
+    def __init__(self, cache_folder, connection, log=print, workers=None, stage_function="Geocode_Publisher:stage_service", upload=None):
+        self.cache_folder = cache_folder
+        self.connection = connection
+        self.log = log
+        self.workers = workers or DEFAULT_WORKERS
+        self.stage_function = stage_function
+        self.upload = upload or upload_service
+        self.state_path = os.path.join(cache_folder, STATE_FILE)
+        os.makedirs(cache_folder, exist_ok=True)
+        self.state = self._read()
+
+    def _read(self):
+        if not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path) as state_file:
+                return json.load(state_file)
+        except ValueError:
+            self.log("   Published service hashes in {} are unreadable - republishing everything".format(self.state_path))
+            return {}
+
+    def _save(self):
+        handle, temporary = tempfile.mkstemp(dir=self.cache_folder, suffix=".tmp")
+        with os.fdopen(handle, "w") as state_file:
+            json.dump(self.state, state_file, indent=2, sort_keys=True)
+        os.replace(temporary, self.state_path)
+
+    def service_folder(self, service):
+        return os.path.join(self.cache_folder, service.name)
+
+    def publish(self, services, force=False):
+        """Stage and upload the services whose content changed (all of them with force); returns a PublishResult."""
+        result = PublishResult()
+        changed = []
+        hashes = {}
+        for service in services:
+            try:
+                hashes[service.name] = service.content_hash()
+            except Exception as error:
+                result.failed.append((service.name, "hash", str(error)))
+                self.log("\n Unable to read the {} locator files: {}".format(service.name, error))
+                continue
+            if not force and self.state.get(service.name, {}).get("hash") == hashes[service.name]:
+                result.unchanged.append(service.name)
+                self.log("\n {} is unchanged since it was last published - not republished".format(service.name))
+            else:
+                changed.append(service)
+        if not changed:
+            return result
+
+        # Stage every changed service at once (clean cache subfolder each)
+        stages = []
+        for service in changed:
+            folder = self.service_folder(service)
+            shutil.rmtree(folder, ignore_errors=True)
+            os.makedirs(folder)
+            stages.append({"name": service.name, "action": "call", "function": self.stage_function,
+                           "arguments": {"name": service.name, "locator": service.locator, "summary": service.summary, "tags": service.tags,
+                                         "settings": service.settings, "connection": self.connection, "folder": folder}})
+        staging = Pipeline_Runner.run_pipeline(Pipeline_Runner.prepare_manifest({"name": "Geocode service staging", "stages": stages}),
+                                               self.log, self.workers, "process")
+        result.stage_seconds = staging.seconds
+        staged = dict((stage.name, stage) for stage in staging.stages)
+
+        # Upload one at a time, in service order
+        for service in changed:
+            if staged[service.name].status != "completed":
+                result.failed.append((service.name, "stage", staged[service.name].error))
+                continue
+            self.log("\n Uploading {} - started at {}".format(service.name, time.strftime("%I:%M:%S %p", time.localtime())))
+            started = time.time()
+            try:
+                self.upload(os.path.join(self.service_folder(service), service.name + ".sd"), self.connection)
+            except Exception as error:
+                result.failed.append((service.name, "upload", "".join(traceback.format_exception_only(type(error), error)).strip()))
+                self.log("\n Unable to publish the {} geocode service: {}".format(service.name, error))
+                continue
+            result.upload_seconds[service.name] = time.time() - started
+            result.published.append(service.name)
+            self.log("     The {} geocode service was successfully published".format(service.name))
+            self.state[service.name] = {"hash": hashes[service.name], "published": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())}
+            self._save()
+        return result
@@ -0,0 +1,160 @@
+# ---------------------------------------------------------------------------
+# Hash_Join.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Attribute join used in place of arcpy JoinField for the VISION joins (Parcel_Builder,
+#  TaxClaim_Data_Spreader).  JoinField looks the join table up
+#  row by row and is slow against the 40k+ parcel VISION tables; this reads the join
+#  table once into a dict keyed on the join field, adds the output fields, and writes
+#  every joined row back in one UpdateCursor pass.
+#
+#  Same results as JoinField:
+#   - fields are added to the target with the join table's definitions, and a name
+#     already in the target gets _1 (_2, ...) on the end
+#   - target rows with no match keep nulls in the joined fields
+#   - a key repeated in the join table joins its first row (mode "first")
+#
+#  mode "one_to_one" stops with a JoinError instead when a key is repeated, and every
+#  join reports how many target rows found no match (and a sample of their keys) so a
+#  VISION export missing parcels shows in the log instead of as empty attributes.
+#
+#  Data is read/written through a Sync_Engine backend (ArcpyBackend in the scripts).
+#
+#  Usage in a script:
+#
+#   import Hash_Join,Sync_Engine
+#   result = Hash_Join.join_field(Sync_Engine.ArcpyBackend(), TAXPARCEL_JOINED_AUTOWKSP, "PID", VISIDATA_TEMP, "REM_PID")
+#   print (result.summary())
+# ---------------------------------------------------------------------------
+
+import os,sys,time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import Sync_Engine
+
+MODES = ("first", "one_to_one")
+
+# Unmatched keys kept on the result for the log (the count is always complete)
+UNMATCHED_SAMPLE = 25
+
+
+class JoinError(Exception):
+    """Raised when a join can't be made (missing field, repeated key in one_to_one mode, ...)."""
+
+
+class JoinResult(object):
+    """Counts and timing of one join."""
+
+    def __init__(self, target, join_table):
+        self.target = target
+        self.join_table = join_table
+        self.fields = {}               # join table field -> field added to the target
+        self.join_rows = 0
+        self.duplicate_keys = 0
+        self.target_rows = 0
+        self.matched = 0
+        self.unmatched = 0
+        self.unmatched_keys = []       # first UNMATCHED_SAMPLE keys with no match
+        self.seconds = 0.0
+
+    def summary(self):
+        text = "Joined {} fields from {} to {}: {} of {} rows matched, {} unmatched ({:.1f} seconds)".format(
+            len(self.fields), self.join_table, self.target, self.matched, self.target_rows, self.unmatched, self.seconds)
+        if self.unmatched_keys:
+            text += ", unmatched keys include {}".format(", ".join(str(key) for key in self.unmatched_keys[:5]))
+        if self.duplicate_keys:
+            text += ", {} repeated keys in the join table (first row used)".format(self.duplicate_keys)
+        return text
+
+
+def output_names(existing, fields):
+    """Names fields get when added to a dataset that has the existing fields (JoinField style _1, _2 suffixes)."""
+    taken = set(name.upper() for name in existing)
+    names = []
+    for field in fields:
+        name = field
+        number = 1
+        while name.upper() in taken:
+            name = "{}_{}".format(field, number)
+            number += 1
+        taken.add(name.upper())
+        names.append(name)
+    return names
+
+
+def _key(value):
+    # Keys compare like the geodatabase compares them: 1234.0 in a double PID field joins 1234 in a long REM_PID
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _split(fields):
+    if fields is None or isinstance(fields, (list, tuple)):
+        return fields
+    return [field for field in fields.split(";") if field]
+
+
+def join_field(backend, target, target_key, join_table, join_key, fields=None, mode="first", join_backend=None):
+    """Join fields from join_table onto target where target_key = join_key; returns a JoinResult.
+
+    fields      - list (or "A;B;C" string, as JoinField takes) of join table fields; None joins them all
+    mode        - "first" (first join row per key, like JoinField) or "one_to_one" (repeated key is an error)
+    join_backend - backend for the join table when it isn't in the target's backend
+    """
+    if mode not in MODES:
+        raise JoinError("Unknown join mode {} (use {})".format(mode, " or ".join(MODES)))
+    join_backend = join_backend or backend
+    started = time.time()
+    result = JoinResult(target, join_table)
+
+    available = dict((name.upper(), name) for name in join_backend.list_fields(join_table) if name != Sync_Engine.SHAPE_TOKEN)
+    target_fields = backend.list_fields(target)
+    fields = _split(fields)
+    if fields is None:
+        fields = list(available.values())
+    missing = [field for field in fields + [join_key] if field.upper() not in available]
+    if missing:
+        raise JoinError("{} has no field(s) {}".format(join_table, ", ".join(missing)))
+    if target_key.upper() not in set(name.upper() for name in target_fields):
+        raise JoinError("{} has no field {}".format(target, target_key))
+    fields = [available[field.upper()] for field in fields]
+    names = output_names(target_fields, fields)
+    result.fields = dict(zip(fields, names))
+
+    # One pass over the join table
+    lookup = {}
+    for row_id, values in join_backend.read_rows(join_table, [available[join_key.upper()]] + fields):
+        result.join_rows += 1
+        key = _key(values[0])
+        if key is None:
+            continue
+        if key in lookup:
+            result.duplicate_keys += 1
+            if mode == "one_to_one":
+                raise JoinError("Join key {} repeats in {} ({} = {})".format(join_key, join_table, join_key, values[0]))
+            continue
+        lookup[key] = list(values[1:])
+
+    # One pass over the target to match keys, then one bulk write
+    updates = {}
+    for row_id, values in backend.read_rows(target, [target_key]):
+        result.target_rows += 1
+        joined = lookup.get(_key(values[0]))
+        if joined is None:
+            result.unmatched += 1
+            if len(result.unmatched_keys) < UNMATCHED_SAMPLE:
+                result.unmatched_keys.append(_key(values[0]))
+            continue
+        updates[row_id] = joined
+    result.matched = len(updates)
+
+    backend.add_fields(target, join_table, fields, names)
+    if updates:
+        backend.apply_changes(target, names, [], updates, set())
+    result.seconds = time.time() - started
+    return result
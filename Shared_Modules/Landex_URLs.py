@@ -0,0 +1,108 @@
+# ---------------------------------------------------------------------------
+# Landex_URLs.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Builds the LANDEX_URL column for Tax_Parcels_Joined and TaxParcel_Air_Joined as one
+#  column transform instead of an UpdateCursor that checks the URL type twice and calls
+#  updateRow on every parcel.  The needed columns are read once into a pandas DataFrame,
+#  the Book_Page and UPI links are built with vectorized string operations, and only rows
+#  whose URL actually changed are written back (by OBJECTID, in batches).
+#
+#  Same rules as the old cursor loop:
+#   - rows with no PID (or PID <= 0) keep whatever is in LANDEX_URL
+#   - URL type "Book_Page" -> Landex search by deed book/page (SLH_BOOK, SLH_PAGE)
+#   - URL type "UPI"       -> Landex search by map/block/lot/PID
+#   - any other URL type keeps whatever is in LANDEX_URL
+#
+#  Usage in Parcel_Builder:
+#
+#   import Landex_URLs
+#   changed = Landex_URLs.update_landex_urls(TAXPARCEL_JOINED_AUTOWKSP, "LANDEX_URL_TYPE")
+# ---------------------------------------------------------------------------
+
+import pandas as pd
+
+BOOK_PAGE_URL = ("http://172.16.154.36/SearchResultsList.asp?bookNumber={}&pageNumber={}&submit=SEARCH&forwardRequest=SearchResultsList.asp"
+                 "&displayPage=1&displayItemsPerPage=50&maximumMatches=1000&getCustomerData=TRUE")
+UPI_URL = ("http://172.16.154.36/SearchResultsList.asp?parcelNumber1=20&parcelNumber2={}&parcelNumber3={}&parcelNumber4={}&parcelNumber5={}"
+           "&submit=SEARCH&parcelNumberFieldCount=5&parcelNumberFormat=2+4+3+17+6+&forwardRequest=SearchResultsList.asp&displayPage=1"
+           "&displayItemsPerPage=50&maximumMatches=1000&getCustomerData=TRUE")
+
+URL_FIELD = "LANDEX_URL"
+VALUE_FIELDS = ["SLH_BOOK", "SLH_PAGE", "REM_MBLU_MAP", "REM_MBLU_BLOCK", "REM_MBLU_LOT", "PID"]
+
+# OBJECTIDs per UpdateCursor where clause when writing changed rows back
+WRITE_BATCH = 1000
+
+
+def _vectorized(template, columns):
+    # "a{}b{}c" with columns [x, y] -> "a" + str(x) + "b" + str(y) + "c", one string operation per piece
+    pieces = template.split("{}")
+    result = pd.Series(pieces[0], index=columns[0].index, dtype=object)
+    for column, piece in zip(columns, pieces[1:]):
+        result = result + column.astype(str) + piece
+    return result
+
+
+def landex_urls(frame, choice_field):
+    """LANDEX_URL each row should have (a Series aligned with frame - the current value where no rule applies).
+
+    frame needs LANDEX_URL, SLH_BOOK, SLH_PAGE, REM_MBLU_MAP, REM_MBLU_BLOCK, REM_MBLU_LOT, PID and choice_field
+    as object columns (None for nulls, as read from a cursor) so values format the same way the old loop did.
+    """
+    pid = pd.to_numeric(frame["PID"], errors="coerce")
+    has_pid = pid.notna() & (pid > 0)
+    choice = frame[choice_field]
+    urls = frame[URL_FIELD].copy()
+
+    book_page = has_pid & (choice == "Book_Page")
+    if book_page.any():
+        rows = frame[book_page]
+        urls[book_page] = _vectorized(BOOK_PAGE_URL, [rows["SLH_BOOK"], rows["SLH_PAGE"]])
+    upi = has_pid & (choice == "UPI")
+    if upi.any():
+        rows = frame[upi]
+        urls[upi] = _vectorized(UPI_URL, [rows["REM_MBLU_MAP"], rows["REM_MBLU_BLOCK"], rows["REM_MBLU_LOT"], rows["PID"]])
+    return urls
+
+
+def changed_urls(frame, choice_field):
+    """{OBJECTID: new URL} for rows whose LANDEX_URL differs from what landex_urls builds (frame indexed by OBJECTID)."""
+    urls = landex_urls(frame, choice_field)
+    changed = urls.ne(frame[URL_FIELD]) & urls.notna()
+    return urls[changed].to_dict()
+
+
+def read_frame(dataset, choice_field):
+    """OBJECTID-indexed DataFrame of the URL columns, read with one SearchCursor pass."""
+    import arcpy
+    fields = ["OID@", URL_FIELD] + VALUE_FIELDS + [choice_field]
+    with arcpy.da.SearchCursor(dataset, fields) as cursor:
+        # object dtype keeps PID an int with nulls as None (a float column would build "...=1234.0" links)
+        frame = pd.DataFrame(list(cursor), columns=["OID"] + fields[1:], dtype=object)
+    return frame.set_index("OID")
+
+
+def write_urls(dataset, urls):
+    """Write {OBJECTID: URL} back, touching only those rows."""
+    import arcpy
+    oid_field = arcpy.Describe(dataset).OIDFieldName
+    oids = sorted(urls)
+    for start in range(0, len(oids), WRITE_BATCH):
+        batch = oids[start:start + WRITE_BATCH]
+        where = "{} IN ({})".format(arcpy.AddFieldDelimiters(dataset, oid_field), ",".join(str(oid) for oid in batch))
+        with arcpy.da.UpdateCursor(dataset, ["OID@", URL_FIELD], where) as cursor:
+            for row in cursor:
+                cursor.updateRow([row[0], urls[row[0]]])
+
+
+def update_landex_urls(dataset, choice_field):
+    """Recalculate LANDEX_URL for a parcel feature class; returns the number of rows written."""
+    urls = changed_urls(read_frame(dataset, choice_field), choice_field)
+    if urls:
+        write_urls(dataset, urls)
+    return len(urls)
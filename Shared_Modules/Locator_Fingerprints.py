@@ -0,0 +1,189 @@
+# ---------------------------------------------------------------------------
+# Locator_Fingerprints.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Skip-if-unchanged for Locator_Rebuilder.  Every locator was rebuilt every night even
+#  when its reference data hadn't changed (Cemeteries, Landmarks and the legislative route
+#  numbers hardly ever do).  A fingerprint of each locator's reference feature classes is
+#  kept in a JSON store between runs:
+#
+#   - "hash"      : row count + hash of every row's attributes and geometry (Sync_Engine
+#                   fingerprints, in any row order - OBJECTIDs and editor tracking fields are
+#                   left out, so a delete/append reload of the same data is still "unchanged")
+#   - "edit_date" : row count + latest editor tracking edit date (quicker, but a reload
+#                   counts as a change)
+#
+#  A single-role locator is rebuilt when a reference fingerprint differs from the one stored
+#  for it (or there is none yet); a composite is rebuilt - and re-staged/republished - only
+#  when one of its participants is rebuilt.  The store also keeps how long each locator took
+#  to rebuild last time, which gives the time saved by skipping it.
+#
+#  Usage in Locator_Rebuilder:
+#
+#   store = Locator_Fingerprints.FingerprintStore(Locator_State)
+#   changes = store.changes(REFERENCE_DATA, Sync_Engine.ArcpyBackend(), composites=PUBLIC_COMPOSITES + INTRANET_COMPOSITES)
+#   ... rebuild changes.rebuild ...
+#   store.record(changes, result.stages)           (locators that completed)
+# ---------------------------------------------------------------------------
+
+import datetime,json,os,sys,tempfile,time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import Sync_Engine
+
+METHODS = ("hash", "edit_date")
+
+# Editor tracking last edit date field (the SDE default)
+EDIT_DATE_FIELD = "last_edited_date"
+
+
+def dataset_fingerprint(backend, dataset, method="hash", edit_date_field=EDIT_DATE_FIELD):
+    """Fingerprint of a feature class/table's contents read through a Sync_Engine backend."""
+    if method not in METHODS:
+        raise ValueError("Unknown fingerprint method {} (use {})".format(method, " or ".join(METHODS)))
+    if method == "edit_date":
+        count = 0
+        latest = None
+        for row_id, values in backend.read_rows(dataset, [edit_date_field]):
+            count += 1
+            if values[0] is not None and (latest is None or values[0] > latest):
+                latest = values[0]
+        return "{}|{}".format(count, latest.isoformat() if isinstance(latest, (datetime.datetime, datetime.date)) else latest)
+    fields = backend.list_fields(dataset)
+    rows = sorted(Sync_Engine.row_fingerprint(values) for row_id, values in backend.read_rows(dataset, fields))
+    return "{}|{}".format(len(rows), Sync_Engine.row_fingerprint(fields + rows))
+
+
+class LocatorChanges(object):
+    """Which locators to rebuild this run and why."""
+
+    def __init__(self):
+        self.rebuild = []              # locator names, in the order given
+        self.skipped = []
+        self.reasons = {}              # locator name -> why it is rebuilt
+        self.fingerprints = {}         # locator name -> {dataset: fingerprint} read this run
+        self.saved_seconds = 0.0       # last rebuild time of the skipped locators
+
+    def summary(self):
+        return "{} locators to rebuild, {} unchanged and skipped (~{} of rebuilding saved)".format(
+            len(self.rebuild), len(self.skipped), time.strftime("%H:%M:%S", time.gmtime(self.saved_seconds)))
+
+
+class FingerprintStore(object):
+    """Reference data fingerprints and last rebuild times per locator (JSON, safe to delete - everything is rebuilt)."""
+
+    def __init__(self, path, method="hash", log=None):
+        self.path = path
+        self.method = method
+        self.log = log or (lambda text: None)
+        self.state = self._read()
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as state_file:
+                return json.load(state_file)
+        except ValueError:
+            self.log("   Locator fingerprint store {} is unreadable - rebuilding everything".format(self.path))
+            return {}
+
+    def save(self):
+        folder = os.path.dirname(os.path.abspath(self.path))
+        handle, temporary = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        with os.fdopen(handle, "w") as state_file:
+            json.dump(self.state, state_file, indent=2, sort_keys=True)
+        os.replace(temporary, self.path)
+
+    def changes(self, references, backend, composites=(), force=False):
+        """Decide what to rebuild.
+
+        references - [(locator name, [reference datasets])] single-role locators, in rebuild order
+        backend    - Sync_Engine backend the datasets are read through
+        composites - [(name, path, [participant names])] (the Locator_Scheduler lists)
+        force      - rebuild everything (fingerprints are still read and recorded)
+        A dataset shared by several locators is read once; one that can't be read counts as changed.
+        """
+        changes = LocatorChanges()
+        read = {}
+        for locator, datasets in references:
+            stored = self.state.get(locator, {})
+            current = {}
+            for dataset in datasets:
+                if dataset not in read:
+                    try:
+                        read[dataset] = dataset_fingerprint(backend, dataset, self.method)
+                    except Exception as error:
+                        self.log("   Unable to fingerprint {} ({}) - treating it as changed".format(dataset, error))
+                        read[dataset] = None
+                current[dataset] = read[dataset]
+            changes.fingerprints[locator] = current
+            if force:
+                reason = "full rebuild requested"
+            elif stored.get("method") != self.method or not stored.get("inputs"):
+                reason = "no fingerprint from a previous rebuild"
+            elif None in current.values():
+                reason = "reference data could not be read"
+            elif current != stored["inputs"]:
+                reason = "reference data changed: " + ", ".join(os.path.basename(dataset) for dataset in datasets
+                                                               if current[dataset] != stored["inputs"].get(dataset))
+            else:
+                reason = None
+            self._decide(changes, locator, reason)
+
+        # Composites follow their participants (in list order, so a composite of composites works too)
+        for composite, path, participants in composites:
+            stored = self.state.get(composite, {})
+            rebuilt = [participant for participant in participants if participant in changes.reasons]
+            # A participant rebuilt on a run where the composite then failed or was skipped
+            newer = [participant for participant in participants
+                     if self.state.get(participant, {}).get("rebuilt", "") > stored.get("rebuilt", "")]
+            if force:
+                reason = "full rebuild requested"
+            elif "rebuilt" not in stored:
+                reason = "no record of a previous rebuild"
+            elif rebuilt:
+                reason = "participants rebuilt: " + ", ".join(rebuilt)
+            elif newer:
+                reason = "participants rebuilt since its last rebuild: " + ", ".join(newer)
+            else:
+                reason = None
+            self._decide(changes, composite, reason)
+        return changes
+
+    def _decide(self, changes, name, reason):
+        if reason:
+            changes.rebuild.append(name)
+            changes.reasons[name] = reason
+        else:
+            changes.skipped.append(name)
+            changes.saved_seconds += self.state.get(name, {}).get("seconds", 0.0)
+
+    def record(self, changes, stages):
+        """Store fingerprints and rebuild times for the locators that completed (Pipeline_Runner StageResults), then save."""
+        rebuilt = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+        for stage in stages:
+            if stage.status != "completed":
+                continue
+            entry = {"method": self.method, "seconds": round(stage.seconds, 1), "rebuilt": rebuilt}
+            if stage.name in changes.fingerprints:
+                entry["inputs"] = changes.fingerprints[stage.name]
+            self.state[stage.name] = entry
+        self.save()
+
+    def report_lines(self, changes, result=None):
+        """Rebuilt versus skipped locators and the time saved."""
+        clock = lambda value: time.strftime("%H:%M:%S", time.gmtime(value))
+        lines = ["Locators rebuilt ({}):".format(len(changes.rebuild))]
+        statuses = dict((stage.name, stage.status) for stage in (result.stages if result else []))
+        for name in changes.rebuild:
+            lines.append("  {:<40} {:<10} {}".format(name, statuses.get(name, "-"), changes.reasons[name]))
+        lines.append("Locators skipped - reference data unchanged ({}):".format(len(changes.skipped)))
+        for name in changes.skipped:
+            lines.append("  {:<40} last rebuild {}".format(name, clock(self.state.get(name, {}).get("seconds", 0.0))))
+        lines.append("Time saved by skipping: ~{} (last rebuild times of the skipped locators)".format(clock(changes.saved_seconds)))
+        return lines
@@ -0,0 +1,116 @@
+# ---------------------------------------------------------------------------
+# Locator_Scheduler.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Dependency-aware locator rebuilds for Locator_Rebuilder.  The script rebuilt about 60
+#  locators one after another, every composite waiting on every single-role locator.
+#  Here the composite -> participant relationships are a graph run by Pipeline_Runner:
+#
+#   - single-role locators (no participants) rebuild at the same time in a process pool
+#   - each composite starts as soon as its own participants have rebuilt
+#   - a failed rebuild skips only the composites that use it
+#
+#  Every rebuild is timed, and report_lines() lists the durations and the critical path
+#  (the chain of rebuilds that decided how long the whole rebuild took).
+#
+#  Usage in a script (process pool - run it under  if __name__ == "__main__": ):
+#
+#   import Locator_Scheduler
+#   plan = Locator_Scheduler.build_plan("Locator_Rebuilder",
+#                                       [("Roads_Name_PubLocator", Roads_Name_PubLocator), ...],
+#                                       [("Crawford_Roads_Locator", Crawford_Roads_Locator, ["Roads_Name_PubLocator", ...]), ...])
+#   result = Locator_Scheduler.run_plan(plan, print_log)
+#   for line in Locator_Scheduler.report_lines(plan, result):
+#       print_log(line)
+# ---------------------------------------------------------------------------
+
+import os,sys,time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import Batch_Orchestrator,Pipeline_Runner
+
+# Rebuilds running at once (each worker is its own python process with arcpy loaded)
+DEFAULT_WORKERS = 4
+
+
+def rebuild_locator(path):
+    """Rebuild one locator - runs inside a worker process (module level so the pool can import it)."""
+    import arcpy
+    arcpy.SetLogHistory(False)
+    arcpy.geocoding.RebuildAddressLocator(path)
+    return {"rows": None, "message": ""}
+
+
+def build_plan(name, locators, composites, workers=None, function="Locator_Scheduler:rebuild_locator", only=None):
+    """Pipeline_Runner manifest rebuilding the locators and composites.
+
+    locators   - [(name, path)] single-role locators, in rebuild order
+    composites - [(name, path, [participant names])]; participants may be locators or other composites
+    function   - "module:function" called with path= for each rebuild (swapped out by the benchmark)
+    only       - names to rebuild (Locator_Fingerprints changes.rebuild); the rest are left as they are
+                 and a composite only waits for the participants being rebuilt
+    Raises Pipeline_Runner.ManifestError for duplicate names, unknown participants or cycles.
+    """
+    known = set(locator for locator, path in locators) | set(composite for composite, path, participants in composites)
+    for composite, path, participants in composites:
+        for participant in participants:
+            if participant not in known:
+                raise Pipeline_Runner.ManifestError("Composite {} has unknown participant {}".format(composite, participant))
+    selected = known if only is None else set(only)
+    stages = [{"name": locator, "action": "call", "function": function, "arguments": {"path": path}}
+              for locator, path in locators if locator in selected]
+    for composite, path, participants in composites:
+        if composite in selected:
+            stages.append({"name": composite, "action": "call", "function": function, "arguments": {"path": path},
+                           "depends_on": [participant for participant in participants if participant in selected]})
+    return Pipeline_Runner.prepare_manifest({"name": name, "workers": workers or DEFAULT_WORKERS, "pool": "process", "stages": stages})
+
+
+def locator_inputs(name, locators, composites):
+    """Paths of a locator and, for a composite, of every participant under it (what a published service copies)."""
+    paths = dict(locators)
+    participants = {}
+    for composite, path, members in composites:
+        paths[composite] = path
+        participants[composite] = members
+    inputs = []
+    pending = [name]
+    while pending:
+        current = pending.pop(0)
+        if paths[current] not in inputs:
+            inputs.append(paths[current])
+            pending.extend(participants.get(current, []))
+    return inputs
+
+
+def run_plan(plan, log=print, workers=None):
+    """Rebuild everything in the plan; returns the Pipeline_Runner.PipelineResult (check .succeeded)."""
+    return Pipeline_Runner.run_pipeline(plan, log, workers, "process")
+
+
+def critical_path(plan, result):
+    """Rebuilds on the critical path, first to last (StageResults)."""
+    graph = {"dependencies": Pipeline_Runner.build_graph(plan["stages"])}
+    return Batch_Orchestrator.critical_path(graph, result.stages)
+
+
+def report_lines(plan, result):
+    clock = lambda value: "-" if value is None else time.strftime("%H:%M:%S", time.gmtime(value))
+    graph = Pipeline_Runner.build_graph(plan["stages"])
+    serial = sum(stage.seconds for stage in result.stages)
+    lines = ["==============================================================",
+             "Locator rebuild timings: {} locators, wall clock {}, one-after-another ~{}".format(len(result.stages), clock(result.seconds), clock(serial)),
+             "  {:<40} {:<10} {:>9} {:>9} {:>9} {:>12}".format("Locator", "Status", "Start", "Finish", "Duration", "Participants")]
+    for stage in sorted(result.stages, key=lambda stage: (stage.started is None, stage.started)):
+        lines.append("  {:<40} {:<10} {:>9} {:>9} {:>9} {:>12}".format(stage.name, stage.status, clock(stage.started), clock(stage.finished),
+                                                                      clock(stage.seconds), len(graph[stage.name]) or "-"))
+    path = critical_path(plan, result)
+    lines.append("Critical path ({}):".format(clock(path[-1].finished) if path else "-"))
+    for stage in path:
+        lines.append("  {} ({})".format(stage.name, clock(stage.seconds)))
+    lines.append("==============================================================")
+    return lines
@@ -0,0 +1,211 @@
+# ---------------------------------------------------------------------------
+# Multi_Dissolve.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Several dissolves of one source from a single read.  PublicSafety_Data_Spreader dissolved
+#  ESZ_ALL five times (fire, BLS/EMS, QRS, police and rescue coverage) - five full reads of
+#  ESZ_ALL, five in_memory feature classes, a feature layer filtering COUNTY_FIPS = 42039 on
+#  four of them, an Append and a Delete of in_memory each.  Here:
+#
+#   - the source is read once (every output's dissolve fields + the geometry)
+#   - one grouping index per output (dissolve field values -> source rows) is built in the same
+#     pass, rows failing an output's filter (COUNTY_FIPS = 42039) are left out before grouping -
+#     values are compared as numbers when both sides are numeric ("42039" = 42039, like the SQL
+#     filter it replaces), and a filter that matches none of the source rows stops the dissolve
+#     before anything is written (the target would otherwise be emptied)
+#   - the outputs are dissolved at the same time in worker processes (geometries of each group
+#     unioned pairwise), and returned as rows ready for an InsertCursor
+#
+#  Dissolves are MULTI_PART (one row per combination of the dissolve fields, whether or not the
+#  polygons touch), like the Dissolve_management calls it replaces.  Data is read and written
+#  through a Sync_Engine backend; with ArcpyBackend geometries go to the workers as WKB.  The
+#  stand-in backends store WKT and have no geometry engine, so their groups are collected into
+#  one MULTIPOLYGON without removing shared edges (row counts and timings only).
+#
+#  Usage in a script (worker processes re-import the script - keep its work under __main__):
+#
+#   import Multi_Dissolve,Sync_Engine
+#   outputs = [Multi_Dissolve.Output("Fire Department Coverage", FIRE_DEPT_COVERAGE_INTERNAL, FIRE_FIELDS),
+#              Multi_Dissolve.Output("BLS Coverage", BLS_COVERAGE_INTERNAL, BLS_FIELDS, only={"COUNTY_FIPS": 42039}), ...]
+#   backend = Sync_Engine.ArcpyBackend()
+#   result = Multi_Dissolve.dissolve(backend, ESZ_ALL_PS, outputs)
+#   Multi_Dissolve.write_output(backend, outputs[0], result.rows[outputs[0].name])
+# ---------------------------------------------------------------------------
+
+import concurrent.futures,os,sys,time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import Sync_Engine
+
+
+class Output(object):
+    """One dissolved layer.
+
+    name           - label of the output (result.rows key, log lines)
+    target         - dataset the dissolved rows are written to
+    fields         - dissolve fields
+    target_fields  - fields written to the target (default: fields) - a subset of fields
+    only           - {field: value} a source row must match to be dissolved ({"COUNTY_FIPS": 42039}),
+                     or None for every row
+    """
+
+    def __init__(self, name, target, fields, target_fields=None, only=None):
+        self.name = name
+        self.target = target
+        self.fields = list(fields)
+        self.target_fields = list(target_fields or fields)
+        self.only = dict(only or {})
+        missing = [field for field in self.target_fields if field not in self.fields]
+        if missing:
+            raise ValueError("{}: target fields {} are not dissolve fields".format(name, ", ".join(missing)))
+
+
+class DissolveResult(object):
+    """Dissolved rows of every output ({name: [target field values + geometry]}) and counts."""
+
+    def __init__(self):
+        self.rows = {}
+        self.source_rows = 0
+        self.grouped = {}              # {name: source rows that passed the output's filter}
+        self.read_seconds = 0.0
+        self.seconds = 0.0
+
+    def summary(self):
+        return "{} source rows read once, {} in {}".format(
+            self.source_rows, ", ".join("{} {} from {} rows".format(name, len(rows), self.grouped[name]) for name, rows in self.rows.items()),
+            time.strftime("%H:%M:%S", time.gmtime(self.seconds)))
+
+
+def matches(value, expected):
+    """Filter test of one value - numerically when both sides are numbers (text "42039" = 42039), null only matches None."""
+    if value is None or expected is None:
+        return value is None and expected is None
+    try:
+        return float(value) == float(expected)
+    except (TypeError, ValueError):
+        return str(value).strip() == str(expected).strip()
+
+
+def group_rows(rows, fields, outputs):
+    """One grouping index per output from a single pass over rows (value lists ordered like fields) -
+    {output name: {dissolve values: [row positions]}}, rows failing an output's filter left out."""
+    position = dict((field, number) for number, field in enumerate(fields))
+    plans = []
+    for output in outputs:
+        keys = [position[field] for field in output.fields]
+        tests = [(position[field], value) for field, value in output.only.items()]
+        plans.append((output.name, keys, tests, {}))
+    for number, values in enumerate(rows):
+        for name, keys, tests, index in plans:
+            if all(matches(values[column], value) for column, value in tests):
+                index.setdefault(tuple(values[column] for column in keys), []).append(number)
+    return dict((name, index) for name, keys, tests, index in plans)
+
+
+def _union_all(geometries):
+    # Pairwise rounds (a balanced tree of unions) - each union works on geometries of similar size
+    while len(geometries) > 1:
+        geometries = [geometries[number].union(geometries[number + 1]) if number + 1 < len(geometries) else geometries[number]
+                      for number in range(0, len(geometries), 2)]
+    return geometries[0]
+
+
+def _collect_wkt(parts):
+    # Stand-in backends: POLYGON/MULTIPOLYGON WKT parts collected into one MULTIPOLYGON
+    polygons = []
+    for part in parts:
+        text = part.strip()
+        if text.upper().startswith("MULTIPOLYGON"):
+            polygons.append(text[text.index("(") + 1:text.rindex(")")].strip())
+        else:
+            polygons.append(text[text.index("("):].strip())
+    return "MULTIPOLYGON ({})".format(", ".join(polygons))
+
+
+def dissolve_groups(groups, spatial_reference=None):
+    """Dissolve [(values, [geometries])] - WKB geometries are unioned with arcpy (spatial_reference is
+    its exportToString), WKT ones collected.  Returns [(values, geometry)] with geometry as given."""
+    arcpy = None
+    if spatial_reference is not None:
+        import arcpy
+        reference = arcpy.SpatialReference()
+        reference.loadFromString(spatial_reference)
+    dissolved = []
+    for values, geometries in groups:
+        geometries = [geometry for geometry in geometries if geometry]
+        if not geometries:
+            dissolved.append((values, None))
+        elif arcpy is not None:
+            union = _union_all([arcpy.FromWKB(bytearray(geometry), reference) for geometry in geometries])
+            dissolved.append((values, bytes(union.WKB)))
+        else:
+            dissolved.append((values, _collect_wkt(geometries)))
+    return dissolved
+
+
+def dissolve(backend, source, outputs, workers=None, where_clause=None):
+    """Dissolve source once for every output - a DissolveResult (rows not written yet, see write_output).
+
+    workers - worker processes (default one per output; 1 dissolves in this process)
+    """
+    result = DissolveResult()
+    started = time.time()
+    fields = []
+    for output in outputs:
+        for field in output.fields + list(output.only):
+            if field not in fields:
+                fields.append(field)
+
+    spatial_reference = None
+    arcpy_backend = isinstance(backend, Sync_Engine.ArcpyBackend)
+    if arcpy_backend:
+        spatial_reference = backend.spatial_reference(source).exportToString()
+    values = []
+    geometries = []
+    for row_id, row in backend.read_rows(source, fields + [Sync_Engine.SHAPE_TOKEN], where_clause):
+        values.append(row[:-1])
+        geometry = row[-1]
+        geometries.append(bytes(geometry.WKB) if arcpy_backend and geometry is not None else geometry)
+    result.source_rows = len(values)
+    result.read_seconds = time.time() - started
+
+    indexes = group_rows(values, fields, outputs)
+    jobs = []
+    for output in outputs:
+        index = indexes[output.name]
+        result.grouped[output.name] = sum(len(positions) for positions in index.values())
+        if output.only and result.source_rows and not result.grouped[output.name]:
+            raise ValueError("{}: filter {} matched none of the {} rows of {} - nothing written".format(
+                output.name, ", ".join("{} = {}".format(field, value) for field, value in output.only.items()), result.source_rows, source))
+        jobs.append([(key, [geometries[number] for number in positions]) for key, positions in index.items()])
+
+    workers = min(workers or len(outputs), len(outputs)) or 1
+    if workers == 1:
+        dissolved = [dissolve_groups(groups, spatial_reference) for groups in jobs]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            dissolved = list(executor.map(dissolve_groups, jobs, [spatial_reference] * len(jobs)))
+
+    if arcpy_backend:
+        reference = backend.arcpy.SpatialReference()
+        reference.loadFromString(spatial_reference)
+    for output, groups in zip(outputs, dissolved):
+        columns = [output.fields.index(field) for field in output.target_fields]
+        rows = []
+        for key, geometry in groups:
+            if arcpy_backend and geometry is not None:
+                geometry = backend.arcpy.FromWKB(bytearray(geometry), reference)
+            rows.append([key[column] for column in columns] + [geometry])
+        result.rows[output.name] = rows
+    result.seconds = time.time() - started
+    return result
+
+
+def write_output(backend, output, rows):
+    """Insert an output's dissolved rows into its target (empty it first - DeleteRows in the script)."""
+    backend.apply_changes(output.target, output.target_fields + [Sync_Engine.SHAPE_TOKEN], rows, {}, set())
+    return len(rows)
@@ -0,0 +1,218 @@
+# ---------------------------------------------------------------------------
+# PID_Match.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  PID matching for the "missing from GIS" reports (Active_VISION_Missing_GIS,
+#  Active_TaxClaim_Missing_GIS).  Both reports geocoded the whole active table against
+#  CAMA_PID_Locator every run just to find the handful of PIDs with no parcel - the Single
+#  Line Input is only a PID, so almost every match is an exact PID lookup.
+#
+#   - the PIDs of the parcel layers (tax parcels + air parcels) are read once into a set and
+#     every record PID found there is matched with no geocoder call at all
+#   - only the PIDs left over (not in any parcel layer) go to the geocoder, which may still
+#     match some of them (the CAMA_PIN participant, spelling tolerance)
+#   - geocoder results are cached per PID with the parcel-layer version (row count + hash of
+#     the parcel PID values) they were matched against: a left-over PID is only geocoded again
+#     when it wasn't geocoded last time or when the parcel layers changed since
+#
+#  Records with no usable PID (null - e.g. a blank or non-numeric Tax Claim Control that would not
+#  calculate into a LONG) can't be matched to anything: they are counted in the match summary and
+#  where_clause(..., include_null=True) keeps them in the report, like the geocoder's Status 'U' did.
+#
+#  The cache is a JSON file next to the report workspace - safe to delete (left-over PIDs are
+#  geocoded again).
+#
+#  Usage in a report:
+#
+#   import PID_Match
+#   parcels = PID_Match.ParcelPIDs.read(Sync_Engine.ArcpyBackend(), [TAX_PARCELS_INTERNAL, TAX_PARCELS_AIR_INTERNAL])
+#   cache = PID_Match.MatchCache(PID_MATCH_CACHE, write_log_function)
+#   result = cache.match(PID_Match.record_pids(Sync_Engine.ArcpyBackend(), VISIDATA_TEMP, "REM_PID"), parcels,
+#                        geocode=lambda pids: PID_Match.geocode_pids(pids, CC_PARCEL_LOC))
+#   where = PID_Match.where_clause("REM_PID", result.unmatched, include_null=True)
+# ---------------------------------------------------------------------------
+
+import json,os,sys,tempfile,time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import Sync_Engine
+
+# Parcel layer field holding the PID
+PID_FIELD = "PID"
+
+# PIDs per IN (...) list in a where clause (keeps each clause well under the database limits)
+WHERE_CHUNK = 900
+
+
+def normalize_pid(value):
+    """PID as text with no leading zeros ("000123", 123, 123.0 -> "123"); None for blanks."""
+    if value is None:
+        return None
+    if isinstance(value, float):
+        if value != value:
+            return None
+        value = int(value) if value.is_integer() else value
+    text = str(value).strip().lstrip("0")
+    if not text:
+        return "0" if str(value).strip() else None
+    return text
+
+
+class RecordPIDs(set):
+    """Set of record PIDs - blank is the number of records with no usable PID (not in the set)."""
+
+    blank = 0
+
+
+def record_pids(backend, dataset, field, where_clause=None):
+    """RecordPIDs of the (normalized) PIDs in a table read through a Sync_Engine backend."""
+    pids = RecordPIDs()
+    for row_id, values in backend.read_rows(dataset, [field], where_clause):
+        pid = normalize_pid(values[0])
+        if pid is not None:
+            pids.add(pid)
+        else:
+            pids.blank += 1
+    return pids
+
+
+class ParcelPIDs(object):
+    """The PIDs of the parcel layers and their version (changes whenever a parcel PID is added, removed or changed)."""
+
+    def __init__(self, pids, version):
+        self.pids = pids
+        self.version = version
+
+    @classmethod
+    def read(cls, backend, datasets, field=PID_FIELD):
+        pids = set()
+        versions = []
+        for dataset in datasets:
+            current = record_pids(backend, dataset, field)
+            pids |= current
+            versions.append("{}|{}".format(len(current), Sync_Engine.row_fingerprint(sorted(current))))
+        return cls(pids, Sync_Engine.row_fingerprint(versions))
+
+
+class MatchResult(object):
+    """Outcome of MatchCache.match - which record PIDs have no parcel and how each was decided."""
+
+    def __init__(self):
+        self.records = 0
+        self.matched_by_set = 0        # PID found in the parcel layers (no geocoding)
+        self.matched_by_geocoder = 0
+        self.geocoded = 0              # left-over PIDs sent to the geocoder this run
+        self.cached = 0                # left-over PIDs decided from the cache
+        self.unmatched = set()
+        self.blank_records = 0         # records with no usable PID (reported as unmatched with include_null)
+        self.seconds = 0.0
+
+    def summary(self):
+        return ("{} record PIDs: {} matched to parcel PIDs, {} matched by the geocoder, {} unmatched "
+                "({} geocoded this run, {} from the match cache), {} records with no usable PID in {}").format(
+                    self.records, self.matched_by_set, self.matched_by_geocoder, len(self.unmatched), self.geocoded, self.cached,
+                    self.blank_records, time.strftime("%H:%M:%S", time.gmtime(self.seconds)))
+
+
+class MatchCache(object):
+    """Geocoder results for left-over PIDs, keyed on PID + parcel-layer version (JSON)."""
+
+    def __init__(self, path, log=None):
+        self.path = path
+        self.log = log or (lambda text: None)
+        self.state = self._read()
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as cache_file:
+                return json.load(cache_file)
+        except ValueError:
+            self.log("   PID match cache {} is unreadable - geocoding every left-over PID".format(self.path))
+            return {}
+
+    def save(self):
+        folder = os.path.dirname(os.path.abspath(self.path))
+        handle, temporary = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        with os.fdopen(handle, "w") as cache_file:
+            json.dump(self.state, cache_file, indent=2, sort_keys=True)
+        os.replace(temporary, self.path)
+
+    def match(self, pids, parcels, geocode=None):
+        """Find the record PIDs with no parcel.
+
+        pids    - record PIDs (record_pids)
+        parcels - ParcelPIDs of the layers the locator is built on
+        geocode - callable(list of PIDs) -> {PID: matched True/False} for the left-over PIDs;
+                  None skips the geocoder (every PID not in the parcel layers is unmatched)
+        The cache only keeps the PIDs still in the table, then it is saved.
+        """
+        started = time.time()
+        result = MatchResult()
+        result.records = len(pids)
+        result.blank_records = getattr(pids, "blank", 0)
+        leftover = pids - parcels.pids
+        result.matched_by_set = len(pids) - len(leftover)
+        matched = {}
+        pending = []
+        for pid in sorted(leftover):
+            entry = self.state.get(pid)
+            if geocode is not None and entry is not None and entry.get("version") == parcels.version:
+                matched[pid] = entry["matched"]
+                result.cached += 1
+            else:
+                pending.append(pid)
+        if geocode is not None and pending:
+            self.log("   Geocoding {} PIDs not found in the parcel layers".format(len(pending)))
+            found = geocode(pending)
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+            for pid in pending:
+                matched[pid] = bool(found.get(pid))
+                self.state[pid] = {"matched": matched[pid], "version": parcels.version, "geocoded": stamp}
+            result.geocoded = len(pending)
+        elif pending:
+            matched.update((pid, False) for pid in pending)
+        result.unmatched = set(pid for pid in leftover if not matched[pid])
+        result.matched_by_geocoder = len(leftover) - len(result.unmatched)
+        if geocode is not None:
+            self.state = dict((pid, entry) for pid, entry in self.state.items() if pid in leftover)
+            self.save()
+        result.seconds = time.time() - started
+        return result
+
+
+def geocode_pids(pids, locator, field="PID"):
+    """Geocode PIDs (Single Line Input) against a locator; returns {PID: matched} (status M or T)."""
+    import arcpy
+    table = arcpy.management.CreateTable("memory", "PID_Match_Input")[0]
+    arcpy.management.AddField(table, field, "TEXT", field_length=50)
+    with arcpy.da.InsertCursor(table, [field]) as cursor:
+        for pid in pids:
+            cursor.insertRow([pid])
+    geocoded = "memory\\PID_Match_Geocode"
+    try:
+        arcpy.geocoding.GeocodeAddresses(table, locator, "'Single Line Input' {} VISIBLE NONE".format(field), geocoded, "STATIC", None, '', None, "MINIMAL")
+        with arcpy.da.SearchCursor(geocoded, ["USER_" + field, "Status"]) as cursor:
+            return dict((normalize_pid(pid), status in ("M", "T")) for pid, status in cursor)
+    finally:
+        for name in (geocoded, table):
+            if arcpy.Exists(name):
+                arcpy.management.Delete(name)
+
+
+def where_clause(field, pids, numeric=True, include_null=False):
+    """Where clause selecting the given PIDs ("1=0" when there are none) - for MakeTableView/MakeFeatureLayer.
+    include_null also selects the records with a null PID (RecordPIDs.blank)."""
+    values = sorted(pids, key=lambda pid: (len(pid), pid))
+    if not numeric:
+        values = ["'{}'".format(pid.replace("'", "''")) for pid in values]
+    chunks = [values[start:start + WHERE_CHUNK] for start in range(0, len(values), WHERE_CHUNK)]
+    clauses = ["{} IN ({})".format(field, ",".join(chunk)) for chunk in chunks]
+    if include_null:
+        clauses.append("{} IS NULL".format(field))
+    return " OR ".join(clauses) or "1=0"
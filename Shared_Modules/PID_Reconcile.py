@@ -0,0 +1,137 @@
+# ---------------------------------------------------------------------------
+# PID_Reconcile.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Set-based VISION <-> GIS reconciliation for the mismatch reports.  Active_GIS_Missing_VISION
+#  copied TAX_PARCELS_INTERNAL into a new temp FGDB, appended the air parcels, copied REALMAST,
+#  joined the two, ran a python CalculateField over every row and filtered a table view - all
+#  to find the PIDs on one side and not the other.  Here:
+#
+#   - the key column of each side (tax parcels + air parcels PID, active REALMAST REM_PID) is
+#     streamed once into a hash set
+#   - missing-in-VISION and missing-in-GIS are the two set differences
+#   - only the report rows of those keys are read back (a where clause of the keys), so the
+#     report fields of the matched rows are never read
+#
+#  Keys are compared as PID_Match.normalize_pid text ("000123" = 123), blank keys are left out.
+#  Nothing is written to a geodatabase - the rows go straight to the report.
+#
+#  Usage in a report:
+#
+#   import PID_Reconcile
+#   gis = [PID_Reconcile.Source(TAX_PARCELS_INTERNAL, "PID", GIS_FIELDS, "PID > 0", "Tax Parcels"), ...]
+#   vision = [PID_Reconcile.Source(REALMAST_VISION, "REM_PID", VISION_FIELDS, "REM_PARCEL_STATUS = 'A'", "REALMAST")]
+#   result = PID_Reconcile.reconcile(Sync_Engine.ArcpyBackend(), gis, vision)
+#   result.left_only   (GIS rows not in VISION)      result.right_only   (VISION rows not in GIS)
+# ---------------------------------------------------------------------------
+
+import os,sys,time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import PID_Match
+
+# Column added in front of the report rows naming the dataset each row came from
+SOURCE_COLUMN = "Source"
+
+
+class Source(object):
+    """One dataset on a side of the reconciliation.
+
+    key_field    - PID field compared with the other side
+    fields       - report fields returned for unmatched rows (the key field is always first)
+    where_clause - backend where clause limiting the rows (SQL for ArcpyBackend/SQLiteBackend)
+    label        - value of the Source column in the report rows (default: dataset name)
+    """
+
+    def __init__(self, dataset, key_field, fields=(), where_clause=None, label=None):
+        self.dataset = dataset
+        self.key_field = key_field
+        self.fields = [key_field] + [field for field in fields if field != key_field]
+        self.where_clause = where_clause
+        self.label = label or os.path.basename(str(dataset))
+
+
+class ReconcileResult(object):
+    """Rows and counts from reconcile() - rows are [source label] + the source's report field values."""
+
+    def __init__(self):
+        self.left_only = []
+        self.right_only = []
+        self.left_keys = 0
+        self.right_keys = 0
+        self.right_only_keys = 0
+        self.matched = 0
+        self.seconds = 0.0
+
+    def summary(self):
+        return "{} left keys, {} right keys: {} matched, {} left-only rows, {} right-only keys in {}".format(
+            self.left_keys, self.right_keys, self.matched, len(self.left_only), self.right_only_keys,
+            time.strftime("%H:%M:%S", time.gmtime(self.seconds)))
+
+
+def columns(sources):
+    """Report columns for the rows of a side: Source + the union of the sources' fields, in order."""
+    names = [SOURCE_COLUMN]
+    for source in sources:
+        names.extend(field for field in source.fields if field not in names)
+    return names
+
+
+def _keys(backend, sources):
+    keys = set()
+    for source in sources:
+        for row_id, values in backend.read_rows(source.dataset, [source.key_field], source.where_clause):
+            key = PID_Match.normalize_pid(values[0])
+            if key is not None:
+                keys.add(key)
+    return keys
+
+
+def _rows(backend, sources, report_columns, keys, key_clause):
+    # Report rows of the given keys; key_clause narrows the read to them in the database
+    rows = []
+    for source in sources:
+        where_clause = source.where_clause
+        if key_clause is not None:
+            where_clause = key_clause(source.key_field, keys) if not where_clause else "({}) AND ({})".format(where_clause, key_clause(source.key_field, keys))
+        positions = [report_columns.index(field) for field in source.fields]
+        for row_id, values in backend.read_rows(source.dataset, source.fields, where_clause):
+            if PID_Match.normalize_pid(values[0]) not in keys:
+                continue
+            row = [None] * len(report_columns)
+            row[0] = source.label
+            for position, value in zip(positions, values):
+                row[position] = value
+            rows.append(row)
+    return rows
+
+
+def reconcile(backend, left, right, right_rows=True, key_clause=PID_Match.where_clause):
+    """Compare the keys of two sides (lists of Sources) read through a Sync_Engine backend.
+
+    right_rows - also return the right-only rows; with False only the right-only keys are counted
+    key_clause - callable(key field, keys) -> where clause reading only those keys' report rows
+                 (default: numeric IN lists for ArcpyBackend/SQLiteBackend); None reads every row
+                 and picks them out in python (MemoryBackend, text keys stored with leading zeros)
+    Returns a ReconcileResult; the row columns are columns(left) / columns(right).
+    """
+    started = time.time()
+    result = ReconcileResult()
+    left_keys = _keys(backend, left)
+    right_keys = _keys(backend, right)
+    left_only = left_keys - right_keys
+    right_only = right_keys - left_keys
+    if left_only:
+        result.left_only = _rows(backend, left, columns(left), left_only, key_clause)
+    if right_rows and right_only:
+        result.right_only = _rows(backend, right, columns(right), right_only, key_clause)
+    result.left_keys = len(left_keys)
+    result.right_keys = len(right_keys)
+    result.right_only_keys = len(right_only)
+    result.matched = len(left_keys & right_keys)
+    result.seconds = time.time() - started
+    return result
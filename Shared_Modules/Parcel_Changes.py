@@ -0,0 +1,307 @@
+# ---------------------------------------------------------------------------
+# Parcel_Changes.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Change tracking for Parcel_Builder, so Tax_Parcels_Joined is patched for the parcels that
+#  changed instead of rebuilt from every hardline in the county each night.
+#
+#  A snapshot of the inputs is kept in a SQLite state file between runs:
+#
+#   - AST.Hardlines     : geometry of every hardline (by OBJECTID)
+#   - AST.PIN           : attributes, lat/long + location of every PIN point (by OBJECTID)
+#   - VISIDATA_Temp     : fingerprint of every VISION REALMAST row (by REM_PID)
+#
+#  Comparing the snapshot with the current data gives the changed hardlines (old and new
+#  shapes), moved/edited PINs and changed VISION rows.  The affected parcels are the joined
+#  parcels those touch, plus any parcel sharing CAMA_PIN/PID with a rebuilt one (the pieces a
+#  softline hooks together).  Only that area goes through FeatureToPolygon -> SpatialJoin ->
+#  Dissolve again; the old features are deleted and the rebuilt ones inserted with their
+#  VISION fields, lat/long and GIS_ACRES filled from lookups.
+#
+#  Parcel_Builder falls back to the full rebuild when there is no snapshot yet, when more
+#  than MAX_INCREMENTAL_PARCELS parcels are affected, when softline-hooked parcels are still
+#  turning up after MAX_NEIGHBOUR_PASSES (PatchError), or when asked to (--full / weekly).
+#  Polygons with no PIN are only rebuilt by the full rebuild (they are dissolved into one
+#  feature there).
+#
+#  Usage in Parcel_Builder:
+#
+#   tracker = Parcel_Changes.ParcelChangeTracker(Parcel_State, HARDLINES_AST, PIN_AST, VISIDATA_TEMP)
+#   changes = tracker.find_changes()               (None when there is no snapshot yet)
+#   affected = tracker.affected_parcels(TAXPARCEL_JOINED_AUTOWKSP, changes)
+#   patched = tracker.patch_parcels(TAXPARCEL_JOINED_AUTOWKSP, affected, changes)
+#   tracker.save()                                 (after a successful full or incremental build)
+# ---------------------------------------------------------------------------
+
+import os,sqlite3,sys,time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import Hash_Join,Sync_Engine
+
+# Fields the full build dissolves Tax_Parcels_Joined on (the PIN attributes)
+DISSOLVE_FIELDS = ["CAMA_PIN", "MAP", "PARCEL", "LOT", "ID_PIN", "MAPTYPE", "CITY", "MEADVILLE", "TITUSVILLE", "LANDEX_URL_TYPE",
+                   "PLANS_AVAILABLE", "BLK_MAP", "BLK_PARCEL", "BLK_MAPTYPE", "INS_MAP", "INS_DESCRIPTION", "INS_SECTION_MAP",
+                   "INS_SCALE", "INS_ROTATION", "SEC_MAP", "SEC_MUNI_NAME", "SEC_ANGLE", "SEC_SCALE", "SEC_ROTATION", "SEC_WARD",
+                   "MDVL_BLK_MAP", "MDVL_BLK_PARCEL", "MDVL_BLK_MAPTYPE", "TSVL_BLK_MAP", "TSVL_BLK_PARCEL", "TSVL_BLK_MAPTYPE",
+                   "TSVL_BLK_ID", "PID"]
+LATLONG_FIELDS = ["LONGITUDE_X", "LATITUDE_Y"]
+VISION_KEY = "REM_PID"
+
+# More affected parcels than this and the full rebuild is quicker (and re-merges everything)
+MAX_INCREMENTAL_PARCELS = 1500
+
+# Rounds of pulling in parcels that share CAMA_PIN/PID with rebuilt ones
+MAX_NEIGHBOUR_PASSES = 3
+
+# Changed hardlines are buffered by this (feet) to join the parcel polygons in the patch area
+LINE_BUFFER_FEET = 1.0
+
+# Values per IN (...) where clause
+IN_BATCH = 900
+
+
+class PatchError(Exception):
+    """The incremental patch can't be done safely - Parcel_Builder falls back to the full rebuild."""
+
+
+class ParcelChanges(object):
+    """What changed in the parcel inputs since the last snapshot."""
+
+    def __init__(self):
+        self.line_shapes = []          # old + new geometry of added/edited/deleted hardlines
+        self.point_shapes = []         # old + new location of added/edited/deleted PINs
+        self.vision_pids = set()       # REM_PID of added/edited/deleted VISION rows
+        self.hardlines = 0
+        self.pins = 0
+
+    @property
+    def empty(self):
+        return not (self.line_shapes or self.point_shapes or self.vision_pids)
+
+    def summary(self):
+        return "{} hardlines, {} PINs and {} VISION records changed since the last run".format(self.hardlines, self.pins, len(self.vision_pids))
+
+
+def _in_clauses(field, values):
+    # Chunked "FIELD IN (...)" where clauses (numbers as-is, text quoted)
+    values = sorted(set(value for value in values if value is not None), key=str)
+    for start in range(0, len(values), IN_BATCH):
+        batch = values[start:start + IN_BATCH]
+        yield "{} IN ({})".format(field, ",".join(str(value) if isinstance(value, (int, float)) else "'{}'".format(str(value).replace("'", "''"))
+                                               for value in batch))
+
+
+def _editable_fields(arcpy, dataset):
+    return [field.name for field in arcpy.ListFields(dataset)
+            if field.type not in Sync_Engine.SKIP_FIELD_TYPES and field.editable and field.name.upper() not in Sync_Engine.SKIP_FIELD_NAMES]
+
+
+class ParcelChangeTracker(object):
+    """Snapshots the parcel inputs and rebuilds only the parcels affected by changes."""
+
+    def __init__(self, state_path, hardlines, pins, visidata, log=None):
+        import arcpy
+        self.arcpy = arcpy
+        self.state_path = state_path
+        self.hardlines = hardlines
+        self.pins = pins
+        self.visidata = visidata
+        self.log = log or (lambda text: None)
+        self.current = None
+
+    # ------------------------------------------------------------------ snapshot
+    def snapshot(self):
+        """Current {OBJECTID: (fingerprint, WKB)} for hardlines and PINs, {REM_PID: fingerprint} for VISION."""
+        arcpy = self.arcpy
+        hardlines = {}
+        with arcpy.da.SearchCursor(self.hardlines, ["OID@", "SHAPE@WKB"]) as cursor:
+            for oid, wkb in cursor:
+                wkb = bytes(wkb) if wkb is not None else b""
+                hardlines[oid] = (Sync_Engine.row_fingerprint([wkb]), wkb)
+        pins = {}
+        # Lat/long is copied to the parcels too, so a PIN whose LONGITUDE_X/LATITUDE_Y alone changed is a change
+        with arcpy.da.SearchCursor(self.pins, ["OID@", "SHAPE@WKB"] + DISSOLVE_FIELDS + LATLONG_FIELDS) as cursor:
+            for row in cursor:
+                wkb = bytes(row[1]) if row[1] is not None else b""
+                pins[row[0]] = (Sync_Engine.row_fingerprint([wkb] + list(row[2:])), wkb)
+        vision = {}
+        fields = _editable_fields(arcpy, self.visidata)
+        key = fields.index(VISION_KEY)
+        with arcpy.da.SearchCursor(self.visidata, fields) as cursor:
+            for row in cursor:
+                vision.setdefault(row[key], []).append(Sync_Engine.row_fingerprint(row))
+        # Several VISION rows can share a PID (owner lines) - fingerprint them together, in any order
+        vision = dict((pid, Sync_Engine.row_fingerprint(sorted(fingerprints))) for pid, fingerprints in vision.items())
+        return {"hardlines": hardlines, "pins": pins, "vision": vision}
+
+    def _read_state(self):
+        if not os.path.exists(self.state_path):
+            return None
+        connection = sqlite3.connect(self.state_path)
+        try:
+            state = {"hardlines": dict((oid, (fingerprint, wkb)) for oid, fingerprint, wkb in connection.execute("SELECT oid, fingerprint, wkb FROM hardlines")),
+                     "pins": dict((oid, (fingerprint, wkb)) for oid, fingerprint, wkb in connection.execute("SELECT oid, fingerprint, wkb FROM pins")),
+                     "vision": dict(connection.execute("SELECT pid, fingerprint FROM vision"))}
+        except sqlite3.Error:
+            return None
+        finally:
+            connection.close()
+        return state
+
+    def save(self):
+        """Store the snapshot taken by find_changes (or a fresh one) for the next run."""
+        current = self.current or self.snapshot()
+        folder = os.path.dirname(self.state_path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder)
+        temporary = self.state_path + ".tmp"
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        connection = sqlite3.connect(temporary)
+        with connection:
+            connection.execute("CREATE TABLE hardlines (oid INTEGER PRIMARY KEY, fingerprint TEXT, wkb BLOB)")
+            connection.execute("CREATE TABLE pins (oid INTEGER PRIMARY KEY, fingerprint TEXT, wkb BLOB)")
+            connection.execute("CREATE TABLE vision (pid, fingerprint TEXT)")
+            connection.execute("CREATE TABLE run (saved TEXT)")
+            connection.executemany("INSERT INTO hardlines VALUES (?, ?, ?)", ((oid, value[0], value[1]) for oid, value in current["hardlines"].items()))
+            connection.executemany("INSERT INTO pins VALUES (?, ?, ?)", ((oid, value[0], value[1]) for oid, value in current["pins"].items()))
+            connection.executemany("INSERT INTO vision VALUES (?, ?)", current["vision"].items())
+            connection.execute("INSERT INTO run VALUES (?)", (time.strftime("%Y-%m-%d %H:%M:%S"),))
+        connection.close()
+        os.replace(temporary, self.state_path)
+
+    # ------------------------------------------------------------------ change detection
+    def find_changes(self):
+        """ParcelChanges since the saved snapshot, or None if there is no snapshot to compare with."""
+        previous = self._read_state()
+        self.current = self.snapshot()
+        if previous is None:
+            return None
+        changes = ParcelChanges()
+        for name, shapes in (("hardlines", changes.line_shapes), ("pins", changes.point_shapes)):
+            old, new = previous[name], self.current[name]
+            changed = 0
+            for oid in set(old) | set(new):
+                if oid in old and oid in new and old[oid][0] == new[oid][0]:
+                    continue
+                changed += 1
+                for side in (old, new):
+                    if oid in side and side[oid][1]:
+                        shapes.append(self.arcpy.FromWKB(bytearray(side[oid][1])))
+            setattr(changes, name, changed)
+        old, new = previous["vision"], self.current["vision"]
+        changes.vision_pids = set(pid for pid in set(old) | set(new) if old.get(pid) != new.get(pid))
+        return changes
+
+    def affected_parcels(self, joined, changes):
+        """OBJECTIDs of joined parcels touched by the changes (geometry intersects, or PID changed in VISION)."""
+        arcpy = self.arcpy
+        affected = set()
+        layer = arcpy.management.MakeFeatureLayer(joined, "Parcel_Changes_Joined")
+        try:
+            for number, shapes in enumerate((changes.line_shapes, changes.point_shapes)):
+                if not shapes:
+                    continue
+                selection = arcpy.management.CopyFeatures(shapes, "memory/Parcel_Changes_{}".format(number))
+                arcpy.management.SelectLayerByLocation(layer, "INTERSECT", selection, "", "NEW_SELECTION")
+                with arcpy.da.SearchCursor(layer, ["OID@", "PID"]) as cursor:
+                    affected.update(oid for oid, pid in cursor if pid is not None)
+                arcpy.management.Delete(selection)
+        finally:
+            arcpy.management.Delete(layer)
+        for where in _in_clauses("PID", changes.vision_pids):
+            with arcpy.da.SearchCursor(joined, ["OID@"], where) as cursor:
+                affected.update(row[0] for row in cursor)
+        return affected
+
+    # ------------------------------------------------------------------ rebuild
+    def _build_patch(self, joined, affected, changes):
+        # FeatureToPolygon -> SpatialJoin -> Dissolve, like the full build, over the affected area only
+        arcpy = self.arcpy
+        # Polygons only (CopyFeatures writes one geometry type) - the changed lines as thin buffers
+        shapes = [line.buffer(LINE_BUFFER_FEET) for line in changes.line_shapes if line is not None and line.length > 0]
+        for where in _in_clauses(arcpy.Describe(joined).OIDFieldName, affected):
+            with arcpy.da.SearchCursor(joined, ["SHAPE@"], where) as cursor:
+                shapes.extend(row[0] for row in cursor)
+        for name in ("memory/Parcel_Patch_Area", "memory/Parcel_Patch_Polygons", "memory/Parcel_Patch_Join", "memory/Parcel_Patch"):
+            if arcpy.Exists(name):
+                arcpy.management.Delete(name)
+        area = arcpy.management.CopyFeatures(shapes, "memory/Parcel_Patch_Area")
+        lines = arcpy.management.MakeFeatureLayer(self.hardlines, "Parcel_Patch_Hardlines")
+        arcpy.management.SelectLayerByLocation(lines, "INTERSECT", area, "", "NEW_SELECTION")
+        polygons = arcpy.management.FeatureToPolygon(lines, "memory/Parcel_Patch_Polygons", "", "NO_ATTRIBUTES", "")
+        polygon_layer = arcpy.management.MakeFeatureLayer(polygons, "Parcel_Patch_Polygons_View")
+        # Polygons along the edge of the selected hardlines are only partly closed - keep the ones inside the area
+        arcpy.management.SelectLayerByLocation(polygon_layer, "HAVE_THEIR_CENTER_IN", area, "", "NEW_SELECTION")
+        joined_polygons = arcpy.analysis.SpatialJoin(polygon_layer, self.pins, "memory/Parcel_Patch_Join", "JOIN_ONE_TO_ONE", "KEEP_ALL")
+        patch = arcpy.management.Dissolve(joined_polygons, "memory/Parcel_Patch", ";".join(DISSOLVE_FIELDS), "", "MULTI_PART", "DISSOLVE_LINES")
+        for name in (lines, polygon_layer, "memory/Parcel_Patch_Area", "memory/Parcel_Patch_Polygons", "memory/Parcel_Patch_Join"):
+            arcpy.management.Delete(name)
+        return patch
+
+    def patch_parcels(self, joined, affected, changes):
+        """Replace the affected parcels in joined with rebuilt ones; returns (deleted, inserted)."""
+        arcpy = self.arcpy
+        affected = set(affected)
+        # The patch is rebuilt every time parcels are added, so what is deleted below is always what the patch covers
+        for attempt in range(MAX_NEIGHBOUR_PASSES + 1):
+            patch = self._build_patch(joined, affected, changes)
+            patch_pids = set(row[0] for row in arcpy.da.SearchCursor(patch, ["PID"]) if row[0] is not None)
+            # Parcels elsewhere with the same PID are pieces hooked to a rebuilt parcel - rebuild them together
+            neighbours = set()
+            for where in _in_clauses("PID", patch_pids):
+                with arcpy.da.SearchCursor(joined, ["OID@"], where) as cursor:
+                    neighbours.update(row[0] for row in cursor if row[0] not in affected)
+            if not neighbours:
+                break
+            arcpy.management.Delete(patch)
+            if attempt == MAX_NEIGHBOUR_PASSES or len(affected) + len(neighbours) > MAX_INCREMENTAL_PARCELS:
+                raise PatchError("Softline-hooked parcels still being added after {} passes ({} parcels) - full rebuild needed".format(
+                    attempt + 1, len(affected) + len(neighbours)))
+            self.log("   {} softline-hooked parcels added to the rebuild".format(len(neighbours)))
+            affected |= neighbours
+
+        # VISION fields come through under the names Hash_Join gave them in the full build
+        joined_fields = _editable_fields(arcpy, joined)
+        vision_fields = _editable_fields(arcpy, self.visidata)
+        vision_names = dict(zip(vision_fields, Hash_Join.output_names(DISSOLVE_FIELDS, vision_fields)))
+        vision = {}
+        for where in _in_clauses(VISION_KEY, patch_pids):
+            with arcpy.da.SearchCursor(self.visidata, vision_fields, where) as cursor:
+                for row in cursor:
+                    vision.setdefault(row[vision_fields.index(VISION_KEY)], dict((vision_names[name], value) for name, value in zip(vision_fields, row)))
+        latlong = {}
+        for where in _in_clauses("PID", patch_pids):
+            with arcpy.da.SearchCursor(self.pins, ["PID"] + LATLONG_FIELDS, where) as cursor:
+                for row in cursor:
+                    latlong.setdefault(row[0], dict(zip(LATLONG_FIELDS, row[1:])))
+
+        rows = []
+        with arcpy.da.SearchCursor(patch, DISSOLVE_FIELDS + ["SHAPE@"]) as cursor:
+            for row in cursor:
+                values = dict(zip(DISSOLVE_FIELDS, row[:-1]))
+                if values["PID"] is None:
+                    continue
+                values.update(vision.get(values["PID"], {}))
+                values.update(latlong.get(values["PID"], {}))
+                values["GIS_ACRES"] = row[-1].getArea("PLANAR", "ACRES")
+                values["SHAPE@"] = row[-1]
+                rows.append(values)
+        arcpy.management.Delete(patch)
+
+        filled = set(DISSOLVE_FIELDS + LATLONG_FIELDS + ["GIS_ACRES"]) | set(vision_names.values())
+        fields = [name for name in joined_fields if name in filled] + ["SHAPE@"]
+        deleted = 0
+        for where in _in_clauses(arcpy.Describe(joined).OIDFieldName, affected):
+            with arcpy.da.UpdateCursor(joined, ["OID@"], where) as cursor:
+                for row in cursor:
+                    cursor.deleteRow()
+                    deleted += 1
+        with arcpy.da.InsertCursor(joined, fields) as cursor:
+            for values in rows:
+                cursor.insertRow([values.get(name) for name in fields])
+        return deleted, len(rows)
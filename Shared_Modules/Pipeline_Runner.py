@@ -0,0 +1,347 @@
+# ---------------------------------------------------------------------------
+# Pipeline_Runner.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Runs a spreader from a declarative manifest (JSON, or YAML when PyYAML is available)
+#  instead of the copy-pasted delete -> append -> GetCount -> print -> write_log blocks.
+#  Stages are built into a dependency graph and independent stages run concurrently
+#  in a worker pool, with per-stage timings recorded.
+#
+#  Manifest layout:
+#
+#   {
+#     "name": "LandRecords_Data_Spreader",
+#     "workers": 4,
+#     "pool": "process",                      (process or thread)
+#     "field_maps": "{Manifests}\\Field_Maps.json",  (optional - Field_Map_Registry definitions for field_map_name)
+#     "variables": {"CRAW_INTERNAL": "{Database_Connections}\\craw_internal@ccsde.sde", ...},
+#     "stages": [
+#       {"name": "Street Centerline - CRAW_INTERNAL from PUBLIC_SAFETY",
+#        "action": "append",                  (append, sync, delete or call)
+#        "source": "{PUBLIC_SAFETY}\\...", "target": "{CRAW_INTERNAL}\\...",
+#        "where": "ConstructionStatus <> 1",  (optional - filters the source)
+#        "field_map": "...",                  (optional - {source} is replaced with the source path)
+#        "field_map_name": "...",             (optional - named mapping from the field_maps registry instead)
+#        "key_field": "Site_NGUID",           (sync only)
+#        "depends_on": ["..."]}               (optional - stage names)
+#     ]
+#   }
+#
+#  Dependencies are also inferred from manifest order: a stage waits for any earlier stage
+#  that reads or writes a dataset it writes, or writes a dataset it reads - so a manifest
+#  behaves exactly like the old top-to-bottom script, just with the independent stages overlapped.
+#
+#  Scripts using the process pool must run the pipeline under  if __name__ == "__main__":
+#  (Windows starts worker processes by re-importing the script).
+# ---------------------------------------------------------------------------
+
+import concurrent.futures,importlib,json,logging,os,sys,time,traceback
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+try:
+    import Run_Metrics                 # optional - only for the worker's peak memory
+except ImportError:
+    Run_Metrics = None
+
+ACTIONS = ("append", "sync", "delete", "call")
+
+
+class ManifestError(Exception):
+    """Raised when a manifest is malformed (unknown action, missing dependency, cycle, ...)."""
+
+
+class StageResult(object):
+    """Outcome and timing of one stage."""
+
+    def __init__(self, name):
+        self.name = name
+        self.status = "pending"        # pending, completed, failed, skipped
+        self.rows = None
+        self.message = ""
+        self.error = None
+        self.started = None             # seconds after the pipeline started
+        self.finished = None
+        self.cpu_seconds = None         # CPU time of the stage's worker thread
+        self.worker_peak_mb = None      # peak working set of the worker process so far when the stage finished - in a
+                                        # reused pool worker that can be an earlier stage's peak, not this stage's own use
+
+    @property
+    def seconds(self):
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    def as_dict(self):
+        return {"name": self.name, "status": self.status, "rows": self.rows, "message": self.message,
+                "error": self.error, "started": self.started, "finished": self.finished, "seconds": round(self.seconds, 3),
+                "cpu_seconds": self.cpu_seconds, "worker_peak_mb": self.worker_peak_mb}
+
+
+class PipelineResult(object):
+    """All stage results for one run, in manifest order."""
+
+    def __init__(self, name, stages):
+        self.name = name
+        self.stages = stages
+        self.seconds = 0.0
+
+    @property
+    def failed(self):
+        return [stage for stage in self.stages if stage.status == "failed"]
+
+    @property
+    def skipped(self):
+        return [stage for stage in self.stages if stage.status == "skipped"]
+
+    @property
+    def succeeded(self):
+        return not self.failed and not self.skipped
+
+    def report_lines(self):
+        lines = ["Stage timings for {} ({:.1f} seconds wall clock, {:.1f} seconds of stage work):".format(
+            self.name, self.seconds, sum(stage.seconds for stage in self.stages))]
+        for stage in sorted(self.stages, key=lambda stage: (stage.started is None, stage.started)):
+            start = "{:8.1f}".format(stage.started) if stage.started is not None else "       -"
+            rows = "" if stage.rows is None else " ({} records)".format(stage.rows)
+            lines.append("  {} +{:7.1f}s  {:<9} {}{}".format(start, stage.seconds, stage.status, stage.name, rows))
+        return lines
+
+    def write_report(self, path):
+        with open(path, "w") as report:
+            json.dump({"name": self.name, "seconds": round(self.seconds, 3), "stages": [stage.as_dict() for stage in self.stages]}, report, indent=2)
+
+
+def substitute_variables(value, variables):
+    """Substitute {VARIABLE} references in a string/list/dict, leaving anything that isn't a known variable alone."""
+    if isinstance(value, str):
+        for name, replacement in variables.items():
+            value = value.replace("{" + name + "}", replacement)
+        return value
+    if isinstance(value, list):
+        return [substitute_variables(item, variables) for item in value]
+    if isinstance(value, dict):
+        return dict((key, substitute_variables(item, variables)) for key, item in value.items())
+    return value
+
+
+def resolve_variables(variables, overrides=None):
+    """Resolve variables in order, so later variables can use earlier ones ({Database_Connections}\\...)."""
+    resolved = {}
+    for name, value in list(variables.items()) + list((overrides or {}).items()):
+        resolved[name] = substitute_variables(value, resolved)
+    return resolved
+
+
+def load_manifest(path, overrides=None):
+    """Read a manifest file, substitute variables and validate the stages."""
+    with open(path) as manifest_file:
+        if path.lower().endswith((".yml", ".yaml")):
+            import yaml
+            manifest = yaml.safe_load(manifest_file)
+        else:
+            manifest = json.load(manifest_file)
+    return prepare_manifest(manifest, overrides)
+
+
+def prepare_manifest(manifest, overrides=None):
+    """Substitute variables and validate the stages of an already-parsed manifest."""
+    variables = resolve_variables(manifest.get("variables", {}), overrides)
+    stages = []
+    names = set()
+    for number, stage in enumerate(manifest.get("stages", [])):
+        stage = substitute_variables(dict(stage), variables)
+        stage.setdefault("name", "stage {}".format(number + 1))
+        stage.setdefault("action", "append")
+        stage.setdefault("depends_on", [])
+        if stage["name"] in names:
+            raise ManifestError("Duplicate stage name: {}".format(stage["name"]))
+        if stage["action"] not in ACTIONS:
+            raise ManifestError("Stage {} has unknown action {}".format(stage["name"], stage["action"]))
+        if stage["action"] in ("append", "sync") and not (stage.get("source") and stage.get("target")):
+            raise ManifestError("Stage {} needs a source and a target".format(stage["name"]))
+        if stage["action"] == "sync" and not stage.get("key_field"):
+            raise ManifestError("Sync stage {} needs a key_field".format(stage["name"]))
+        if stage["action"] == "delete" and not stage.get("target"):
+            raise ManifestError("Delete stage {} needs a target".format(stage["name"]))
+        if stage["action"] == "call" and not stage.get("function"):
+            raise ManifestError("Call stage {} needs a function (module:function)".format(stage["name"]))
+        if stage.get("field_map_name"):
+            if not manifest.get("field_maps"):
+                raise ManifestError("Stage {} uses field_map_name but the manifest has no field_maps".format(stage["name"]))
+            stage.setdefault("field_maps", substitute_variables(manifest["field_maps"], variables))
+        names.add(stage["name"])
+        stages.append(stage)
+    manifest = dict(manifest)
+    manifest["variables"] = variables
+    manifest["stages"] = stages
+    build_graph(stages)
+    return manifest
+
+
+def _datasets(stage):
+    # (read, written) dataset paths of a stage, compared case-insensitively
+    reads = set(path.lower() for path in [stage.get("source")] + list(stage.get("reads", [])) if path)
+    writes = set(path.lower() for path in [stage.get("target")] + list(stage.get("writes", [])) if path)
+    return reads, writes
+
+
+def build_graph(stages):
+    """Return {stage name: set of stage names it waits for}; raises ManifestError on unknown names or cycles."""
+    names = [stage["name"] for stage in stages]
+    graph = dict((name, set()) for name in names)
+    touched = [_datasets(stage) for stage in stages]
+    for position, stage in enumerate(stages):
+        for dependency in stage.get("depends_on", []):
+            if dependency not in graph:
+                raise ManifestError("Stage {} depends on unknown stage {}".format(stage["name"], dependency))
+            graph[stage["name"]].add(dependency)
+        reads, writes = touched[position]
+        for earlier in range(position):
+            earlier_reads, earlier_writes = touched[earlier]
+            if writes & (earlier_reads | earlier_writes) or reads & earlier_writes:
+                graph[stage["name"]].add(names[earlier])
+
+    # Kahn's algorithm - anything left over is on a cycle
+    waiting = dict((name, set(dependencies)) for name, dependencies in graph.items())
+    ready = [name for name in names if not waiting[name]]
+    ordered = []
+    while ready:
+        name = ready.pop(0)
+        ordered.append(name)
+        for other in names:
+            if name in waiting[other]:
+                waiting[other].discard(name)
+                if not waiting[other] and other not in ordered and other not in ready:
+                    ready.append(other)
+    if len(ordered) != len(names):
+        raise ManifestError("Dependency cycle between stages: {}".format(", ".join(name for name in names if name not in ordered)))
+    return graph
+
+
+def run_stage(stage):
+    """Execute one stage - runs inside the worker (module level so the process pool can pickle it)."""
+    action = stage["action"]
+    if action == "call":
+        module_name, function_name = stage["function"].split(":")
+        function = getattr(importlib.import_module(module_name), function_name)
+        value = function(**stage.get("arguments", {}))
+        if isinstance(value, dict):
+            return value
+        return {"rows": value if isinstance(value, int) else None, "message": ""}
+
+    import arcpy
+    arcpy.SetLogHistory(False)
+    if action == "delete":
+        if arcpy.Exists(stage["target"]):
+            arcpy.Delete_management(stage["target"])
+        return {"rows": None, "message": "deleted"}
+    if action == "sync":
+        import Sync_Engine
+        result = Sync_Engine.sync_dataset(Sync_Engine.ArcpyBackend(stage.get("edit_workspace")), stage["source"], stage["target"],
+                                          stage["key_field"], stage.get("fields"), stage.get("source_fields"), stage.get("where"))
+        return {"rows": int(arcpy.GetCount_management(stage["target"])[0]), "message": result.summary()}
+
+    # append - empty the target (unless told not to), then append the (optionally filtered) source
+    if stage.get("delete_rows", True):
+        arcpy.DeleteRows_management(stage["target"])
+    if stage.get("field_map_name"):
+        import Field_Map_Registry
+        field_map = Field_Map_Registry.registry(stage["field_maps"], logging.info).field_map(stage["field_map_name"], stage["source"], stage["target"])
+    else:
+        field_map = (stage.get("field_map") or "").replace("{source}", stage["source"])
+    arcpy.management.Append(stage["source"], stage["target"], stage.get("schema_type", "NO_TEST"), field_map, "", stage.get("where") or "")
+    return {"rows": int(arcpy.GetCount_management(stage["target"])[0]), "message": ""}
+
+
+def run_measured_stage(stage):
+    """run_stage plus the stage's CPU seconds and the worker's peak memory so far (None without Run_Metrics)."""
+    cpu_started = time.thread_time()
+    outcome = dict(run_stage(stage))
+    outcome["cpu_seconds"] = round(time.thread_time() - cpu_started, 3)
+    outcome["worker_peak_mb"] = Run_Metrics.peak_memory_mb() if Run_Metrics else None
+    return outcome
+
+
+def run_pipeline(manifest, log=print, workers=None, pool=None):
+    """Run every stage of a prepared manifest, overlapping independent stages.
+
+    log      - callable taking one line of text (print, or a lambda writing to the script log)
+    workers  - pool size (default manifest "workers", else 4)
+    pool     - "process" or "thread" (default manifest "pool", else "process")
+
+    A failed stage does not stop unrelated stages; anything that depends on it is skipped.
+    Returns a PipelineResult - check .succeeded.
+    """
+    stages = manifest["stages"]
+    by_name = dict((stage["name"], stage) for stage in stages)
+    graph = build_graph(stages)
+    results = dict((stage["name"], StageResult(stage["name"])) for stage in stages)
+    workers = workers or manifest.get("workers", 4)
+    pool = pool or manifest.get("pool", "process")
+    executor_class = concurrent.futures.ProcessPoolExecutor if pool == "process" else concurrent.futures.ThreadPoolExecutor
+
+    started = time.time()
+    running = {}
+    remaining = [stage["name"] for stage in stages]
+
+    def finished(name):
+        return results[name].status in ("completed", "failed", "skipped")
+
+    with executor_class(max_workers=workers) as executor:
+        while remaining or running:
+            # Skip stages whose dependencies failed, submit stages whose dependencies completed
+            # (only as many as there are free workers, so a stage's start time is when it really started)
+            for name in list(remaining):
+                dependencies = graph[name]
+                if any(results[dependency].status in ("failed", "skipped") for dependency in dependencies):
+                    results[name].status = "skipped"
+                    results[name].message = "skipped - depends on a failed stage"
+                    log("\n Skipping {} (a stage it depends on failed)".format(name))
+                    remaining.remove(name)
+                elif len(running) < workers and all(finished(dependency) for dependency in dependencies):
+                    log("\n Updating {} - started at {}".format(name, time.strftime("%I:%M:%S %p", time.localtime())))
+                    results[name].started = time.time() - started
+                    running[executor.submit(run_measured_stage, by_name[name])] = name
+                    remaining.remove(name)
+            if not running:
+                continue
+            done, pending = concurrent.futures.wait(list(running), return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                result = results[name]
+                result.finished = time.time() - started
+                try:
+                    outcome = future.result()
+                    result.status = "completed"
+                    result.rows = outcome.get("rows")
+                    result.message = outcome.get("message", "")
+                    result.cpu_seconds = outcome.get("cpu_seconds")
+                    result.worker_peak_mb = outcome.get("worker_peak_mb")
+                    if result.message:
+                        log("   " + result.message)
+                    if result.rows is not None:
+                        log("{} has {} records".format(by_name[name].get("target", name), result.rows))
+                    log("       Updating {} completed at {} ({:.1f} seconds)".format(name, time.strftime("%I:%M:%S %p", time.localtime()), result.seconds))
+                except Exception as error:
+                    result.status = "failed"
+                    result.error = "".join(traceback.format_exception_only(type(error), error)).strip()
+                    log("\n Unable to update {}: {}".format(name, result.error))
+                    logging.error("Got exception on {} logged at: {}\n{}".format(name, time.strftime("%I:%M:%S %p", time.localtime()),
+                                                                                "".join(traceback.format_exception(type(error), error, error.__traceback__))))
+
+    pipeline = PipelineResult(manifest.get("name", "pipeline"), [results[stage["name"]] for stage in stages])
+    pipeline.seconds = time.time() - started
+    return pipeline
+
+
+def manifest_path(folder, name):
+    """Manifest file for a script name, preferring .json then .yml/.yaml."""
+    for extension in (".json", ".yml", ".yaml"):
+        path = os.path.join(folder, name + extension)
+        if os.path.exists(path):
+            return path
+    raise ManifestError("No manifest named {} in {}".format(name, folder))
@@ -0,0 +1,186 @@
+# ---------------------------------------------------------------------------
+# Portal_Dependency_Index.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Reverse index of service URLs for the PortalItem_Dependencies tools.  gather_info used to
+#  search every Web Map and call get_data() on every map and every app once per layer item;
+#  this fetches each map/app JSON once, pulls out every service URL and item ID it references,
+#  and builds
+#
+#   service URL -> web maps that reference it
+#   service URL -> apps that reference it directly
+#   item ID     -> apps that reference it (web maps inside dashboards, experiences, ...)
+#
+#  so finding what depends on a layer is a few dict lookups.  The extracted references are
+#  saved (one JSON file per portal) with each item's modified timestamp - the next run only
+#  calls get_data() for maps/apps that are new or were modified since.
+#
+#  URLs are compared without scheme, query string or trailing slash and case-insensitively,
+#  and every leading part of a referenced URL is indexed, so a FeatureServer item URL finds
+#  maps that reference one of its layers (.../FeatureServer/3) - the same matches the old
+#  str(get_data()).find(url) check made.
+#
+#  Usage in a dependency tool:
+#
+#   import Portal_Dependency_Index
+#   index = Portal_Dependency_Index.DependencyIndex(ReportDirectory + "\\PORTALNAME_Dependency_Index.json")
+#   index.crawl(webmaps, apps)
+#   index.save()
+#   for app in index.apps_for(item.url): ...
+# ---------------------------------------------------------------------------
+
+import json,os,re,tempfile,time
+
+INDEX_VERSION = 1
+
+URL_PATTERN = re.compile(r"https?://[^\s\"'<>\\]+", re.IGNORECASE)
+ITEM_ID_PATTERN = re.compile(r"(?<![0-9a-fA-F])[0-9a-fA-F]{32}(?![0-9a-fA-F])")
+
+
+def url_key(url):
+    """Comparable form of a URL: no scheme, query, fragment or trailing slash, lower case."""
+    url = url.strip().split("?", 1)[0].split("#", 1)[0]
+    url = re.sub(r"^[a-z]+://", "", url, flags=re.IGNORECASE)
+    return url.rstrip("/").lower()
+
+
+def url_keys(url):
+    """url_key of a URL and of each leading part of its path (host/a, host/a/b, ...)."""
+    parts = url_key(url).split("/")
+    return ["/".join(parts[:count]) for count in range(2, len(parts) + 1)]
+
+
+def references(data):
+    """(set of url_keys, set of item ids) referenced anywhere in an item's JSON (keys, values, embedded HTML)."""
+    urls = set()
+    item_ids = set()
+    pending = [data]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, dict):
+            pending.extend(value.keys())
+            pending.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            pending.extend(value)
+        elif isinstance(value, str):
+            for url in URL_PATTERN.findall(value):
+                urls.update(url_keys(url))
+            item_ids.update(item_id.lower() for item_id in ITEM_ID_PATTERN.findall(value))
+    return urls, item_ids
+
+
+class DependencyIndex(object):
+    """Service URL / item ID -> web maps and apps, built from one get_data() per map/app.
+
+    path  - JSON file the extracted references are saved to and reloaded from (None keeps it in memory)
+    fetch - callable returning an item's data JSON (default item.get_data(), Portal_Item_Cache in the tools)
+    """
+
+    def __init__(self, path=None, fetch=None):
+        self.path = path
+        self.fetch = fetch or (lambda item: item.get_data())
+        self.entries = self._read()       # item id -> {"modified": ..., "urls": [...], "ids": [...]}
+        self.items = {}                   # item id -> portal item, for this run
+        self.maps = []                    # web map ids, in search order
+        self.apps = []                    # app ids, in search order
+        self.fetched = 0
+        self.reused = 0
+        self.seconds = 0.0
+        self.by_url = {}                  # url key -> (web map ids, app ids)
+        self.apps_by_id = {}              # item id -> app ids referencing it
+        self.positions = {}               # map/app id -> search order
+
+    def _read(self):
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as index_file:
+                saved = json.load(index_file)
+        except (IOError, OSError, ValueError):
+            return {}
+        if saved.get("version") != INDEX_VERSION:
+            return {}
+        return saved.get("items", {})
+
+    def save(self):
+        """Write the extracted references (temp file swapped in, so an interrupted run leaves the old index)."""
+        if not self.path:
+            return
+        folder = os.path.dirname(os.path.abspath(self.path))
+        handle, temporary = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        with os.fdopen(handle, "w") as index_file:
+            json.dump({"version": INDEX_VERSION, "saved": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+                       "items": self.entries}, index_file)
+        os.replace(temporary, self.path)
+
+    def crawl(self, webmaps, apps, log=None):
+        """Index the web maps and apps (portal items from content.search); returns the number of get_data() calls made."""
+        started = time.time()
+        self.maps = [item.id for item in webmaps]
+        self.apps = [item.id for item in apps]
+        self.items = dict((item.id, item) for item in list(webmaps) + list(apps))
+        entries = {}
+        self.fetched = 0
+        self.reused = 0
+        for item_id, item in self.items.items():
+            entry = self.entries.get(item_id)
+            modified = getattr(item, "modified", None)
+            if entry is not None and modified is not None and entry.get("modified") == modified:
+                self.reused += 1
+            else:
+                try:
+                    data = self.fetch(item)
+                except Exception:
+                    # Some apps have no data (or the request fails) - indexed as referencing nothing
+                    data = None
+                urls, item_ids = references(data)
+                entry = {"modified": modified, "urls": sorted(urls), "ids": sorted(item_ids)}
+                self.fetched += 1
+            entries[item_id] = entry
+        # Maps/apps deleted from the portal drop out of the saved index here
+        self.entries = entries
+        self._build()
+        self.seconds = time.time() - started
+        if log:
+            log("Dependency index: {} maps, {} apps - {} fetched, {} unchanged since the last run ({:.1f} seconds)".format(
+                len(self.maps), len(self.apps), self.fetched, self.reused, self.seconds))
+        return self.fetched
+
+    def _build(self):
+        self.by_url = {}
+        self.apps_by_id = {}
+        self.positions = dict((item_id, position) for position, item_id in enumerate(self.maps))
+        self.positions.update((item_id, position) for position, item_id in enumerate(self.apps))
+        map_ids = set(self.maps)
+        app_ids = set(self.apps)
+        for item_id, entry in self.entries.items():
+            is_map = item_id in map_ids
+            is_app = item_id in app_ids
+            for key in entry["urls"]:
+                maps, apps = self.by_url.setdefault(key, (set(), set()))
+                if is_map:
+                    maps.add(item_id)
+                if is_app:
+                    apps.add(item_id)
+            if is_app:
+                for referenced in entry["ids"]:
+                    self.apps_by_id.setdefault(referenced, set()).add(item_id)
+
+    def maps_for(self, url):
+        """Ids of web maps that reference the URL (or one of its layers)."""
+        if not url:
+            return []
+        return sorted(self.by_url.get(url_key(url), (set(), set()))[0], key=self.positions.get)
+
+    def apps_for(self, url):
+        """Apps (portal items, in search order) that reference the URL directly or through a web map that does."""
+        if not url:
+            return []
+        found = set(self.by_url.get(url_key(url), (set(), set()))[1])
+        for map_id in self.maps_for(url):
+            found.update(self.apps_by_id.get(map_id.lower(), ()))
+        return [self.items[item_id] for item_id in sorted(found, key=self.positions.get)]
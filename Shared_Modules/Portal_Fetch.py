@@ -0,0 +1,162 @@
+# ---------------------------------------------------------------------------
+# Portal_Fetch.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Concurrent fetch layer for the AGOL/Enterprise Portal tools.  The tools made one REST
+#  request after another (an item lookup per item, a user lookup per group member); this
+#  runs those lookups in a bounded thread pool, retries the ones that fail with a growing
+#  wait between attempts (portals answer a burst with 429/5xx), and times every request.
+#
+#   FetchPool(workers=8, retries=3, backoff=0.5)
+#     .map(function, keys)  - function(key) for every key, results in key order
+#     .fetch(function, key) - one call with the same retry rules
+#     .summary()            - requests, retries, failures, total/slowest request time
+#
+#  Failures don't stop a map() - each FetchResult carries the value or the error, so a
+#  report can still list an item whose lookup failed (as the tools did before).
+#
+#  get_json() is a plain urllib GET of a portal REST endpoint (?f=json) raising PortalError
+#  for portal error responses - used when a tool needs a call the arcgis module doesn't make,
+#  and by the benchmark against a local HTTP stand-in of the portal.
+#
+#  Usage in a portal tool:
+#
+#   import Portal_Fetch
+#   pool = Portal_Fetch.FetchPool(workers=8)
+#   for result in pool.map(lambda username: gis.users.get(username), usernames):
+#       users[result.key] = result.value
+#   print (pool.summary())
+# ---------------------------------------------------------------------------
+
+import concurrent.futures,json,random,threading,time,urllib.error,urllib.parse,urllib.request
+
+DEFAULT_WORKERS = 8
+
+# HTTP status codes worth retrying (throttled, or the portal/web adaptor momentarily unavailable)
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+
+class PortalError(Exception):
+    """Error response from a portal REST endpoint ({"error": {"code": ..., "message": ...}})."""
+
+    def __init__(self, code, message):
+        Exception.__init__(self, "{} {}".format(code, message))
+        self.code = code
+
+
+class FetchResult(object):
+    """Value (or error) of one lookup with its attempts and time."""
+
+    def __init__(self, key):
+        self.key = key
+        self.value = None
+        self.error = None
+        self.attempts = 0
+        self.seconds = 0.0
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def retryable(error):
+    """True for errors another attempt may fix (timeouts, dropped connections, throttling, 5xx)."""
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code in RETRY_STATUS
+    if isinstance(error, PortalError):
+        return error.code in RETRY_STATUS
+    if isinstance(error, (urllib.error.URLError, ConnectionError, TimeoutError)):
+        return True
+    # The arcgis module raises plain Exceptions with the portal's message text
+    text = str(error).lower()
+    return any(word in text for word in ("timed out", "timeout", "too many requests", "429", "502", "503", "504", "connection"))
+
+
+class FetchPool(object):
+    """Runs lookups in a bounded thread pool with retry/backoff and per-request timing.
+
+    workers  - lookups running at once (keep it modest on a production portal)
+    retries  - extra attempts for a lookup that fails with a retryable error
+    backoff  - seconds before the first retry, doubled each retry (plus up to 25% jitter)
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, retries=3, backoff=0.5, should_retry=None):
+        self.workers = max(1, workers)
+        self.retries = retries
+        self.backoff = backoff
+        self.should_retry = should_retry or retryable
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retried = 0
+        self.failed = 0
+        self.request_seconds = 0.0
+        self.slowest = None             # (seconds, key) of the slowest single request
+
+    def _record(self, key, seconds, retried=False):
+        with self._lock:
+            self.requests += 1
+            self.request_seconds += seconds
+            if retried:
+                self.retried += 1
+            if self.slowest is None or seconds > self.slowest[0]:
+                self.slowest = (seconds, key)
+
+    def fetch(self, function, key):
+        """function(key) with retries; returns a FetchResult (never raises for the lookup itself)."""
+        result = FetchResult(key)
+        started = time.time()
+        while True:
+            result.attempts += 1
+            request_started = time.time()
+            try:
+                result.value = function(key)
+                result.error = None
+                self._record(key, time.time() - request_started)
+                break
+            except Exception as error:
+                result.error = error
+                if result.attempts > self.retries or not self.should_retry(error):
+                    self._record(key, time.time() - request_started)
+                    break
+                self._record(key, time.time() - request_started, retried=True)
+                wait = self.backoff * (2 ** (result.attempts - 1))
+                time.sleep(wait + random.uniform(0, wait / 4))
+        if result.error is not None:
+            with self._lock:
+                self.failed += 1
+        result.seconds = time.time() - started
+        return result
+
+    def map(self, function, keys):
+        """FetchResults of function(key) for every key, in the order of keys."""
+        keys = list(keys)
+        if self.workers == 1 or len(keys) < 2:
+            return [self.fetch(function, key) for key in keys]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.workers, len(keys))) as executor:
+            return list(executor.map(lambda key: self.fetch(function, key), keys))
+
+    def summary(self):
+        text = "{} requests ({} workers), {} retried, {} failed, {:.1f} seconds of requests".format(
+            self.requests, self.workers, self.retried, self.failed, self.request_seconds)
+        if self.slowest:
+            text += ", slowest {:.2f} seconds ({})".format(self.slowest[0], self.slowest[1])
+        return text
+
+
+def get_json(url, params=None, timeout=30, token=None):
+    """GET a portal REST endpoint as JSON (f=json added); raises PortalError for a portal error response."""
+    params = dict(params or {})
+    params.setdefault("f", "json")
+    if token:
+        params["token"] = token
+    request_url = url + ("&" if "?" in url else "?") + urllib.parse.urlencode(params)
+    with urllib.request.urlopen(request_url, timeout=timeout) as response:
+        data = json.loads(response.read().decode("utf-8"))
+    if isinstance(data, dict) and "error" in data:
+        error = data["error"] or {}
+        raise PortalError(error.get("code"), error.get("message", ""))
+    return data
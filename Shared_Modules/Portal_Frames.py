@@ -0,0 +1,131 @@
+# ---------------------------------------------------------------------------
+# Portal_Frames.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  DataFrame builders for the AGOL/Enterprise Portal export tools.
+#
+#  Group members (PortalGroup_Members_ExportTool):  the tool re-merged each group's frame
+#  with the user list, rewrote the group's sheet and saved the whole workbook once per
+#  member - quadratic in group size.  Here membership is collected into columns for every
+#  group, merged against the user list once, and each group's sheet is written once, so
+#  the workbook is saved a single time.  A group whose members are all missing from the
+#  user list still gets a sheet with just the header, as the per-member export wrote.
+#
+#  Records (PortalUser_ExportTool, the user list of PortalGroup_Members_ExportTool):  the tools
+#  built their frames with DataFrame.append once per user, copying the whole frame every row
+#  (and append is gone in pandas 2).  RecordCollector keeps one list per column and builds the
+#  frame once, converting level codes and epoch millisecond dates for the whole column at once.
+#
+#  Usage in a portal tool:
+#
+#   import Portal_Frames
+#   users = Portal_Frames.RecordCollector(['User Name', 'Level', 'Last Login Date'])
+#   for user in portalusers:
+#       users.add({'User Name': user.username, 'Level': user.level, 'Last Login Date': user.lastLogin})
+#   userdf = users.frame(levels='Level', epoch_dates=['Last Login Date'])
+#
+#   frame = Portal_Frames.group_member_frame(groups, GroupMembers, userdf)
+#   Portal_Frames.write_group_sheets(Excel_Report.ReportWriter(ExcelOutput), frame, Portal_Frames.group_sheets(groups, GroupMembers))
+# ---------------------------------------------------------------------------
+
+import pandas as pd
+
+# Portal user level codes -> names shown in the reports
+LEVEL_NAMES = {"1": "Viewer", "2": "Creator", "11": "Field Worker"}
+
+GROUP_COLUMNS = ["Group Name", "Group Owner", "Member Username"]
+
+# Excel sheet names are limited to 31 characters - the tools use 30 with spaces removed
+SHEET_NAME_LENGTH = 30
+
+
+class RecordCollector(object):
+    """Rows collected into one list per column; frame() builds the DataFrame once.
+
+    columns - column names, in frame order (add() ignores keys not listed, missing keys are None)
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.values = dict((column, []) for column in self.columns)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, record):
+        """Add one row from a {column: value} dict (the dict the tools passed to DataFrame.append)."""
+        for column in self.columns:
+            self.values[column].append(record.get(column))
+        self.count += 1
+
+    def frame(self, levels=None, epoch_dates=()):
+        """DataFrame of the collected rows.
+
+        levels      - column of user level codes to show as names (LEVEL_NAMES; other values kept)
+        epoch_dates - columns of epoch milliseconds (user.lastLogin, item.created, ...) converted to dates
+        """
+        frame = pd.DataFrame(self.values, columns=self.columns)
+        if levels:
+            frame[levels] = frame[levels].replace(LEVEL_NAMES)
+        for column in epoch_dates:
+            frame[column] = pd.to_datetime(frame[column], unit="ms")
+        return frame
+
+
+def sheet_name(title):
+    return title.replace(" ", "")[:SHEET_NAME_LENGTH]
+
+
+def group_member_frame(groups, members, users):
+    """One row per group member joined to the user list (inner join on Member Username, like the tools did).
+
+    groups  - portal groups (title, owner, id), in report order
+    members - {group id: group.get_members() result} ("users" list of usernames)
+    users   - DataFrame of users with a Member Username column (a Level column of level codes is shown as names)
+    Rows keep group order and member order; a Sheet column holds each group's sheet name.
+    """
+    group_names = []
+    group_owners = []
+    usernames = []
+    sheets = []
+    for group in groups:
+        group_users = members[group.id]["users"]
+        group_names.extend([group.title] * len(group_users))
+        group_owners.extend([group.owner] * len(group_users))
+        sheets.extend([sheet_name(group.title)] * len(group_users))
+        usernames.extend(group_users)
+    frame = pd.DataFrame({"Group Name": group_names, "Group Owner": group_owners, "Member Username": usernames, "Sheet": sheets},
+                         columns=GROUP_COLUMNS + ["Sheet"])
+    frame = frame.merge(users, on="Member Username", how="inner", sort=False)
+    if "Level" in frame.columns:
+        frame["Level"] = frame["Level"].replace(LEVEL_NAMES)
+    return frame
+
+
+def group_sheets(groups, members):
+    """Sheet names of the groups with at least one member, in report order - the sheets the per-member export wrote."""
+    names = []
+    for group in groups:
+        name = sheet_name(group.title)
+        if members[group.id]["users"] and name not in names:
+            names.append(name)
+    return names
+
+
+def write_group_sheets(report, frame, sheets=None):
+    """Write each group's rows of a group_member_frame to its own sheet of an Excel_Report.ReportWriter; returns sheets written.
+
+    sheets - sheet names to write, in order (group_sheets); names with no rows in the frame get a header-only
+             sheet.  Default is the sheets that have rows.
+    """
+    grouped = dict((name, rows) for name, rows in frame.groupby("Sheet", sort=False))
+    written = 0
+    for name in (grouped if sheets is None else sheets):
+        report.add_frame(name, grouped.get(name, frame.iloc[0:0]).drop(columns="Sheet"))
+        written += 1
+    return written
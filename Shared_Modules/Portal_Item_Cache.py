@@ -0,0 +1,131 @@
+# ---------------------------------------------------------------------------
+# Portal_Item_Cache.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  On-disk cache of portal item JSON for the AGOL/Enterprise Portal tools.  Each run used to
+#  download every item's data (get_data) and details again although most items haven't
+#  changed.  Entries are stored in SQLite keyed by item id and kind ("data", "url", ...)
+#  together with the item's modified timestamp from the search result - an item modified
+#  since it was cached is downloaded again, an unchanged item is read from disk.
+#
+#  The cache is shared by every tool run from the same folder (cache\<portal>_Item_Cache.sqlite)
+#  and kept under a size limit: least recently used entries are dropped past max_entries /
+#  max_megabytes.  summary() gives hits/misses for the tool's log.
+#
+#  Only cache what changes with item.modified - sharing (shared_with) and view counts change
+#  without touching modified, so the tools still request those every run.
+#
+#  Usage in a portal tool:
+#
+#   import Portal_Item_Cache
+#   cache = Portal_Item_Cache.ItemCache(os.getcwd() + "\\cache\\" + PortalName + "_Item_Cache.sqlite")
+#   data = cache.cached(item, "data", lambda item: item.get_data())
+#   cache.close()
+#   print (cache.summary())
+# ---------------------------------------------------------------------------
+
+import json,os,sqlite3,threading,time
+
+DEFAULT_MAX_ENTRIES = 50000
+DEFAULT_MAX_MEGABYTES = 500
+
+# Puts between size checks (pruning is a full scan of the cache table)
+PRUNE_EVERY = 500
+
+
+class ItemCache(object):
+    """Item JSON keyed by (item id, kind), valid while the item's modified timestamp is unchanged.
+
+    path          - SQLite file (folder is created)
+    max_entries   - entries kept before least recently used ones are dropped
+    max_megabytes - total JSON size kept before least recently used entries are dropped
+    """
+
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES, max_megabytes=DEFAULT_MAX_MEGABYTES):
+        folder = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_megabytes * 1024 * 1024
+        # Tools call the cache from Portal_Fetch pool threads - one connection, one lock
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS item_cache (item_id TEXT, kind TEXT, modified INTEGER, "
+                                "last_used REAL, size INTEGER, value TEXT, PRIMARY KEY (item_id, kind))")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS item_cache_last_used ON item_cache (last_used)")
+        self.connection.commit()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0                  # misses because the item was modified since it was cached
+        self.evicted = 0
+        self._puts = 0
+
+    def get(self, item_id, kind, modified):
+        """(True, value) when cached for this modified timestamp, (False, None) otherwise."""
+        with self._lock:
+            row = self.connection.execute("SELECT modified, value FROM item_cache WHERE item_id = ? AND kind = ?",
+                                          (item_id, kind)).fetchone()
+            if row is not None and modified is not None and row[0] == modified:
+                self.hits += 1
+                self.connection.execute("UPDATE item_cache SET last_used = ? WHERE item_id = ? AND kind = ?", (time.time(), item_id, kind))
+                return True, json.loads(row[1])
+            self.misses += 1
+            if row is not None:
+                self.stale += 1
+            return False, None
+
+    def put(self, item_id, kind, modified, value):
+        text = json.dumps(value, default=str)
+        with self._lock:
+            self.connection.execute("INSERT OR REPLACE INTO item_cache VALUES (?, ?, ?, ?, ?, ?)",
+                                    (item_id, kind, modified, time.time(), len(text), text))
+            self._puts += 1
+            if self._puts % PRUNE_EVERY == 0:
+                self._prune()
+                self.connection.commit()
+
+    def cached(self, item, kind, loader):
+        """Value of loader(item) for a portal item - from the cache when item.modified is unchanged.
+
+        Errors from loader are raised and not cached, so a failed request is retried next time.
+        """
+        modified = getattr(item, "modified", None)
+        found, value = self.get(item.id, kind, modified)
+        if found:
+            return value
+        value = loader(item)
+        if modified is not None:
+            self.put(item.id, kind, modified, value)
+        return value
+
+    def _prune(self):
+        # Drop least recently used entries until both limits are met
+        count, size = self.connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM item_cache").fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        dropped = []
+        for item_id, kind, entry_size in self.connection.execute("SELECT item_id, kind, size FROM item_cache ORDER BY last_used"):
+            if count <= self.max_entries and size <= self.max_bytes:
+                break
+            dropped.append((item_id, kind))
+            count -= 1
+            size -= entry_size
+        self.connection.executemany("DELETE FROM item_cache WHERE item_id = ? AND kind = ?", dropped)
+        self.evicted += len(dropped)
+
+    def close(self):
+        """Apply the size limits and write the cache out."""
+        with self._lock:
+            self._prune()
+            self.connection.commit()
+            self.connection.close()
+
+    def summary(self):
+        requests = self.hits + self.misses
+        return "Item cache: {} of {} lookups from disk ({:.0f}%), {} downloaded ({} modified since cached), {} evicted".format(
+            self.hits, requests, 100.0 * self.hits / requests if requests else 0, self.misses, self.stale, self.evicted)
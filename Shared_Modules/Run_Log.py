@@ -0,0 +1,302 @@
+# ---------------------------------------------------------------------------
+# Run_Log.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Buffered, structured run log for the scripts.  Each script defined write_log(text, file), which
+#  opened the log on the GIS_LOGS share for every line (one SMB round trip, and a file handle left
+#  open, per line), and every step printed, wrote the log and called logging.exception separately.
+#  Here:
+#
+#   - every line is a JSON record (time, script, level, stage, message, rows, duration_ms,
+#     traceback) put on a bounded queue - the script never waits on the share
+#   - a background writer thread appends the records in batches to a log on local disk and
+#     mirrors each batch to the share (the .jsonl and the plain-text .log, one open/write each);
+#     when the share is unreachable nothing is held in memory - the next write that gets through
+#     copies the whole local log over, the local log always has everything
+#   - logging calls (logging.exception in the except blocks) go to the same records
+#   - with a Run_Metrics store, every stage is also written to the run-metrics database
+#   - the log is flushed and closed when the script exits (atexit), including on an error
+#
+#  Log files: <local folder>\<name>.jsonl (default %TEMP%\GIS_LOGS), the share log with a
+#  .jsonl extension (LandUse_Data_Spreader.log -> LandUse_Data_Spreader.jsonl) and the share log
+#  itself as plain text (format_record lines, so GIS_LOGS\*.log stays current), all started
+#  fresh every run like the old filemode='w' logs.
+#
+#  Usage in a script:
+#
+#   import Run_Log
+#   logfile = r"\\FILELOCATION\\GIS\\GIS_LOGS\\LandUse_Data_Spreader.log"
+#   run_log = Run_Log.start("LandUse_Data_Spreader", logfile)
+#   write_log = run_log.write_log                      (old write_log(text, logfile) calls keep working)
+#
+#   run_log.info("Updating Land Use Parcels")          (print + record)
+#   with run_log.stage("Append Land Use Parcels") as stage:
+#       ...
+#       stage.rows = int(arcpy.GetCount_management(LANDUSE_PARCELS_WKSP)[0])
+#   except:
+#       run_log.exception("Unable to append Land Use Parcels")   (print + record with the traceback)
+#
+#  Reading a log as text:
+#
+#   propy Run_Log.py <log.jsonl> [--errors]
+# ---------------------------------------------------------------------------
+
+import argparse,atexit,datetime,json,logging,os,queue,sys,tempfile,threading,time,traceback
+
+# Local log folder (fast local disk - the share gets a mirror)
+LOCAL_FOLDER = os.path.join(tempfile.gettempdir(), "GIS_LOGS")
+
+# Queue bound (records) - record() waits for the writer when the queue is full
+QUEUE_SIZE = 10000
+
+# Records per write, and the longest a record waits for one (seconds)
+BATCH_SIZE = 200
+FLUSH_SECONDS = 2.0
+
+_STOP = object()
+
+
+class Stage(object):
+    """Timing of one stage of a script - set rows inside the with block to record the row count."""
+
+    def __init__(self, run_log, name, echo, source=None, target=None, rows_in=None):
+        self.run_log = run_log
+        self.name = name
+        self.echo = echo
+        self.rows = None
+        self.started = None
+        self.metrics = run_log.metrics.stage(name, source, target, rows_in) if run_log.metrics else None
+
+    def __enter__(self):
+        self.started = time.time()
+        if self.metrics:
+            self.metrics.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        duration_ms = int((time.time() - self.started) * 1000)
+        if self.metrics:
+            self.metrics.rows_out = self.rows
+            self.metrics.__exit__(exc_type, exc_value, exc_traceback)
+        if exc_type is None:
+            message = "{} completed at {}".format(self.name, time.strftime("%I:%M:%S %p", time.localtime()))
+            if self.echo:
+                print ("       " + message)
+            self.run_log.record(message, stage=self.name, rows=self.rows, duration_ms=duration_ms)
+        else:
+            self.run_log.record("Unable to complete {}".format(self.name), level="ERROR", stage=self.name, duration_ms=duration_ms,
+                                traceback="".join(traceback.format_exception(exc_type, exc_value, exc_traceback)))
+        return False
+
+
+class RunLogHandler(logging.Handler):
+    """logging handler putting log calls (logging.exception, ...) on a RunLog."""
+
+    def __init__(self, run_log):
+        logging.Handler.__init__(self)
+        self.run_log = run_log
+
+    def emit(self, record):
+        try:
+            trace = "".join(traceback.format_exception(*record.exc_info)) if record.exc_info else None
+            self.run_log.record(record.getMessage(), level=record.levelname, traceback=trace)
+        except Exception:
+            self.handleError(record)
+
+
+class RunLog(object):
+    """JSON-lines run log written by a background thread in batches (local disk + share mirror).
+
+    script        - script name written on every record
+    path          - share log path (written as plain text, the .jsonl mirror next to it), or None for local only
+    local_folder  - folder of the local log (default LOCAL_FOLDER)
+    mirror        - also write the batches to the share
+    metrics       - Run_Metrics.MetricsStore the stages are also recorded in, or None
+    """
+
+    def __init__(self, script, path=None, local_folder=None, mirror=True, queue_size=QUEUE_SIZE, batch_size=BATCH_SIZE,
+                 flush_seconds=FLUSH_SECONDS, metrics=None):
+        self.script = script
+        self.metrics = metrics
+        name = os.path.splitext(os.path.basename(path))[0] if path else script
+        local_folder = local_folder or LOCAL_FOLDER
+        if not os.path.isdir(local_folder):
+            os.makedirs(local_folder)
+        self.local_path = os.path.join(local_folder, name + ".jsonl")
+        self.mirror_path = os.path.splitext(path)[0] + ".jsonl" if path and mirror else None
+        if self.mirror_path and os.path.normcase(os.path.abspath(self.mirror_path)) == os.path.normcase(os.path.abspath(self.local_path)):
+            self.mirror_path = None                  # logging straight to the share folder - nothing to mirror
+        self.text_path = os.path.splitext(path)[0] + ".log" if path and mirror else None
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.records = 0
+        self.batches = 0
+        self.mirror_error = None
+        self.local_error = None
+        self._mirror_behind = False                 # a batch missed the share - copy the local log over on the next write
+        self._queue = queue.Queue(queue_size)
+        self._closed = False
+        self._append(self.local_path, "", "w")
+        self._mirror([], "w")
+        self._thread = threading.Thread(target=self._writer, name="Run_Log " + script)
+        self._thread.daemon = True
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _append(self, path, text, mode="a"):
+        with open(path, mode) as log_file:
+            log_file.write(text)
+
+    def _mirror(self, entries, mode="a"):
+        # One open/write per share file per batch; after a missed batch the local log is copied over instead
+        # (re-read from disk, so an unreachable share never holds the run's log in memory)
+        if not self.mirror_path and not self.text_path:
+            return
+        try:
+            if self._mirror_behind:
+                entries = read_records(self.local_path)
+                mode = "w"
+            if self.mirror_path:
+                self._append(self.mirror_path, "".join(json.dumps(entry, default=str) + "\n" for entry in entries), mode)
+            if self.text_path:
+                self._append(self.text_path, "".join(format_record(entry) + "\n" for entry in entries), mode)
+            self._mirror_behind = False
+            self.mirror_error = None
+        except (IOError, OSError) as error:
+            self._mirror_behind = True
+            self.mirror_error = error
+
+    def _write(self, pending):
+        text = "".join(json.dumps(entry, default=str) + "\n" for entry in pending)
+        try:
+            self._append(self.local_path, text)
+        except (IOError, OSError) as error:
+            self.local_error = error                 # keep draining the queue - the share mirror still gets the batch
+        self._mirror(pending)
+        self.batches += 1
+
+    def _writer(self):
+        pending = []
+        last_write = time.time()
+        while True:
+            try:
+                entry = self._queue.get(timeout=self.flush_seconds)
+            except queue.Empty:
+                entry = None
+            if entry is not None and entry is not _STOP:
+                if isinstance(entry, threading.Event):
+                    if pending:
+                        self._write(pending)
+                        pending = []
+                    entry.set()
+                    continue
+                pending.append(entry)
+            if pending and (entry is _STOP or len(pending) >= self.batch_size or time.time() - last_write >= self.flush_seconds):
+                self._write(pending)
+                pending = []
+                last_write = time.time()
+            if entry is _STOP:
+                return
+
+    def record(self, message, level="INFO", stage=None, rows=None, duration_ms=None, traceback=None, **fields):
+        """Queue one record (waits while the queue is full)."""
+        if self._closed:
+            return
+        entry = {"time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "script": self.script, "level": level,
+                 "stage": stage, "message": str(message).strip(), "rows": rows, "duration_ms": duration_ms, "traceback": traceback}
+        entry.update(fields)
+        self._queue.put(entry)
+        self.records += 1
+
+    def write_log(self, text, file=None):
+        """Drop-in for the scripts' write_log(text, logfile) - the file argument is ignored."""
+        self.record(text)
+
+    def info(self, text, stage=None, rows=None, **fields):
+        """Print a line and record it."""
+        print (text)
+        self.record(text, stage=stage, rows=rows, **fields)
+
+    def exception(self, text, stage=None):
+        """Print an error line and record it with the traceback of the exception being handled."""
+        print ("\n " + text)
+        trace = traceback.format_exc() if sys.exc_info()[0] is not None else None
+        self.record(text, level="ERROR", stage=stage, traceback=trace)
+
+    def stage(self, name, echo=True, source=None, target=None, rows_in=None):
+        """with run_log.stage(name) as stage: ... - records the stage's duration (and stage.rows) when it ends."""
+        return Stage(self, name, echo, source, target, rows_in)
+
+    def flush(self, timeout=None):
+        """Wait until everything queued so far is written."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self):
+        """Write what is left and stop the writer (atexit calls this)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        if self._mirror_behind:
+            self._mirror([])
+
+
+def start(script, path=None, local_folder=None, mirror=True, level=logging.DEBUG, metrics=None):
+    """RunLog for a script, with logging calls (logging.exception, ...) routed to it."""
+    run_log = RunLog(script, path, local_folder, mirror, metrics=metrics)
+    root = logging.getLogger()
+    root.addHandler(RunLogHandler(run_log))
+    root.setLevel(level)
+    return run_log
+
+
+def read_records(path):
+    """Records of a JSON-lines log (lines that aren't JSON are skipped)."""
+    records = []
+    with open(path) as log_file:
+        for line in log_file:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def format_record(entry):
+    """One record as a text log line."""
+    text = "{} {:<7} {}{}".format(entry.get("time"), entry.get("level"), "[{}] ".format(entry["stage"]) if entry.get("stage") else "",
+                                  entry.get("message"))
+    details = []
+    if entry.get("rows") is not None:
+        details.append("{} rows".format(entry["rows"]))
+    if entry.get("duration_ms") is not None:
+        details.append("{:.1f} seconds".format(entry["duration_ms"] / 1000.0))
+    if details:
+        text += " ({})".format(", ".join(details))
+    if entry.get("traceback"):
+        text += "\n" + entry["traceback"].rstrip()
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print a Run_Log JSON-lines log as text.")
+    parser.add_argument("log", help="log file (.jsonl)")
+    parser.add_argument("--errors", action="store_true", help="only the ERROR/CRITICAL records")
+    args = parser.parse_args()
+    for entry in read_records(args.log):
+        if args.errors and entry.get("level") not in ("ERROR", "CRITICAL"):
+            continue
+        print (format_record(entry))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+# ---------------------------------------------------------------------------
+# Run_Metrics.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Run-metrics store for the scripts.  The only timing record was the batch-file Duration line and
+#  the "completed at" prints, so a layer that suddenly took 3x longer went unnoticed.  Every run and
+#  every stage of a run is written to a local SQLite file:
+#
+#   runs   - script, host, started, finished, wall seconds, status
+#   stages - script, stage, source, target, rows in/out, wall/CPU seconds, peak memory so far (MB), status, error
+#
+#  Stages come from Run_Log stages (Run_Log.start(..., metrics=store)), from a Pipeline_Runner
+#  result (store.add_pipeline - the spreader stages and locator rebuilds) or from store.stage().
+#  CPU seconds are the stage thread's CPU time.  Peak memory is the process's peak working set so far
+#  when the stage finished, not the stage's own use: for stages run in a process pool it is the
+#  worker's peak (a reused worker carries the largest earlier stage's peak), for a thread pool or a
+#  Run_Log stage the whole script's.
+#  Metrics never stop a script: a database error while recording (locked file, full disk) is
+#  logged once and the rest of the run is not recorded.
+#
+#  From the command line (trends, the slowest stages, and stages whose latest run is more than
+#  --sigma standard deviations slower than their trailing baseline):
+#
+#   propy Run_Metrics.py runs [--script LandRecords_Data_Spreader]
+#   propy Run_Metrics.py trend LandRecords_Data_Spreader [Tax Parcels - CRAW_INTERNAL] [--runs 20]
+#   propy Run_Metrics.py slowest [--days 30] [--limit 20]
+#   propy Run_Metrics.py regressions [--sigma 3] [--baseline 10]
+#
+#  Usage in a script:
+#
+#   import Run_Metrics
+#   metrics = Run_Metrics.MetricsStore("LandUse_Data_Spreader")
+#   run_log = Run_Log.start("LandUse_Data_Spreader", logfile, metrics=metrics)
+#   with run_log.stage("Append Land Use Parcels - AUTO_WORKSPACE", source=TAX_PARCELS_INTERNAL, target=LANDUSE_PARCELS_WKSP) as stage:
+#       ...
+#   metrics.add_pipeline(result, manifest)             (Pipeline_Runner results)
+#   metrics.finish()                                   (run status "completed" - left "incomplete" otherwise)
+# ---------------------------------------------------------------------------
+
+import argparse,atexit,datetime,logging,math,os,socket,sqlite3,sys,tempfile,time,traceback
+
+# Metrics database (local disk - every script on the machine writes to the same file)
+DEFAULT_PATH = os.path.join(os.environ.get("LOCALAPPDATA") or tempfile.gettempdir(), "GIS_Metrics", "Run_Metrics.sqlite")
+
+# Regression check: runs in the trailing baseline, fewest runs to judge, standard deviations allowed
+BASELINE_RUNS = 10
+MIN_BASELINE_RUNS = 3
+SIGMA = 3.0
+
+# Smallest spread used for the check (share of the baseline mean) - a stage that always took the
+# same time has a standard deviation of ~0 and would flag on a second of noise
+MIN_SPREAD = 0.05
+
+STAGE_COLUMNS = ("run_id", "script", "stage", "source", "target", "rows_in", "rows_out", "started", "wall_seconds", "cpu_seconds",
+                 "peak_memory_mb", "status", "error")
+
+
+def peak_memory_mb():
+    """Peak working set of this process in MB (None when it can't be read)."""
+    try:
+        if sys.platform == "win32":
+            import ctypes,ctypes.wintypes
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [("cb", ctypes.wintypes.DWORD), ("PageFaultCount", ctypes.wintypes.DWORD),
+                            ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                            ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return None
+            return round(counters.PeakWorkingSetSize / 1048576.0, 1)
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(peak / (1048576.0 if sys.platform == "darwin" else 1024.0), 1)
+    except Exception:
+        return None
+
+
+class StageMetrics(object):
+    """One stage being measured - set rows_in/rows_out inside the with block."""
+
+    def __init__(self, store, name, source=None, target=None, rows_in=None):
+        self.store = store
+        self.name = name
+        self.source = source
+        self.target = target
+        self.rows_in = rows_in
+        self.rows_out = None
+
+    def __enter__(self):
+        self.started = time.time()
+        self.cpu_started = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        error = "".join(traceback.format_exception_only(exc_type, exc_value)).strip() if exc_type else None
+        self.store.add_stage(self.name, time.time() - self.started, source=self.source, target=self.target, rows_in=self.rows_in,
+                             rows_out=self.rows_out, cpu_seconds=time.thread_time() - self.cpu_started, peak_memory=peak_memory_mb(),
+                             status="failed" if exc_type else "completed", error=error, started=self.started)
+        return False
+
+
+class MetricsStore(object):
+    """Runs and stage metrics of one script run in the SQLite metrics database.
+
+    script - script name (None opens the database for reading only - the CLI)
+    path   - SQLite file (folder is created)
+    """
+
+    def __init__(self, script=None, path=None):
+        self.path = path or DEFAULT_PATH
+        folder = os.path.dirname(os.path.abspath(self.path))
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        self.script = script
+        self.error = None
+        self.run_id = None
+        self.started = None
+        # Scripts run at the same time by Batch_Orchestrator share the file - wait on each other's writes
+        self.connection = sqlite3.connect(self.path, timeout=60)
+        try:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS runs (run_id INTEGER PRIMARY KEY AUTOINCREMENT, script TEXT, host TEXT, "
+                                    "started REAL, finished REAL, wall_seconds REAL, status TEXT)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS stages (stage_id INTEGER PRIMARY KEY AUTOINCREMENT, run_id INTEGER, script TEXT, "
+                                    "stage TEXT, source TEXT, target TEXT, rows_in INTEGER, rows_out INTEGER, started REAL, wall_seconds REAL, "
+                                    "cpu_seconds REAL, peak_memory_mb REAL, status TEXT, error TEXT)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS stages_script_stage ON stages (script, stage, run_id)")
+            self.connection.commit()
+        except sqlite3.Error as error:
+            if not script:
+                raise
+            self._disable(error)
+        if script:
+            self.started = time.time()
+            cursor = self._write("INSERT INTO runs (script, host, started, status) VALUES (?, ?, ?, 'incomplete')",
+                                 (script, socket.gethostname(), self.started))
+            if cursor is not None:
+                self.run_id = cursor.lastrowid
+            atexit.register(self.close)
+
+    def _disable(self, error):
+        self.error = error
+        self.run_id = None
+        logging.warning("Run metrics for {} not recorded from here on ({}): {}".format(self.script, self.path, error))
+
+    def _write(self, statement, values):
+        # One statement + commit; on a database error log it once and stop recording this run
+        if self.error is not None:
+            return None
+        try:
+            cursor = self.connection.execute(statement, values)
+            self.connection.commit()
+            return cursor
+        except sqlite3.Error as error:
+            self._disable(error)
+            return None
+
+    def stage(self, name, source=None, target=None, rows_in=None):
+        """with store.stage(name, source, target) as stage: ... stage.rows_out = n"""
+        return StageMetrics(self, name, source, target, rows_in)
+
+    def add_stage(self, name, wall_seconds, source=None, target=None, rows_in=None, rows_out=None, cpu_seconds=None, peak_memory=None,
+                  status="completed", error=None, started=None):
+        """Record a measured stage of this run."""
+        self._write("INSERT INTO stages ({}) VALUES ({})".format(", ".join(STAGE_COLUMNS), ", ".join("?" * len(STAGE_COLUMNS))),
+                    (self.run_id, self.script, name, source and str(source), target and str(target), rows_in, rows_out,
+                     started or time.time() - wall_seconds, wall_seconds, cpu_seconds, peak_memory, status, error))
+
+    def add_pipeline(self, result, manifest=None):
+        """Record the stages of a Pipeline_Runner.PipelineResult (source/target from the manifest stages)."""
+        stages = dict((stage["name"], stage) for stage in (manifest or {}).get("stages", []))
+        pipeline_started = time.time() - result.seconds
+        for stage in result.stages:
+            if stage.status == "skipped":
+                continue
+            definition = stages.get(stage.name, {})
+            self.add_stage(stage.name, stage.seconds, source=definition.get("source"), target=definition.get("target"), rows_out=stage.rows,
+                           cpu_seconds=getattr(stage, "cpu_seconds", None), peak_memory=getattr(stage, "worker_peak_mb", None),
+                           status=stage.status, error=stage.error,
+                           started=pipeline_started + stage.started if stage.started is not None else None)
+
+    def finish(self, status="completed"):
+        """Close the run with a status (a run never finished stays "incomplete")."""
+        if self.run_id is None:
+            return
+        finished = time.time()
+        self._write("UPDATE runs SET finished = ?, wall_seconds = ?, status = ? WHERE run_id = ?",
+                    (finished, finished - self.started, status, self.run_id))
+        self.run_id = None
+
+    def close(self):
+        if self.run_id is not None:
+            finished = time.time()
+            self._write("UPDATE runs SET finished = ?, wall_seconds = ? WHERE run_id = ?", (finished, finished - self.started, self.run_id))
+            self.run_id = None
+        try:
+            self.connection.close()
+        except sqlite3.Error:
+            pass
+
+    # Queries (CLI)
+
+    def runs(self, script=None, limit=20):
+        where, values = ("WHERE script = ?", [script]) if script else ("", [])
+        return self.connection.execute("SELECT run_id, script, host, started, wall_seconds, status FROM runs {} ORDER BY run_id DESC LIMIT ?".format(where),
+                                       values + [limit]).fetchall()
+
+    def trend(self, script, stage=None, runs=20):
+        """(run_id, stage, started, rows_in, rows_out, wall, cpu, peak memory, status) of the script's last runs, oldest first."""
+        values = [script]
+        where = "script = ?"
+        if stage:
+            where += " AND stage = ?"
+            values.append(stage)
+        run_ids = [row[0] for row in self.connection.execute("SELECT DISTINCT run_id FROM stages WHERE {} ORDER BY run_id DESC LIMIT ?".format(where),
+                                                             values + [runs])]
+        if not run_ids:
+            return []
+        return self.connection.execute("SELECT run_id, stage, started, rows_in, rows_out, wall_seconds, cpu_seconds, peak_memory_mb, status "
+                                       "FROM stages WHERE {} AND run_id IN ({}) ORDER BY run_id, started".format(where, ", ".join("?" * len(run_ids))),
+                                       values + run_ids).fetchall()
+
+    def slowest(self, days=30, limit=20):
+        """(script, stage, runs, average, maximum, last wall seconds) of completed stages in the last days, slowest average first."""
+        since = time.time() - days * 86400
+        rows = self.connection.execute("SELECT script, stage, COUNT(*), AVG(wall_seconds), MAX(wall_seconds) FROM stages "
+                                       "WHERE status = 'completed' AND started >= ? GROUP BY script, stage ORDER BY AVG(wall_seconds) DESC LIMIT ?",
+                                       (since, limit)).fetchall()
+        return [row + (self._last(row[0], row[1]),) for row in rows]
+
+    def _last(self, script, stage):
+        row = self.connection.execute("SELECT wall_seconds FROM stages WHERE script = ? AND stage = ? AND status = 'completed' "
+                                      "ORDER BY stage_id DESC LIMIT 1", (script, stage)).fetchone()
+        return row[0] if row else None
+
+    def regressions(self, sigma=SIGMA, baseline=BASELINE_RUNS, min_baseline=MIN_BASELINE_RUNS):
+        """Stages whose latest completed run is slower than baseline mean + sigma standard deviations.
+
+        Returns (script, stage, latest seconds, baseline mean, standard deviation, baseline runs, latest run_id), worst first.
+        """
+        flagged = []
+        for script, stage in self.connection.execute("SELECT DISTINCT script, stage FROM stages").fetchall():
+            history = self.connection.execute("SELECT wall_seconds, run_id FROM stages WHERE script = ? AND stage = ? AND status = 'completed' "
+                                              "ORDER BY stage_id DESC LIMIT ?", (script, stage, baseline + 1)).fetchall()
+            if len(history) < min_baseline + 1:
+                continue
+            latest, run_id = history[0]
+            trailing = [row[0] for row in history[1:]]
+            mean = sum(trailing) / len(trailing)
+            deviation = math.sqrt(sum((value - mean) ** 2 for value in trailing) / (len(trailing) - 1))
+            if latest > mean + sigma * max(deviation, mean * MIN_SPREAD):
+                flagged.append((script, stage, latest, mean, deviation, len(trailing), run_id))
+        return sorted(flagged, key=lambda row: row[2] / row[3] if row[3] else float("inf"), reverse=True)
+
+
+def _clock(seconds):
+    if seconds is None:
+        return "-"
+    if seconds < 60:
+        return "{:.2f}s".format(seconds)          # sub-minute stages (benchmarks, lookups) would all read 00:00:00
+    return time.strftime("%H:%M:%S", time.gmtime(seconds))
+
+
+def _date(timestamp):
+    return "-" if timestamp is None else datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run and stage metrics of the GIS scripts.")
+    parser.add_argument("--db", default=DEFAULT_PATH, help="metrics database (default {})".format(DEFAULT_PATH))
+    commands = parser.add_subparsers(dest="command")
+    runs = commands.add_parser("runs", help="latest runs")
+    runs.add_argument("--script")
+    runs.add_argument("--limit", type=int, default=20)
+    trend = commands.add_parser("trend", help="stage timings of a script's last runs")
+    trend.add_argument("script")
+    trend.add_argument("stage", nargs="?")
+    trend.add_argument("--runs", type=int, default=20)
+    slowest = commands.add_parser("slowest", help="slowest stages by average time")
+    slowest.add_argument("--days", type=float, default=30)
+    slowest.add_argument("--limit", type=int, default=20)
+    regressions = commands.add_parser("regressions", help="stages slower than their trailing baseline")
+    regressions.add_argument("--sigma", type=float, default=SIGMA)
+    regressions.add_argument("--baseline", type=int, default=BASELINE_RUNS)
+    args = parser.parse_args()
+    store = MetricsStore(path=args.db)
+
+    if args.command == "runs":
+        print ("{:>7}  {:<45} {:<16} {:<16} {:>9}  {}".format("Run", "Script", "Host", "Started", "Duration", "Status"))
+        for run_id, script, host, started, wall_seconds, status in store.runs(args.script, args.limit):
+            print ("{:>7}  {:<45} {:<16} {:<16} {:>9}  {}".format(run_id, script, host, _date(started), _clock(wall_seconds), status))
+    elif args.command == "trend":
+        print ("{:>7}  {:<16} {:<45} {:>9} {:>9} {:>9} {:>9} {:>11}  {}".format("Run", "Started", "Stage", "Rows in", "Rows out", "Wall", "CPU",
+                                                                            "Peak so far", "Status"))
+        for run_id, stage, started, rows_in, rows_out, wall, cpu, memory, status in store.trend(args.script, args.stage, args.runs):
+            print ("{:>7}  {:<16} {:<45} {:>9} {:>9} {:>9} {:>9} {:>11}  {}".format(run_id, _date(started), stage, "-" if rows_in is None else rows_in,
+                                                                                "-" if rows_out is None else rows_out, _clock(wall), _clock(cpu),
+                                                                                "-" if memory is None else memory, status))
+    elif args.command == "slowest":
+        print ("{:<40} {:<45} {:>5} {:>9} {:>9} {:>9}".format("Script", "Stage", "Runs", "Average", "Slowest", "Last"))
+        for script, stage, count, average, maximum, last in store.slowest(args.days, args.limit):
+            print ("{:<40} {:<45} {:>5} {:>9} {:>9} {:>9}".format(script, stage, count, _clock(average), _clock(maximum), _clock(last)))
+    elif args.command == "regressions":
+        flagged = store.regressions(args.sigma, args.baseline)
+        if not flagged:
+            print ("No stage is more than {} standard deviations slower than its last {} runs".format(args.sigma, args.baseline))
+        for script, stage, latest, mean, deviation, count, run_id in flagged:
+            print ("{} - {}: {} in run {}, {:.1f}x its {}-run baseline of {} (standard deviation {:.1f}s)".format(
+                script, stage, _clock(latest), run_id, latest / mean if mean else float("inf"), count, _clock(mean), deviation))
+    else:
+        parser.print_help()
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+# ---------------------------------------------------------------------------
+# Sync_Engine.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Shared change-detection sync used by the *_Data_Spreader scripts in place of
+#  DeleteRows + Append.  Every source and target row is fingerprinted (key field +
+#  hash of the attribute values and geometry), then only the inserts, updates and
+#  deletes needed to make the target match the source are applied.  Targets keep
+#  their rows while the sync runs, so services never drop to zero records and SDE
+#  delta tables only grow by the rows that actually changed.
+#
+#  The engine talks to data through a backend:
+#
+#   ArcpyBackend   - feature classes/tables through arcpy.da cursors (production)
+#   SQLiteBackend  - tables in a SQLite database, geometry stored as WKT (benchmarks/stand-in)
+#   MemoryBackend  - plain python dicts (benchmarks/stand-in)
+#
+#  Usage in a spreader:
+#
+#   import Sync_Engine
+#   result = Sync_Engine.sync_dataset(Sync_Engine.ArcpyBackend(), SOURCE_FC, TARGET_FC, "Site_NGUID")
+#   print (result.summary())
+# ---------------------------------------------------------------------------
+
+import datetime,hashlib,sqlite3,time
+
+# Fields the engine never compares or writes (maintained by the geodatabase itself)
+SKIP_FIELD_TYPES = ("OID", "GlobalID", "Geometry", "Raster", "Blob")
+SKIP_FIELD_NAMES = ("SHAPE_AREA", "SHAPE_LENGTH", "SHAPE.STAREA()", "SHAPE.STLENGTH()", "SHAPE__AREA", "SHAPE__LENGTH")
+
+# ListFields type -> AddFields type (add_fields copies field definitions between datasets)
+ADD_FIELD_TYPES = {"String": "TEXT", "Integer": "LONG", "SmallInteger": "SHORT", "BigInteger": "BIGINTEGER", "Double": "DOUBLE",
+                   "Single": "FLOAT", "Date": "DATE", "DateOnly": "DATEONLY", "TimeOnly": "TIMEONLY", "GUID": "GUID"}
+
+# Token used for the geometry column in every backend
+SHAPE_TOKEN = "SHAPE@"
+
+# Doubles are rounded before hashing so re-stored values don't show up as edits
+FLOAT_DIGITS = 8
+
+
+class SyncResult(object):
+    """Counts and timing for one sync_dataset call."""
+
+    def __init__(self, source, target):
+        self.source = source
+        self.target = target
+        self.inserted = 0
+        self.updated = 0
+        self.deleted = 0
+        self.unchanged = 0
+        self.source_rows = 0
+        self.target_rows = 0
+        self.seconds = 0.0
+
+    @property
+    def touched(self):
+        return self.inserted + self.updated + self.deleted
+
+    @property
+    def skipped(self):
+        return self.unchanged
+
+    def summary(self):
+        return ("{} -> {}: {} rows touched ({} inserted, {} updated, {} deleted), {} rows skipped unchanged in {:.1f} seconds"
+                .format(self.source, self.target, self.touched, self.inserted, self.updated, self.deleted, self.unchanged, self.seconds))
+
+    def as_dict(self):
+        return {"source": self.source, "target": self.target, "inserted": self.inserted, "updated": self.updated,
+                "deleted": self.deleted, "unchanged": self.unchanged, "touched": self.touched, "skipped": self.skipped,
+                "source_rows": self.source_rows, "target_rows": self.target_rows, "seconds": round(self.seconds, 3)}
+
+
+def _normalize(value):
+    # Reduce a cell value to stable bytes for hashing (geometry as WKB, doubles rounded, dates as ISO strings)
+    if value is None:
+        return b"\x00"
+    if hasattr(value, "WKB"):
+        return bytes(value.WKB)
+    if isinstance(value, float):
+        return repr(round(value, FLOAT_DIGITS)).encode("utf-8")
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat().encode("utf-8")
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    return str(value).encode("utf-8")
+
+
+def row_fingerprint(values):
+    """Hash a sequence of attribute/geometry values into a short hex digest."""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        digest.update(_normalize(value))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+class SyncBackend(object):
+    """Interface every backend implements.
+
+    read_rows yields (row_id, values) with values ordered like fields.  The row id
+    is whatever the backend needs to address the row again (OBJECTID, rowid, ...).
+    """
+
+    def list_fields(self, dataset):
+        raise NotImplementedError
+
+    def read_rows(self, dataset, fields, where_clause=None, spatial_reference=None):
+        raise NotImplementedError
+
+    def spatial_reference(self, dataset):
+        return None
+
+    def apply_changes(self, dataset, fields, inserts, updates, deletes):
+        """inserts: list of value lists, updates: {row_id: values}, deletes: set of row ids"""
+        raise NotImplementedError
+
+    def add_fields(self, dataset, template, fields, names):
+        """Add fields to dataset named names, defined like fields in the template dataset (used by Hash_Join)"""
+        raise NotImplementedError
+
+
+class ArcpyBackend(SyncBackend):
+    """Feature classes and tables through arcpy.da cursors.
+
+    edit_workspace - pass the .sde connection when the target is versioned or
+                     participates in a topology/network, so edits run in an edit session.
+    """
+
+    def __init__(self, edit_workspace=None):
+        import arcpy
+        self.arcpy = arcpy
+        self.edit_workspace = edit_workspace
+
+    def list_fields(self, dataset):
+        names = []
+        for field in self.arcpy.ListFields(dataset):
+            if field.type in SKIP_FIELD_TYPES or not field.editable:
+                continue
+            if field.name.upper() in SKIP_FIELD_NAMES:
+                continue
+            names.append(field.name)
+        if hasattr(self.arcpy.Describe(dataset), "shapeType"):
+            names.append(SHAPE_TOKEN)
+        return names
+
+    def spatial_reference(self, dataset):
+        desc = self.arcpy.Describe(dataset)
+        return getattr(desc, "spatialReference", None)
+
+    def read_rows(self, dataset, fields, where_clause=None, spatial_reference=None):
+        with self.arcpy.da.SearchCursor(dataset, ["OID@"] + list(fields), where_clause, spatial_reference) as cursor:
+            for row in cursor:
+                yield row[0], row[1:]
+
+    def add_fields(self, dataset, template, fields, names):
+        definitions = dict((field.name.upper(), field) for field in self.arcpy.ListFields(template))
+        descriptions = []
+        for field, name in zip(fields, names):
+            definition = definitions[field.upper()]
+            descriptions.append([name, ADD_FIELD_TYPES.get(definition.type, "TEXT"), definition.aliasName,
+                                 definition.length if definition.type == "String" else None])
+        self.arcpy.management.AddFields(dataset, descriptions)
+
+    def apply_changes(self, dataset, fields, inserts, updates, deletes):
+        editor = None
+        if self.edit_workspace:
+            editor = self.arcpy.da.Editor(self.edit_workspace)
+            editor.startEditing(False, True)
+            editor.startOperation()
+        try:
+            if updates or deletes:
+                with self.arcpy.da.UpdateCursor(dataset, ["OID@"] + list(fields)) as cursor:
+                    for row in cursor:
+                        oid = row[0]
+                        if oid in deletes:
+                            cursor.deleteRow()
+                        elif oid in updates:
+                            cursor.updateRow([oid] + list(updates[oid]))
+            if inserts:
+                with self.arcpy.da.InsertCursor(dataset, list(fields)) as cursor:
+                    for values in inserts:
+                        cursor.insertRow(values)
+        except:
+            if editor is not None:
+                editor.abortOperation()
+                editor.stopEditing(False)
+            raise
+        if editor is not None:
+            editor.stopOperation()
+            editor.stopEditing(True)
+
+
+class SQLiteBackend(SyncBackend):
+    """Tables in a SQLite database - the geometry column (SHAPE@) is stored as WKT text in a SHAPE column."""
+
+    def __init__(self, database):
+        self.connection = sqlite3.connect(database)
+
+    def _column(self, field):
+        return "SHAPE" if field == SHAPE_TOKEN else field
+
+    def create_table(self, dataset, fields):
+        columns = ", ".join('"{}"'.format(self._column(field)) for field in fields)
+        self.connection.execute('DROP TABLE IF EXISTS "{}"'.format(dataset))
+        self.connection.execute('CREATE TABLE "{}" ({})'.format(dataset, columns))
+        self.connection.commit()
+
+    def load_rows(self, dataset, fields, rows):
+        marks = ", ".join("?" for field in fields)
+        columns = ", ".join('"{}"'.format(self._column(field)) for field in fields)
+        self.connection.executemany('INSERT INTO "{}" ({}) VALUES ({})'.format(dataset, columns, marks), rows)
+        self.connection.commit()
+
+    def list_fields(self, dataset):
+        names = [info[1] for info in self.connection.execute('PRAGMA table_info("{}")'.format(dataset))]
+        return [SHAPE_TOKEN if name == "SHAPE" else name for name in names]
+
+    def read_rows(self, dataset, fields, where_clause=None, spatial_reference=None):
+        columns = ", ".join('"{}"'.format(self._column(field)) for field in fields)
+        sql = 'SELECT rowid, {} FROM "{}"'.format(columns, dataset)
+        if where_clause:
+            sql += " WHERE " + where_clause
+        for row in self.connection.execute(sql):
+            yield row[0], row[1:]
+
+    def add_fields(self, dataset, template, fields, names):
+        with self.connection:
+            for name in names:
+                self.connection.execute('ALTER TABLE "{}" ADD COLUMN "{}"'.format(dataset, name))
+
+    def apply_changes(self, dataset, fields, inserts, updates, deletes):
+        columns = [self._column(field) for field in fields]
+        with self.connection:
+            if deletes:
+                self.connection.executemany('DELETE FROM "{}" WHERE rowid = ?'.format(dataset), [(row_id,) for row_id in deletes])
+            if updates:
+                assignments = ", ".join('"{}" = ?'.format(column) for column in columns)
+                self.connection.executemany('UPDATE "{}" SET {} WHERE rowid = ?'.format(dataset, assignments),
+                                            [list(values) + [row_id] for row_id, values in updates.items()])
+            if inserts:
+                marks = ", ".join("?" for column in columns)
+                self.connection.executemany('INSERT INTO "{}" ({}) VALUES ({})'.format(dataset, ", ".join('"{}"'.format(column) for column in columns), marks), inserts)
+
+
+class MemoryBackend(SyncBackend):
+    """Datasets held as {name: {"fields": [...], "rows": {row_id: [values]}}} - used for benchmarks.
+
+    where_clause is a callable taking {field: value} instead of SQL.
+    """
+
+    def __init__(self):
+        self.datasets = {}
+        self._next_id = 1
+
+    def create_table(self, dataset, fields):
+        self.datasets[dataset] = {"fields": list(fields), "rows": {}}
+
+    def load_rows(self, dataset, fields, rows):
+        self.apply_changes(dataset, fields, list(rows), {}, set())
+
+    def list_fields(self, dataset):
+        return list(self.datasets[dataset]["fields"])
+
+    def read_rows(self, dataset, fields, where_clause=None, spatial_reference=None):
+        table = self.datasets[dataset]
+        positions = [table["fields"].index(field) for field in fields]
+        for row_id, values in table["rows"].items():
+            row = [values[position] for position in positions]
+            if where_clause is not None and not where_clause(dict(zip(fields, row))):
+                continue
+            yield row_id, row
+
+    def add_fields(self, dataset, template, fields, names):
+        table = self.datasets[dataset]
+        table["fields"].extend(names)
+        for row in table["rows"].values():
+            row.extend([None] * len(names))
+
+    def apply_changes(self, dataset, fields, inserts, updates, deletes):
+        table = self.datasets[dataset]
+        positions = [table["fields"].index(field) for field in fields]
+        for row_id in deletes:
+            del table["rows"][row_id]
+        for row_id, values in updates.items():
+            row = table["rows"][row_id]
+            for position, value in zip(positions, values):
+                row[position] = value
+        for values in inserts:
+            row = [None] * len(table["fields"])
+            for position, value in zip(positions, values):
+                row[position] = value
+            table["rows"][self._next_id] = row
+            self._next_id += 1
+
+
+def _resolve_fields(backend, source, target, key_field, fields, source_fields, target_backend):
+    # Default field list = editable fields both sides share (case-insensitive), key first
+    if fields is None:
+        source_names = dict((name.upper(), name) for name in backend.list_fields(source))
+        target_names = target_backend.list_fields(target)
+        fields = [name for name in target_names if name.upper() in source_names]
+        source_fields = [source_names[name.upper()] for name in fields]
+    if source_fields is None:
+        source_fields = list(fields)
+    if len(source_fields) != len(fields):
+        raise ValueError("source_fields and fields must be the same length")
+    upper = [name.upper() for name in fields]
+    if key_field.upper() not in upper:
+        raise ValueError("Key field {} is not in the sync field list for {}".format(key_field, target))
+    key_index = upper.index(key_field.upper())
+    return list(source_fields), list(fields), key_index
+
+
+def sync_dataset(backend, source, target, key_field, fields=None, source_fields=None, where_clause=None, target_backend=None):
+    """Make target match source by applying only inserts, updates and deletes.
+
+    backend        - backend used to read the source (and write the target unless target_backend is given)
+    key_field      - target field that identifies a row on both sides (Site_NGUID, PID, ...)
+    fields         - target fields to compare/write; default is every editable field both datasets share
+    source_fields  - matching source field names when they differ from the target names
+    where_clause   - filter applied to the source (e.g. public exempt records left out of PUBLIC_WEB)
+
+    Rows with a null key can't be matched, so they are replaced every run (target rows deleted, source rows inserted).
+    Keys that repeat (condo parcels sharing a CAMA_PIN, ...) are compared as a group - if every row of the
+    group is unchanged it is skipped, otherwise the target rows for that key are replaced with the source rows.
+    """
+    target_backend = target_backend or backend
+    result = SyncResult(source, target)
+    started = time.time()
+
+    source_fields, fields, key_index = _resolve_fields(backend, source, target, key_field, fields, source_fields, target_backend)
+
+    # Fingerprint the target as it stands now
+    target_index = {}
+    deletes = set()
+    for row_id, values in target_backend.read_rows(target, fields):
+        result.target_rows += 1
+        key = values[key_index]
+        if key is None:
+            deletes.add(row_id)
+            continue
+        target_index.setdefault(key, []).append((row_id, row_fingerprint(values)))
+
+    # Stream the source (projected to the target's coordinate system so geometry hashes are comparable)
+    inserts = []
+    source_index = {}
+    for row_id, values in backend.read_rows(source, source_fields, where_clause, target_backend.spatial_reference(target)):
+        result.source_rows += 1
+        key = values[key_index]
+        if key is None:
+            inserts.append(list(values))
+            continue
+        source_index.setdefault(key, []).append(list(values))
+
+    # Compare key by key
+    updates = {}
+    for key, rows in source_index.items():
+        existing = target_index.pop(key, None)
+        if existing is None:
+            inserts.extend(rows)
+        elif len(rows) == 1 and len(existing) == 1:
+            if existing[0][1] == row_fingerprint(rows[0]):
+                result.unchanged += 1
+            else:
+                updates[existing[0][0]] = rows[0]
+        elif sorted(fingerprint for row_id, fingerprint in existing) == sorted(row_fingerprint(values) for values in rows):
+            result.unchanged += len(rows)
+        else:
+            deletes.update(row_id for row_id, fingerprint in existing)
+            inserts.extend(rows)
+
+    # Whatever is left in the target no longer exists in the source
+    for existing in target_index.values():
+        deletes.update(row_id for row_id, fingerprint in existing)
+
+    if inserts or updates or deletes:
+        target_backend.apply_changes(target, fields, inserts, updates, deletes)
+
+    result.inserted = len(inserts)
+    result.updated = len(updates)
+    result.deleted = len(deletes)
+    result.seconds = time.time() - started
+    return result
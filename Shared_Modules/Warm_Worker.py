@@ -0,0 +1,604 @@
+# ---------------------------------------------------------------------------
+# Warm_Worker.py
+# Created on: 2026-10-18
+# Works in ArcGIS Pro
+#
+# Author: Phil Baranyai/GIS Manager
+#
+# Description:
+#  Local job server that keeps arcpy and the SDE connections loaded between batch scripts.
+#  Every propy call in the Batch Files masters starts a new python, imports arcpy (10-30 seconds)
+#  and opens its connection files from cold - for the short spreader scripts that is most of the
+#  run.  The server starts a few worker processes that import the GIS stack once, Describe every
+#  connection in Database_Connections (arcpy keeps a connection per process once it is open) and
+#  then run scripts sent to them over a local socket:
+#
+#   - each script runs as __main__ in a warm worker (runpy), with its own arguments, working folder,
+#     log file (stdout/stderr) and a fresh scratch folder (TEMP/TMP, arcpy.env.scratchWorkspace)
+#     that is deleted afterwards - arcpy environments are reset and memory/in_memory is cleared
+#     before and after every job
+#   - functions the script registers with atexit (Run_Log, Run_Metrics) run when the script ends,
+#     and its logging handlers are closed, so the worker is left as it started
+#   - Shared_Modules changed on disk are imported again by the next job, and each worker is replaced
+#     after max_jobs_per_worker jobs (or a timeout) so nothing leaks from job to job for long
+#   - idle workers Describe the connections again every rewarm_minutes so they don't time out
+#
+#  Scripts that start their own process pools (LandRecords_Data_Spreader, Locator_Rebuilder) are
+#  better run cold - the pool processes import arcpy for themselves anyway.
+#
+#  Settings: Manifests\Warm_Worker.json (workers, port, preload, connections, folders - see the file).
+#  The server writes a key to %LOCALAPPDATA%\GIS_Warm_Worker that clients on the same machine use.
+#
+#  Usage:
+#
+#   propy Warm_Worker.py serve [--config <json>]               (Batch Files\Warm_Worker_Server.bat)
+#   propy Warm_Worker.py run <script> [arguments]              (runs cold with propy if no server is up)
+#   propy Warm_Worker.py status
+#   propy Warm_Worker.py stop
+#
+#   From python (Batch_Orchestrator with "warm_worker" in the graph):
+#   result = Warm_Worker.submit(script, arguments, log=log_path)   -> status, returncode, seconds, ...
+# ---------------------------------------------------------------------------
+
+import argparse,atexit,collections,gc,importlib,json,logging,multiprocessing,multiprocessing.connection,os,queue,runpy,shutil,subprocess,sys,tempfile,threading,time,traceback
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import Pipeline_Runner
+
+DEFAULT_CONFIG = r"\\FILELOCATION\\GIS\\ArcAutomations\\Manifests\\Warm_Worker.json"
+
+# Key file and default scratch/log folders (local disk of the machine running the batch files)
+STATE_FOLDER = os.path.join(os.environ.get("LOCALAPPDATA") or tempfile.gettempdir(), "GIS_Warm_Worker")
+KEY_FILE = os.path.join(STATE_FOLDER, "Warm_Worker.key")
+
+DEFAULTS = {"host": "127.0.0.1",
+            "port": 50731,
+            "workers": 2,
+            "max_jobs_per_worker": 25,
+            "rewarm_minutes": 15,
+            "default_timeout_minutes": 120,
+            "preload": ["arcpy"],
+            "connections": [],
+            "watch_folders": [],
+            "scratch_folder": os.path.join(STATE_FOLDER, "Scratch"),
+            "log_folder": os.path.join(STATE_FOLDER, "Logs"),
+            "keep_scratch": False}
+
+# Workspace Describe objects kept by each worker (holds the connections open)
+_WARM_WORKSPACES = {}
+
+
+class WarmWorkerUnavailable(Exception):
+    """No server is listening (or it was restarted with a new key) - run the script cold."""
+
+
+def load_config(path=None, overrides=None):
+    """Settings from a Warm_Worker JSON file ({variables} substituted), over DEFAULTS."""
+    config = dict(DEFAULTS)
+    if path is None and os.path.exists(DEFAULT_CONFIG):
+        path = DEFAULT_CONFIG
+    if path:
+        with open(path) as config_file:
+            settings = json.load(config_file)
+        variables = Pipeline_Runner.resolve_variables(settings.pop("variables", {}))
+        config.update(Pipeline_Runner.substitute_variables(settings, variables))
+    config.update(overrides or {})
+    return config
+
+
+def _authkey(create=False):
+    if create:
+        if not os.path.isdir(STATE_FOLDER):
+            os.makedirs(STATE_FOLDER)
+        with open(KEY_FILE, "w") as key_file:
+            key_file.write(os.urandom(32).hex())
+    try:
+        with open(KEY_FILE) as key_file:
+            return key_file.read().strip().encode("ascii")
+    except (IOError, OSError):
+        raise WarmWorkerUnavailable("No Warm_Worker key at {} - the server has not been started".format(KEY_FILE))
+
+
+def _clock(seconds):
+    return time.strftime("%H:%M:%S", time.gmtime(seconds or 0))
+
+
+# ---------------------------------------------------------------------------
+# Worker process
+# ---------------------------------------------------------------------------
+
+def warm_connections(config):
+    """Describe every connection file (opens the workspace, or checks it is still open) - {path: seconds or error}."""
+    timings = collections.OrderedDict()
+    arcpy = sys.modules.get("arcpy")
+    for path in config["connections"]:
+        started = time.time()
+        try:
+            if arcpy is None:
+                raise RuntimeError("arcpy is not loaded")
+            _WARM_WORKSPACES[path] = arcpy.Describe(path)
+            timings[path] = round(time.time() - started, 2)
+        except Exception as error:
+            _WARM_WORKSPACES.pop(path, None)
+            timings[path] = "{}: {}".format(type(error).__name__, error)
+    return timings
+
+
+def warm_up(config):
+    """Import the preload modules and open the connections - {module or connection: seconds or error}."""
+    timings = collections.OrderedDict()
+    for name in config["preload"]:
+        started = time.time()
+        try:
+            importlib.import_module(name)
+            timings[name] = round(time.time() - started, 2)
+        except Exception as error:
+            timings[name] = "{}: {}".format(type(error).__name__, error)
+    timings.update(warm_connections(config))
+    return timings
+
+
+def _watched_modules(folders):
+    folders = [os.path.normcase(os.path.abspath(folder)) for folder in folders]
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and name not in ("__main__", "__mp_main__") and any(os.path.normcase(os.path.abspath(path)).startswith(folder + os.sep) for folder in folders):
+            yield name, path
+
+
+def _refresh_modules(folders, seen):
+    # Forget watched modules whose file changed since they were imported (the next import loads the new
+    # code) and remember when newly imported ones were last modified
+    dropped = []
+    for name, path in _watched_modules(folders):
+        try:
+            modified = os.path.getmtime(path)
+        except OSError:
+            modified = None
+        if name not in seen:
+            seen[name] = modified
+        elif seen[name] != modified:
+            del sys.modules[name]
+            del seen[name]
+            dropped.append(name)
+    return dropped
+
+
+def _reset_logging():
+    # Close the handlers a script added with logging.basicConfig/Run_Log.start, so the next script's
+    # basicConfig isn't ignored and its log files aren't held open
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        try:
+            handler.close()
+        except Exception:
+            pass
+    root.setLevel(logging.WARNING)
+
+
+def _clear_arcpy(arcpy):
+    # (not ClearWorkspaceCache - that would close the warm connections)
+    try:
+        arcpy.ResetEnvironments()
+    except Exception:
+        pass
+    for workspace in ("memory", "in_memory"):
+        try:
+            arcpy.Delete_management(workspace)
+        except Exception:
+            pass
+
+
+def _scratch_path(config, name, pid):
+    # One scratch folder per job and worker - the server removes it if it has to kill the worker
+    return os.path.join(config["scratch_folder"], "{}_{}".format(name, pid))
+
+
+def run_job(job, config):
+    """Run one script as __main__ in this process with its own arguments, log and scratch folder."""
+    name = job.get("name") or os.path.splitext(os.path.basename(job["script"]))[0]
+    script_folder = os.path.dirname(os.path.abspath(job["script"]))
+    for folder in (config["scratch_folder"], config["log_folder"]):
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+    scratch = _scratch_path(config, name, os.getpid())
+    shutil.rmtree(scratch, ignore_errors=True)
+    os.makedirs(scratch)
+    log_path = job.get("log") or os.path.join(config["log_folder"], name + ".log")
+    result = {"name": name, "status": "failed", "returncode": 1, "worker": os.getpid(), "log": log_path, "scratch": scratch, "error": None}
+
+    saved_argv, saved_path, saved_cwd, saved_environ = list(sys.argv), list(sys.path), os.getcwd(), dict(os.environ)
+    saved_tempdir, saved_stdout, saved_stderr = tempfile.tempdir, sys.stdout, sys.stderr
+    saved_register, saved_unregister = atexit.register, atexit.unregister
+    exit_functions = []
+
+    def register(function, *args, **kwargs):
+        exit_functions.append((function, args, kwargs))
+        return function
+
+    def unregister(function):
+        exit_functions[:] = [entry for entry in exit_functions if entry[0] != function]
+
+    arcpy = sys.modules.get("arcpy")
+    started = time.time()
+    with open(log_path, "w") as job_log:
+        try:
+            _reset_logging()
+            os.environ["TEMP"] = os.environ["TMP"] = scratch
+            tempfile.tempdir = scratch
+            if arcpy:
+                _clear_arcpy(arcpy)
+                arcpy.env.scratchWorkspace = scratch
+            sys.argv = [job["script"]] + [str(argument) for argument in job.get("arguments", [])]
+            sys.path.insert(0, script_folder)
+            os.chdir(job.get("cwd") or script_folder)
+            atexit.register, atexit.unregister = register, unregister
+            sys.stdout = sys.stderr = job_log
+            try:
+                runpy.run_path(job["script"], run_name="__main__")
+                result.update(status="completed", returncode=0)
+            except SystemExit as exit:
+                # sys.exit() / sys.exit(0) is success, sys.exit("message") prints the message and fails
+                if exit.code is None or exit.code == 0:
+                    result.update(status="completed", returncode=0)
+                elif isinstance(exit.code, int):
+                    result.update(returncode=exit.code)
+                else:
+                    print (exit.code)
+                    result.update(error=str(exit.code))
+            except Exception as error:
+                traceback.print_exc()
+                result.update(error="{}: {}".format(type(error).__name__, error))
+            finally:
+                while exit_functions:
+                    function, args, kwargs = exit_functions.pop()
+                    try:
+                        function(*args, **kwargs)
+                    except Exception:
+                        traceback.print_exc()
+        finally:
+            sys.stdout, sys.stderr = saved_stdout, saved_stderr
+            atexit.register, atexit.unregister = saved_register, saved_unregister
+            sys.argv[:] = saved_argv
+            sys.path[:] = saved_path
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_environ)
+            tempfile.tempdir = saved_tempdir
+            _reset_logging()
+            if arcpy:
+                _clear_arcpy(arcpy)
+            if not config.get("keep_scratch"):
+                shutil.rmtree(scratch, ignore_errors=True)
+            gc.collect()
+    result["seconds"] = round(time.time() - started, 3)
+    return result
+
+
+def _worker_main(connection, config):
+    # Worker process: warm up, then run jobs until told to stop or max_jobs_per_worker is reached
+    connection.send({"pid": os.getpid(), "warm": warm_up(config)})
+    modules = {}
+    _refresh_modules(config["watch_folders"], modules)
+    rewarm = config["rewarm_minutes"] * 60 or None
+    jobs = 0
+    while True:
+        if not connection.poll(rewarm):
+            warm_connections(config)        # idle - keep the connections from timing out
+            continue
+        job = connection.recv()
+        if job is None:
+            break
+        dropped = _refresh_modules(config["watch_folders"], modules)
+        result = run_job(job, config)
+        _refresh_modules(config["watch_folders"], modules)
+        jobs += 1
+        result.update(reloaded=dropped, jobs=jobs, recycle=jobs >= config["max_jobs_per_worker"])
+        connection.send(result)
+        if result["recycle"]:
+            break
+    connection.close()
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+class WorkerProcess(object):
+    """One warm worker process and the pipe the server talks to it on."""
+
+    def __init__(self, number, config, log=print):
+        self.number = number
+        self.config = config
+        self.log = log
+        self.process = None
+        self.connection = None
+        self.pid = None
+        self.jobs = 0
+        self.started = None
+
+    def start(self):
+        started = time.time()
+        self.connection, child = multiprocessing.Pipe()
+        # Not a daemon - scripts running in it can start process pools of their own
+        self.process = multiprocessing.Process(target=_worker_main, args=(child, self.config), name="Warm_Worker {}".format(self.number))
+        self.process.start()
+        child.close()
+        ready = self.connection.recv()
+        self.pid = ready["pid"]
+        self.jobs = 0
+        self.started = time.time()
+        self.log("Worker {} (pid {}) warm in {}".format(self.number, self.pid, _clock(time.time() - started)))
+        for name, timing in ready["warm"].items():
+            self.log("    {:<60} {}".format(name, "{:.2f} seconds".format(timing) if isinstance(timing, float) else timing))
+
+    def stop(self, timeout=30):
+        try:
+            self.connection.send(None)
+            self.process.join(timeout)
+        except (IOError, OSError):
+            pass
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+
+    def restart(self, reason):
+        self.log("Replacing worker {} (pid {}) - {}".format(self.number, self.pid, reason))
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.connection.close()
+        self.start()
+
+    def run(self, job, timeout_minutes):
+        """Send a job and wait for its result (the worker is replaced after a timeout or a crash)."""
+        started = time.time()
+        self.connection.send(job)
+        if not self.connection.poll(timeout_minutes * 60 if timeout_minutes else None):
+            pid = self.pid
+            self.restart("{} ran longer than {} minutes".format(job["name"], timeout_minutes))
+            shutil.rmtree(_scratch_path(self.config, job["name"], pid), ignore_errors=True)
+            if job.get("log"):
+                with open(job["log"], "a") as job_log:
+                    job_log.write("\n Killed by Warm_Worker after {} minutes\n".format(timeout_minutes))
+            return {"name": job["name"], "status": "timeout", "returncode": None, "worker": pid, "error": "timeout",
+                    "log": job.get("log"), "seconds": round(time.time() - started, 3)}
+        try:
+            result = self.connection.recv()
+        except (EOFError, IOError, OSError):
+            self.process.join()
+            pid, exitcode = self.pid, self.process.exitcode
+            self.restart("it stopped while running {}".format(job["name"]))
+            shutil.rmtree(_scratch_path(self.config, job["name"], pid), ignore_errors=True)
+            return {"name": job["name"], "status": "failed", "returncode": exitcode, "worker": pid, "error": "worker process stopped",
+                    "log": job.get("log"), "seconds": round(time.time() - started, 3)}
+        self.jobs += 1
+        if result.get("reloaded"):
+            self.log("    reloaded changed modules: {}".format(", ".join(result["reloaded"])))
+        if result.get("recycle"):
+            self.process.join()
+            self.connection.close()
+            self.start()
+        return result
+
+
+class WarmServer(object):
+    """Accepts run/status/stop requests on a local socket and hands jobs to idle warm workers."""
+
+    def __init__(self, config, log=None):
+        self.config = config
+        self.log = log or (lambda text: print ("{} {}".format(time.strftime("%m/%d/%Y %I:%M:%S %p", time.localtime()), text), flush=True))
+        self.address = (config["host"], int(config["port"]))
+        self.workers = []
+        self.idle = queue.Queue()
+        self.running = {}
+        self.completed = 0
+        self.failed = 0
+        self.started = None
+        self.stopping = False
+        self._lock = threading.Lock()
+        self._listener = None
+
+    def start_workers(self):
+        for number in range(1, int(self.config["workers"]) + 1):
+            worker = WorkerProcess(number, self.config, self.log)
+            worker.start()
+            self.workers.append(worker)
+            self.idle.put(worker)
+
+    def serve(self):
+        """Start the workers and answer requests until a stop request."""
+        self.started = time.time()
+        self._listener = multiprocessing.connection.Listener(self.address, authkey=_authkey(create=True))
+        self.log("Warm_Worker listening on {}:{} with {} workers".format(self.address[0], self.address[1], self.config["workers"]))
+        self.start_workers()
+        try:
+            while not self.stopping:
+                try:
+                    connection = self._listener.accept()
+                except multiprocessing.AuthenticationError:
+                    self.log("Refused a connection with the wrong key")
+                    continue
+                except (IOError, OSError):
+                    if self.stopping:
+                        break
+                    raise
+                if self.stopping:
+                    connection.close()
+                    break
+                thread = threading.Thread(target=self._handle, args=(connection,), name="Warm_Worker client")
+                thread.daemon = True
+                thread.start()
+        finally:
+            self._listener.close()
+            for worker in self.workers:
+                worker.stop()
+            self.log("Warm_Worker stopped after {} jobs ({} failed)".format(self.completed + self.failed, self.failed))
+
+    def _handle(self, connection):
+        try:
+            request = connection.recv()
+            action = request.get("action")
+            if action == "run":
+                connection.send(self.run(request["job"]))
+            elif action == "status":
+                connection.send(self.status())
+            elif action == "stop":
+                connection.send({"stopping": True})
+                self.stop()
+            else:
+                connection.send({"error": "Unknown action {}".format(action)})
+        except (EOFError, IOError, OSError):
+            pass
+        finally:
+            connection.close()
+
+    def run(self, job):
+        """Run a job on the next idle worker (waits for one) - the result dict."""
+        job = dict(job)
+        job.setdefault("name", os.path.splitext(os.path.basename(job["script"]))[0])
+        if not os.path.exists(job["script"]):
+            return {"name": job["name"], "status": "failed", "returncode": 2, "error": "{} not found".format(job["script"])}
+        timeout = job.get("timeout_minutes", self.config["default_timeout_minutes"])
+        queued = time.time()
+        worker = self.idle.get()
+        waited = time.time() - queued
+        with self._lock:
+            self.running[worker.number] = (job["name"], time.time())
+        self.log("Start Running {} on worker {}{}".format(job["name"], worker.number, " after waiting {}".format(_clock(waited)) if waited >= 1 else ""))
+        try:
+            result = worker.run(job, timeout)
+        finally:
+            with self._lock:
+                self.running.pop(worker.number, None)
+            self.idle.put(worker)
+        result["waited"] = round(waited, 3)
+        with self._lock:
+            if result["status"] == "completed":
+                self.completed += 1
+            else:
+                self.failed += 1
+        self.log("End Running {} - {} in {}".format(job["name"], result["status"], _clock(result.get("seconds"))))
+        return result
+
+    def status(self):
+        with self._lock:
+            running = dict((number, {"job": name, "seconds": round(time.time() - started, 1)}) for number, (name, started) in self.running.items())
+        return {"address": "{}:{}".format(*self.address), "uptime": round(time.time() - self.started, 1), "completed": self.completed,
+                "failed": self.failed, "workers": [{"number": worker.number, "pid": worker.pid, "jobs": worker.jobs,
+                                                    "running": running.get(worker.number)} for worker in self.workers]}
+
+    def stop(self):
+        """Stop accepting requests; the workers are stopped once serve() leaves its loop."""
+        self.stopping = True
+        try:
+            # accept() is waiting - wake it with a connection of our own
+            multiprocessing.connection.Client(self.address, authkey=_authkey()).close()
+        except Exception:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+def _request(message, config=None):
+    config = config or load_config()
+    try:
+        connection = multiprocessing.connection.Client((config["host"], int(config["port"])), authkey=_authkey())
+    except (IOError, OSError, multiprocessing.AuthenticationError) as error:
+        raise WarmWorkerUnavailable("No Warm_Worker server on {}:{} ({})".format(config["host"], config["port"], error))
+    try:
+        connection.send(message)
+        return connection.recv()
+    except EOFError:
+        return {"status": "failed", "returncode": None, "error": "the Warm_Worker server closed the connection"}
+    finally:
+        connection.close()
+
+
+def submit(script, arguments=None, log=None, cwd=None, timeout_minutes=None, name=None, config=None):
+    """Run a script on the warm server and wait for it - dict with status (completed, failed, timeout),
+    returncode, seconds, waited and log.  Raises WarmWorkerUnavailable if no server is running."""
+    job = {"script": os.path.abspath(script), "arguments": list(arguments or []), "log": os.path.abspath(log) if log else None, "cwd": cwd}
+    if name:
+        job["name"] = name
+    if timeout_minutes is not None:
+        job["timeout_minutes"] = timeout_minutes
+    return _request({"action": "run", "job": job}, config)
+
+
+def status(config=None):
+    return _request({"action": "status"}, config)
+
+
+def stop(config=None):
+    return _request({"action": "stop"}, config)
+
+
+def run_remote(script, arguments=None, log=None, timeout_minutes=None, config=None, fallback=True):
+    """Run a script on the warm server and print its output (when there is no log of its own) -
+    the script's return code.  Without a server the script runs cold with this python."""
+    try:
+        result = submit(script, arguments, log=log, timeout_minutes=timeout_minutes, config=config)
+    except WarmWorkerUnavailable as error:
+        if not fallback:
+            raise
+        print ("{} - running {} cold".format(error, os.path.basename(script)))
+        sys.stdout.flush()
+        return subprocess.call([sys.executable, script] + list(arguments or []))
+    if not log and result.get("log") and os.path.exists(result["log"]):
+        with open(result["log"]) as job_log:
+            sys.stdout.write(job_log.read())
+    print ("Warm_Worker: {} {} in {} (worker {}{})".format(result.get("name"), result["status"], _clock(result.get("seconds")),
+                                                          result.get("worker"), ", waited {}".format(_clock(result["waited"])) if result.get("waited") else ""))
+    if result.get("error"):
+        print ("    " + result["error"])
+    if result["status"] == "completed":
+        return 0
+    return result["returncode"] if isinstance(result.get("returncode"), int) and result["returncode"] else 1
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Warm arcpy job server for the batch scripts")
+    parser.add_argument("--config", help="Warm_Worker settings (JSON, default {})".format(DEFAULT_CONFIG))
+    commands = parser.add_subparsers(dest="command")
+    serve_parser = commands.add_parser("serve", help="start the server (runs until a stop request)")
+    serve_parser.add_argument("--workers", type=int, help="warm worker processes")
+    run_parser = commands.add_parser("run", help="run a script on the server and wait for it")
+    run_parser.add_argument("--log", help="script output log (default: printed when the script ends)")
+    run_parser.add_argument("--timeout", type=float, help="minutes before the script is stopped")
+    run_parser.add_argument("--no-fallback", action="store_true", help="fail instead of running cold when no server is up")
+    run_parser.add_argument("script")
+    run_parser.add_argument("arguments", nargs=argparse.REMAINDER)
+    commands.add_parser("status", help="workers and running jobs")
+    commands.add_parser("stop", help="stop the server")
+    options = parser.parse_args(arguments)
+
+    config = load_config(options.config)
+    if options.command == "serve":
+        if options.workers:
+            config["workers"] = options.workers
+        WarmServer(config).serve()
+        return 0
+    if options.command == "run":
+        return run_remote(options.script, options.arguments, options.log, options.timeout, config, not options.no_fallback)
+    try:
+        if options.command == "status":
+            print (json.dumps(status(config), indent=2))
+        elif options.command == "stop":
+            stop(config)
+            print ("Warm_Worker stopping")
+        else:
+            parser.print_help()
+            return 2
+    except WarmWorkerUnavailable as error:
+        print (error)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())